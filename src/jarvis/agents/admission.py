@@ -0,0 +1,225 @@
+"""Admission control for LLM calls: per-model concurrency caps and fair queuing."""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from jarvis.core.config import (
+    ADMISSION_DEFAULT_MAX_CONCURRENCY,
+    ADMISSION_MAX_CONCURRENCY,
+    ADMISSION_USER_WEIGHTS,
+)
+from jarvis.core.enums import ModelEnum
+
+logger = logging.getLogger(__name__)
+
+ADMIN_CLASS = 0
+"""Priority class of admin requests (served before any user request)."""
+
+USER_CLASS = 1
+"""Priority class of every other request."""
+
+
+@dataclass
+class QueueWait:
+    """Queue wait accumulated by the LLM calls of one request."""
+
+    ms: float = 0.0
+
+
+_current_wait: ContextVar[QueueWait | None] = ContextVar("jarvis_queue_wait", default=None)
+
+
+def track_queue_wait() -> QueueWait:
+    """
+    Start accumulating admission wait for the current request.
+
+    Every call admitted afterwards in the same context (task) adds its wait
+    to the returned object.
+
+    Returns:
+        QueueWait updated in place.
+    """
+    wait = QueueWait()
+    _current_wait.set(wait)
+    return wait
+
+
+@dataclass(order=True)
+class _Waiter:
+    """Queued request, ordered by priority class, then virtual finish tag."""
+
+    priority: int
+    tag: float
+    seq: int
+    future: asyncio.Future = field(compare=False)
+
+
+class _ModelGate:
+    """Concurrency cap and weighted fair queue of one model."""
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.running = 0
+        self.heap: list[_Waiter] = []
+        self.virtual_time = 0.0
+        self.finish_tags: dict[str, float] = {}
+        self.admitted = 0
+        self.queued = 0
+        self.total_wait_ms = 0.0
+
+
+class AdmissionScheduler:
+    """
+    Gate every LLM call behind a per-model concurrency cap.
+
+    Requests beyond a model's cap wait in a weighted fair queue: each
+    ``real_name`` gets a virtual finish tag that advances by ``1 / weight``
+    per queued request, and the lowest tag is served first, so a burst from
+    one user is interleaved with everyone else's requests instead of
+    delaying them. Admin requests form a higher priority class that is
+    always served before regular users.
+
+    Attributes:
+        limits: Concurrency cap per model.
+        default_limit: Cap of models missing from ``limits``.
+        weights: Share of each ``real_name`` (1.0 when missing).
+    """
+
+    def __init__(
+        self,
+        limits: dict[ModelEnum, int],
+        default_limit: int = ADMISSION_DEFAULT_MAX_CONCURRENCY,
+        weights: dict[str, float] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Args:
+            limits: Maximum concurrent calls per model.
+            default_limit: Maximum concurrent calls of any other model.
+            weights: Fair-queuing weight per ``real_name``.
+            clock: Monotonic time source (overridable in tests).
+        """
+        self.limits = limits
+        self.default_limit = default_limit
+        self.weights = weights or {}
+        self._clock = clock
+        self._gates: dict[ModelEnum, _ModelGate] = {}
+        self._seq = itertools.count()
+
+    @asynccontextmanager
+    async def admit(self, model: ModelEnum, real_name: str, admin: bool = False) -> AsyncIterator[float]:
+        """
+        Hold one of ``model``'s slots for the duration of an LLM call.
+
+        Args:
+            model: Model about to be called.
+            real_name: User the call is made for (fair-queuing key).
+            admin: Whether the user belongs to the admin priority class.
+
+        Yields:
+            Milliseconds the call waited in the queue.
+        """
+        gate = self._gate(model)
+        started = self._clock()
+        await self._acquire(gate, real_name, admin)
+        wait_ms = (self._clock() - started) * 1000
+        gate.admitted += 1
+        gate.total_wait_ms += wait_ms
+        request_wait = _current_wait.get()
+        if request_wait is not None:
+            request_wait.ms += wait_ms
+        if wait_ms >= 1:
+            logger.debug("Admitted %s call for %s after %.0f ms", model.name, real_name, wait_ms)
+        try:
+            yield wait_ms
+        finally:
+            self._release(gate)
+
+    def stats(self) -> dict:
+        """
+        Summarize every model gate used so far.
+
+        Returns:
+            Dict keyed by model name with ``limit``, ``running``, ``waiting``,
+            ``admitted``, ``queued`` and ``avg_wait_ms``.
+        """
+        return {
+            model.name: {
+                "limit": gate.limit,
+                "running": gate.running,
+                "waiting": len(gate.heap),
+                "admitted": gate.admitted,
+                "queued": gate.queued,
+                "avg_wait_ms": round(gate.total_wait_ms / gate.admitted, 1) if gate.admitted else 0.0,
+            }
+            for model, gate in self._gates.items()
+        }
+
+    def _gate(self, model: ModelEnum) -> _ModelGate:
+        """Gate of ``model``, created with its configured cap on first use."""
+        gate = self._gates.get(model)
+        if gate is None:
+            gate = self._gates[model] = _ModelGate(self.limits.get(model, self.default_limit))
+        return gate
+
+    async def _acquire(self, gate: _ModelGate, real_name: str, admin: bool) -> None:
+        """Take a slot, queueing by priority class and virtual finish tag if none is free."""
+        if gate.running < gate.limit and not gate.heap:
+            gate.running += 1
+            return
+        weight = self.weights.get(real_name, 1.0)
+        tag = max(gate.virtual_time, gate.finish_tags.get(real_name, 0.0)) + 1 / weight
+        gate.finish_tags[real_name] = tag
+        waiter = _Waiter(
+            ADMIN_CLASS if admin else USER_CLASS,
+            tag,
+            next(self._seq),
+            asyncio.get_running_loop().create_future(),
+        )
+        heapq.heappush(gate.heap, waiter)
+        gate.queued += 1
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # The slot was handed over just as we were cancelled.
+                self._release(gate)
+            else:
+                gate.heap.remove(waiter)
+                heapq.heapify(gate.heap)
+            raise
+
+    def _release(self, gate: _ModelGate) -> None:
+        """Hand the slot to the next queued request, or free it."""
+        while gate.heap:
+            waiter = heapq.heappop(gate.heap)
+            if waiter.future.done():
+                continue
+            gate.virtual_time = max(gate.virtual_time, waiter.tag)
+            waiter.future.set_result(None)
+            return
+        gate.running -= 1
+        if gate.running == 0:
+            # No backlog left: nobody carries a debt into the next burst.
+            gate.finish_tags.clear()
+            gate.virtual_time = 0.0
+
+
+_scheduler = AdmissionScheduler(ADMISSION_MAX_CONCURRENCY, weights=ADMISSION_USER_WEIGHTS)
+
+
+def get_admission_scheduler() -> AdmissionScheduler:
+    """
+    Return the process-wide admission scheduler.
+
+    Returns:
+        Shared AdmissionScheduler.
+    """
+    return _scheduler
@@ -0,0 +1,66 @@
+"""Shared ``chatbot`` graph node for the OpenAI memory agents."""
+
+from langchain_core.runnables import Runnable, RunnableConfig, RunnableLambda
+
+from jarvis.agents.context_window import select_context
+from jarvis.agents.llm_cache import LlmResponseCache
+
+
+def build_chatbot_node(
+    llm_with_tools: Runnable,
+    token_budget: int | None = None,
+    response_cache: LlmResponseCache | None = None,
+) -> RunnableLambda:
+    """
+    Build the LLM node with native sync and async implementations.
+
+    ``graph.invoke`` runs the sync path and ``graph.ainvoke`` awaits the LLM
+    directly instead of offloading a blocking call to a worker thread.
+
+    Args:
+        llm_with_tools: Chat model with the agent tools bound.
+        token_budget: If set, only the system prompt, the rolling ``summary``
+            and the newest turns fitting this many tokens are sent.
+        response_cache: If set, byte-identical deterministic calls are
+            answered from this cache instead of the model.
+
+    Returns:
+        Runnable usable as a ``StateGraph`` node.
+    """
+
+    def _context(state: dict) -> list:
+        if token_budget is None:
+            return state["messages"]
+        return select_context(
+            state["messages"],
+            token_budget,
+            summary=state.get("summary"),
+            summarized_through=state.get("summarized_through"),
+        )
+
+    def _cache_key(messages: list, config: RunnableConfig) -> str | None:
+        if response_cache is None or response_cache.is_bypassed(config):
+            return None
+        return response_cache.make_key(llm_with_tools, messages)
+
+    def chatbot(state: dict, config: RunnableConfig) -> dict:
+        messages = _context(state)
+        key = _cache_key(messages, config)
+        if key and (cached := response_cache.get(key)) is not None:
+            return {"messages": [cached]}
+        response = llm_with_tools.invoke(messages, config)
+        if key:
+            response_cache.put(key, response)
+        return {"messages": [response]}
+
+    async def achatbot(state: dict, config: RunnableConfig) -> dict:
+        messages = _context(state)
+        key = _cache_key(messages, config)
+        if key and (cached := response_cache.get(key)) is not None:
+            return {"messages": [cached]}
+        response = await llm_with_tools.ainvoke(messages, config)
+        if key:
+            response_cache.put(key, response)
+        return {"messages": [response]}
+
+    return RunnableLambda(chatbot, afunc=achatbot, name="chatbot")
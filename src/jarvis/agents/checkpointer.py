@@ -0,0 +1,109 @@
+"""Checkpointer backend selection for the memory agents."""
+
+import threading
+
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.checkpoint.memory import MemorySaver
+
+from jarvis.core.config import (
+    CHECKPOINT_FLUSH_BATCH_SIZE,
+    CHECKPOINT_FLUSH_INTERVAL_SECONDS,
+    CHECKPOINT_KEEP_LAST,
+    CHECKPOINT_VACUUM_INTERVAL_SECONDS,
+    CHECKPOINTER_BACKEND,
+    REDIS_KEY_PREFIX,
+    SESSION_CACHE_TTL_SECONDS,
+)
+from jarvis.core.enums import CheckpointerBackendEnum
+from jarvis.core.paths import CHECKPOINTS_DB_PATH
+from jarvis.infrastructure.persistence.checkpoints import SqliteCheckpointSaver
+from jarvis.infrastructure.persistence.redis_checkpoints import RedisCheckpointSaver
+from jarvis.infrastructure.persistence.redis_client import get_redis_client
+
+_sqlite_savers: dict[str, SqliteCheckpointSaver] = {}
+_savers_lock = threading.Lock()
+_redis_saver: RedisCheckpointSaver | None = None
+
+
+def build_checkpointer(
+    backend: CheckpointerBackendEnum = CHECKPOINTER_BACKEND,
+    db_path: str | None = None,
+) -> BaseCheckpointSaver:
+    """
+    Return the checkpointer for the configured backend.
+
+    SQLite savers are shared per database file, so agents rebuilt after a cache
+    reset keep reading the same threads and only one writer thread exists.
+    The Redis saver (server from ``REDIS_URL``) is shared by the whole process;
+    its keys expire ``SESSION_CACHE_TTL_SECONDS`` after a thread's last turn.
+
+    Args:
+        backend: Storage backend (``CHECKPOINTER_BACKEND`` by default).
+        db_path: SQLite file; defaults to ``data/checkpoints.db``.
+
+    Returns:
+        A new MemorySaver, the shared SqliteCheckpointSaver for ``db_path``,
+        or the shared RedisCheckpointSaver.
+
+    Raises:
+        ValueError: If the backend is not supported.
+        RuntimeError: If the Redis backend is selected but unavailable.
+    """
+    global _redis_saver
+    if backend == CheckpointerBackendEnum.MEMORY:
+        return MemorySaver()
+    if backend == CheckpointerBackendEnum.SQLITE:
+        path = str(db_path or CHECKPOINTS_DB_PATH)
+        with _savers_lock:
+            saver = _sqlite_savers.get(path)
+            if saver is None:
+                saver = _sqlite_savers[path] = SqliteCheckpointSaver(
+                    path,
+                    keep_last=CHECKPOINT_KEEP_LAST,
+                    flush_batch_size=CHECKPOINT_FLUSH_BATCH_SIZE,
+                    flush_interval_seconds=CHECKPOINT_FLUSH_INTERVAL_SECONDS,
+                    vacuum_interval_seconds=CHECKPOINT_VACUUM_INTERVAL_SECONDS,
+                )
+        return saver
+    if backend == CheckpointerBackendEnum.REDIS:
+        with _savers_lock:
+            if _redis_saver is None:
+                _redis_saver = RedisCheckpointSaver(
+                    get_redis_client(),
+                    keep_last=CHECKPOINT_KEEP_LAST,
+                    key_prefix=REDIS_KEY_PREFIX,
+                    ttl_seconds=SESSION_CACHE_TTL_SECONDS,
+                )
+        return _redis_saver
+    raise ValueError(f"Unsupported checkpointer backend: {backend}")
+
+
+def is_durable_checkpointer(memory: object) -> bool:
+    """
+    Whether a checkpointer keeps threads outside process memory.
+
+    Args:
+        memory: Agent checkpointer.
+
+    Returns:
+        True for disk- and Redis-backed savers, whose threads must survive cache eviction.
+    """
+    return isinstance(memory, (SqliteCheckpointSaver, RedisCheckpointSaver))
+
+
+def latest_checkpoint_id(memory: BaseCheckpointSaver, thread_id: str) -> str | None:
+    """
+    Id of a thread's latest checkpoint, reading as little as the backend allows.
+
+    Args:
+        memory: Agent checkpointer.
+        thread_id: Conversation thread.
+
+    Returns:
+        Checkpoint id, or None if the thread has no history.
+    """
+    config = {"configurable": {"thread_id": thread_id, "checkpoint_ns": ""}}
+    if isinstance(memory, (SqliteCheckpointSaver, RedisCheckpointSaver)):
+        return memory.get_latest_checkpoint_id(config)
+    checkpoint_tuple = memory.get_tuple(config)
+    return checkpoint_tuple.config["configurable"]["checkpoint_id"] if checkpoint_tuple else None
@@ -0,0 +1,234 @@
+"""Token-budgeted LLM context with a rolling summary of older messages."""
+
+import asyncio
+import logging
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager, nullcontext
+from dataclasses import dataclass
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import (
+    BaseMessage,
+    HumanMessage,
+    SystemMessage,
+    get_buffer_string,
+)
+from langchain_core.messages.utils import count_tokens_approximately
+
+from jarvis.agents.checkpointer import latest_checkpoint_id
+from jarvis.core.config import CONTEXT_SUMMARY_KEEP_RATIO
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_PREFIX = "Resumen de la conversación anterior con el usuario:\n"
+
+SUMMARY_INSTRUCTIONS = (
+    "Eres el asistente de memoria de Jarvis. Recibirás un resumen previo de la conversación "
+    "y mensajes nuevos que ya no caben en el contexto. Devuelve un único resumen actualizado, "
+    "breve y en español, que conserve nombres, datos, fechas, decisiones, peticiones pendientes "
+    "y resultados de herramientas relevantes. No añadas nada que no aparezca en los mensajes."
+)
+
+def _split_turns(messages: list[BaseMessage]) -> list[list[BaseMessage]]:
+    """
+    Group messages into turns that each start at a human message.
+
+    An AI tool call and its tool results always land in the same turn, so
+    dropping whole turns never leaves an orphaned tool message.
+    """
+    turns: list[list[BaseMessage]] = []
+    for message in messages:
+        if isinstance(message, HumanMessage) or not turns:
+            turns.append([message])
+        else:
+            turns[-1].append(message)
+    return turns
+
+
+def _fit_recent_turns(messages: list[BaseMessage], available_tokens: int) -> list[BaseMessage]:
+    """Newest whole turns that fit in ``available_tokens`` (the last turn is always kept)."""
+    kept: list[list[BaseMessage]] = []
+    used = 0
+    for turn in reversed(_split_turns(messages)):
+        cost = count_tokens_approximately(turn)
+        if kept and used + cost > available_tokens:
+            break
+        kept.append(turn)
+        used += cost
+    return [message for turn in reversed(kept) for message in turn]
+
+
+def _partition(
+    messages: list[BaseMessage], summarized_through: str | None
+) -> tuple[list[BaseMessage], list[BaseMessage]]:
+    """Split into system prompts and the conversation not yet folded into the summary."""
+    system = [m for m in messages if isinstance(m, SystemMessage)]
+    conversation = [m for m in messages if not isinstance(m, SystemMessage)]
+    if summarized_through:
+        for index, message in enumerate(conversation):
+            if message.id == summarized_through:
+                return system, conversation[index + 1:]
+    return system, conversation
+
+
+def _summary_messages(summary: str | None) -> list[BaseMessage]:
+    """Rolling summary as a system message (empty list when there is none)."""
+    return [SystemMessage(content=SUMMARY_PREFIX + summary)] if summary else []
+
+
+def select_context(
+    messages: list[BaseMessage],
+    token_budget: int,
+    summary: str | None = None,
+    summarized_through: str | None = None,
+) -> list[BaseMessage]:
+    """
+    Choose the messages sent to the LLM for one call.
+
+    System prompts (``build_background_prompt``) are always kept, followed by
+    the rolling summary and the newest whole turns that fit the budget. Turns
+    are never split, so tool calls stay next to their results, and the current
+    turn is kept even if it alone exceeds the budget.
+
+    Args:
+        messages: Full thread from the graph state.
+        token_budget: Approximate token limit for the prompt.
+        summary: Rolling summary of messages already folded away.
+        summarized_through: Id of the last message covered by ``summary``.
+
+    Returns:
+        Messages to pass to the chat model.
+    """
+    system, conversation = _partition(messages, summarized_through)
+    prefix = system + _summary_messages(summary)
+    available = token_budget - count_tokens_approximately(prefix)
+    return prefix + _fit_recent_turns(conversation, available)
+
+
+@dataclass
+class _Fold:
+    """Summary request planned from one checkpoint of a thread."""
+
+    thread_id: str
+    checkpoint_id: str | None
+    request: list[BaseMessage]
+    overflow: list[BaseMessage]
+
+
+def _plan_fold(graph, thread_id: str, token_budget: int, keep_ratio: float) -> _Fold | None:
+    """Read the thread and build the summary request, or None if nothing overflows."""
+    config = {"configurable": {"thread_id": thread_id}}
+    snapshot = graph.get_state(config)
+    if snapshot.next:
+        return None
+    values = snapshot.values
+    summary = values.get("summary") or ""
+    system, conversation = _partition(values.get("messages", []), values.get("summarized_through"))
+    prefix = system + _summary_messages(summary)
+    if count_tokens_approximately(prefix + conversation) <= token_budget:
+        return None
+
+    available = int(token_budget * keep_ratio) - count_tokens_approximately(prefix)
+    kept = _fit_recent_turns(conversation, available)
+    overflow = conversation[: len(conversation) - len(kept)]
+    if not overflow:
+        return None
+
+    request = [
+        SystemMessage(content=SUMMARY_INSTRUCTIONS),
+        HumanMessage(
+            content=(
+                f"Resumen previo:\n{summary or '(vacío)'}\n\n"
+                f"Mensajes nuevos:\n{get_buffer_string(overflow)}"
+            )
+        ),
+    ]
+    checkpoint_id = (snapshot.config or {}).get("configurable", {}).get("checkpoint_id")
+    return _Fold(thread_id, checkpoint_id, request, overflow)
+
+
+def _apply_fold(graph, fold: _Fold, new_summary: str) -> bool:
+    """
+    Store a summary unless a turn checkpointed the thread since it was planned.
+
+    A turn that started before the update would overwrite the summary
+    checkpoint with its own, so the summary is dropped instead; the next
+    fold covers those messages again.
+    """
+    if latest_checkpoint_id(graph.checkpointer, fold.thread_id) != fold.checkpoint_id:
+        logger.info("Thread %s changed while summarizing; summary discarded", fold.thread_id)
+        return False
+    graph.update_state(
+        {"configurable": {"thread_id": fold.thread_id}},
+        {"summary": new_summary, "summarized_through": fold.overflow[-1].id},
+        as_node="chatbot",
+    )
+    logger.info("Folded %d messages of thread %s into its summary", len(fold.overflow), fold.thread_id)
+    return True
+
+
+def fold_overflow(
+    graph,
+    llm: BaseChatModel,
+    thread_id: str,
+    token_budget: int,
+    keep_ratio: float = CONTEXT_SUMMARY_KEEP_RATIO,
+) -> bool:
+    """
+    Fold messages that no longer fit the budget into the thread's rolling summary.
+
+    Runs only once the thread exceeds ``token_budget``, and then folds enough
+    old turns to leave ``keep_ratio`` of the budget for verbatim messages, so a
+    summary call happens every few turns rather than on every one. Messages
+    stay in the checkpoint (history is unchanged); only ``summary`` and
+    ``summarized_through`` are updated, and only if no other checkpoint was
+    written to the thread during the summary call.
+
+    Args:
+        graph: Compiled graph whose state has ``summary`` / ``summarized_through``.
+        llm: Chat model used to write the summary (no tools bound).
+        thread_id: Thread to compact.
+        token_budget: Approximate prompt token limit of the agent's model.
+        keep_ratio: Share of the budget kept as recent turns after folding.
+
+    Returns:
+        True if a new summary was stored.
+    """
+    fold = _plan_fold(graph, thread_id, token_budget, keep_ratio)
+    if fold is None:
+        return False
+    return _apply_fold(graph, fold, llm.invoke(fold.request).content)
+
+
+async def afold_overflow(
+    graph,
+    llm: BaseChatModel,
+    thread_id: str,
+    token_budget: int,
+    keep_ratio: float = CONTEXT_SUMMARY_KEEP_RATIO,
+    admit: Callable[[], AbstractAsyncContextManager] | None = None,
+) -> bool:
+    """
+    Async ``fold_overflow`` for callers that hold the thread's turn.
+
+    Checkpointer reads and the summary call run in worker threads (the
+    summary model may belong to another event loop); only the summary call
+    holds an ``admit`` slot.
+
+    Args:
+        graph: Compiled graph whose state has ``summary`` / ``summarized_through``.
+        llm: Chat model used to write the summary (no tools bound).
+        thread_id: Thread to compact.
+        token_budget: Approximate prompt token limit of the agent's model.
+        keep_ratio: Share of the budget kept as recent turns after folding.
+        admit: Factory of the admission context held during the summary call.
+
+    Returns:
+        True if a new summary was stored.
+    """
+    fold = await asyncio.to_thread(_plan_fold, graph, thread_id, token_budget, keep_ratio)
+    if fold is None:
+        return False
+    async with admit() if admit is not None else nullcontext():
+        response = await asyncio.to_thread(llm.invoke, fold.request)
+    return await asyncio.to_thread(_apply_fold, graph, fold, response.content)
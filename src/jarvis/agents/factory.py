@@ -1,19 +1,29 @@
 """LangGraph agent factory by selected model."""
 
+from typing import TYPE_CHECKING
+
 from jarvis.core.config import USE_MCP
 from jarvis.core.enums import ModelEnum
-from jarvis.agents.jarvis_memory_agent import JarvisMemoryAgent
-from jarvis.agents.jarvis_mcp_memory_agent import JarvisMcpMemoryAgent
-from jarvis.agents.jarvis_basic_agent import JarvisBasicAgent
+
+if TYPE_CHECKING:
+    from jarvis.agents.jarvis_basic_agent import JarvisBasicAgent
+    from jarvis.agents.jarvis_mcp_memory_agent import JarvisMcpMemoryAgent
+    from jarvis.agents.jarvis_memory_agent import JarvisMemoryAgent
 
 models_with_memory: list[ModelEnum] = [ModelEnum.GPT_3_5]
 """Models that persist conversation history with a checkpointer."""
 
 
-def build_agent(model_used: ModelEnum) -> JarvisBasicAgent | JarvisMemoryAgent | JarvisMcpMemoryAgent:
+def build_agent(
+    model_used: ModelEnum,
+) -> "JarvisBasicAgent | JarvisMemoryAgent | JarvisMcpMemoryAgent":
     """
     Build and instantiate the agent for the given model.
 
+    Each backend module is imported the first time its model is requested, so
+    processes that only use GPT-3.5 never load the Ollama, Hugging Face or MCP
+    client libraries.
+
     Args:
         model_used: ModelEnum member (GPT_3_5, ZEPHYR, MISTRAL, etc.).
 
@@ -24,9 +34,15 @@ def build_agent(model_used: ModelEnum) -> JarvisBasicAgent | JarvisMemoryAgent |
         ValueError: If the model is not supported.
     """
     if model_used in [ModelEnum.ZEPHYR, ModelEnum.MISTRAL]:
+        from jarvis.agents.jarvis_basic_agent import JarvisBasicAgent
+
         return JarvisBasicAgent(model_used)
     if model_used == ModelEnum.GPT_3_5:
         if USE_MCP:
+            from jarvis.agents.jarvis_mcp_memory_agent import JarvisMcpMemoryAgent
+
             return JarvisMcpMemoryAgent(model_used)
+        from jarvis.agents.jarvis_memory_agent import JarvisMemoryAgent
+
         return JarvisMemoryAgent(model_used)
     raise ValueError("Modelo no soportado.")
@@ -1,6 +1,7 @@
 """ReAct agent without persistent memory (Zephyr via HF, Mistral via Ollama)."""
 
 import os
+from collections.abc import AsyncIterator
 
 from jarvis.core.enums import ModelEnum
 from langchain_ollama import ChatOllama
@@ -76,6 +77,31 @@ class JarvisBasicAgent:
         """
         return self.graph.invoke(**kwargs)
 
+    async def ainvoke(self, **kwargs) -> dict:
+        """
+        Run an async graph invocation.
+
+        Args:
+            **kwargs: Arguments accepted by ``graph.ainvoke`` (input, config, etc.).
+
+        Returns:
+            Resulting graph state (dict with keys such as ``messages``).
+        """
+        return await self.graph.ainvoke(**kwargs)
+
+    async def astream_events(self, **kwargs) -> AsyncIterator[dict]:
+        """
+        Stream graph execution events.
+
+        Args:
+            **kwargs: Arguments accepted by ``graph.astream_events`` (input, config, etc.).
+
+        Yields:
+            LangChain ``v2`` stream events (tokens, tool runs, chain ends).
+        """
+        async for event in self.graph.astream_events(**kwargs, version="v2"):
+            yield event
+
     def cleanup(self) -> None:
         """Release agent resources (no-op for this agent)."""
         pass
@@ -1,67 +1,48 @@
 """GPT-3.5 agent with memory, local tools, and MCP servers via stdio."""
 
 import asyncio
-import json
 import logging
-import os
-from contextlib import AsyncExitStack
-
-logger = logging.getLogger(__name__)
+from collections.abc import AsyncIterator
 from typing import Annotated
 
-from typing_extensions import TypedDict
+from typing_extensions import NotRequired, TypedDict
 
+from jarvis.core.config import CONTEXT_TOKEN_BUDGETS
 from jarvis.core.enums import ModelEnum
-from langchain_openai import ChatOpenAI
-from langchain_mcp_adapters.tools import load_mcp_tools
-from langgraph.checkpoint.memory import MemorySaver
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.graph import StateGraph
 from langgraph.graph.message import add_messages
-from langgraph.prebuilt import ToolNode, tools_condition
-from mcp import ClientSession, StdioServerParameters
-from mcp.client.stdio import stdio_client
+from langgraph.prebuilt import tools_condition
+from jarvis.agents.mcp_session_manager import MCP_CONNECTION_ERRORS, McpSessionManager
+from jarvis.agents.chatbot_node import build_chatbot_node
+from jarvis.agents.checkpointer import build_checkpointer
+from jarvis.agents.context_window import afold_overflow, fold_overflow
+from jarvis.agents.llm_cache import get_response_cache
+from jarvis.agents.openai_client import build_chat_openai
+from jarvis.agents.tool_output import build_tool_node
 from jarvis.tools.tools_registry import local_tools
 
+logger = logging.getLogger(__name__)
+
 
 class State(TypedDict):
-    """Graph state with messages and real_name injected into tools."""
+    """Graph state with messages, real_name injected into tools, and rolling summary."""
 
     messages: Annotated[list, add_messages]
     real_name: str
-
-
-from jarvis.core.paths import MCP_DIR, MCP_SERVER_CONFIG_PATH
-
-server_config_path = str(MCP_SERVER_CONFIG_PATH)
-
-
-def _resolve_mcp_server_config(server_config: dict) -> dict:
-    """
-    Normalize MCP server config paths relative to ``MCP_DIR``.
-
-    Args:
-        server_config: Raw entry from ``server_config.json``.
-
-    Returns:
-        Config with absolute paths in ``args`` when they reference local scripts.
-    """
-    resolved = dict(server_config)
-    args = list(resolved.get("args", []))
-    normalized: list[str] = []
-    for arg in args:
-        if isinstance(arg, str) and arg.endswith(".py") and not os.path.isabs(arg):
-            normalized.append(str((MCP_DIR / arg).resolve()))
-        else:
-            normalized.append(arg)
-    resolved["args"] = normalized
-    return resolved
+    summary: NotRequired[str]
+    summarized_through: NotRequired[str]
 
 
 class JarvisMcpMemoryAgent:
     """
     Agent with memory combining local tools and MCP server tools.
 
-    MCP connection is established lazily on the first invocation.
+    MCP servers are connected lazily on the first invocation and then kept
+    alive by a ``McpSessionManager`` for the lifetime of the agent; the graph
+    is compiled once and only recompiled after a reconnect. Concurrent turns
+    share one connect or reconnect: it is serialized by a lock and skipped
+    when another turn already reconnected since the failure.
     """
 
     def __init__(self, model_enum: ModelEnum) -> None:
@@ -70,14 +51,16 @@ class JarvisMcpMemoryAgent:
             model_enum: Must be GPT_3_5.
         """
         self.model_enum = model_enum
-        self.exit_stack: AsyncExitStack | None = None
+        self.mcp_manager = McpSessionManager()
         self.tools: list | None = None
         self.graph = None
-        self.memory: MemorySaver | None = None
-        self._is_connected = False
+        self.memory: BaseCheckpointSaver = build_checkpointer()
+        self.token_budget = CONTEXT_TOKEN_BUDGETS.get(model_enum)
+        self.summary_llm = None
+        self._setup_lock: asyncio.Lock | None = None
 
     def _create_langgraph_agent(
-        self, model_enum: ModelEnum, tools: list, memory: MemorySaver | None = None
+        self, model_enum: ModelEnum, tools: list, memory: BaseCheckpointSaver | None = None
     ) -> None:
         """
         Compile the LangGraph with the given tools.
@@ -85,88 +68,137 @@ class JarvisMcpMemoryAgent:
         Args:
             model_enum: LLM model (GPT_3_5).
             tools: Local + MCP tools.
-            memory: Checkpointer; MemorySaver is created if None.
+            memory: Checkpointer; ``build_checkpointer()`` is used if None.
 
         Raises:
             ValueError: If the model is not GPT_3_5.
         """
         if model_enum == ModelEnum.GPT_3_5:
-            llm = ChatOpenAI(model="gpt-3.5-turbo", temperature=0)
+            llm = build_chat_openai(model_enum)
         else:
             raise ValueError(f"Unsupported model: {model_enum}")
 
+        self.summary_llm = llm
         graph_builder = StateGraph(State)
         llm_with_tools = llm.bind_tools(tools)
 
-        def chatbot(state: State) -> dict:
-            return {"messages": [llm_with_tools.invoke(state["messages"])]}
-
-        graph_builder.add_node("chatbot", chatbot)
-        graph_builder.add_node("tools", ToolNode(tools=tools))
+        graph_builder.add_node(
+            "chatbot",
+            build_chatbot_node(llm_with_tools, self.token_budget, get_response_cache()),
+        )
+        graph_builder.add_node("tools", build_tool_node(tools))
         graph_builder.add_conditional_edges("chatbot", tools_condition)
         graph_builder.add_edge("tools", "chatbot")
         graph_builder.set_entry_point("chatbot")
 
         if memory is None:
-            memory = MemorySaver()
+            memory = build_checkpointer()
 
         self.graph = graph_builder.compile(checkpointer=memory)
         self.memory = memory
 
-    async def _connect_to_server(self, server_name: str, server_config: dict) -> None:
+    async def setup_mcp(self, reconnect: bool = False) -> None:
         """
-        Connect to an MCP server over stdio and append its tools.
+        Connect MCP servers (or reconnect them) and compile the LangGraph.
+
+        Must run on the MCP manager loop.
 
         Args:
-            server_name: Logical server name (for logging).
-            server_config: Parameters for StdioServerParameters.
+            reconnect: If True, close existing sessions and open new ones.
+
+        Returns:
+            None.
         """
-        server_params = StdioServerParameters(**_resolve_mcp_server_config(server_config))
-        read, write = await self.exit_stack.enter_async_context(stdio_client(server_params))
-        session = await self.exit_stack.enter_async_context(ClientSession(read, write))
-        await session.initialize()
-        mcp_tools = await load_mcp_tools(session)
-        self.tools.extend(mcp_tools)
+        if reconnect:
+            mcp_tools = await self.mcp_manager.areconnect()
+        else:
+            mcp_tools = await self.mcp_manager.aget_tools()
+        self.tools = list(local_tools) + mcp_tools
+        self._create_langgraph_agent(self.model_enum, self.tools, memory=self.memory)
 
-    async def initialize_mcp_connection(self) -> None:
+    async def _aensure_graph(self, failed_generation: int | None = None) -> int:
         """
-        Read ``mcp/server_config.json`` and connect all MCP servers.
+        Connect MCP and compile the graph if needed, one turn at a time.
+
+        Must run on the MCP manager loop.
+
+        Args:
+            failed_generation: Connection generation a turn saw fail; it is
+                only replaced if no other turn reconnected in the meantime.
 
         Returns:
-            None. Idempotent if already connected.
+            Generation of the connection the graph is now bound to.
         """
-        if self._is_connected:
-            logger.info(
-                "Initialize MCP Connection called, but MCP services are already initialized"
-            )
-            return
+        if self._setup_lock is None:
+            self._setup_lock = asyncio.Lock()
+        async with self._setup_lock:
+            manager = self.mcp_manager
+            if failed_generation is not None and failed_generation == manager.generation:
+                await self.setup_mcp(reconnect=True)
+            elif self.graph is None or not manager.is_connected:
+                await self.setup_mcp(reconnect=self.graph is not None)
+            return manager.generation
+
+    async def _can_resume(self, graph, config: dict | None) -> bool:
+        """
+        Whether a turn interrupted by an MCP failure can be replayed safely.
 
-        self.exit_stack = AsyncExitStack()
-        await self.exit_stack.__aenter__()
+        Resuming reruns the interrupted tools step from its checkpoint. That
+        is only safe when the step was a single MCP tool call (the one whose
+        transport failed); any other tool of the step, such as a calendar
+        write, may already have run.
 
-        with open(server_config_path, "r", encoding="utf-8") as file:
-            data = json.load(file)
-        servers = data.get("mcpServers", {})
+        Args:
+            graph: Graph the turn ran on.
+            config: Turn config (thread_id).
 
-        for server_name, server_config in servers.items():
-            await self._connect_to_server(server_name, server_config)
+        Returns:
+            True if the pending step is exactly one MCP tool call.
+        """
+        if not config:
+            return False
+        snapshot = await graph.aget_state(config)
+        if tuple(snapshot.next) != ("tools",):
+            return False
+        messages = snapshot.values.get("messages") or []
+        tool_calls = getattr(messages[-1], "tool_calls", None) if messages else None
+        local_names = {tool.name for tool in local_tools}
+        return (
+            bool(tool_calls) and len(tool_calls) == 1 and tool_calls[0]["name"] not in local_names
+        )
+
+    async def _ainvoke_on_mcp_loop(self, **kwargs) -> dict:
+        """
+        Invoke the graph next to the MCP sessions, reconnecting once on transport failure.
 
-        self._is_connected = True
+        The turn is resumed on the new connection only if that cannot repeat
+        a tool call that already ran (see ``_can_resume``); otherwise the
+        error is raised after reconnecting, for the next turn's sake.
 
-    async def setup_mcp(self) -> None:
-        """
-        Initialize local tools, MCP connection, and LangGraph.
+        Args:
+            **kwargs: Arguments for ``graph.ainvoke``.
 
         Returns:
-            None.
+            Final graph state.
         """
-        self.tools = list(local_tools)
-        await self.initialize_mcp_connection()
-        self._create_langgraph_agent(self.model_enum, self.tools, memory=self.memory)
+        generation = await self._aensure_graph()
+        graph = self.graph
+        try:
+            return await graph.ainvoke(**kwargs)
+        except MCP_CONNECTION_ERRORS as e:
+            resume = await self._can_resume(graph, kwargs.get("config"))
+            logger.warning(
+                "MCP transport failed (%s); reconnecting%s", e, " and resuming" if resume else ""
+            )
+            await self._aensure_graph(failed_generation=generation)
+            if not resume:
+                raise
+            # The checkpointer already holds this turn's input: resume from it.
+            return await self.graph.ainvoke(**{**kwargs, "input": None})
 
     async def ainvoke(self, **kwargs) -> dict:
         """
-        Async graph invocation (connects MCP if needed).
+        Async graph invocation from any event loop (connects MCP if needed).
 
         Args:
             **kwargs: Arguments for ``graph.ainvoke``.
@@ -174,37 +206,95 @@ class JarvisMcpMemoryAgent:
         Returns:
             Final graph state.
         """
-        if not self._is_connected:
-            await self.setup_mcp()
-        return await self.graph.ainvoke(**kwargs)
+        return await self.mcp_manager.arun(self._ainvoke_on_mcp_loop(**kwargs))
+
+    async def _astream_events_on_mcp_loop(self, **kwargs) -> AsyncIterator[dict]:
+        """
+        Stream graph events next to the MCP sessions (connects MCP if needed).
+
+        Args:
+            **kwargs: Arguments for ``graph.astream_events``.
+
+        Yields:
+            LangChain ``v2`` stream events.
+        """
+        await self._aensure_graph()
+        async for event in self.graph.astream_events(**kwargs, version="v2"):
+            yield event
+
+    async def astream_events(self, **kwargs) -> AsyncIterator[dict]:
+        """
+        Stream graph events to any event loop.
+
+        Args:
+            **kwargs: Arguments for ``graph.astream_events``.
+
+        Yields:
+            LangChain ``v2`` stream events.
+        """
+        async for event in self.mcp_manager.aiter(self._astream_events_on_mcp_loop(**kwargs)):
+            yield event
 
     async def aclose(self) -> None:
         """
-        Close MCP sessions and reset the connection flag.
+        Close MCP sessions; they reopen on the next invocation.
 
         Returns:
             None.
         """
-        if self.exit_stack:
-            await self.exit_stack.aclose()
-        self.exit_stack = None
-        self._is_connected = False
+        await self.mcp_manager.arun(self.mcp_manager.aclose())
 
     def invoke(self, **kwargs) -> dict:
         """
-        Synchronous wrapper that runs ainvoke and closes MCP when done.
+        Synchronous invocation that reuses the persistent MCP sessions.
 
         Args:
-            **kwargs: Arguments for ``ainvoke``.
+            **kwargs: Arguments for ``graph.ainvoke``.
 
         Returns:
             Final graph state.
         """
+        return self.mcp_manager.run(self._ainvoke_on_mcp_loop(**kwargs))
+
+    def fold_context(self, thread_id: str) -> bool:
+        """
+        Fold turns beyond the token budget into the thread summary, now.
+
+        Sync counterpart of ``afold_context``, for callers that finished the
+        thread's turn and have not started the next one.
+
+        Args:
+            thread_id: Thread to compact.
+
+        Returns:
+            True if a new summary was stored.
+        """
+        if self.token_budget is None or self.graph is None:
+            return False
+        return fold_overflow(self.graph, self.summary_llm, thread_id, self.token_budget)
+
+    async def afold_context(self, thread_id: str, admit=None) -> bool:
+        """
+        Fold turns beyond the token budget into the thread summary, now.
 
-        async def _wrapped() -> dict:
-            try:
-                return await self.ainvoke(**kwargs)
-            finally:
-                await self.aclose()
+        Meant for callers holding the thread's turn, so no turn can
+        checkpoint the thread while the summary is written.
 
-        return asyncio.run(_wrapped())
+        Args:
+            thread_id: Thread to compact.
+            admit: Factory of the admission context held during the summary call.
+
+        Returns:
+            True if a new summary was stored.
+        """
+        if self.token_budget is None or self.graph is None:
+            return False
+        return await afold_overflow(
+            self.graph, self.summary_llm, thread_id, self.token_budget, admit=admit
+        )
+
+    def cleanup(self) -> None:
+        """Close MCP sessions and stop the background loop."""
+        self.mcp_manager.shutdown()
+        # The lock belongs to the stopped loop; a new one is made on the next turn.
+        self._setup_lock = None
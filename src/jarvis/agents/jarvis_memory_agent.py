@@ -1,34 +1,45 @@
-"""LangGraph agent with memory (MemorySaver) and tools for GPT-3.5."""
+"""LangGraph agent with a persistent checkpointer and tools for GPT-3.5."""
 
+from collections.abc import AsyncIterator
 from typing import Annotated
 
-from typing_extensions import TypedDict
+from typing_extensions import NotRequired, TypedDict
 
+from jarvis.core.config import CONTEXT_TOKEN_BUDGETS
 from jarvis.core.enums import ModelEnum
-from langchain_openai import ChatOpenAI
 from langgraph.graph import StateGraph
-from langgraph.checkpoint.memory import MemorySaver
-from langgraph.prebuilt import ToolNode, tools_condition
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.prebuilt import tools_condition
 from langgraph.graph.message import add_messages
+from jarvis.agents.chatbot_node import build_chatbot_node
+from jarvis.agents.checkpointer import build_checkpointer
+from jarvis.agents.context_window import afold_overflow, fold_overflow
+from jarvis.agents.llm_cache import get_response_cache
+from jarvis.agents.openai_client import build_chat_openai
+from jarvis.agents.tool_output import build_tool_node
 from jarvis.tools.tools_registry import local_tools
 
 
 class State(TypedDict):
-    """Graph state: accumulated messages and real_name for tools."""
+    """Graph state: accumulated messages, real_name for tools, and rolling summary."""
 
     messages: Annotated[list, add_messages]
     real_name: str
+    summary: NotRequired[str]
+    summarized_through: NotRequired[str]
 
 
 class JarvisMemoryAgent:
     """
-    Agent with chatbot ↔ tools loop and in-memory checkpointer.
+    Agent with chatbot ↔ tools loop and a configurable checkpointer.
 
     Attributes:
         model_enum: Must be GPT_3_5.
         graph: Compiled graph.
-        memory: MemorySaver for per-thread_id threads.
+        memory: Checkpointer (see ``CHECKPOINTER_BACKEND``) for per-thread_id threads.
         tools: Registered local tools.
+        token_budget: Prompt token budget (``CONTEXT_TOKEN_BUDGETS``), or None.
+        summary_llm: Tool-less chat model that writes rolling summaries.
     """
 
     def __init__(self, model_enum: ModelEnum) -> None:
@@ -40,11 +51,13 @@ class JarvisMemoryAgent:
             ValueError: If the model is not GPT_3_5.
         """
         self.model_enum = model_enum
+        self.token_budget = CONTEXT_TOKEN_BUDGETS.get(model_enum)
+        self.summary_llm = None
         self.graph, self.memory, self.tools = self._build_agent(model_enum)
 
     def _build_agent(
         self, model_enum: ModelEnum
-    ) -> tuple[object, MemorySaver, list]:
+    ) -> tuple[object, BaseCheckpointSaver, list]:
         """
         Compile the StateGraph with chatbot and tools nodes.
 
@@ -52,31 +65,31 @@ class JarvisMemoryAgent:
             model_enum: LLM model.
 
         Returns:
-            Tuple (compiled graph, memory saver, tool list).
+            Tuple (compiled graph, checkpointer, tool list).
 
         Raises:
             ValueError: If model_enum is not GPT_3_5.
         """
         tools = local_tools
         if model_enum == ModelEnum.GPT_3_5:
-            llm = ChatOpenAI(model="gpt-3.5-turbo", temperature=0)
+            llm = build_chat_openai(model_enum)
         else:
             raise ValueError(f"Unsupported model: {model_enum}")
 
+        self.summary_llm = llm
         graph_builder = StateGraph(State)
         llm_with_tools = llm.bind_tools(tools)
 
-        def chatbot(state: State) -> dict:
-            return {"messages": [llm_with_tools.invoke(state["messages"])]}
-
-        graph_builder.add_node("chatbot", chatbot)
-        tool_node = ToolNode(tools=tools)
-        graph_builder.add_node("tools", tool_node)
+        graph_builder.add_node(
+            "chatbot",
+            build_chatbot_node(llm_with_tools, self.token_budget, get_response_cache()),
+        )
+        graph_builder.add_node("tools", build_tool_node(tools))
         graph_builder.add_conditional_edges("chatbot", tools_condition)
         graph_builder.add_edge("tools", "chatbot")
         graph_builder.set_entry_point("chatbot")
 
-        memory = MemorySaver()
+        memory = build_checkpointer()
         graph = graph_builder.compile(checkpointer=memory)
         return graph, memory, tools
 
@@ -92,6 +105,68 @@ class JarvisMemoryAgent:
         """
         return self.graph.invoke(**kwargs)
 
+    async def ainvoke(self, **kwargs) -> dict:
+        """
+        Async graph invocation (awaits the LLM without blocking the event loop).
+
+        Args:
+            **kwargs: ``input``, ``config``, etc.
+
+        Returns:
+            Final graph state.
+        """
+        return await self.graph.ainvoke(**kwargs)
+
+    async def astream_events(self, **kwargs) -> AsyncIterator[dict]:
+        """
+        Stream graph execution events.
+
+        Args:
+            **kwargs: ``input``, ``config``, etc.
+
+        Yields:
+            LangChain ``v2`` stream events (tokens, tool runs, chain ends).
+        """
+        async for event in self.graph.astream_events(**kwargs, version="v2"):
+            yield event
+
+    def fold_context(self, thread_id: str) -> bool:
+        """
+        Fold turns beyond the token budget into the thread summary, now.
+
+        Sync counterpart of ``afold_context``, for callers that finished the
+        thread's turn and have not started the next one.
+
+        Args:
+            thread_id: Thread to compact.
+
+        Returns:
+            True if a new summary was stored.
+        """
+        if self.token_budget is None:
+            return False
+        return fold_overflow(self.graph, self.summary_llm, thread_id, self.token_budget)
+
+    async def afold_context(self, thread_id: str, admit=None) -> bool:
+        """
+        Fold turns beyond the token budget into the thread summary, now.
+
+        Meant for callers holding the thread's turn, so no turn can
+        checkpoint the thread while the summary is written.
+
+        Args:
+            thread_id: Thread to compact.
+            admit: Factory of the admission context held during the summary call.
+
+        Returns:
+            True if a new summary was stored.
+        """
+        if self.token_budget is None:
+            return False
+        return await afold_overflow(
+            self.graph, self.summary_llm, thread_id, self.token_budget, admit=admit
+        )
+
     def cleanup(self) -> None:
         """Release agent resources (no-op)."""
         pass
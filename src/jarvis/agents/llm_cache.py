@@ -0,0 +1,285 @@
+"""Exact-match cache of chat model responses for deterministic (temperature 0) calls."""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+
+from langchain_core.messages import AIMessage, BaseMessage, message_to_dict, messages_from_dict
+from langchain_core.runnables import Runnable, RunnableConfig
+
+from jarvis.core.config import (
+    LLM_CACHE_ENABLED,
+    LLM_CACHE_MAX_ENTRIES,
+    LLM_CACHE_PERSIST,
+    LLM_CACHE_TTL_SECONDS,
+)
+from jarvis.core.paths import LLM_CACHE_DB_PATH
+from jarvis.infrastructure.persistence.sqlite import get_connection
+
+logger = logging.getLogger(__name__)
+
+BYPASS_CONFIG_KEY = "llm_cache_bypass"
+"""``configurable`` flag that skips the cache for one invocation."""
+
+
+def _normalize_message(message: BaseMessage) -> dict:
+    """Fields that determine the model's answer (ids and metadata excluded)."""
+    normalized = {"type": message.type, "content": message.content, "name": message.name}
+    if isinstance(message, AIMessage) and message.tool_calls:
+        normalized["tool_calls"] = [
+            {"name": call["name"], "args": call["args"], "id": call.get("id")}
+            for call in message.tool_calls
+        ]
+    tool_call_id = getattr(message, "tool_call_id", None)
+    if tool_call_id:
+        normalized["tool_call_id"] = tool_call_id
+    return normalized
+
+
+class LlmResponseCache:
+    """
+    Two-level response cache: in-memory LRU, optionally backed by SQLite.
+
+    Only calls to temperature-0 models are cached, and only final answers
+    (responses that request tools are always recomputed, since tool call ids
+    must stay unique within a thread). Entries expire ``ttl_seconds`` after
+    they were stored.
+
+    Attributes:
+        max_entries: In-memory LRU capacity.
+        ttl_seconds: Lifetime of an entry.
+        db_path: SQLite file of the persistent layer, or None for memory only.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        db_path: str | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Args:
+            max_entries: In-memory LRU capacity.
+            ttl_seconds: Lifetime of an entry, in seconds.
+            db_path: Optional SQLite file for a persistent second layer.
+            clock: Wall-clock time source (overridable in tests).
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.db_path = db_path
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[AIMessage, float]] = OrderedDict()
+        self._bypassed_threads: set[str] = set()
+        self._lock = threading.Lock()
+        self._counters = {"memory_hits": 0, "sqlite_hits": 0, "misses": 0, "bypassed": 0, "stores": 0}
+        if db_path:
+            conn = get_connection(db_path)
+            with conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS llm_cache ("
+                    " key TEXT PRIMARY KEY, response TEXT NOT NULL, expires_at REAL NOT NULL)"
+                    " WITHOUT ROWID"
+                )
+
+    def make_key(self, llm: Runnable, messages: list[BaseMessage]) -> str | None:
+        """
+        Hash model, normalized messages, and bound tool schemas.
+
+        Args:
+            llm: Chat model, usually a ``bind_tools`` binding.
+            messages: Messages about to be sent.
+
+        Returns:
+            Hex SHA-256 key, or None if the model is not deterministic.
+        """
+        model = getattr(llm, "bound", llm)
+        if getattr(model, "temperature", None) != 0:
+            return None
+        payload = {
+            "model": getattr(model, "model_name", None) or type(model).__name__,
+            "messages": [_normalize_message(m) for m in messages],
+            "bound": getattr(llm, "kwargs", {}),
+        }
+        encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def is_bypassed(self, config: RunnableConfig | None) -> bool:
+        """
+        Whether this invocation must skip the cache.
+
+        Args:
+            config: Runnable config of the graph node.
+
+        Returns:
+            True if the thread is bypassed or ``llm_cache_bypass`` is set.
+        """
+        configurable = (config or {}).get("configurable", {})
+        bypassed = bool(configurable.get(BYPASS_CONFIG_KEY)) or (
+            configurable.get("thread_id") in self._bypassed_threads
+        )
+        if bypassed:
+            with self._lock:
+                self._counters["bypassed"] += 1
+        return bypassed
+
+    def set_thread_bypass(self, thread_id: str, bypass: bool = True) -> None:
+        """
+        Turn the cache off (or back on) for every call of a thread.
+
+        Args:
+            thread_id: Conversation thread.
+            bypass: True to skip the cache, False to use it again.
+        """
+        with self._lock:
+            if bypass:
+                self._bypassed_threads.add(thread_id)
+            else:
+                self._bypassed_threads.discard(thread_id)
+
+    def get(self, key: str) -> AIMessage | None:
+        """
+        Look up a response in memory, then in SQLite.
+
+        Args:
+            key: Key from ``make_key``.
+
+        Returns:
+            Copy of the cached message with a fresh id, or None on a miss.
+        """
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] > now:
+                self._entries.move_to_end(key)
+                self._counters["memory_hits"] += 1
+                return self._fresh_copy(entry[0])
+            if entry is not None:
+                del self._entries[key]
+
+        message = self._sqlite_get(key, now)
+        with self._lock:
+            if message is None:
+                self._counters["misses"] += 1
+                return None
+            self._counters["sqlite_hits"] += 1
+        self._remember(key, message[0], message[1])
+        return self._fresh_copy(message[0])
+
+    def put(self, key: str, message: BaseMessage) -> bool:
+        """
+        Store a final answer in every layer.
+
+        Args:
+            key: Key from ``make_key``.
+            message: Model response.
+
+        Returns:
+            True if stored; False for tool-calling or empty responses.
+        """
+        if not isinstance(message, AIMessage) or message.tool_calls or not message.content:
+            return False
+        expires_at = self._clock() + self.ttl_seconds
+        self._remember(key, message, expires_at)
+        if self.db_path:
+            try:
+                conn = get_connection(self.db_path)
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO llm_cache (key, response, expires_at) VALUES (?, ?, ?)",
+                        (key, json.dumps(message_to_dict(message), ensure_ascii=False), expires_at),
+                    )
+            except Exception as e:
+                logger.warning("Failed to persist LLM cache entry: %s", e)
+        with self._lock:
+            self._counters["stores"] += 1
+        return True
+
+    def clear(self) -> None:
+        """Drop every entry from both layers (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+        if self.db_path:
+            conn = get_connection(self.db_path)
+            with conn:
+                conn.execute("DELETE FROM llm_cache")
+
+    def stats(self) -> dict:
+        """
+        Summarize size and hit-rate counters.
+
+        Returns:
+            Dict with ``size``, ``max_entries``, ``ttl_seconds``, ``persistent``,
+            ``memory_hits``, ``sqlite_hits``, ``misses``, ``bypassed``,
+            ``stores``, and ``hit_ratio``.
+        """
+        with self._lock:
+            counters = dict(self._counters)
+            size = len(self._entries)
+        hits = counters["memory_hits"] + counters["sqlite_hits"]
+        lookups = hits + counters["misses"]
+        return {
+            "size": size,
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "persistent": self.db_path is not None,
+            **counters,
+            "hit_ratio": round(hits / lookups, 4) if lookups else 0.0,
+        }
+
+    def _remember(self, key: str, message: AIMessage, expires_at: float) -> None:
+        """Insert into the in-memory LRU, evicting the oldest entries over capacity."""
+        with self._lock:
+            self._entries[key] = (message, expires_at)
+            self._entries.move_to_end(key)
+            while self.max_entries > 0 and len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _sqlite_get(self, key: str, now: float) -> tuple[AIMessage, float] | None:
+        """Read a live entry from the SQLite layer, if enabled."""
+        if not self.db_path:
+            return None
+        try:
+            row = get_connection(self.db_path).execute(
+                "SELECT response, expires_at FROM llm_cache WHERE key = ? AND expires_at > ?",
+                (key, now),
+            ).fetchone()
+        except Exception as e:
+            logger.warning("Failed to read LLM cache entry: %s", e)
+            return None
+        if row is None:
+            return None
+        return messages_from_dict([json.loads(row[0])])[0], row[1]
+
+    @staticmethod
+    def _fresh_copy(message: AIMessage) -> AIMessage:
+        """Copy without id, so ``add_messages`` appends it instead of replacing."""
+        return message.model_copy(update={"id": None})
+
+
+_response_cache: LlmResponseCache | None = None
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> LlmResponseCache | None:
+    """
+    Return the process-wide response cache when ``LLM_CACHE_ENABLED`` is set.
+
+    Returns:
+        Shared LlmResponseCache, or None if caching is disabled.
+    """
+    global _response_cache
+    if not LLM_CACHE_ENABLED:
+        return None
+    with _response_cache_lock:
+        if _response_cache is None:
+            _response_cache = LlmResponseCache(
+                max_entries=LLM_CACHE_MAX_ENTRIES,
+                ttl_seconds=LLM_CACHE_TTL_SECONDS,
+                db_path=str(LLM_CACHE_DB_PATH) if LLM_CACHE_PERSIST else None,
+            )
+        return _response_cache
@@ -0,0 +1,319 @@
+"""Long-lived MCP client sessions hosted on a dedicated background event loop."""
+
+import asyncio
+import atexit
+import concurrent.futures
+import json
+import logging
+import os
+import threading
+from collections.abc import AsyncIterator, Coroutine
+from contextlib import AsyncExitStack
+from pathlib import Path
+from typing import Any, TypeVar
+
+import anyio
+from langchain_mcp_adapters.tools import load_mcp_tools
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+from mcp.shared.exceptions import McpError
+
+from jarvis.core.paths import MCP_DIR, MCP_SERVER_CONFIG_PATH
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+MCP_CONNECTION_ERRORS: tuple[type[BaseException], ...] = (
+    anyio.ClosedResourceError,
+    anyio.BrokenResourceError,
+    anyio.EndOfStream,
+    ConnectionError,
+    EOFError,
+    McpError,
+)
+"""Exceptions that indicate a dead MCP transport and warrant a reconnect."""
+
+
+def resolve_mcp_server_config(server_config: dict) -> dict:
+    """
+    Normalize MCP server config paths relative to ``MCP_DIR``.
+
+    Args:
+        server_config: Raw entry from ``server_config.json``.
+
+    Returns:
+        Config with absolute paths in ``args`` when they reference local scripts.
+    """
+    resolved = dict(server_config)
+    args = list(resolved.get("args", []))
+    normalized: list[str] = []
+    for arg in args:
+        if isinstance(arg, str) and arg.endswith(".py") and not os.path.isabs(arg):
+            normalized.append(str((MCP_DIR / arg).resolve()))
+        else:
+            normalized.append(arg)
+    resolved["args"] = normalized
+    return resolved
+
+
+class McpSessionManager:
+    """
+    Keep MCP server processes and ``ClientSession`` objects alive across turns.
+
+    All MCP I/O runs on a private event loop in a daemon thread, so the stdio
+    transports outlive any single ``asyncio.run`` or request loop. Connections
+    are owned by a single long-running task (anyio cancel scopes must be
+    entered and exited by the same task) that closes them when asked to
+    reconnect or shut down.
+
+    Attributes:
+        config_path: Path to the ``mcpServers`` JSON configuration.
+        generation: Number of connections opened so far; changes on every
+            (re)connect, so callers can tell whether a failure they saw is
+            already being handled.
+    """
+
+    def __init__(self, config_path: Path = MCP_SERVER_CONFIG_PATH) -> None:
+        """
+        Args:
+            config_path: MCP server configuration file.
+        """
+        self.config_path = config_path
+        self.generation = 0
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._lifecycle_lock = threading.Lock()
+        self._connect_lock: asyncio.Lock | None = None
+        self._owner_task: asyncio.Task | None = None
+        self._close_event: asyncio.Event | None = None
+        self._tools: list = []
+        self._atexit_registered = False
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """Background event loop, started on first access."""
+        self._ensure_loop()
+        return self._loop
+
+    @property
+    def is_connected(self) -> bool:
+        """Whether the owner task is alive and holding open sessions."""
+        return self._owner_task is not None and not self._owner_task.done()
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> concurrent.futures.Future:
+        """
+        Schedule a coroutine on the background loop.
+
+        Args:
+            coro: Coroutine to run next to the MCP sessions.
+
+        Returns:
+            Thread-safe future with the coroutine result.
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """
+        Run a coroutine on the background loop and block until it finishes.
+
+        Args:
+            coro: Coroutine to run.
+
+        Returns:
+            Coroutine result.
+        """
+        return self.submit(coro).result()
+
+    async def arun(self, coro: Coroutine[Any, Any, T]) -> T:
+        """
+        Await a coroutine on the background loop from any other event loop.
+
+        Args:
+            coro: Coroutine to run.
+
+        Returns:
+            Coroutine result.
+        """
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            return await coro
+        return await asyncio.wrap_future(self.submit(coro))
+
+    async def aiter(self, iterator: AsyncIterator[T]) -> AsyncIterator[T]:
+        """
+        Consume an async iterator on the background loop and relay its items.
+
+        Args:
+            iterator: Async iterator that must run next to the MCP sessions.
+
+        Yields:
+            Items produced by ``iterator``, in order, on the caller's loop.
+        """
+        running = asyncio.get_running_loop()
+        if running is self._loop:
+            async for item in iterator:
+                yield item
+            return
+
+        queue: asyncio.Queue = asyncio.Queue()
+        finished = object()
+
+        async def _pump() -> None:
+            try:
+                async for item in iterator:
+                    running.call_soon_threadsafe(queue.put_nowait, (item, None))
+            except BaseException as e:
+                running.call_soon_threadsafe(queue.put_nowait, (finished, e))
+                raise
+            running.call_soon_threadsafe(queue.put_nowait, (finished, None))
+
+        future = self.submit(_pump())
+        try:
+            while True:
+                item, error = await queue.get()
+                if item is finished:
+                    if error is not None:
+                        raise error
+                    return
+                yield item
+        finally:
+            future.cancel()
+
+    async def aget_tools(self) -> list:
+        """
+        Connect if needed and return the MCP tools (must run on the background loop).
+
+        Returns:
+            LangChain tools bound to the live MCP sessions.
+        """
+        async with self._get_connect_lock():
+            if not self.is_connected:
+                await self._aconnect()
+            return list(self._tools)
+
+    async def areconnect(self) -> list:
+        """
+        Close every session and reconnect (must run on the background loop).
+
+        Returns:
+            Fresh tool list bound to the new sessions.
+        """
+        async with self._get_connect_lock():
+            await self._aclose_sessions()
+            await self._aconnect()
+            return list(self._tools)
+
+    async def aclose(self) -> None:
+        """Close every MCP session (must run on the background loop)."""
+        async with self._get_connect_lock():
+            await self._aclose_sessions()
+
+    def shutdown(self) -> None:
+        """
+        Close sessions, stop the background loop, and join its thread.
+
+        Returns:
+            None. Safe to call more than once.
+        """
+        with self._lifecycle_lock:
+            loop, thread = self._loop, self._thread
+            if loop is None or not loop.is_running():
+                return
+            try:
+                asyncio.run_coroutine_threadsafe(self.aclose(), loop).result(timeout=10)
+            except Exception as e:
+                logger.warning("Error while closing MCP sessions: %s", e)
+            loop.call_soon_threadsafe(loop.stop)
+            if thread is not None:
+                thread.join(timeout=10)
+            loop.close()
+            self._loop = None
+            self._thread = None
+            self._connect_lock = None
+
+    def _ensure_loop(self) -> None:
+        """Start the background loop thread if it is not running."""
+        with self._lifecycle_lock:
+            if self._loop is not None and self._loop.is_running():
+                return
+            loop = asyncio.new_event_loop()
+            started = threading.Event()
+
+            def _run() -> None:
+                asyncio.set_event_loop(loop)
+                loop.call_soon(started.set)
+                loop.run_forever()
+
+            self._thread = threading.Thread(target=_run, name="jarvis-mcp-loop", daemon=True)
+            self._thread.start()
+            started.wait()
+            self._loop = loop
+            if not self._atexit_registered:
+                atexit.register(self.shutdown)
+                self._atexit_registered = True
+
+    def _get_connect_lock(self) -> asyncio.Lock:
+        """Lazily create the lock that serializes connect/close on the loop."""
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+        return self._connect_lock
+
+    def _read_server_configs(self) -> dict[str, dict]:
+        """Load the ``mcpServers`` section from the configuration file."""
+        with open(self.config_path, "r", encoding="utf-8") as file:
+            data = json.load(file)
+        return data.get("mcpServers", {})
+
+    async def _aconnect(self) -> None:
+        """Spawn the owner task and wait until every server is connected."""
+        ready: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._close_event = asyncio.Event()
+        self._owner_task = asyncio.create_task(self._own_sessions(ready, self._close_event))
+        self._tools = await ready
+        self.generation += 1
+        logger.info("MCP sessions ready (%d tools)", len(self._tools))
+
+    async def _aclose_sessions(self) -> None:
+        """Ask the owner task to close its sessions and wait for it."""
+        task, close_event = self._owner_task, self._close_event
+        self._owner_task = None
+        self._close_event = None
+        self._tools = []
+        if task is None:
+            return
+        if close_event is not None:
+            close_event.set()
+        try:
+            await task
+        except Exception as e:
+            logger.warning("MCP session owner exited with error: %s", e)
+
+    async def _own_sessions(self, ready: asyncio.Future, close_event: asyncio.Event) -> None:
+        """
+        Open every configured server, publish its tools, and hold them open.
+
+        Args:
+            ready: Future resolved with the tool list (or the connect error).
+            close_event: Set to close all sessions and end the task.
+        """
+        try:
+            async with AsyncExitStack() as exit_stack:
+                tools: list = []
+                for server_name, server_config in self._read_server_configs().items():
+                    server_params = StdioServerParameters(**resolve_mcp_server_config(server_config))
+                    read, write = await exit_stack.enter_async_context(stdio_client(server_params))
+                    session = await exit_stack.enter_async_context(ClientSession(read, write))
+                    await session.initialize()
+                    tools.extend(await load_mcp_tools(session))
+                    logger.info("Connected to MCP server %s", server_name)
+                ready.set_result(tools)
+                await close_event.wait()
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                logger.error("MCP sessions closed unexpectedly: %s", e)
@@ -0,0 +1,315 @@
+"""OpenAI chat models whose HTTP calls are rate limited and retried client-side."""
+
+import asyncio
+import json
+import logging
+import time
+from collections.abc import AsyncIterator, Iterator
+
+import httpx
+from langchain_openai import ChatOpenAI
+from openai import DefaultAsyncHttpxClient, DefaultHttpxClient
+
+from jarvis.agents.rate_limit import (
+    ModelRateLimiter,
+    backoff_delay,
+    get_rate_limiter,
+    parse_retry_after,
+)
+from jarvis.core.config import LLM_COMPLETION_TOKENS_ESTIMATE, LLM_MAX_RETRIES
+from jarvis.core.enums import ModelEnum
+
+logger = logging.getLogger(__name__)
+
+OPENAI_MODEL_NAMES: dict[ModelEnum, str] = {ModelEnum.GPT_3_5: "gpt-3.5-turbo"}
+"""OpenAI model behind each ModelEnum served by ``ChatOpenAI``."""
+
+_COMPLETIONS_PATH = "/chat/completions"
+_USAGE_TAIL_BYTES = 8192
+
+
+def _is_retryable(status_code: int) -> bool:
+    """Statuses the OpenAI SDK itself would retry: timeouts, conflicts, 429, and 5xx."""
+    return status_code in (408, 409, 429) or status_code >= 500
+
+
+def _is_completion(request: httpx.Request) -> bool:
+    """Whether ``request`` is a chat completion (the only calls that are limited)."""
+    return request.method == "POST" and request.url.path.endswith(_COMPLETIONS_PATH)
+
+
+def estimate_request_tokens(request: httpx.Request) -> int:
+    """
+    Estimate the tokens a chat completion will consume.
+
+    The prompt side is approximated from the JSON body size (about four
+    bytes per token, tool schemas included); the completion side is the
+    request's ``max_completion_tokens`` / ``max_tokens`` or
+    ``LLM_COMPLETION_TOKENS_ESTIMATE``.
+
+    Args:
+        request: Outgoing chat completion request.
+
+    Returns:
+        Estimated total tokens.
+    """
+    body = request.content
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        payload = {}
+    completion = (
+        payload.get("max_completion_tokens")
+        or payload.get("max_tokens")
+        or LLM_COMPLETION_TOKENS_ESTIMATE
+    )
+    return len(body) // 4 + completion
+
+
+def _usage_tokens(payload: dict) -> int | None:
+    """``usage.total_tokens`` of a completion or final stream chunk, if present."""
+    usage = payload.get("usage") if isinstance(payload, dict) else None
+    if not usage:
+        return None
+    return usage.get("total_tokens")
+
+
+def _usage_from_stream_tail(tail: bytes) -> int | None:
+    """Find the usage chunk among the last Server-Sent Events of a stream."""
+    for line in reversed(tail.decode("utf-8", errors="ignore").splitlines()):
+        if not line.startswith("data: {") or '"usage"' not in line:
+            continue
+        try:
+            tokens = _usage_tokens(json.loads(line[len("data: "):]))
+        except ValueError:
+            continue
+        if tokens is not None:
+            return tokens
+    return None
+
+
+class _UsageTap:
+    """Keeps the tail of a streamed body and reconciles its usage when it closes."""
+
+    def __init__(self, limiter: ModelRateLimiter, estimate: int) -> None:
+        self.limiter = limiter
+        self.estimate = estimate
+        self.tail = b""
+        self.done = False
+
+    def feed(self, chunk: bytes) -> None:
+        self.tail = (self.tail + chunk)[-_USAGE_TAIL_BYTES:]
+
+    def finish(self) -> None:
+        if self.done:
+            return
+        self.done = True
+        tokens = _usage_from_stream_tail(self.tail)
+        if tokens is not None:
+            self.limiter.reconcile(self.estimate, tokens)
+
+
+class _TappedStream(httpx.SyncByteStream):
+    def __init__(self, stream: httpx.SyncByteStream, tap: _UsageTap) -> None:
+        self._stream = stream
+        self._tap = tap
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self._stream:
+            self._tap.feed(chunk)
+            yield chunk
+
+    def close(self) -> None:
+        self._tap.finish()
+        self._stream.close()
+
+
+class _AsyncTappedStream(httpx.AsyncByteStream):
+    def __init__(self, stream: httpx.AsyncByteStream, tap: _UsageTap) -> None:
+        self._stream = stream
+        self._tap = tap
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            self._tap.feed(chunk)
+            yield chunk
+
+    async def aclose(self) -> None:
+        self._tap.finish()
+        await self._stream.aclose()
+
+
+def _is_plain_stream(response: httpx.Response) -> bool:
+    """Uncompressed Server-Sent Events (the body can be scanned for usage as it passes)."""
+    content_type = response.headers.get("content-type", "")
+    return content_type.startswith("text/event-stream") and not response.headers.get("content-encoding")
+
+
+class _RetryPolicy:
+    """Decisions shared by the sync and async transports."""
+
+    def __init__(self, limiter: ModelRateLimiter, max_retries: int) -> None:
+        self.limiter = limiter
+        self.max_retries = max_retries
+
+    def failed_delay(self, attempt: int, estimate: int, response: httpx.Response | None) -> float:
+        """Refund a failed attempt and compute the wait before the next one."""
+        self.limiter.reconcile(estimate, 0)
+        retry_after = parse_retry_after(response.headers) if response is not None else None
+        delay = backoff_delay(attempt, retry_after)
+        if response is not None and response.status_code == 429:
+            self.limiter.backoff(retry_after if retry_after is not None else delay)
+        self.limiter.record_retry()
+        logger.warning(
+            "OpenAI call failed (%s), retry %d/%d in %.2f s",
+            response.status_code if response is not None else "connection error",
+            attempt + 1,
+            self.max_retries,
+            delay,
+        )
+        return delay
+
+    def reconcile_json(self, response: httpx.Response, estimate: int) -> None:
+        """Correct the token reservation from a JSON completion's ``usage``."""
+        try:
+            tokens = _usage_tokens(response.json())
+        except ValueError:
+            tokens = None
+        if tokens is not None:
+            self.limiter.reconcile(estimate, tokens)
+
+
+class RateLimitedTransport(httpx.BaseTransport):
+    """
+    Sync transport that paces chat completions and retries 429/5xx responses.
+
+    Every attempt first waits for the model's ``ModelRateLimiter``. Retryable
+    failures back off with jitter (honouring ``Retry-After``); after
+    ``max_retries`` the last response is returned for the SDK to raise.
+    """
+
+    def __init__(
+        self,
+        limiter: ModelRateLimiter,
+        transport: httpx.BaseTransport | None = None,
+        max_retries: int = LLM_MAX_RETRIES,
+    ) -> None:
+        """
+        Args:
+            limiter: Shared limiter of the model.
+            transport: Transport that sends the requests (default ``httpx.HTTPTransport``).
+            max_retries: Retries after the first attempt.
+        """
+        self._transport = transport or httpx.HTTPTransport()
+        self._policy = _RetryPolicy(limiter, max_retries)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if not _is_completion(request):
+            return self._transport.handle_request(request)
+        limiter = self._policy.limiter
+        estimate = estimate_request_tokens(request)
+        for attempt in range(self._policy.max_retries + 1):
+            time.sleep(limiter.reserve(estimate))
+            try:
+                response = self._transport.handle_request(request)
+            except httpx.TransportError:
+                if attempt == self._policy.max_retries:
+                    raise
+                time.sleep(self._policy.failed_delay(attempt, estimate, None))
+                continue
+            if _is_retryable(response.status_code) and attempt < self._policy.max_retries:
+                response.close()
+                time.sleep(self._policy.failed_delay(attempt, estimate, response))
+                continue
+            break
+        if _is_plain_stream(response):
+            response.stream = _TappedStream(response.stream, _UsageTap(limiter, estimate))
+        elif response.is_success:
+            response.read()
+            self._policy.reconcile_json(response, estimate)
+        return response
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncRateLimitedTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of ``RateLimitedTransport`` (sleeps without blocking the loop)."""
+
+    def __init__(
+        self,
+        limiter: ModelRateLimiter,
+        transport: httpx.AsyncBaseTransport | None = None,
+        max_retries: int = LLM_MAX_RETRIES,
+    ) -> None:
+        """
+        Args:
+            limiter: Shared limiter of the model.
+            transport: Transport that sends the requests (default ``httpx.AsyncHTTPTransport``).
+            max_retries: Retries after the first attempt.
+        """
+        self._transport = transport or httpx.AsyncHTTPTransport()
+        self._policy = _RetryPolicy(limiter, max_retries)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if not _is_completion(request):
+            return await self._transport.handle_async_request(request)
+        limiter = self._policy.limiter
+        estimate = estimate_request_tokens(request)
+        for attempt in range(self._policy.max_retries + 1):
+            await asyncio.sleep(limiter.reserve(estimate))
+            try:
+                response = await self._transport.handle_async_request(request)
+            except httpx.TransportError:
+                if attempt == self._policy.max_retries:
+                    raise
+                await asyncio.sleep(self._policy.failed_delay(attempt, estimate, None))
+                continue
+            if _is_retryable(response.status_code) and attempt < self._policy.max_retries:
+                await response.aclose()
+                await asyncio.sleep(self._policy.failed_delay(attempt, estimate, response))
+                continue
+            break
+        if _is_plain_stream(response):
+            response.stream = _AsyncTappedStream(response.stream, _UsageTap(limiter, estimate))
+        elif response.is_success:
+            await response.aread()
+            self._policy.reconcile_json(response, estimate)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def build_chat_openai(model_enum: ModelEnum, **kwargs) -> ChatOpenAI:
+    """
+    Build the ``ChatOpenAI`` of a model with client-side rate limiting.
+
+    The SDK's own retries are disabled (``max_retries=0``); the transports
+    retry instead, after waiting for the model's shared limiter, so retries
+    count against the same RPM/TPM budget as first attempts. ``stream_usage``
+    is enabled so streamed calls also report their real token usage. The
+    endpoint honours ``OPENAI_BASE_URL`` like any OpenAI client.
+
+    Args:
+        model_enum: Model served by OpenAI (see ``OPENAI_MODEL_NAMES``).
+        **kwargs: Extra ``ChatOpenAI`` arguments (defaults: ``temperature=0``).
+
+    Returns:
+        Configured ChatOpenAI.
+
+    Raises:
+        ValueError: If the model is not an OpenAI model.
+    """
+    if model_enum not in OPENAI_MODEL_NAMES:
+        raise ValueError(f"Unsupported model: {model_enum}")
+    kwargs.setdefault("temperature", 0)
+    limiter = get_rate_limiter(model_enum)
+    if limiter is not None:
+        kwargs.setdefault("max_retries", 0)
+        kwargs.setdefault("stream_usage", True)
+        kwargs.setdefault("http_client", DefaultHttpxClient(transport=RateLimitedTransport(limiter)))
+        kwargs.setdefault(
+            "http_async_client", DefaultAsyncHttpxClient(transport=AsyncRateLimitedTransport(limiter))
+        )
+    return ChatOpenAI(model=OPENAI_MODEL_NAMES[model_enum], **kwargs)
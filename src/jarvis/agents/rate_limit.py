@@ -0,0 +1,277 @@
+"""Client-side request and token rate limiting with jittered exponential backoff."""
+
+import random
+import threading
+import time
+from collections.abc import Callable
+from email.utils import parsedate_to_datetime
+
+from jarvis.core.config import (
+    LLM_BACKOFF_BASE_SECONDS,
+    LLM_BACKOFF_MAX_SECONDS,
+    LLM_REQUESTS_PER_MINUTE,
+    LLM_TOKENS_PER_MINUTE,
+)
+from jarvis.core.enums import ModelEnum
+
+
+class TokenBucket:
+    """
+    Bucket refilled continuously up to one minute's worth of units.
+
+    Reservations may overdraw the bucket: the caller is told how long to wait
+    until its units would have been refilled, so concurrent callers line up
+    in reservation order instead of polling.
+
+    Attributes:
+        per_minute: Refill rate, which is also the bucket capacity.
+    """
+
+    def __init__(self, per_minute: float, clock: Callable[[], float] = time.monotonic) -> None:
+        """
+        Args:
+            per_minute: Units refilled per minute (and bucket capacity).
+            clock: Monotonic time source (overridable in tests).
+        """
+        self.per_minute = per_minute
+        self._clock = clock
+        self._level = float(per_minute)
+        self._updated = clock()
+
+    @property
+    def level(self) -> float:
+        """Units currently available (negative while overdrawn)."""
+        self._refill()
+        return self._level
+
+    def reserve(self, amount: float) -> float:
+        """
+        Take ``amount`` units, possibly from future refills.
+
+        Args:
+            amount: Units to consume.
+
+        Returns:
+            Seconds to wait before the units are actually available.
+        """
+        self._refill()
+        self._level -= amount
+        return 0.0 if self._level >= 0 else -self._level * 60 / self.per_minute
+
+    def adjust(self, delta: float) -> None:
+        """
+        Consume ``delta`` more units (or give back ``-delta``), without waiting.
+
+        Args:
+            delta: Correction to a previous reservation.
+        """
+        self._refill()
+        self._level = min(float(self.per_minute), self._level - delta)
+
+    def pause(self, seconds: float) -> None:
+        """
+        Make the bucket empty for at least ``seconds``.
+
+        Args:
+            seconds: Time during which new reservations must wait.
+        """
+        self._refill()
+        self._level = min(self._level, -seconds * self.per_minute / 60)
+
+    def _refill(self) -> None:
+        """Add the units accrued since the last update."""
+        now = self._clock()
+        elapsed = now - self._updated
+        self._updated = now
+        self._level = min(float(self.per_minute), self._level + elapsed * self.per_minute / 60)
+
+
+class ModelRateLimiter:
+    """
+    Requests-per-minute and tokens-per-minute budget shared by every caller of a model.
+
+    A call reserves one request and an estimate of its tokens up front. Once
+    the response reports its real ``usage``, ``reconcile`` corrects the
+    token bucket. A provider 429 pauses both buckets, so every caller
+    backs off together instead of retrying into the limit.
+
+    Attributes:
+        requests: Requests-per-minute bucket.
+        tokens: Tokens-per-minute bucket.
+        throttled: Number of 429 responses received.
+        retries: Number of retried calls.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int,
+        tokens_per_minute: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Args:
+            requests_per_minute: Provider RPM limit.
+            tokens_per_minute: Provider TPM limit.
+            clock: Monotonic time source (overridable in tests).
+        """
+        self.requests = TokenBucket(requests_per_minute, clock)
+        self.tokens = TokenBucket(tokens_per_minute, clock)
+        self._lock = threading.Lock()
+        self.throttled = 0
+        self.retries = 0
+
+    def reserve(self, estimated_tokens: int) -> float:
+        """
+        Reserve one request and ``estimated_tokens`` tokens.
+
+        Args:
+            estimated_tokens: Prompt plus expected completion tokens.
+
+        Returns:
+            Seconds to wait before sending the request.
+        """
+        with self._lock:
+            return max(self.requests.reserve(1), self.tokens.reserve(estimated_tokens))
+
+    def reconcile(self, estimated_tokens: int, actual_tokens: int) -> None:
+        """
+        Replace a reservation's token estimate with the tokens actually used.
+
+        Args:
+            estimated_tokens: Amount passed to ``reserve``.
+            actual_tokens: ``usage.total_tokens`` of the response (0 if it failed).
+        """
+        with self._lock:
+            self.tokens.adjust(actual_tokens - estimated_tokens)
+
+    def backoff(self, seconds: float) -> None:
+        """
+        Hold every caller back after the provider answered 429.
+
+        Args:
+            seconds: Time the provider asked to wait.
+        """
+        with self._lock:
+            self.throttled += 1
+            self.requests.pause(seconds)
+            self.tokens.pause(seconds)
+
+    def record_retry(self) -> None:
+        """Count a call that is about to be retried."""
+        with self._lock:
+            self.retries += 1
+
+    def stats(self) -> dict:
+        """
+        Summarize the limiter.
+
+        Returns:
+            Dict with limits, currently available requests and tokens, and counters.
+        """
+        with self._lock:
+            return {
+                "requests_per_minute": self.requests.per_minute,
+                "tokens_per_minute": self.tokens.per_minute,
+                "available_requests": round(self.requests.level, 1),
+                "available_tokens": round(self.tokens.level),
+                "throttled": self.throttled,
+                "retries": self.retries,
+            }
+
+
+def parse_retry_after(headers) -> float | None:
+    """
+    Read the wait a provider asked for.
+
+    Args:
+        headers: Response headers (``retry-after-ms`` or ``retry-after``,
+            in seconds or as an HTTP date).
+
+    Returns:
+        Seconds to wait, or None if absent or unparseable.
+    """
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            return max(0.0, float(retry_after_ms) / 1000)
+        except ValueError:
+            pass
+    retry_after = headers.get("retry-after")
+    if not retry_after:
+        return None
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(
+    attempt: int,
+    retry_after: float | None = None,
+    base: float = LLM_BACKOFF_BASE_SECONDS,
+    cap: float = LLM_BACKOFF_MAX_SECONDS,
+    rng: Callable[[], float] = random.random,
+) -> float:
+    """
+    Delay before retry number ``attempt + 1``.
+
+    Without a ``Retry-After`` hint this is "full jitter" exponential backoff,
+    uniform in ``[0, min(cap, base * 2**attempt)]``. With a hint, the hint is
+    honoured and a little jitter (up to ``base``) is added, so clients told
+    the same time do not all retry at once.
+
+    Args:
+        attempt: Zero-based number of the failed attempt.
+        retry_after: Seconds requested by the provider, if any.
+        base: First backoff step, in seconds.
+        cap: Maximum backoff without a hint, in seconds.
+        rng: Uniform [0, 1) source (overridable in tests).
+
+    Returns:
+        Seconds to sleep.
+    """
+    if retry_after is not None:
+        return retry_after + rng() * base
+    return rng() * min(cap, base * 2 ** attempt)
+
+
+_limiters: dict[ModelEnum, ModelRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(model: ModelEnum) -> ModelRateLimiter | None:
+    """
+    Return the process-wide limiter of a model.
+
+    Args:
+        model: Model whose provider limits apply.
+
+    Returns:
+        Shared ModelRateLimiter, or None if ``LLM_REQUESTS_PER_MINUTE`` or
+        ``LLM_TOKENS_PER_MINUTE`` has no entry for the model.
+    """
+    if model not in LLM_REQUESTS_PER_MINUTE or model not in LLM_TOKENS_PER_MINUTE:
+        return None
+    with _limiters_lock:
+        limiter = _limiters.get(model)
+        if limiter is None:
+            limiter = _limiters[model] = ModelRateLimiter(
+                LLM_REQUESTS_PER_MINUTE[model], LLM_TOKENS_PER_MINUTE[model]
+            )
+        return limiter
+
+
+def get_rate_limiter_stats() -> dict:
+    """
+    Counters of every limiter created so far.
+
+    Returns:
+        Dict keyed by model name with ``ModelRateLimiter.stats`` output.
+    """
+    with _limiters_lock:
+        limiters = dict(_limiters)
+    return {model.name: limiter.stats() for model, limiter in limiters.items()}
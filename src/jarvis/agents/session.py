@@ -1,14 +1,32 @@
 """Chat session orchestration, agent cache, and LLM invocation."""
 
+import asyncio
 import json
 import logging
+import threading
+from collections.abc import AsyncIterator
 
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
 
 logger = logging.getLogger(__name__)
 
+from jarvis.agents.admission import get_admission_scheduler
+from jarvis.agents.checkpointer import is_durable_checkpointer, latest_checkpoint_id
 from jarvis.agents.factory import build_agent, models_with_memory
-from jarvis.core.config import DEFAULT_MODEL, IDENTIFICATION_FAILED_PROTOCOL
+from jarvis.agents.llm_cache import get_response_cache
+from jarvis.agents.rate_limit import get_rate_limiter_stats
+from jarvis.agents.session_cache import SessionCache
+from jarvis.agents.session_store import get_session_store
+from jarvis.agents.turn_queue import ThreadBusyError, TurnQueue
+from jarvis.core.config import (
+    DEFAULT_MODEL,
+    IDENTIFICATION_FAILED_PROTOCOL,
+    SESSION_CACHE_MAX_ENTRIES,
+    SESSION_CACHE_TTL_SECONDS,
+    TURN_COALESCE_DUPLICATES,
+    TURN_COALESCE_WINDOW_SECONDS,
+    TURN_QUEUE_MAX_DEPTH,
+)
 from jarvis.domain.chat.chat_state import (
     ChatState,
     compute_next_chat_state,
@@ -21,11 +39,61 @@ from jarvis.domain.users.prompts import (
     get_welcome_message,
 )
 from jarvis.core.enums import ModelEnum
+from jarvis.infrastructure.persistence.session_store import SessionStore
 
 not_verbosed_tools = ["get_upcoming_events_tool"]
 
-_sessions_cache: dict[tuple[ModelEnum, str], "JarvisSession"] = {}
+
+def _on_session_evicted(session_key: tuple[ModelEnum, str], session: "JarvisSession") -> None:
+    """
+    Drop the in-memory checkpointer thread of a session evicted from the cache.
+
+    Durable (disk-backed) threads are kept so the conversation resumes when the
+    session is recreated; their size is bounded by the checkpointer's vacuum.
+
+    Args:
+        session_key: Evicted ``(model, thread_id)`` key.
+        session: Evicted session instance.
+
+    Returns:
+        None.
+    """
+    model, thread_id = session_key
+    logger.info("Evicting session for thread %s with model %s", thread_id, model.name)
+    memory = getattr(session.agent, "memory", None)
+    if memory and not is_durable_checkpointer(memory):
+        try:
+            memory.delete_thread(thread_id)
+        except Exception as e:
+            logger.error("Failed to delete thread %s on eviction: %s", thread_id, e)
+
+
+_sessions_cache: SessionCache[tuple[ModelEnum, str], "JarvisSession"] = SessionCache(
+    max_entries=SESSION_CACHE_MAX_ENTRIES,
+    ttl_seconds=SESSION_CACHE_TTL_SECONDS,
+    on_evict=_on_session_evicted,
+)
 _agents_cache: dict[ModelEnum, object] = {}
+_agents_build_lock = threading.Lock()
+
+
+def get_agent(model: ModelEnum) -> object:
+    """
+    Return the shared agent of a model, building it on first use.
+
+    Args:
+        model: Model whose agent is needed.
+
+    Returns:
+        Agent instance (Basic, Memory, or MCP).
+    """
+    agent = _agents_cache.get(model)
+    if agent is None:
+        with _agents_build_lock:
+            agent = _agents_cache.get(model)
+            if agent is None:
+                agent = _agents_cache[model] = build_agent(model)
+    return agent
 
 
 def get_cache_status() -> dict:
@@ -34,14 +102,23 @@ def get_cache_status() -> dict:
 
     Returns:
         Dict with keys ``agents_cache_count``, ``sessions_cache_count``,
-        ``agent_models`` (names), and ``sessions`` (model/thread pairs).
+        ``agent_models`` (names), ``sessions`` (model/thread pairs),
+        ``sessions_cache_stats`` (limits plus hit/miss/eviction counters),
+        ``llm_cache_stats`` (response cache counters, None when disabled),
+        ``admission_stats`` (per-model slots, queue lengths and waits), and
+        ``rate_limit_stats`` (per-model RPM/TPM budget and 429/retry counters).
     """
     sessions = [(key[0].name, key[1]) for key in _sessions_cache.keys()]
+    response_cache = get_response_cache()
     return {
         "agents_cache_count": len(_agents_cache),
-        "sessions_cache_count": len(_sessions_cache),
+        "sessions_cache_count": len(sessions),
         "agent_models": [model.name for model in _agents_cache.keys()],
         "sessions": list(map(str, sessions)),
+        "sessions_cache_stats": _sessions_cache.stats(),
+        "llm_cache_stats": response_cache.stats() if response_cache else None,
+        "admission_stats": get_admission_scheduler().stats(),
+        "rate_limit_stats": get_rate_limiter_stats(),
     }
 
 
@@ -56,9 +133,36 @@ def check_individual_session_cache_exists(
         model: Model associated with the session.
 
     Returns:
-        True if key (model, thread_id) is in the cache.
+        True if key (model, thread_id) is in this worker's cache or in the
+        shared session store.
+    """
+    if (model, thread_id) in _sessions_cache:
+        return True
+    store = get_session_store()
+    try:
+        return store is not None and store.get(model.name, thread_id) is not None
+    except Exception as e:
+        logger.error("Failed to read session store for thread %s: %s", thread_id, e)
+        return False
+
+
+def _get_or_create_session(
+    model: ModelEnum, thread_id: str, user_info: dict | None
+) -> "JarvisSession":
+    """
+    Return the cached session for ``(model, thread_id)`` or create it.
+
+    Args:
+        model: LLM model of the session.
+        thread_id: Thread / session identifier.
+        user_info: Authenticated user dict used when creating the session.
+
+    Returns:
+        Cached or new JarvisSession.
     """
-    return (model, thread_id) in _sessions_cache
+    return _sessions_cache.get_or_create(
+        (model, thread_id), lambda: JarvisSession(model, thread_id, user_info)
+    )
 
 
 def ask_jarvis(
@@ -79,19 +183,96 @@ def ask_jarvis(
     Returns:
         List of response text fragments for the user.
     """
-    session_key = (model, thread_id)
-    if session_key not in _sessions_cache:
-        _sessions_cache[session_key] = JarvisSession(model, thread_id, user_info)
-    result = _sessions_cache[session_key].ask(prompt)
+    result = _get_or_create_session(model, thread_id, user_info).ask(prompt)
+
+    if isinstance(result, list):
+        return result
+    return [result]
+
+
+async def ask_jarvis_async(
+    prompt: str,
+    model: ModelEnum = DEFAULT_MODEL,
+    thread_id: str = "1",
+    user_info: dict | None = None,
+) -> list[str]:
+    """
+    Async entry point to send a message to Jarvis (used by the HTTP API).
+
+    Turns of the same thread run one at a time (see ``JarvisSession.aask``).
+    Session creation (which may build the agent) and the blocking part of
+    each turn run in worker threads, never on the event loop.
+
+    Args:
+        prompt: User message.
+        model: LLM model to use.
+        thread_id: Thread / session identifier.
+        user_info: Authenticated user dict (API); None in CLI without JWT.
+
+    Returns:
+        List of response text fragments for the user.
+
+    Raises:
+        ThreadBusyError: If the thread already has ``TURN_QUEUE_MAX_DEPTH`` turns waiting.
+    """
+    session = await asyncio.to_thread(_get_or_create_session, model, thread_id, user_info)
+    result = await session.aask(prompt)
 
     if isinstance(result, list):
         return result
     return [result]
 
 
+async def ask_jarvis_stream(
+    prompt: str,
+    model: ModelEnum = DEFAULT_MODEL,
+    thread_id: str = "1",
+    user_info: dict | None = None,
+) -> AsyncIterator[dict]:
+    """
+    Streaming entry point: yield reply events as the agent produces them.
+
+    Args:
+        prompt: User message.
+        model: LLM model to use.
+        thread_id: Thread / session identifier.
+        user_info: Authenticated user dict (API); None in CLI without JWT.
+
+    Yields:
+        Dicts ``{event, data}`` as described in ``JarvisSession.astream``.
+
+    Raises:
+        ThreadBusyError: Before the first event, if the thread's queue is full.
+    """
+    session = await asyncio.to_thread(_get_or_create_session, model, thread_id, user_info)
+    async for event in session.astream(prompt):
+        yield event
+
+
+def set_llm_cache_bypass(thread_id: str, bypass: bool = True) -> bool:
+    """
+    Make a thread skip (or use again) the LLM response cache.
+
+    Args:
+        thread_id: Conversation thread.
+        bypass: True to always call the model for this thread.
+
+    Returns:
+        False if the response cache is disabled, True otherwise.
+    """
+    response_cache = get_response_cache()
+    if response_cache is None:
+        return False
+    response_cache.set_thread_bypass(thread_id, bypass)
+    return True
+
+
 def reset_session(thread_id: str, model: ModelEnum = DEFAULT_MODEL) -> None:
     """
-    Remove the cached session and agent memory thread if applicable.
+    Remove the cached session, its shared state, and agent memory thread if applicable.
+
+    Other workers still holding the session restore the reset state on
+    their next turn.
 
     Args:
         thread_id: Thread to clear.
@@ -104,17 +285,49 @@ def reset_session(thread_id: str, model: ModelEnum = DEFAULT_MODEL) -> None:
     agent = _agents_cache.get(model)
     if agent and hasattr(agent, "memory") and agent.memory:
         agent.memory.delete_thread(thread_id)
+    store = get_session_store()
+    if store is not None:
+        store.delete(model.name, thread_id)
     _sessions_cache.pop(session_key, None)
 
 
+def shutdown_agents() -> None:
+    """
+    Release resources held by cached agents (e.g. MCP server processes).
+
+    Returns:
+        None.
+    """
+    for model, agent in list(_agents_cache.items()):
+        try:
+            agent.cleanup()
+        except Exception as e:
+            logger.error("Failed to clean up agent %s: %s", model.name, e)
+
+
 def reset_cache_global() -> None:
     """
-    Clear agent and session caches completely.
+    Clear agent and session caches completely, including durable threads
+    and the shared session store.
 
     Returns:
         None.
     """
     global _agents_cache, _sessions_cache
+    for model, agent in list(_agents_cache.items()):
+        memory = getattr(agent, "memory", None)
+        if memory and is_durable_checkpointer(memory):
+            try:
+                memory.delete_all_threads()
+            except Exception as e:
+                logger.error("Failed to clear checkpoints of %s: %s", model.name, e)
+    store = get_session_store()
+    if store is not None:
+        try:
+            store.clear()
+        except Exception as e:
+            logger.error("Failed to clear session store: %s", e)
+    shutdown_agents()
     _agents_cache.clear()
     _sessions_cache.clear()
 
@@ -171,48 +384,165 @@ def _parse_message_list(messages: list) -> list[dict]:
     return result
 
 
-def get_message_history(thread_id: str, model: ModelEnum = DEFAULT_MODEL) -> list[dict]:
+def _to_stream_event(event: dict) -> dict | None:
+    """
+    Translate a LangChain ``v2`` stream event into a client-facing event.
+
+    Tool results of ``not_verbosed_tools`` are omitted unless they report an
+    error, matching ``_parse_message_list``.
+
+    Args:
+        event: Event yielded by ``astream_events``.
+
+    Returns:
+        Dict ``{event, data}`` (``token``, ``tool_start`` or ``tool_end``),
+        or None if the event is not forwarded.
     """
-    Return parsed message history for a thread if the session is cached.
+    kind = event["event"]
+    if kind == "on_chat_model_stream":
+        content = getattr(event["data"].get("chunk"), "content", "")
+        if isinstance(content, str) and content:
+            return {"event": "token", "data": {"content": content}}
+        return None
+    if kind == "on_tool_start":
+        return {
+            "event": "tool_start",
+            "data": {"name": event["name"], "input": event["data"].get("input", {})},
+        }
+    if kind == "on_tool_end":
+        output = event["data"].get("output")
+        content = str(getattr(output, "content", output))
+        data = {"name": event["name"]}
+        if event["name"] not in not_verbosed_tools or "error" in content.lower():
+            data["output"] = content
+        return {"event": "tool_end", "data": data}
+    return None
+
+
+def _get_history_agent(thread_id: str, model: ModelEnum):
+    """
+    Agent whose checkpointer holds ``thread_id``: the cached session's, or the cached agent's.
+
+    Args:
+        thread_id: Conversation identifier.
+        model: Agent model.
+
+    Returns:
+        Agent with a ``graph``, or None if nothing is cached for the model.
+    """
+    session = _sessions_cache.get((model, thread_id))
+    if session is not None:
+        return session.agent
+    if model in models_with_memory:
+        return _agents_cache.get(model)
+    return None
+
+
+def get_history_version(thread_id: str, model: ModelEnum = DEFAULT_MODEL) -> str | None:
+    """
+    Return the latest checkpoint id of a thread, without loading its messages.
 
     Args:
         thread_id: Conversation identifier.
         model: Cached agent model.
 
     Returns:
-        List of ``{role, content}`` messages; empty if no session or on failure.
+        Checkpoint id (changes on every turn), or None if there is no history.
     """
-    logger.debug("Sessions cache: %s", _sessions_cache)
-    session_key = (model, thread_id)
-    if session_key not in _sessions_cache:
+    agent = _get_history_agent(thread_id, model)
+    memory = getattr(agent, "memory", None)
+    if not memory:
+        return None
+    try:
+        return latest_checkpoint_id(memory, thread_id)
+    except Exception as e:
+        logger.error("Failed to read history version for thread %s: %s", thread_id, e)
+        return None
+
+
+def get_message_history_page(
+    thread_id: str,
+    model: ModelEnum = DEFAULT_MODEL,
+    *,
+    before: int | None = None,
+    limit: int | None = None,
+) -> dict:
+    """
+    Return one page of parsed message history from a single state snapshot.
+
+    Only the messages in the page are converted. Pages go backwards from the
+    newest message; pass the returned ``next_before`` as ``before`` to fetch
+    the previous page.
+
+    Args:
+        thread_id: Conversation identifier.
+        model: Cached agent model.
+        before: Cursor: position of the first message *not* to include
+            (defaults to the end of the thread).
+        limit: Maximum number of stored messages in the page (all if None).
+
+    Returns:
+        Dict with ``messages`` (``{role, content}`` list), ``next_before``
+        (cursor of the previous page, or None when there is none), and
+        ``version`` (checkpoint id of the snapshot, or None).
+    """
+    empty = {"messages": [], "next_before": None, "version": None}
+    agent = _get_history_agent(thread_id, model)
+    if agent is None:
         logger.warning(
             "No session found for thread %s with model %s", thread_id, model.name
         )
-        return []
+        return empty
     try:
-        agent = _sessions_cache[session_key].agent
-        last_snapshot = list(
-            agent.graph.get_state_history({"configurable": {"thread_id": thread_id}})
-        )[0]
-        messages = last_snapshot.values.get("messages", [])
-        return _parse_message_list(messages)
+        snapshot = agent.graph.get_state({"configurable": {"thread_id": thread_id}})
     except Exception as e:
         logger.error(
             "Failed to retrieve message history for thread %s: %s", thread_id, e
         )
-        return []
+        return empty
+
+    messages = snapshot.values.get("messages", [])
+    end = len(messages) if before is None else min(before, len(messages))
+    start = 0 if limit is None else max(0, end - limit)
+    return {
+        "messages": _parse_message_list(messages[start:end]),
+        "next_before": start if start > 0 else None,
+        "version": (snapshot.config or {}).get("configurable", {}).get("checkpoint_id"),
+    }
+
+
+def get_message_history(thread_id: str, model: ModelEnum = DEFAULT_MODEL) -> list[dict]:
+    """
+    Return the full parsed message history of a thread.
+
+    Args:
+        thread_id: Conversation identifier.
+        model: Cached agent model.
+
+    Returns:
+        List of ``{role, content}`` messages; empty if no session or on failure.
+    """
+    return get_message_history_page(thread_id, model)["messages"]
 
 
 class JarvisSession:
     """
     Orchestrates a conversation turn: state, prompts, and LLM agent.
 
+    When a session store is configured, chat state and the identified user
+    are read from it at the start of every turn and written back once the
+    state advances, and the agent's checkpoints are flushed when the turn
+    ends, so the next turn of the thread may run on any API worker.
+
     Attributes:
         model_enum: Session LLM model.
         thread_id: Thread identifier.
         valid_user: Whether the user is identified or authenticated.
         user: User data dict (real_name, jarvis_name, etc.).
         agent: Agent instance from the global cache.
+        authenticated: Whether the session was opened with a JWT user; only
+            those sessions share their state through the session store.
+        turns: Queue that runs this thread's async turns one at a time.
     """
 
     def __init__(
@@ -231,8 +561,13 @@ class JarvisSession:
         self.thread_id = thread_id
         self.valid_user = bool(user_info)
         self.user = user_info
+        self.authenticated = bool(user_info)
         self.agent = self._load_or_build_agent()
         self._chat_state = ChatState.NOT_INITIALIZED
+        self.turns = TurnQueue(
+            thread_id, TURN_QUEUE_MAX_DEPTH, TURN_COALESCE_DUPLICATES, TURN_COALESCE_WINDOW_SECONDS
+        )
+        self._fold_task: asyncio.Task | None = None
 
     def _load_or_build_agent(self) -> object:
         """
@@ -241,9 +576,7 @@ class JarvisSession:
         Returns:
             Agent instance (Basic, Memory, or MCP).
         """
-        if self.model_enum not in _agents_cache:
-            _agents_cache[self.model_enum] = build_agent(self.model_enum)
-        return _agents_cache[self.model_enum]
+        return get_agent(self.model_enum)
 
     def _try_identify_user(self, prompt: str) -> None:
         """
@@ -260,6 +593,97 @@ class JarvisSession:
             self.valid_user = True
             self.user = user
 
+    def _restore_state(self) -> None:
+        """
+        Load the chat state another worker left in the session store.
+
+        A chat whose checkpointer thread is gone is started again, so the
+        system prompt is not lost. The user always comes from this session
+        (JWT claims), never from the store.
+
+        Returns:
+            None. Keeps the in-memory state if nothing is stored or the store fails.
+        """
+        store = self._shared_store()
+        if store is None:
+            return
+        try:
+            state = store.get(self.model_enum.name, self.thread_id)
+        except Exception as e:
+            logger.error("Failed to restore session %s: %s", self.thread_id, e)
+            return
+        if state is None:
+            self._chat_state = ChatState.NOT_INITIALIZED
+            return
+        self._chat_state = ChatState[state["chat_state"]]
+        chat_started = self._chat_state in (ChatState.STARTING_CHAT, ChatState.INITIALIZED)
+        if chat_started and self._thread_lost():
+            # Advances to STARTING_CHAT, which resends the system prompt.
+            self._chat_state = ChatState.JARVIS_WELCOME_MESSAGE
+
+    def _shared_store(self) -> SessionStore | None:
+        """
+        Session store used by this session.
+
+        Local interfaces (CLI, Gradio) have no JWT and reuse thread ids such
+        as ``"1"`` for whoever runs them next, so their state must never be
+        restored from a shared store.
+
+        Returns:
+            The process-wide store for authenticated sessions, otherwise None.
+        """
+        return get_session_store() if self.authenticated else None
+
+    def _thread_lost(self) -> bool:
+        """
+        Whether the agent's checkpointer no longer has this thread.
+
+        An in-memory thread disappears on eviction or restart (and any
+        thread once its checkpoints expire) while the stored state still
+        says the chat is under way.
+
+        Returns:
+            True if the agent keeps history but has none for this thread.
+        """
+        memory = getattr(self.agent, "memory", None)
+        if not memory:
+            return False
+        try:
+            return latest_checkpoint_id(memory, self.thread_id) is None
+        except Exception as e:
+            logger.error("Failed to read checkpoints of thread %s: %s", self.thread_id, e)
+            return False
+
+    def _persist_state(self) -> None:
+        """
+        Share the chat state through the session store.
+
+        Returns:
+            None. Failures are logged; the turn goes on with local state.
+        """
+        store = self._shared_store()
+        if store is None:
+            return
+        try:
+            store.put(self.model_enum.name, self.thread_id, {"chat_state": self._chat_state.name})
+        except Exception as e:
+            logger.error("Failed to persist session %s: %s", self.thread_id, e)
+
+    def _flush_checkpoints(self) -> None:
+        """
+        Make this turn's buffered checkpoints visible to other workers.
+
+        Returns:
+            None. No-op without a session store or for unbuffered checkpointers.
+        """
+        flush = getattr(getattr(self.agent, "memory", None), "flush", None)
+        if flush is None or self._shared_store() is None:
+            return
+        try:
+            flush()
+        except Exception as e:
+            logger.error("Failed to flush checkpoints of thread %s: %s", self.thread_id, e)
+
     def _update_chat_state(self, prompt: str) -> None:
         """
         Advance the state machine and apply memory effects if needed.
@@ -306,6 +730,84 @@ class JarvisSession:
             kwargs["config"] = {"configurable": {"thread_id": self.thread_id}}
         return kwargs
 
+    def _extract_reply(self, response: dict) -> list[str] | str:
+        """
+        Extract the assistant replies produced after the last human message.
+
+        Args:
+            response: Final graph state.
+
+        Returns:
+            List of response strings, or a fallback message as str.
+        """
+        response_messages = response.get("messages", [])
+        last_human_index = max(
+            (i for i, msg in enumerate(response_messages) if isinstance(msg, HumanMessage)),
+            default=-1,
+        )
+        msg_dict_list = _parse_message_list(response_messages[last_human_index + 1 :])
+        result = [msg["content"] for msg in msg_dict_list]
+        return result if result else "Lo siento, señor. No tengo respuesta para su petición."
+
+    def _admit(self):
+        """
+        Reserve an LLM slot for this session's model (see ``AdmissionScheduler``).
+
+        Returns:
+            Async context manager yielding the queue wait in milliseconds.
+        """
+        real_name = self.user["real_name"] if self.user else self.thread_id
+        admin = bool(self.user and self.user.get("admin"))
+        return get_admission_scheduler().admit(self.model_enum, real_name, admin)
+
+    def _fold_context_inline(self) -> None:
+        """
+        Let the agent compact this thread's context before a sync turn returns.
+
+        Sync turns bypass ``turns``, so the fold runs in the caller's own
+        turn rather than in the background: the caller cannot send the
+        thread's next message while the summary is written.
+
+        Returns:
+            None. Failures are logged; the turn's reply is unaffected.
+        """
+        fold = getattr(self.agent, "fold_context", None)
+        if fold is None or self.model_enum not in models_with_memory:
+            return
+        try:
+            if fold(self.thread_id):
+                self._flush_checkpoints()
+        except Exception as e:
+            logger.error("Failed to summarize thread %s: %s", self.thread_id, e)
+
+    def _schedule_context_fold(self) -> None:
+        """
+        Async-path counterpart of ``_fold_context_inline``.
+
+        The summary runs as a turn of its own in ``turns``, after the current
+        one, so no turn of the thread can checkpoint while it is written, and
+        its LLM call goes through admission control like any other.
+
+        Returns:
+            None. At most one fold per session is pending at a time.
+        """
+        if self.model_enum not in models_with_memory or not hasattr(self.agent, "afold_context"):
+            return
+        if self._fold_task is not None and not self._fold_task.done():
+            return
+        self._fold_task = asyncio.get_running_loop().create_task(self._fold_context())
+
+    async def _fold_context(self) -> None:
+        """Hold the thread and let the agent fold its overflow into the summary."""
+        try:
+            async with self.turns.turn():
+                await self.agent.afold_context(self.thread_id, admit=self._admit)
+                await asyncio.to_thread(self._flush_checkpoints)
+        except ThreadBusyError:
+            logger.debug("Thread %s busy; summary deferred to a later turn", self.thread_id)
+        except Exception as e:
+            logger.error("Failed to summarize thread %s: %s", self.thread_id, e)
+
     def _process_messages(self, messages: list) -> list[str] | str:
         """
         Invoke the agent and extract assistant replies from the state.
@@ -317,36 +819,56 @@ class JarvisSession:
             List of response strings, or an error message as str/list.
         """
         try:
-            kwargs = self._build_agent_kwargs(messages)
-            response = self.agent.invoke(**kwargs)
-            response_messages = response.get("messages", [])
-            last_human_index = max(
-                (i for i, msg in enumerate(response_messages) if isinstance(msg, HumanMessage)),
-                default=-1,
-            )
-            msg_dict_list = _parse_message_list(response_messages[last_human_index + 1 :])
-            result = [msg["content"] for msg in msg_dict_list]
-            return result if result else "Lo siento, señor. No tengo respuesta para su petición."
+            response = self.agent.invoke(**self._build_agent_kwargs(messages))
+            reply = self._extract_reply(response)
         except Exception as e:
             return f"Ha habido un error procesando su petición, señor. Error: {e}"
+        finally:
+            self._flush_checkpoints()
+        self._fold_context_inline()
+        return reply
 
-    def ask(self, prompt: str) -> list[str] | str:
+    async def _aprocess_messages(self, messages: list) -> list[str] | str:
         """
-        Process a user turn and return Jarvis's reply.
+        Async variant of ``_process_messages`` built on ``agent.ainvoke``.
+
+        Args:
+            messages: Messages to send to the graph.
+
+        Returns:
+            List of response strings, or an error message as str/list.
+        """
+        try:
+            async with self._admit():
+                response = await self.agent.ainvoke(**self._build_agent_kwargs(messages))
+            reply = self._extract_reply(response)
+        except Exception as e:
+            return f"Ha habido un error procesando su petición, señor. Error: {e}"
+        finally:
+            await asyncio.to_thread(self._flush_checkpoints)
+        self._schedule_context_fold()
+        return reply
+
+    def _start_turn(self, prompt: str) -> tuple[list[str] | None, list | None]:
+        """
+        Advance the chat state and decide how to answer this turn.
 
         Args:
             prompt: User message.
 
         Returns:
-            List of response strings or a single message depending on state.
+            Tuple ``(reply, messages)``: a canned reply when no LLM call is
+            needed, otherwise the messages to send to the agent.
         """
+        self._restore_state()
         self._update_chat_state(prompt)
+        self._persist_state()
 
         if self._chat_state == ChatState.NOT_INITIALIZED:
-            return [AUTOMATIC_RESPONSE_IF_ID_FAILED]
+            return [AUTOMATIC_RESPONSE_IF_ID_FAILED], None
 
         if self._chat_state == ChatState.JARVIS_WELCOME_MESSAGE:
-            return [get_welcome_message(self.user)]
+            return [get_welcome_message(self.user)], None
 
         if self._chat_state == ChatState.STARTING_CHAT:
             messages = [
@@ -355,8 +877,125 @@ class JarvisSession:
             if self.valid_user:
                 messages.append(AIMessage(content=get_welcome_message(self.user)))
             messages.append(HumanMessage(content=prompt))
-            return self._process_messages(messages)
+            return None, messages
+
+        return None, [HumanMessage(content=prompt)]
+
+    def ask(self, prompt: str) -> list[str] | str:
+        """
+        Process a user turn and return Jarvis's reply.
+
+        Synchronous turns (CLI, Gradio) bypass the thread's turn queue; a
+        context fold due after the turn runs before this returns.
+
+        Args:
+            prompt: User message.
+
+        Returns:
+            List of response strings or a single message depending on state.
+        """
+        reply, messages = self._start_turn(prompt)
+        if messages is None:
+            return reply
+        return self._process_messages(messages)
+
+    async def astream(self, prompt: str) -> AsyncIterator[dict]:
+        """
+        Process a user turn, yielding events while the agent runs.
 
-        if self._chat_state == ChatState.INITIALIZED:
-            messages = [HumanMessage(content=prompt)]
-            return self._process_messages(messages)
+        Canned replies (identification, welcome) are yielded as ``message``
+        events. LLM turns yield ``token`` deltas and ``tool_start`` /
+        ``tool_end`` events. Every turn ends with a ``done`` event carrying the
+        same ``response`` list ``ask`` would return (plus ``queue_wait_ms``,
+        the time spent waiting for an LLM slot); failures also yield an
+        ``error`` event first. The thread is held until the stream ends, so
+        other turns of the thread wait for it.
+
+        Args:
+            prompt: User message.
+
+        Yields:
+            Dicts ``{event, data}``.
+
+        Raises:
+            ThreadBusyError: If the thread's turn queue is full.
+        """
+        async with self.turns.turn():
+            async for event in self._astream_turn(prompt):
+                yield event
+
+    async def _astream_turn(self, prompt: str) -> AsyncIterator[dict]:
+        """
+        Body of ``astream``, run while the thread is held.
+
+        Args:
+            prompt: User message.
+
+        Yields:
+            Dicts ``{event, data}``.
+        """
+        reply, messages = await asyncio.to_thread(self._start_turn, prompt)
+        if messages is None:
+            for content in reply:
+                yield {"event": "message", "data": {"content": content}}
+            yield {"event": "done", "data": {"response": reply, "queue_wait_ms": 0}}
+            return
+
+        queue_wait_ms = 0.0
+        try:
+            final_state: dict = {}
+            async with self._admit() as queue_wait_ms:
+                async for event in self.agent.astream_events(**self._build_agent_kwargs(messages)):
+                    if event["event"] == "on_chain_end" and not event.get("parent_ids"):
+                        final_state = event["data"].get("output") or {}
+                    stream_event = _to_stream_event(event)
+                    if stream_event:
+                        yield stream_event
+            response = self._extract_reply(final_state)
+        except Exception as e:
+            response = f"Ha habido un error procesando su petición, señor. Error: {e}"
+            yield {"event": "error", "data": {"detail": response}}
+        await asyncio.to_thread(self._flush_checkpoints)
+        yield {
+            "event": "done",
+            "data": {
+                "response": response if isinstance(response, list) else [response],
+                "queue_wait_ms": round(queue_wait_ms),
+            },
+        }
+        self._schedule_context_fold()
+
+    async def aask(self, prompt: str) -> list[str] | str:
+        """
+        Async variant of ``ask`` that awaits the agent instead of blocking.
+
+        Turns of this thread run one at a time, in arrival order, so chat
+        state and checkpoints never interleave. When ``TURN_COALESCE_DUPLICATES``
+        is set, a message identical to one sent moments ago that is still
+        queued gets that turn's reply instead of a new turn.
+
+        Args:
+            prompt: User message.
+
+        Returns:
+            List of response strings or a single message depending on state.
+
+        Raises:
+            ThreadBusyError: If ``TURN_QUEUE_MAX_DEPTH`` turns are already waiting.
+        """
+        return await self.turns.run(prompt, lambda: self._aask_turn(prompt))
+
+    async def _aask_turn(self, prompt: str) -> list[str] | str:
+        """
+        Body of ``aask``, run while the thread is held.
+
+        Args:
+            prompt: User message.
+
+        Returns:
+            List of response strings or a single message depending on state.
+        """
+        reply, messages = await asyncio.to_thread(self._start_turn, prompt)
+        if messages is None:
+            return reply
+        return await self._aprocess_messages(messages)
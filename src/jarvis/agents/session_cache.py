@@ -0,0 +1,233 @@
+"""Bounded LRU cache with idle TTL for chat sessions."""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterator
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class SessionCache(Generic[K, V]):
+    """
+    Thread-safe LRU cache whose entries also expire after an idle period.
+
+    Entries are evicted when the cache exceeds ``max_entries`` (least recently
+    used first) or when they have not been accessed for ``ttl_seconds``. Every
+    eviction calls ``on_evict(key, value)`` so owners can release resources
+    tied to the entry. Explicit ``pop`` and ``clear`` do not trigger the hook.
+
+    Attributes:
+        max_entries: Maximum number of live entries (0 or less disables the limit).
+        ttl_seconds: Idle time before an entry expires (0 or less disables TTL).
+        hits: Lookups served from the cache.
+        misses: Lookups that had to create a new entry.
+        evictions: Entries removed by the LRU policy or TTL expiry.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        on_evict: Callable[[K, V], None] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Args:
+            max_entries: Maximum number of cached entries.
+            ttl_seconds: Idle time to live, in seconds.
+            on_evict: Optional hook called for every evicted entry.
+            clock: Monotonic time source (overridable in tests).
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._on_evict = on_evict
+        self._clock = clock
+        self._entries: OrderedDict[K, tuple[V, float]] = OrderedDict()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_create(self, key: K, factory: Callable[[], V]) -> V:
+        """
+        Return the cached value for ``key`` or build, store, and return a new one.
+
+        Args:
+            key: Cache key.
+            factory: Zero-argument callable that builds the value on a miss.
+
+        Returns:
+            Cached or newly created value.
+        """
+        evicted: list[tuple[K, V]] = []
+        with self._lock:
+            evicted.extend(self._purge_expired())
+            entry = self._entries.get(key)
+            if entry is not None:
+                self.hits += 1
+                self._touch(key, entry[0])
+            else:
+                self.misses += 1
+        self._notify_evicted(evicted)
+        if entry is not None:
+            return entry[0]
+
+        # Build outside the lock so a slow factory does not block other keys.
+        value = factory()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value = entry[0]
+                self._touch(key, value)
+                evicted = []
+            else:
+                self._touch(key, value)
+                evicted = self._enforce_capacity()
+        self._notify_evicted(evicted)
+        return value
+
+    def get(self, key: K) -> V | None:
+        """
+        Return the value for ``key`` without creating it (refreshes recency).
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Cached value, or None if missing or expired.
+        """
+        evicted: list[tuple[K, V]] = []
+        with self._lock:
+            evicted.extend(self._purge_expired())
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._touch(key, entry[0])
+        self._notify_evicted(evicted)
+        return entry[0] if entry is not None else None
+
+    def pop(self, key: K, default: V | None = None) -> V | None:
+        """
+        Remove ``key`` without calling the eviction hook.
+
+        Args:
+            key: Cache key.
+            default: Value returned when the key is absent.
+
+        Returns:
+            Removed value or ``default``.
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+        return entry[0] if entry is not None else default
+
+    def clear(self) -> None:
+        """Drop every entry without calling the eviction hook."""
+        with self._lock:
+            self._entries.clear()
+
+    def expire(self) -> int:
+        """
+        Evict every entry whose idle TTL has elapsed.
+
+        Returns:
+            Number of entries evicted.
+        """
+        with self._lock:
+            evicted = self._purge_expired()
+        self._notify_evicted(evicted)
+        return len(evicted)
+
+    def keys(self) -> list[K]:
+        """
+        Return live keys from least to most recently used.
+
+        Returns:
+            Snapshot list of keys (expired entries excluded).
+        """
+        self.expire()
+        with self._lock:
+            return list(self._entries.keys())
+
+    def stats(self) -> dict:
+        """
+        Summarize cache configuration and counters.
+
+        Returns:
+            Dict with ``size``, ``max_entries``, ``ttl_seconds``, ``hits``,
+            ``misses``, ``evictions``, and ``hit_ratio``.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+    def _touch(self, key: K, value: V) -> None:
+        """Store ``value`` as the most recently used entry (caller holds the lock)."""
+        self._entries[key] = (value, self._clock())
+        self._entries.move_to_end(key)
+
+    def _is_expired(self, last_access: float, now: float) -> bool:
+        """Whether an entry last accessed at ``last_access`` is past its TTL."""
+        return self.ttl_seconds > 0 and now - last_access >= self.ttl_seconds
+
+    def _purge_expired(self) -> list[tuple[K, V]]:
+        """Remove expired entries (caller holds the lock) and return them."""
+        if self.ttl_seconds <= 0:
+            return []
+        now = self._clock()
+        expired: list[tuple[K, V]] = []
+        # Entries are kept in access order, so the oldest ones come first.
+        for key, (value, last_access) in list(self._entries.items()):
+            if not self._is_expired(last_access, now):
+                break
+            del self._entries[key]
+            expired.append((key, value))
+        self.evictions += len(expired)
+        return expired
+
+    def _enforce_capacity(self) -> list[tuple[K, V]]:
+        """Evict least recently used entries over capacity (caller holds the lock)."""
+        evicted: list[tuple[K, V]] = []
+        if self.max_entries <= 0:
+            return evicted
+        while len(self._entries) > self.max_entries:
+            key, (value, _) = self._entries.popitem(last=False)
+            evicted.append((key, value))
+        self.evictions += len(evicted)
+        return evicted
+
+    def _notify_evicted(self, evicted: list[tuple[K, V]]) -> None:
+        """Run the eviction hook outside the lock for each evicted entry."""
+        if not self._on_evict:
+            return
+        for key, value in evicted:
+            self._on_evict(key, value)
+
+    def __contains__(self, key: object) -> bool:
+        """Whether ``key`` is cached and not expired (does not refresh recency)."""
+        with self._lock:
+            entry = self._entries.get(key)  # type: ignore[arg-type]
+            return entry is not None and not self._is_expired(entry[1], self._clock())
+
+    def __len__(self) -> int:
+        """Number of stored entries (including not-yet-purged expired ones)."""
+        with self._lock:
+            return len(self._entries)
+
+    def __iter__(self) -> Iterator[K]:
+        """Iterate over a snapshot of live keys."""
+        return iter(self.keys())
+
+    def __repr__(self) -> str:
+        """Debug representation with keys and counters."""
+        return f"SessionCache(keys={self.keys()!r}, stats={self.stats()!r})"
@@ -0,0 +1,80 @@
+"""Session store backend selection (state shared by every API worker)."""
+
+import os
+import threading
+
+from jarvis.core.config import REDIS_KEY_PREFIX, SESSION_CACHE_TTL_SECONDS, SESSION_STORE_BACKEND
+from jarvis.core.enums import SessionStoreBackendEnum
+from jarvis.core.paths import SESSIONS_DB_PATH
+from jarvis.infrastructure.persistence.redis_client import get_redis_client
+from jarvis.infrastructure.persistence.session_store import (
+    RedisSessionStore,
+    SessionStore,
+    SqliteSessionStore,
+)
+
+_session_store: SessionStore | None = None
+_session_store_lock = threading.Lock()
+
+
+def session_store_backend() -> SessionStoreBackendEnum:
+    """
+    Resolve the session store backend of this process.
+
+    Without an explicit ``SESSION_STORE_BACKEND``, state is only shared
+    when the API runs several workers (``API_WORKERS`` > 1); a single
+    process keeps it in memory, so nothing outlives a restart.
+
+    Returns:
+        Configured backend, or SQLITE/MEMORY depending on ``API_WORKERS``.
+    """
+    if SESSION_STORE_BACKEND is not None:
+        return SESSION_STORE_BACKEND
+    if int(os.getenv("API_WORKERS", 1)) > 1:
+        return SessionStoreBackendEnum.SQLITE
+    return SessionStoreBackendEnum.MEMORY
+
+
+def build_session_store(
+    backend: SessionStoreBackendEnum | None = None,
+    db_path: str | None = None,
+) -> SessionStore | None:
+    """
+    Build the session store of a backend.
+
+    Args:
+        backend: Storage backend (``session_store_backend()`` by default).
+        db_path: SQLite file; defaults to ``data/sessions.db``.
+
+    Returns:
+        A new SessionStore, or None for ``MEMORY`` (state stays in the worker).
+
+    Raises:
+        ValueError: If the backend is not supported.
+        RuntimeError: If the Redis backend is selected but unavailable.
+    """
+    backend = backend or session_store_backend()
+    if backend == SessionStoreBackendEnum.MEMORY:
+        return None
+    if backend == SessionStoreBackendEnum.SQLITE:
+        return SqliteSessionStore(str(db_path or SESSIONS_DB_PATH), SESSION_CACHE_TTL_SECONDS)
+    if backend == SessionStoreBackendEnum.REDIS:
+        return RedisSessionStore(get_redis_client(), SESSION_CACHE_TTL_SECONDS, REDIS_KEY_PREFIX)
+    raise ValueError(f"Unsupported session store backend: {backend}")
+
+
+def get_session_store() -> SessionStore | None:
+    """
+    Return the process-wide session store, building it on first use.
+
+    Returns:
+        Shared SessionStore, or None if the backend is ``MEMORY``.
+    """
+    global _session_store
+    if session_store_backend() == SessionStoreBackendEnum.MEMORY:
+        return None
+    if _session_store is None:
+        with _session_store_lock:
+            if _session_store is None:
+                _session_store = build_session_store()
+    return _session_store
@@ -0,0 +1,212 @@
+"""Token-budgeted ``tools`` graph node: compact and truncate tool results."""
+
+import json
+import logging
+import math
+import re
+from collections.abc import Awaitable, Callable, Sequence
+
+from langchain_core.messages import ToolMessage
+from langgraph.prebuilt import ToolNode
+from langgraph.prebuilt.tool_node import ToolCallRequest
+from langgraph.types import Command
+
+from jarvis.core.config import TOOL_OUTPUT_DEFAULT_TOKEN_BUDGET, TOOL_OUTPUT_TOKEN_BUDGETS
+
+logger = logging.getLogger(__name__)
+
+CHARS_PER_TOKEN = 4.0
+"""Same ratio as ``count_tokens_approximately`` (used for the context budget)."""
+
+TRUNCATION_MARKER = (
+    "… [{omitted} líneas más disponibles. Acota la consulta (por ejemplo, fechas o "
+    "número de resultados) para verlas.]"
+)
+"""Appended to truncated results so the model knows there is more to ask for."""
+
+JSON_TRUNCATION_MARKER = (
+    "… [{omitted} elementos más disponibles. Acota la consulta (por ejemplo, fechas o "
+    "número de resultados) para verlos.]"
+)
+"""Appended, on its own line, to JSON results whose array lost trailing elements."""
+
+_BLANK_LINES = re.compile(r"\n{3,}")
+
+
+def _tokens(text: str) -> int:
+    """Approximate token count of a string."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def _dump_json(value) -> str:
+    """Serialize JSON the way ``compact_text`` does."""
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def _truncate_json(text: str, token_budget: int) -> str | None:
+    """
+    Drop trailing elements of a JSON result's array so it stays valid JSON.
+
+    The array is the result itself or, for an object, its largest array
+    value (e.g. ``items`` of an API response); other fields are kept.
+
+    Returns:
+        Re-serialized JSON plus ``JSON_TRUNCATION_MARKER``, or None if
+        ``text`` is not JSON with an array or not even one element fits.
+    """
+    if text[:1] not in ("{", "["):
+        return None
+    try:
+        value = json.loads(text)
+    except ValueError:
+        return None
+    if isinstance(value, list):
+        items = value
+    elif isinstance(value, dict):
+        arrays = [(key, item) for key, item in value.items() if isinstance(item, list) and item]
+        if not arrays:
+            return None
+        array_key, items = max(arrays, key=lambda pair: len(_dump_json(pair[1])))
+    else:
+        return None
+    if not items:
+        return None
+
+    def rebuild(kept_items: list):
+        return kept_items if isinstance(value, list) else {**value, array_key: kept_items}
+
+    marker = JSON_TRUNCATION_MARKER.format(omitted=len(items))
+    room = int(token_budget * CHARS_PER_TOKEN) - len(marker) - 1 - len(_dump_json(rebuild([])))
+    kept = used = 0
+    for item in items:
+        cost = len(_dump_json(item)) + (1 if kept else 0)
+        if used + cost > room:
+            break
+        used += cost
+        kept += 1
+    if kept == 0:
+        return None
+    return (
+        _dump_json(rebuild(items[:kept]))
+        + "\n"
+        + JSON_TRUNCATION_MARKER.format(omitted=len(items) - kept)
+    )
+
+
+def compact_text(text: str) -> str:
+    """
+    Re-encode a tool result without changing its information.
+
+    JSON is re-serialized without indentation or spaces after separators;
+    plain text loses trailing spaces and runs of blank lines.
+
+    Args:
+        text: Raw tool output.
+
+    Returns:
+        Compact equivalent of ``text``.
+    """
+    stripped = text.strip()
+    if stripped[:1] in ("{", "["):
+        try:
+            return json.dumps(json.loads(stripped), ensure_ascii=False, separators=(",", ":"))
+        except ValueError:
+            pass
+    lines = [line.rstrip() for line in stripped.splitlines()]
+    return _BLANK_LINES.sub("\n\n", "\n".join(lines))
+
+
+def truncate_text(text: str, token_budget: int) -> str:
+    """
+    Keep the leading whole lines of ``text`` that fit in ``token_budget``.
+
+    JSON results (a single line once compacted) keep their leading whole
+    array elements instead, so what remains still parses. Truncation is
+    deterministic (same input, same output), so identical results stay
+    identical in the checkpoint and in cache keys. A single line larger than
+    the budget is cut at a character boundary.
+
+    Args:
+        text: Compacted tool output.
+        token_budget: Approximate token limit, marker included.
+
+    Returns:
+        ``text`` unchanged if it fits, otherwise a prefix plus ``TRUNCATION_MARKER``
+        (or trimmed JSON plus ``JSON_TRUNCATION_MARKER``).
+    """
+    if _tokens(text) <= token_budget:
+        return text
+    truncated_json = _truncate_json(text, token_budget)
+    if truncated_json is not None:
+        return truncated_json
+    lines = text.split("\n")
+    kept: list[str] = []
+    used = 0
+    for index, line in enumerate(lines):
+        marker = TRUNCATION_MARKER.format(omitted=len(lines) - index)
+        cost = _tokens(line + "\n")
+        if used + cost + _tokens(marker) > token_budget:
+            if not kept:
+                room = max(0, int((token_budget - _tokens(marker)) * CHARS_PER_TOKEN))
+                kept.append(line[:room])
+            return "\n".join(kept) + "\n" + marker
+        kept.append(line)
+        used += cost
+    return text
+
+
+def _apply_budget(
+    result: ToolMessage | Command, budgets: dict[str, int], default_budget: int | None
+) -> ToolMessage | Command:
+    """Compact and truncate a tool result in place of the original message."""
+    if not isinstance(result, ToolMessage) or not isinstance(result.content, str):
+        return result
+    original = result.content
+    content = compact_text(original)
+    budget = budgets.get(result.name or "", default_budget)
+    if budget is not None:
+        content = truncate_text(content, budget)
+    saved = _tokens(original) - _tokens(content)
+    if saved <= 0:
+        return result
+    logger.info(
+        "Tool output of %s compacted: %d -> %d tokens (%d saved)",
+        result.name, _tokens(original), _tokens(content), saved,
+    )
+    return result.model_copy(update={"content": content})
+
+
+def build_tool_node(
+    tools: Sequence,
+    budgets: dict[str, int] | None = None,
+    default_budget: int | None = TOOL_OUTPUT_DEFAULT_TOKEN_BUDGET,
+) -> ToolNode:
+    """
+    Build a ``ToolNode`` whose results are compacted and kept within a token budget.
+
+    Results are re-encoded compactly, then truncated by whole lines with a
+    "more available" marker if they still exceed their tool's budget. The
+    tokens saved are logged per call.
+
+    Args:
+        tools: Tools to expose.
+        budgets: Per-tool budgets by tool name (defaults to ``TOOL_OUTPUT_TOKEN_BUDGETS``).
+        default_budget: Budget of tools not in ``budgets``; None disables truncation.
+
+    Returns:
+        ToolNode usable as the ``tools`` graph node.
+    """
+    budgets = TOOL_OUTPUT_TOKEN_BUDGETS if budgets is None else budgets
+
+    def wrap_tool_call(
+        request: ToolCallRequest, execute: Callable[[ToolCallRequest], ToolMessage | Command]
+    ) -> ToolMessage | Command:
+        return _apply_budget(execute(request), budgets, default_budget)
+
+    async def awrap_tool_call(
+        request: ToolCallRequest,
+        execute: Callable[[ToolCallRequest], Awaitable[ToolMessage | Command]],
+    ) -> ToolMessage | Command:
+        return _apply_budget(await execute(request), budgets, default_budget)
+
+    return ToolNode(tools=tools, wrap_tool_call=wrap_tool_call, awrap_tool_call=awrap_tool_call)
@@ -0,0 +1,203 @@
+"""Per-thread turn serialization with a bounded queue and duplicate coalescing."""
+
+import asyncio
+import math
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from typing import Any
+
+INITIAL_TURN_SECONDS = 5.0
+"""Turn duration assumed for ``Retry-After`` until a thread has completed a turn."""
+
+_EMA_WEIGHT = 0.3
+
+
+class ThreadBusyError(Exception):
+    """
+    Raised when a thread already has the maximum number of turns waiting.
+
+    Attributes:
+        thread_id: Busy conversation thread.
+        retry_after: Suggested wait before retrying, in whole seconds.
+    """
+
+    def __init__(self, thread_id: str, retry_after: int) -> None:
+        super().__init__(f"Thread {thread_id} has too many pending turns")
+        self.thread_id = thread_id
+        self.retry_after = retry_after
+
+
+class TurnQueue:
+    """
+    FIFO that lets one turn of a conversation thread run at a time.
+
+    Turns that arrive while another is running wait in order; once
+    ``max_depth`` turns are waiting, new ones are rejected with
+    ``ThreadBusyError``. With ``coalesce`` set, a message identical to one
+    that is still waiting (not yet running) and arrived less than
+    ``coalesce_window`` seconds earlier shares that turn's result instead of
+    being queued again; anything else may be a deliberate repeat and gets its
+    own turn. Each session owns its queue, so different threads never wait
+    on each other.
+
+    Attributes:
+        thread_id: Conversation thread served by the queue.
+        max_depth: Maximum number of waiting turns (the running one excluded).
+        coalesce: Whether duplicate queued messages share one turn.
+        coalesce_window: Maximum gap in seconds between coalesced duplicates.
+        coalesced: Number of messages answered by another turn.
+        rejected: Number of turns rejected because the queue was full.
+    """
+
+    def __init__(
+        self,
+        thread_id: str,
+        max_depth: int,
+        coalesce: bool,
+        coalesce_window: float = 2.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Args:
+            thread_id: Conversation thread served by the queue.
+            max_depth: Maximum number of waiting turns.
+            coalesce: Share one turn between identical queued messages.
+            coalesce_window: Maximum gap in seconds between coalesced duplicates.
+            clock: Monotonic time source (overridable in tests).
+        """
+        self.thread_id = thread_id
+        self.max_depth = max_depth
+        self.coalesce = coalesce
+        self.coalesce_window = coalesce_window
+        self._clock = clock
+        self._busy = False
+        self._waiters: deque[asyncio.Future] = deque()
+        self._queued: dict[str, tuple[asyncio.Future, float]] = {}
+        self._avg_turn_seconds = INITIAL_TURN_SECONDS
+        self.coalesced = 0
+        self.rejected = 0
+
+    @property
+    def pending(self) -> int:
+        """Number of turns waiting behind the running one."""
+        return len(self._waiters)
+
+    def retry_after(self) -> int:
+        """
+        Estimate when the queue will have room, from the average turn duration.
+
+        Returns:
+            Whole seconds (at least 1).
+        """
+        return max(1, math.ceil(self._avg_turn_seconds * (self.pending + 1)))
+
+    @asynccontextmanager
+    async def turn(self) -> AsyncIterator[None]:
+        """
+        Hold the thread for one turn, waiting behind earlier turns.
+
+        Yields:
+            None while the caller owns the thread.
+
+        Raises:
+            ThreadBusyError: If ``max_depth`` turns are already waiting.
+        """
+        await self._acquire()
+        started = self._clock()
+        try:
+            yield
+        finally:
+            elapsed = self._clock() - started
+            self._avg_turn_seconds += _EMA_WEIGHT * (elapsed - self._avg_turn_seconds)
+            self._release()
+
+    async def run(self, message: str, turn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run ``turn`` for ``message`` in order, or join an identical queued turn.
+
+        Args:
+            message: User message (the coalescing key).
+            turn: Zero-argument coroutine function producing the reply.
+
+        Returns:
+            The turn's reply (shared with coalesced duplicates).
+
+        Raises:
+            ThreadBusyError: If the queue is full.
+        """
+        if self.coalesce:
+            queued = self._queued.get(message)
+            if queued is not None and self._clock() - queued[1] <= self.coalesce_window:
+                self.coalesced += 1
+                return await asyncio.shield(queued[0])
+        result: asyncio.Future = asyncio.get_running_loop().create_future()
+        if self.coalesce:
+            self._queued[message] = (result, self._clock())
+        try:
+            async with self.turn():
+                # A running turn is never joined: a repeat now may be deliberate.
+                self._forget(message, result)
+                value = await turn()
+        except BaseException as e:
+            if not result.done():
+                result.set_exception(e)
+                # Only duplicates await this future; avoid "never retrieved" warnings.
+                result.exception()
+            raise
+        else:
+            result.set_result(value)
+            return value
+        finally:
+            self._forget(message, result)
+
+    def stats(self) -> dict:
+        """
+        Summarize the queue.
+
+        Returns:
+            Dict with ``busy``, ``pending``, ``max_depth``, ``coalesced`` and ``rejected``.
+        """
+        return {
+            "busy": self._busy,
+            "pending": self.pending,
+            "max_depth": self.max_depth,
+            "coalesced": self.coalesced,
+            "rejected": self.rejected,
+        }
+
+    def _forget(self, message: str, result: asyncio.Future) -> None:
+        """Stop offering ``result`` to duplicates of ``message``."""
+        queued = self._queued.get(message)
+        if queued is not None and queued[0] is result:
+            del self._queued[message]
+
+    async def _acquire(self) -> None:
+        """Take the thread, queueing behind the running turn if needed."""
+        if not self._busy and not self._waiters:
+            self._busy = True
+            return
+        if len(self._waiters) >= self.max_depth:
+            self.rejected += 1
+            raise ThreadBusyError(self.thread_id, self.retry_after())
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The thread was handed over just as we were cancelled.
+                self._release()
+            else:
+                self._waiters.remove(waiter)
+            raise
+
+    def _release(self) -> None:
+        """Hand the thread to the next waiting turn, or mark it idle."""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._busy = False
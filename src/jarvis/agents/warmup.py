@@ -0,0 +1,133 @@
+"""Startup warm-up of agents and readiness tracking."""
+
+import asyncio
+import logging
+import threading
+import time
+
+from jarvis.agents.session import get_agent
+from jarvis.core.enums import ModelEnum
+
+logger = logging.getLogger(__name__)
+
+PENDING = "pending"
+WARMING = "warming"
+READY = "ready"
+FAILED = "failed"
+
+
+class WarmupTracker:
+    """
+    Per-model warm-up progress, read by the readiness probe.
+
+    A worker is ready once every listed model finished warming up. A model
+    whose warm-up failed still counts as finished (its agent is built on the
+    first request instead), but the overall status is reported as ``degraded``.
+    """
+
+    def __init__(self, models: list[ModelEnum]) -> None:
+        """
+        Args:
+            models: Models to warm up, in order.
+        """
+        self._lock = threading.Lock()
+        self._models: dict[ModelEnum, dict] = {model: {"status": PENDING} for model in models}
+
+    def update(self, model: ModelEnum, status: str, **details) -> None:
+        """
+        Record a model's progress.
+
+        Args:
+            model: Model being warmed up.
+            status: One of ``pending``, ``warming``, ``ready``, ``failed``.
+            **details: Extra fields (``duration_ms``, ``error``).
+        """
+        with self._lock:
+            self._models[model] = {"status": status, **details}
+
+    def snapshot(self) -> dict:
+        """
+        Summarize warm-up progress.
+
+        Returns:
+            Dict with ``ready`` (bool), ``status`` (``warming``, ``ready`` or
+            ``degraded``) and per-model ``models`` details.
+        """
+        with self._lock:
+            models = {model.value: dict(info) for model, info in self._models.items()}
+        statuses = {info["status"] for info in models.values()}
+        ready = statuses <= {READY, FAILED}
+        if not ready:
+            status = WARMING
+        else:
+            status = "degraded" if FAILED in statuses else READY
+        return {"ready": ready, "status": status, "models": models}
+
+
+_tracker = WarmupTracker([])
+
+
+def get_warmup_status() -> dict:
+    """
+    Progress of the current (or last) startup warm-up.
+
+    Returns:
+        Output of ``WarmupTracker.snapshot``.
+    """
+    return _tracker.snapshot()
+
+
+async def _open_llm_connections(llm, invoke: bool) -> None:
+    """Open the async HTTP pool of an OpenAI chat model (and optionally call it)."""
+    client = getattr(llm, "root_async_client", None)
+    if client is not None:
+        await client.models.list()
+    if invoke and llm is not None:
+        await llm.ainvoke("ping", max_tokens=1)
+
+
+async def _warm_up_model(model: ModelEnum, invoke: bool) -> None:
+    """Build a model's agent, connect its MCP servers, and open LLM connections."""
+    agent = await asyncio.to_thread(get_agent, model)
+    if hasattr(agent, "setup_mcp") and agent.graph is None:
+        await agent.mcp_manager.arun(agent.setup_mcp())
+    await _open_llm_connections(getattr(agent, "summary_llm", None), invoke)
+
+
+async def _run_warmup(tracker: WarmupTracker, models: list[ModelEnum], invoke: bool) -> dict:
+    """Warm up agents one model at a time, recording progress in ``tracker``."""
+    for model in models:
+        tracker.update(model, WARMING)
+        started = time.perf_counter()
+        try:
+            await _warm_up_model(model, invoke)
+        except asyncio.CancelledError:
+            tracker.update(model, FAILED, error="cancelled")
+            raise
+        except Exception as e:
+            logger.warning("Warm-up of %s failed: %s", model.name, e)
+            tracker.update(model, FAILED, error=str(e))
+            continue
+        duration_ms = round((time.perf_counter() - started) * 1000)
+        logger.info("Agent for %s warmed up in %d ms", model.name, duration_ms)
+        tracker.update(model, READY, duration_ms=duration_ms)
+    return tracker.snapshot()
+
+
+def start_warmup(models: list[ModelEnum], invoke: bool = False) -> "asyncio.Task[dict]":
+    """
+    Start warming up agents in the background of the running event loop.
+
+    The models are marked pending before this returns, so ``/readyz``
+    reports not-ready from the first request on.
+
+    Args:
+        models: Models whose agents are pre-built.
+        invoke: Also send a one-token request to each model.
+
+    Returns:
+        Task resolving to the final warm-up status.
+    """
+    global _tracker
+    _tracker = WarmupTracker(models)
+    return asyncio.create_task(_run_warmup(_tracker, models, invoke), name="jarvis-warmup")
@@ -8,8 +8,7 @@ from fastapi.security import (
     HTTPBearer,
 )
 
-from jarvis.api.security.jwt import get_jwt_secret_key
-from jarvis.core.config import JWT_ALGORITHM
+from jarvis.api.security.jwt import verify_jwt
 
 security_basic = HTTPBasic()
 security_bearer = HTTPBearer(auto_error=True)
@@ -21,6 +20,9 @@ def verify_jwt_token(
     """
     FastAPI dependency that validates the Bearer JWT.
 
+    Tokens seen before are answered from the verified-token cache until their
+    ``exp``; new ones are checked against the current and previous keys.
+
     Args:
         credentials: Authorization Bearer header.
 
@@ -31,11 +33,7 @@ def verify_jwt_token(
         HTTPException: 401 if the token expired or is invalid.
     """
     try:
-        return jwt.decode(
-            credentials.credentials,
-            get_jwt_secret_key(),
-            algorithms=[JWT_ALGORITHM],
-        )
+        return verify_jwt(credentials.credentials)
     except jwt.ExpiredSignatureError:
         raise HTTPException(status_code=401, detail="Token expirado") from None
     except jwt.InvalidTokenError:
@@ -20,6 +20,7 @@ logger = logging.getLogger(__name__)
 load_dotenv()
 
 API_PORT = int(os.getenv("API_PORT", 8000))
+API_WORKERS = int(os.getenv("API_WORKERS", 1))
 
 
 def _telegram_config() -> tuple[str | None, str | None]:
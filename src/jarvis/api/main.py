@@ -1,5 +1,9 @@
 """FastAPI Jarvis application bootstrap."""
 
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -7,11 +11,45 @@ load_dotenv()
 import uvicorn
 from fastapi import FastAPI
 
-from jarvis.api.deployment import API_PORT, run_with_optional_tunnel
+from jarvis.api.deployment import API_PORT, API_WORKERS, run_with_optional_tunnel
 from jarvis.core.logging_config import configure_logging
 
 configure_logging()
-from jarvis.api.routers import admin, auth, chat
+from jarvis.agents.session import shutdown_agents
+from jarvis.agents.session_store import session_store_backend
+from jarvis.agents.warmup import start_warmup
+from jarvis.api.routers import admin, auth, chat, health
+from jarvis.api.security.jwt import get_signing_keys
+from jarvis.core.config import (
+    CHECKPOINTER_BACKEND,
+    WARMUP_INVOKE,
+    WARMUP_MODELS,
+)
+from jarvis.core.enums import CheckpointerBackendEnum, SessionStoreBackendEnum
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(application: FastAPI) -> AsyncIterator[None]:
+    """
+    Application lifespan: warm up agents in the background, release them on shutdown.
+
+    The JWT signing keys are loaded first, so a missing ``JWT_SECRET_KEY``
+    stops startup. Requests are served while ``WARMUP_MODELS`` are being
+    built; ``/readyz`` answers 503 until that finishes.
+
+    Args:
+        application: FastAPI instance being served.
+
+    Yields:
+        None while the application is running.
+    """
+    get_signing_keys()
+    warmup = start_warmup(WARMUP_MODELS, invoke=WARMUP_INVOKE)
+    yield
+    warmup.cancel()
+    shutdown_agents()
 
 
 def create_app() -> FastAPI:
@@ -25,10 +63,12 @@ def create_app() -> FastAPI:
         title="Jarvis API",
         description="API backend for Jarvis",
         version="1.0.0",
+        lifespan=lifespan,
     )
     application.include_router(auth.router)
     application.include_router(chat.router)
     application.include_router(admin.router)
+    application.include_router(health.router)
     return application
 
 
@@ -36,8 +76,29 @@ app = create_app()
 
 
 def start_uvicorn() -> None:
-    """Start the ASGI server on 0.0.0.0:API_PORT (blocking)."""
-    uvicorn.run(app, host="0.0.0.0", port=API_PORT)
+    """
+    Start the ASGI server on 0.0.0.0:API_PORT with API_WORKERS processes (blocking).
+
+    Workers share sessions through the session store (SQLite by default
+    with several workers, see ``session_store_backend``) and threads
+    through ``CHECKPOINTER_BACKEND``; in-memory backends are per process,
+    so with several workers a thread would lose its state whenever it
+    lands on another one.
+    """
+    if API_WORKERS > 1 and (
+        session_store_backend() == SessionStoreBackendEnum.MEMORY
+        or CHECKPOINTER_BACKEND == CheckpointerBackendEnum.MEMORY
+    ):
+        logger.warning(
+            "Running %d workers with in-memory session or checkpoint storage; "
+            "threads will not be shared between workers",
+            API_WORKERS,
+        )
+    if API_WORKERS > 1:
+        # Each worker process imports the app itself.
+        uvicorn.run("jarvis.api.main:app", host="0.0.0.0", port=API_PORT, workers=API_WORKERS)
+    else:
+        uvicorn.run(app, host="0.0.0.0", port=API_PORT)
 
 
 def main() -> None:
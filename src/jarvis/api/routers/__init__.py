@@ -1,5 +1,5 @@
-"""FastAPI routers by domain (auth, chat, admin)."""
+"""FastAPI routers by domain (auth, chat, admin, health)."""
 
-from jarvis.api.routers import admin, auth, chat
+from jarvis.api.routers import admin, auth, chat, health
 
-__all__ = ["admin", "auth", "chat"]
+__all__ = ["admin", "auth", "chat", "health"]
@@ -1,7 +1,7 @@
 """Jarvis conversation routes and cached session management."""
 
-from fastapi import APIRouter, Body, Depends
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Body, Depends, Header, Query, Response
+from fastapi.responses import JSONResponse, StreamingResponse
 
 from jarvis.api.dependencies import verify_jwt_token
 from jarvis.api.schemas.chat import AskInput, ThreadIdPayload
@@ -10,6 +10,23 @@ from jarvis.api.services.chat_service import chat_service
 router = APIRouter(tags=["chat"])
 
 
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Whether an ``If-None-Match`` header matches ``etag`` (weak comparison).
+
+    Args:
+        if_none_match: Raw header value (``*`` or a comma-separated ETag list).
+        etag: Current quoted ETag.
+
+    Returns:
+        True if the client's cached copy is current.
+    """
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in (tag.removeprefix("W/") for tag in candidates)
+
+
 @router.post("/ask")
 async def ask_json(
     input_data: AskInput,
@@ -23,9 +40,38 @@ async def ask_json(
         user: JWT payload (dependency).
 
     Returns:
-        Dict with key ``response`` (list of strings).
+        Dict with keys ``response`` (list of strings) and ``queue_wait_ms``.
+
+    Raises:
+        HTTPException: 429 with ``Retry-After`` if the thread has too many turns waiting.
     """
-    return chat_service.ask(input_data, user)
+    return await chat_service.aask(input_data, user)
+
+
+@router.post("/ask/stream")
+async def ask_stream(
+    input_data: AskInput,
+    user: dict = Depends(verify_jwt_token),
+) -> StreamingResponse:
+    """
+    Send a message to Jarvis and stream the reply as Server-Sent Events.
+
+    Args:
+        input_data: Message, model, and optional thread_id.
+        user: JWT payload (dependency).
+
+    Returns:
+        ``text/event-stream`` response with ``message``, ``token``,
+        ``tool_start``, ``tool_end``, ``error``, and final ``done`` events.
+
+    Raises:
+        HTTPException: 429 with ``Retry-After`` if the thread has too many turns waiting.
+    """
+    return StreamingResponse(
+        await chat_service.open_stream(input_data, user),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.post("/reset-session")
@@ -46,7 +92,7 @@ async def reset_session_individual(
     Raises:
         HTTPException: 403 if a non-admin tries to reset another thread.
     """
-    return chat_service.reset_session_for_user(payload, user)
+    return await chat_service.reset_session_for_user(payload, user)
 
 
 @router.get("/individual-cache-status")
@@ -60,26 +106,44 @@ async def individual_cache_status(user: dict = Depends(verify_jwt_token)) -> JSO
     Returns:
         JSON ``{exists: bool}``.
     """
-    exists = chat_service.individual_cache_exists(user["real_name"])
+    exists = await chat_service.individual_cache_exists(user["real_name"])
     return JSONResponse(content={"exists": exists})
 
 
 @router.get("/message-history")
 async def message_history(
+    response: Response,
     thread_id: str | None = None,
+    before: int | None = Query(default=None, ge=0),
+    limit: int | None = Query(default=None, ge=1, le=500),
+    if_none_match: str | None = Header(default=None),
     user: dict = Depends(verify_jwt_token),
 ) -> dict:
     """
-    Parsed message history for a thread.
+    Parsed message history for a thread, newest page first.
+
+    The response carries an ``ETag`` derived from the thread's latest
+    checkpoint; a request whose ``If-None-Match`` still matches gets an empty
+    304 without the history being read.
 
     Args:
+        response: Outgoing response (for the ``ETag`` header).
         thread_id: Thread to query; defaults to JWT real_name.
+        before: Pagination cursor (``next_before`` of the previous page).
+        limit: Maximum number of messages per page (all if omitted).
+        if_none_match: ETag of the client's cached copy.
         user: JWT payload.
 
     Returns:
-        Dict ``{thread_id, messages}``.
+        Dict ``{thread_id, messages, next_before}``, or a 304 response.
 
     Raises:
         HTTPException: 403 if a non-admin queries another thread.
     """
-    return chat_service.get_history(thread_id, user)
+    etag = await chat_service.get_history_etag(thread_id, user)
+    if etag and _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    body, etag = await chat_service.get_history(thread_id, user, before=before, limit=limit)
+    if etag:
+        response.headers["ETag"] = etag
+    return body
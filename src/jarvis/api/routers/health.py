@@ -0,0 +1,31 @@
+"""Liveness and readiness probes (no authentication)."""
+
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+
+from jarvis.api.services.health_service import health_service
+
+router = APIRouter(tags=["health"])
+
+
+@router.get("/healthz")
+async def healthz() -> dict:
+    """
+    Liveness probe: the process is running.
+
+    Returns:
+        Dict ``{status: "ok"}``.
+    """
+    return health_service.liveness()
+
+
+@router.get("/readyz")
+async def readyz() -> JSONResponse:
+    """
+    Readiness probe: 200 once agent warm-up finished, 503 while it runs.
+
+    Returns:
+        JSON with ``ready``, ``status`` and per-model warm-up progress.
+    """
+    status = health_service.readiness()
+    return JSONResponse(status, status_code=200 if status["ready"] else 503)
@@ -1,17 +1,29 @@
 """API security helpers (JWT signing and verification)."""
 
 from jarvis.api.security.jwt import (
+    SigningKeys,
     build_token_payload,
     build_token_payload_from_user,
     create_jwt_token,
+    decode_jwt,
     encode_jwt,
     get_jwt_secret_key,
+    get_signing_keys,
+    get_verified_token_cache_stats,
+    reload_signing_keys,
+    verify_jwt,
 )
 
 __all__ = [
+    "SigningKeys",
     "build_token_payload",
     "build_token_payload_from_user",
     "create_jwt_token",
+    "decode_jwt",
     "encode_jwt",
     "get_jwt_secret_key",
+    "get_signing_keys",
+    "get_verified_token_cache_stats",
+    "reload_signing_keys",
+    "verify_jwt",
 ]
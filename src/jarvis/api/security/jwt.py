@@ -1,27 +1,96 @@
-"""JWT payload building and signing (no FastAPI dependencies)."""
+"""JWT payload building, signing, and cached verification (no FastAPI dependencies)."""
 
 import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 
 import jwt
 
-from jarvis.core.config import JWT_ALGORITHM, JWT_EXP_DELTA_SECONDS
+from jarvis.core.config import (
+    JWT_ALGORITHM,
+    JWT_EXP_DELTA_SECONDS,
+    JWT_VERIFIED_CACHE_MAX_ENTRIES,
+)
+
+
+@dataclass(frozen=True)
+class SigningKeys:
+    """
+    Keys accepted for JWT verification.
+
+    Attributes:
+        current: Key that signs new tokens (``JWT_SECRET_KEY``).
+        previous: Retired keys still accepted until their tokens expire
+            (comma-separated ``JWT_PREVIOUS_SECRET_KEYS``).
+    """
+
+    current: str
+    previous: tuple[str, ...] = ()
+
+
+_signing_keys: SigningKeys | None = None
+_signing_keys_lock = threading.Lock()
+
+
+def _read_signing_keys() -> SigningKeys:
+    """Build ``SigningKeys`` from the environment."""
+    secret = os.getenv("JWT_SECRET_KEY")
+    if not secret:
+        raise RuntimeError("JWT_SECRET_KEY is not set")
+    previous = os.getenv("JWT_PREVIOUS_SECRET_KEYS", "")
+    return SigningKeys(secret, tuple(key.strip() for key in previous.split(",") if key.strip()))
+
+
+def get_signing_keys() -> SigningKeys:
+    """
+    Return the JWT keys, reading the environment only the first time.
+
+    Returns:
+        Current and previous signing keys.
+
+    Raises:
+        RuntimeError: If ``JWT_SECRET_KEY`` is not set.
+    """
+    global _signing_keys
+    if _signing_keys is None:
+        with _signing_keys_lock:
+            if _signing_keys is None:
+                _signing_keys = _read_signing_keys()
+    return _signing_keys
+
+
+def reload_signing_keys() -> SigningKeys:
+    """
+    Re-read the keys from the environment after a rotation.
+
+    Verified tokens are forgotten, so tokens signed with a key that is no
+    longer listed stop being accepted immediately.
+
+    Returns:
+        The new signing keys.
+    """
+    global _signing_keys
+    with _signing_keys_lock:
+        _signing_keys = _read_signing_keys()
+    _verified_tokens.clear()
+    return _signing_keys
 
 
 def get_jwt_secret_key() -> str:
     """
-    Read the JWT signing key from the environment.
+    Return the key that signs new JWTs.
 
     Returns:
-        Value of ``JWT_SECRET_KEY``.
+        Value of ``JWT_SECRET_KEY`` (read once, see ``get_signing_keys``).
 
     Raises:
         RuntimeError: If the variable is not set.
     """
-    secret = os.getenv("JWT_SECRET_KEY")
-    if not secret:
-        raise RuntimeError("JWT_SECRET_KEY is not set")
-    return secret
+    return get_signing_keys().current
 
 
 def build_token_payload(
@@ -103,3 +172,150 @@ def create_jwt_token(username: str) -> str:
         Signed JWT token.
     """
     return encode_jwt(build_token_payload(sub=username))
+
+
+class VerifiedTokenCache:
+    """
+    Thread-safe LRU of verified tokens and their claims.
+
+    Each entry expires at the token's ``exp`` claim, so a cached token is
+    never accepted after the moment ``jwt.decode`` would reject it. Tokens
+    without ``exp`` and failed verifications are not cached.
+
+    Attributes:
+        max_entries: Maximum number of cached tokens (0 or less disables caching).
+        hits: Lookups answered from the cache.
+        misses: Lookups that required a full verification.
+    """
+
+    def __init__(self, max_entries: int, clock: Callable[[], float] = time.time) -> None:
+        """
+        Args:
+            max_entries: Maximum number of cached tokens.
+            clock: Wall-clock time source, comparable with ``exp`` (overridable in tests).
+        """
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[dict, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, token: str) -> dict | None:
+        """
+        Return a copy of the claims of a cached, unexpired token.
+
+        Args:
+            token: Encoded JWT.
+
+        Returns:
+            Claims dict, or None on a miss (the miss is counted).
+        """
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is not None and self._clock() >= entry[1]:
+                del self._entries[token]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(token)
+            return dict(entry[0])
+
+    def put(self, token: str, claims: dict) -> None:
+        """
+        Cache the claims of a verified token until its ``exp``.
+
+        Args:
+            token: Encoded JWT that passed verification.
+            claims: Decoded claims.
+        """
+        exp = claims.get("exp")
+        if self.max_entries <= 0 or not isinstance(exp, (int, float)):
+            return
+        with self._lock:
+            self._entries[token] = (dict(claims), float(exp))
+            self._entries.move_to_end(token)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Forget every cached token."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """
+        Summarize cache occupancy and effectiveness.
+
+        Returns:
+            Dict with ``size``, ``max_entries``, ``hits``, ``misses`` and ``hit_ratio``.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+_verified_tokens = VerifiedTokenCache(JWT_VERIFIED_CACHE_MAX_ENTRIES)
+
+
+def decode_jwt(token: str) -> dict:
+    """
+    Verify a JWT against the current key, then each previous key.
+
+    Args:
+        token: Encoded JWT.
+
+    Returns:
+        Decoded claims.
+
+    Raises:
+        jwt.ExpiredSignatureError: If the signature is valid but ``exp`` passed.
+        jwt.InvalidTokenError: If no key verifies the token or it is malformed.
+    """
+    keys = get_signing_keys()
+    candidates = (keys.current, *keys.previous)
+    for key in candidates[:-1]:
+        try:
+            return jwt.decode(token, key, algorithms=[JWT_ALGORITHM])
+        except jwt.InvalidSignatureError:
+            continue
+    return jwt.decode(token, candidates[-1], algorithms=[JWT_ALGORITHM])
+
+
+def verify_jwt(token: str) -> dict:
+    """
+    Return the claims of a valid JWT, from the verified-token cache when possible.
+
+    Args:
+        token: Encoded JWT.
+
+    Returns:
+        Decoded claims (a copy the caller may modify).
+
+    Raises:
+        jwt.ExpiredSignatureError: If the token expired.
+        jwt.InvalidTokenError: If the token is invalid.
+    """
+    claims = _verified_tokens.get(token)
+    if claims is None:
+        claims = decode_jwt(token)
+        _verified_tokens.put(token, claims)
+    return claims
+
+
+def get_verified_token_cache_stats() -> dict:
+    """
+    Counters of the verified-token cache.
+
+    Returns:
+        Output of ``VerifiedTokenCache.stats``.
+    """
+    return _verified_tokens.stats()
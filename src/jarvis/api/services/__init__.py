@@ -3,12 +3,15 @@
 from jarvis.api.services.admin_service import AdminService, admin_service
 from jarvis.api.services.auth_service import AuthService, auth_service
 from jarvis.api.services.chat_service import ChatService, chat_service
+from jarvis.api.services.health_service import HealthService, health_service
 
 __all__ = [
     "AdminService",
     "AuthService",
     "ChatService",
+    "HealthService",
     "admin_service",
     "auth_service",
     "chat_service",
+    "health_service",
 ]
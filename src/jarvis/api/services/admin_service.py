@@ -1,29 +1,38 @@
 """Administrative use cases (global cache)."""
 
+import asyncio
+
 from jarvis.agents.session import get_cache_status, reset_cache_global
+from jarvis.api.security.jwt import get_verified_token_cache_stats
 
 
 class AdminService:
     """Operations restricted to admin users."""
 
-    def reset_global_memory(self) -> dict:
+    async def reset_global_memory(self) -> dict:
         """
         Clear all agent and session caches.
 
+        The session store is cleared in a worker thread, off the event loop.
+
         Returns:
             Dict ``{status, message}``.
         """
-        reset_cache_global()
+        await asyncio.to_thread(reset_cache_global)
         return {"status": "ok", "message": "Memoria global reiniciada"}
 
-    def get_cache_status(self) -> dict:
+    async def get_cache_status(self) -> dict:
         """
         Summarize global cache state.
 
+        Collected in a worker thread, off the event loop.
+
         Returns:
-            Dict with counters and lists of active models/sessions.
+            Dict with counters and lists of active models/sessions, plus
+            ``jwt_cache_stats`` (verified-token cache counters and hit ratio).
         """
-        return get_cache_status()
+        status = await asyncio.to_thread(get_cache_status)
+        return {**status, "jwt_cache_stats": get_verified_token_cache_stats()}
 
 
 admin_service = AdminService()
@@ -1,17 +1,43 @@
 """Chat, session, and history use cases."""
 
+import asyncio
+import json
+from collections.abc import AsyncIterator
+
 from fastapi import HTTPException, status
 
+from jarvis.agents.admission import track_queue_wait
 from jarvis.agents.session import (
     ask_jarvis,
+    ask_jarvis_async,
+    ask_jarvis_stream,
     check_individual_session_cache_exists,
-    get_message_history,
+    get_history_version,
+    get_message_history_page,
     reset_session,
 )
+from jarvis.agents.turn_queue import ThreadBusyError
 from jarvis.api.schemas.chat import AskInput, ThreadIdPayload
 from jarvis.core.enums import ModelEnum
 
 
+def _thread_busy(error: ThreadBusyError) -> HTTPException:
+    """
+    Translate a full turn queue into HTTP 429.
+
+    Args:
+        error: Rejection raised by the thread's turn queue.
+
+    Returns:
+        HTTPException with a ``Retry-After`` header.
+    """
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail="Hay demasiados mensajes pendientes en esta conversación. Inténtelo de nuevo en unos segundos.",
+        headers={"Retry-After": str(error.retry_after)},
+    )
+
+
 class ChatService:
     """Orchestrates Jarvis conversations via the API."""
 
@@ -31,12 +57,90 @@ class ChatService:
         answer = ask_jarvis(input_data.message, model_enum, thread_id, user_info=user)
         return {"response": answer}
 
-    def reset_session_for_user(
+    async def aask(self, input_data: AskInput, user: dict) -> dict:
+        """
+        Send a message to Jarvis without blocking the event loop.
+
+        Args:
+            input_data: Message, model, and optional thread_id.
+            user: Decoded JWT claims.
+
+        Returns:
+            Dict ``{response: list[str], queue_wait_ms: int}``; the wait is the
+            time this request's LLM calls spent queued for a model slot.
+
+        Raises:
+            HTTPException: 429 if the thread has too many turns waiting.
+        """
+        model_enum = ModelEnum[input_data.model_name]
+        thread_id = input_data.thread_id or user["real_name"]
+        queue_wait = track_queue_wait()
+        try:
+            answer = await ask_jarvis_async(
+                input_data.message, model_enum, thread_id, user_info=user
+            )
+        except ThreadBusyError as e:
+            raise _thread_busy(e) from None
+        return {"response": answer, "queue_wait_ms": round(queue_wait.ms)}
+
+    async def astream(self, input_data: AskInput, user: dict) -> AsyncIterator[str]:
+        """
+        Stream Jarvis's reply as Server-Sent Events.
+
+        Args:
+            input_data: Message, model, and optional thread_id.
+            user: Decoded JWT claims.
+
+        Yields:
+            SSE frames (``event:`` + JSON ``data:``) ending with a ``done`` event.
+        """
+        model_enum = ModelEnum[input_data.model_name]
+        thread_id = input_data.thread_id or user["real_name"]
+        async for event in ask_jarvis_stream(
+            input_data.message, model_enum, thread_id, user_info=user
+        ):
+            data = json.dumps(event["data"], ensure_ascii=False, default=str)
+            yield f"event: {event['event']}\ndata: {data}\n\n"
+
+    async def open_stream(self, input_data: AskInput, user: dict) -> AsyncIterator[str]:
+        """
+        Start ``astream`` up to its first frame, so a full queue still maps to 429.
+
+        The first frame is produced once the thread is free, before any
+        response header is sent.
+
+        Args:
+            input_data: Message, model, and optional thread_id.
+            user: Decoded JWT claims.
+
+        Returns:
+            Async iterator over every SSE frame, the first one included.
+
+        Raises:
+            HTTPException: 429 if the thread has too many turns waiting.
+        """
+        frames = self.astream(input_data, user)
+        try:
+            first = await anext(frames)
+        except ThreadBusyError as e:
+            raise _thread_busy(e) from None
+
+        async def replay() -> AsyncIterator[str]:
+            yield first
+            async for frame in frames:
+                yield frame
+
+        return replay()
+
+    async def reset_session_for_user(
         self, payload: ThreadIdPayload | None, user: dict
     ) -> dict:
         """
         Reset session cache for the given thread or the current user.
 
+        The reset (checkpointer thread and session store entry) runs in a
+        worker thread, off the event loop.
+
         Args:
             payload: Optional body with thread_id.
             user: Decoded JWT claims.
@@ -49,38 +153,81 @@ class ChatService:
         """
         thread_id = payload.thread_id if payload else None
         thread_id = self._resolve_thread_id(thread_id, user, action="reset")
-        reset_session(thread_id)
+        await asyncio.to_thread(reset_session, thread_id)
         return {"status": "ok", "message": "Memoria reiniciada"}
 
-    def individual_cache_exists(self, real_name: str) -> bool:
+    async def individual_cache_exists(self, real_name: str) -> bool:
         """
         Report whether a session is cached for a real_name.
 
+        The session store is read in a worker thread, off the event loop.
+
         Args:
             real_name: User identifier.
 
         Returns:
             True if a session cache entry exists.
         """
-        return check_individual_session_cache_exists(real_name)
+        return await asyncio.to_thread(check_individual_session_cache_exists, real_name)
 
-    def get_history(self, thread_id: str | None, user: dict) -> dict:
+    async def get_history_etag(self, thread_id: str | None, user: dict) -> str | None:
         """
-        Return parsed message history for a thread.
+        Return the ETag of a thread's history without reading its messages.
+
+        The checkpointer is read in a worker thread, off the event loop.
+
+        Args:
+            thread_id: Explicit thread or None to use JWT real_name.
+            user: Decoded JWT claims.
+
+        Returns:
+            Quoted ETag derived from the latest checkpoint id, or None if the
+            thread has no history.
+
+        Raises:
+            HTTPException: 403 if a non-admin queries another thread.
+        """
+        thread_id = self._resolve_thread_id(thread_id, user, action="read")
+        version = await asyncio.to_thread(get_history_version, thread_id)
+        return f'"{version}"' if version else None
+
+    async def get_history(
+        self,
+        thread_id: str | None,
+        user: dict,
+        *,
+        before: int | None = None,
+        limit: int | None = None,
+    ) -> tuple[dict, str | None]:
+        """
+        Return one page of parsed message history for a thread.
+
+        The checkpointer is read in a worker thread, off the event loop.
 
         Args:
             thread_id: Explicit thread or None to use JWT real_name.
             user: Decoded JWT claims.
+            before: Pagination cursor (``next_before`` of the previous page).
+            limit: Maximum number of messages per page (all if None).
 
         Returns:
-            Dict ``{thread_id, messages}``.
+            Tuple of dict ``{thread_id, messages, next_before}`` and the ETag of
+            the snapshot it was read from (None if there is no history).
 
         Raises:
             HTTPException: 403 if a non-admin queries another thread.
         """
         thread_id = self._resolve_thread_id(thread_id, user, action="read")
-        history = get_message_history(thread_id)
-        return {"thread_id": thread_id, "messages": history}
+        page = await asyncio.to_thread(
+            get_message_history_page, thread_id, before=before, limit=limit
+        )
+        etag = f'"{page["version"]}"' if page["version"] else None
+        body = {
+            "thread_id": thread_id,
+            "messages": page["messages"],
+            "next_before": page["next_before"],
+        }
+        return body, etag
 
     def _resolve_thread_id(
         self, thread_id: str | None, user: dict, *, action: str
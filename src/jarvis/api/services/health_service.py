@@ -0,0 +1,28 @@
+"""Liveness and readiness use cases."""
+
+from jarvis.agents.warmup import get_warmup_status
+
+
+class HealthService:
+    """Process health as seen by load balancers and orchestrators."""
+
+    def liveness(self) -> dict:
+        """
+        Report that the process is up and serving HTTP.
+
+        Returns:
+            Dict ``{status}``.
+        """
+        return {"status": "ok"}
+
+    def readiness(self) -> dict:
+        """
+        Report whether startup warm-up has finished.
+
+        Returns:
+            Dict with ``ready``, ``status`` and per-model warm-up details.
+        """
+        return get_warmup_status()
+
+
+health_service = HealthService()
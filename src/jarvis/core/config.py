@@ -1,6 +1,11 @@
 """Global Jarvis configuration (default model, JWT, debug flags)."""
 
-from jarvis.core.enums import IdentificationFailedProtocolEnum, ModelEnum
+from jarvis.core.enums import (
+    CheckpointerBackendEnum,
+    IdentificationFailedProtocolEnum,
+    ModelEnum,
+    SessionStoreBackendEnum,
+)
 
 DEFAULT_MODEL: ModelEnum = ModelEnum.GPT_3_5
 """LLM used when the client does not specify another model."""
@@ -22,5 +27,146 @@ JWT_ALGORITHM: str = "HS256"
 JWT_EXP_DELTA_SECONDS: int = 3600
 """JWT lifetime in seconds (one hour by default)."""
 
+JWT_VERIFIED_CACHE_MAX_ENTRIES: int = 1024
+"""Verified tokens whose claims are kept until their ``exp`` (0 disables the cache)."""
+
 USE_MCP: bool = False
 """If True, the GPT-3.5 agent uses JarvisMcpMemoryAgent instead of JarvisMemoryAgent."""
+
+WARMUP_MODELS: list[ModelEnum] = [DEFAULT_MODEL]
+"""Models whose agents are built (and LLM connections opened) when the API starts."""
+
+WARMUP_INVOKE: bool = False
+"""If True, warm-up also sends a one-token request to each model's LLM."""
+
+SESSION_CACHE_MAX_ENTRIES: int = 256
+"""Maximum number of cached chat sessions; least recently used ones are evicted first."""
+
+SESSION_CACHE_TTL_SECONDS: int = 6 * 3600
+"""Idle time after which a cached session (and any in-memory checkpointer thread) is evicted."""
+
+SESSION_STORE_BACKEND: SessionStoreBackendEnum | None = None
+"""Where the chat state of API sessions is shared between workers; None uses SQLITE if ``API_WORKERS`` > 1, else MEMORY."""
+
+REDIS_KEY_PREFIX: str = "jarvis"
+"""Prefix of every key written by the Redis session store and checkpointer (server from ``REDIS_URL``)."""
+
+TURN_QUEUE_MAX_DEPTH: int = 4
+"""Turns of one thread that may wait behind the running one before new ones get HTTP 429."""
+
+TURN_COALESCE_DUPLICATES: bool = False
+"""If True, a message identical to one still queued (not yet running) on its thread shares that turn's reply."""
+
+TURN_COALESCE_WINDOW_SECONDS: float = 2.0
+"""Maximum gap between two identical messages for the second to share the first one's turn."""
+
+ADMISSION_MAX_CONCURRENCY: dict[ModelEnum, int] = {
+    ModelEnum.GPT_3_5: 8,
+    ModelEnum.ZEPHYR: 2,
+    ModelEnum.MISTRAL: 2,
+}
+"""Maximum concurrent LLM calls per model across the process; extra calls wait in a fair queue."""
+
+ADMISSION_DEFAULT_MAX_CONCURRENCY: int = 4
+"""Concurrent LLM call cap of models missing from ``ADMISSION_MAX_CONCURRENCY``."""
+
+ADMISSION_USER_WEIGHTS: dict[str, float] = {}
+"""Fair-queuing weight per ``real_name`` (1.0 when missing); admins are always served first."""
+
+LLM_REQUESTS_PER_MINUTE: dict[ModelEnum, int] = {ModelEnum.GPT_3_5: 3500}
+"""Client-side requests-per-minute limit per OpenAI model (match your account's tier)."""
+
+LLM_TOKENS_PER_MINUTE: dict[ModelEnum, int] = {ModelEnum.GPT_3_5: 200_000}
+"""Client-side tokens-per-minute limit per OpenAI model, reconciled with each response's usage."""
+
+LLM_COMPLETION_TOKENS_ESTIMATE: int = 512
+"""Completion tokens reserved for a call that sets no ``max_tokens`` until its real usage is known."""
+
+LLM_MAX_RETRIES: int = 6
+"""Retries of an OpenAI call that failed with 408, 409, 429, 5xx, or a connection error."""
+
+LLM_BACKOFF_BASE_SECONDS: float = 0.5
+"""First step of the exponential backoff between retries (also the jitter added to ``Retry-After``)."""
+
+LLM_BACKOFF_MAX_SECONDS: float = 30.0
+"""Upper bound of the backoff between retries when the provider sends no ``Retry-After``."""
+
+CHECKPOINTER_BACKEND: CheckpointerBackendEnum = CheckpointerBackendEnum.SQLITE
+"""Where memory agents keep conversation threads (SQLite file survives restarts; Redis is shared across hosts)."""
+
+CHECKPOINT_KEEP_LAST: int = 20
+"""Checkpoints kept per thread (by the SQLite backend's background vacuum, on every write with Redis)."""
+
+CHECKPOINT_FLUSH_BATCH_SIZE: int = 64
+"""Buffered checkpoint writes that force a flush to SQLite."""
+
+CHECKPOINT_FLUSH_INTERVAL_SECONDS: float = 1.0
+"""Maximum time a checkpoint write stays buffered before it is flushed."""
+
+CHECKPOINT_VACUUM_INTERVAL_SECONDS: int = 600
+"""Period of the SQLite backend's prune and incremental-vacuum pass."""
+
+CONTEXT_TOKEN_BUDGETS: dict[ModelEnum, int] = {
+    ModelEnum.GPT_3_5: 3000,
+    ModelEnum.GPT_4: 6000,
+}
+"""Approximate prompt tokens per LLM call; older turns are folded into a rolling summary."""
+
+CONTEXT_SUMMARY_KEEP_RATIO: float = 0.5
+"""Share of the token budget left to verbatim recent turns after a summary pass."""
+
+TOOL_OUTPUT_DEFAULT_TOKEN_BUDGET: int | None = 1500
+"""Approximate tokens a tool result may add to the context (None disables truncation)."""
+
+TOOL_OUTPUT_TOKEN_BUDGETS: dict[str, int] = {
+    "get_upcoming_events_tool": 1200,
+}
+"""Per-tool overrides of ``TOOL_OUTPUT_DEFAULT_TOKEN_BUDGET``, keyed by tool name."""
+
+LLM_CACHE_ENABLED: bool = False
+"""If True, identical temperature-0 chatbot calls are answered from the response cache."""
+
+LLM_CACHE_MAX_ENTRIES: int = 1024
+"""Responses kept in the in-memory LRU layer of the LLM cache."""
+
+LLM_CACHE_TTL_SECONDS: int = 24 * 3600
+"""Lifetime of a cached LLM response."""
+
+LLM_CACHE_PERSIST: bool = False
+"""If True, the LLM cache also stores responses in ``data/llm_cache.db``."""
+
+TRANSCRIPTION_CACHE_ENABLED: bool = True
+"""If True, transcriptions are cached in ``data/transcriptions.db`` by the audio's SHA-256."""
+
+TRANSCRIPTION_CACHE_MAX_ENTRIES: int = 1000
+"""Transcriptions kept before the least recently used are evicted."""
+
+TRANSCRIPTION_CACHE_MAX_BYTES: int = 8 * 1024 * 1024
+"""Total transcription text kept before the least recently used are evicted."""
+
+AUDIO_PREPROCESSING_ENABLED: bool = True
+"""If True, audio is downmixed to 16 kHz mono, trimmed and compressed before transcription."""
+
+AUDIO_SILENCE_THRESHOLD_DB: float = -45.0
+"""Level (dBFS) below which leading and trailing audio is trimmed as silence."""
+
+CALENDAR_FETCH_MAX_WORKERS: int = 4
+"""Google accounts queried in parallel by the calendar tools."""
+
+CALENDAR_MIRROR_ENABLED: bool = True
+"""If True, calendar reads are served from a local SQLite mirror kept in sync with ``syncToken``."""
+
+CALENDAR_MIRROR_STALENESS_SECONDS: int = 60
+"""Maximum age of an account's last sync before a read triggers an incremental sync."""
+
+CALENDAR_MIRROR_HISTORY_DAYS: int = 30
+"""Days of past events fetched by an account's full sync; older ranges are read from the API."""
+
+GOOGLE_OAUTH_TOKEN_URI: str | None = None
+"""Override of Google's OAuth token endpoint (e.g. a local stand-in); None uses Google's."""
+
+GOOGLE_TOKEN_REFRESH_AHEAD_SECONDS: int = 10 * 60
+"""Google OAuth tokens expiring within this window are renewed in the background."""
+
+GOOGLE_TOKEN_REFRESH_INTERVAL_SECONDS: int = 60
+"""Period of the background Google token refresh pass."""
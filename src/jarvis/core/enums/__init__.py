@@ -1,5 +1,15 @@
 """Enumerations in the core package."""
 
-from jarvis.core.enums.core_enums import IdentificationFailedProtocolEnum, ModelEnum
+from jarvis.core.enums.core_enums import (
+    CheckpointerBackendEnum,
+    IdentificationFailedProtocolEnum,
+    ModelEnum,
+    SessionStoreBackendEnum,
+)
 
-__all__ = ["ModelEnum", "IdentificationFailedProtocolEnum"]
+__all__ = [
+    "ModelEnum",
+    "IdentificationFailedProtocolEnum",
+    "CheckpointerBackendEnum",
+    "SessionStoreBackendEnum",
+]
@@ -17,3 +17,19 @@ class IdentificationFailedProtocolEnum(Enum):
 
     HOSTILE_RESPONSES = "hostile_responses"
     AUTOMATIC_RESPONSE = "automatic_response"
+
+
+class CheckpointerBackendEnum(Enum):
+    """Storage backend for LangGraph conversation checkpoints."""
+
+    MEMORY = "memory"
+    SQLITE = "sqlite"
+    REDIS = "redis"
+
+
+class SessionStoreBackendEnum(Enum):
+    """Where chat session state is shared between API worker processes."""
+
+    MEMORY = "memory"
+    SQLITE = "sqlite"
+    REDIS = "redis"
@@ -24,6 +24,12 @@ PROJECT_ROOT: Path = find_project_root()
 JARVIS_PACKAGE_DIR: Path = Path(__file__).resolve().parent.parent
 DATA_DIR: Path = PROJECT_ROOT / "data"
 USERS_DB_PATH: Path = DATA_DIR / "users.db"
+CHECKPOINTS_DB_PATH: Path = DATA_DIR / "checkpoints.db"
+SESSIONS_DB_PATH: Path = DATA_DIR / "sessions.db"
+LLM_CACHE_DB_PATH: Path = DATA_DIR / "llm_cache.db"
+TRANSCRIPTION_CACHE_DB_PATH: Path = DATA_DIR / "transcriptions.db"
+CALENDAR_MIRROR_DB_PATH: Path = DATA_DIR / "calendar_mirror.db"
+TOOLS_MANIFEST_PATH: Path = DATA_DIR / "tools_manifest.json"
 GOOGLE_CREDENTIALS_DIR: Path = DATA_DIR / "google"
 FIREBASE_PRIVATE_KEY_PATH: Path = DATA_DIR / "firebase_project_secret_private_key.json"
 MCP_DIR: Path = JARVIS_PACKAGE_DIR / "mcp"
@@ -0,0 +1,159 @@
+"""Shrink audio before transcription: 16 kHz mono, trimmed silence, compact codec."""
+
+import io
+import logging
+import os
+import shutil
+import subprocess
+import wave
+from dataclasses import dataclass
+
+import numpy as np
+
+from jarvis.core.config import AUDIO_SILENCE_THRESHOLD_DB
+
+logger = logging.getLogger(__name__)
+
+TARGET_SAMPLE_RATE = 16_000
+"""Whisper resamples to 16 kHz internally, so higher rates only cost upload bytes."""
+
+OPUS_BITRATE = "24k"
+"""Opus bitrate used when ffmpeg is available (ample for speech)."""
+
+_FRAME_SECONDS = 0.02
+
+
+@dataclass(frozen=True)
+class PreparedAudio:
+    """Audio ready for upload."""
+
+    filename: str
+    data: bytes
+
+
+def _ffmpeg_filters(threshold_db: float) -> str:
+    """Trim leading silence, reverse, trim again, reverse back (= trailing trim)."""
+    trim = f"silenceremove=start_periods=1:start_threshold={threshold_db}dB"
+    return f"{trim},areverse,{trim},areverse"
+
+
+def _with_ffmpeg(ffmpeg: str, file_path: str, threshold_db: float) -> PreparedAudio:
+    """Transcode to 16 kHz mono Ogg/Opus with silence trimmed."""
+    completed = subprocess.run(
+        [
+            ffmpeg, "-nostdin", "-loglevel", "error", "-i", file_path,
+            "-af", _ffmpeg_filters(threshold_db),
+            "-ac", "1", "-ar", str(TARGET_SAMPLE_RATE),
+            "-c:a", "libopus", "-b:a", OPUS_BITRATE, "-f", "ogg", "pipe:1",
+        ],
+        capture_output=True,
+        check=True,
+        timeout=120,
+    )
+    return PreparedAudio("audio.ogg", completed.stdout)
+
+
+def _read_wav(file_path: str) -> tuple[np.ndarray, int]:
+    """Decode a PCM WAV file into mono float samples in [-1, 1]."""
+    with wave.open(file_path, "rb") as wav:
+        channels, width, rate = wav.getnchannels(), wav.getsampwidth(), wav.getframerate()
+        frames = wav.readframes(wav.getnframes())
+    if width == 1:
+        samples = (np.frombuffer(frames, dtype=np.uint8).astype(np.float32) - 128) / 128
+    elif width == 2:
+        samples = np.frombuffer(frames, dtype="<i2").astype(np.float32) / 32768
+    elif width == 4:
+        samples = np.frombuffer(frames, dtype="<i4").astype(np.float32) / 2147483648
+    else:
+        raise ValueError(f"Unsupported WAV sample width: {width} bytes")
+    return samples.reshape(-1, channels).mean(axis=1), rate
+
+
+def _resample(samples: np.ndarray, rate: int, target_rate: int) -> np.ndarray:
+    """Linear-interpolation resampling (adequate for speech recognition)."""
+    if rate == target_rate or samples.size == 0:
+        return samples
+    duration = samples.size / rate
+    target_times = np.arange(int(duration * target_rate)) / target_rate
+    return np.interp(target_times, np.arange(samples.size) / rate, samples).astype(np.float32)
+
+
+def trim_silence(samples: np.ndarray, rate: int, threshold_db: float) -> np.ndarray:
+    """
+    Drop leading and trailing frames whose RMS level is below ``threshold_db``.
+
+    Args:
+        samples: Mono float samples in [-1, 1].
+        rate: Sample rate in Hz.
+        threshold_db: Silence level in dBFS.
+
+    Returns:
+        Trimmed samples, or ``samples`` unchanged if everything is silence.
+    """
+    frame = max(1, int(rate * _FRAME_SECONDS))
+    count = samples.size // frame
+    if count == 0:
+        return samples
+    frames = samples[: count * frame].reshape(count, frame)
+    rms = np.sqrt(np.mean(frames ** 2, axis=1))
+    voiced = np.flatnonzero(rms > 10 ** (threshold_db / 20))
+    if voiced.size == 0:
+        return samples
+    return samples[voiced[0] * frame : (voiced[-1] + 1) * frame]
+
+
+def _encode_wav(samples: np.ndarray, rate: int) -> bytes:
+    """Encode mono float samples as 16-bit PCM WAV."""
+    pcm = (np.clip(samples, -1, 1) * 32767).astype("<i2")
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(pcm.tobytes())
+    return buffer.getvalue()
+
+
+def _with_numpy(file_path: str, threshold_db: float) -> PreparedAudio:
+    """Downmix, resample and trim a WAV file without external tools."""
+    samples, rate = _read_wav(file_path)
+    samples = trim_silence(_resample(samples, rate, TARGET_SAMPLE_RATE), TARGET_SAMPLE_RATE, threshold_db)
+    return PreparedAudio("audio.wav", _encode_wav(samples, TARGET_SAMPLE_RATE))
+
+
+def preprocess_audio(file_path: str, threshold_db: float = AUDIO_SILENCE_THRESHOLD_DB) -> PreparedAudio:
+    """
+    Prepare an audio file for upload to the transcription API.
+
+    With ``ffmpeg`` on PATH any input is transcoded to 16 kHz mono Opus with
+    leading and trailing silence removed. Without it, WAV input is downmixed,
+    resampled and trimmed with numpy and re-encoded as 16-bit PCM; other
+    formats are uploaded as they are. The original file is also used whenever
+    preprocessing fails or would not make the upload smaller.
+
+    Args:
+        file_path: Audio file on disk.
+        threshold_db: Silence level in dBFS.
+
+    Returns:
+        Filename (its extension tells the API the format) and bytes to upload.
+    """
+    with open(file_path, "rb") as f:
+        original = PreparedAudio(os.path.basename(file_path), f.read())
+    ffmpeg = shutil.which("ffmpeg")
+    try:
+        if ffmpeg:
+            prepared = _with_ffmpeg(ffmpeg, file_path, threshold_db)
+        elif file_path.lower().endswith(".wav"):
+            prepared = _with_numpy(file_path, threshold_db)
+        else:
+            return original
+    except Exception as e:
+        logger.warning("Audio preprocessing failed for %s, uploading original: %s", file_path, e)
+        return original
+    if not prepared.data or len(prepared.data) >= len(original.data):
+        return original
+    logger.debug(
+        "Audio %s reduced from %d to %d bytes", file_path, len(original.data), len(prepared.data)
+    )
+    return prepared
@@ -0,0 +1,176 @@
+"""Transcriptions cached on disk by the SHA-256 of the audio file."""
+
+import hashlib
+import logging
+import threading
+import time
+from collections.abc import Callable
+
+from jarvis.core.config import (
+    TRANSCRIPTION_CACHE_ENABLED,
+    TRANSCRIPTION_CACHE_MAX_BYTES,
+    TRANSCRIPTION_CACHE_MAX_ENTRIES,
+)
+from jarvis.core.paths import TRANSCRIPTION_CACHE_DB_PATH
+from jarvis.infrastructure.persistence.sqlite import get_connection
+
+logger = logging.getLogger(__name__)
+
+_HASH_CHUNK_BYTES = 1024 * 1024
+
+
+def file_sha256(file_path: str) -> str:
+    """
+    Hash a file's contents in chunks.
+
+    Args:
+        file_path: File on disk.
+
+    Returns:
+        Hex SHA-256 digest.
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        while chunk := f.read(_HASH_CHUNK_BYTES):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class TranscriptionCache:
+    """
+    SQLite-backed LRU of transcriptions keyed by (audio SHA-256, model).
+
+    Entries survive restarts; when the cache holds more than ``max_entries``
+    rows or ``max_bytes`` of text, the least recently used are deleted.
+
+    Attributes:
+        db_path: SQLite file of the cache.
+        max_entries: Maximum number of transcriptions kept.
+        max_bytes: Maximum total UTF-8 size of the kept transcriptions.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        max_entries: int = TRANSCRIPTION_CACHE_MAX_ENTRIES,
+        max_bytes: int = TRANSCRIPTION_CACHE_MAX_BYTES,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Args:
+            db_path: SQLite file of the cache.
+            max_entries: Maximum number of transcriptions kept.
+            max_bytes: Maximum total size of the kept text, in bytes.
+            clock: Wall-clock time source (overridable in tests).
+        """
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._clock = clock
+        conn = get_connection(db_path)
+        with conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS transcriptions ("
+                " audio_sha256 TEXT NOT NULL, model TEXT NOT NULL, text TEXT NOT NULL,"
+                " size INTEGER NOT NULL, last_used REAL NOT NULL,"
+                " PRIMARY KEY (audio_sha256, model)) WITHOUT ROWID"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS transcriptions_lru ON transcriptions (last_used)"
+            )
+
+    def get(self, audio_sha256: str, model: str) -> str | None:
+        """
+        Look up a transcription and mark it as recently used.
+
+        Args:
+            audio_sha256: Digest from ``file_sha256``.
+            model: Transcription model name.
+
+        Returns:
+            Cached text, or None on a miss.
+        """
+        conn = get_connection(self.db_path)
+        with conn:
+            row = conn.execute(
+                "UPDATE transcriptions SET last_used = ? WHERE audio_sha256 = ? AND model = ?"
+                " RETURNING text",
+                (self._clock(), audio_sha256, model),
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, audio_sha256: str, model: str, text: str) -> None:
+        """
+        Store a transcription, evicting least recently used entries over the limits.
+
+        Args:
+            audio_sha256: Digest from ``file_sha256``.
+            model: Transcription model name.
+            text: Transcribed text.
+        """
+        conn = get_connection(self.db_path)
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO transcriptions (audio_sha256, model, text, size, last_used)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (audio_sha256, model, text, len(text.encode("utf-8")), self._clock()),
+            )
+            self._evict(conn)
+
+    def stats(self) -> dict:
+        """
+        Summarize cache occupancy.
+
+        Returns:
+            Dict with ``entries``, ``bytes``, ``max_entries`` and ``max_bytes``.
+        """
+        entries, size = get_connection(self.db_path).execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM transcriptions"
+        ).fetchone()
+        return {
+            "entries": entries,
+            "bytes": size,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+        }
+
+    def _evict(self, conn) -> None:
+        """Delete least recently used rows until both limits hold."""
+        entries, size = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM transcriptions"
+        ).fetchone()
+        if entries <= self.max_entries and size <= self.max_bytes:
+            return
+        evicted = 0
+        for key, model, row_size in conn.execute(
+            "SELECT audio_sha256, model, size FROM transcriptions ORDER BY last_used"
+        ).fetchall():
+            if entries <= self.max_entries and size <= self.max_bytes:
+                break
+            conn.execute(
+                "DELETE FROM transcriptions WHERE audio_sha256 = ? AND model = ?", (key, model)
+            )
+            entries -= 1
+            size -= row_size
+            evicted += 1
+        logger.debug("Evicted %d cached transcriptions", evicted)
+
+
+_cache: TranscriptionCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_transcription_cache() -> TranscriptionCache | None:
+    """
+    Return the process-wide transcription cache when ``TRANSCRIPTION_CACHE_ENABLED`` is set.
+
+    Returns:
+        Shared TranscriptionCache, or None if caching is disabled.
+    """
+    global _cache
+    if not TRANSCRIPTION_CACHE_ENABLED:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = TranscriptionCache(str(TRANSCRIPTION_CACHE_DB_PATH))
+        return _cache
@@ -1,6 +1,7 @@
 """Symmetric encryption (Fernet) and hashing utilities for user data."""
 
 import hashlib
+import hmac
 import os
 
 from cryptography.fernet import Fernet
@@ -9,6 +10,7 @@ from dotenv import load_dotenv
 load_dotenv()
 
 _fernet: Fernet | None = None
+_blind_index_key: bytes | None = None
 
 
 def _get_fernet() -> Fernet:
@@ -30,6 +32,53 @@ def _get_fernet() -> Fernet:
     return _fernet
 
 
+def _get_blind_index_key() -> bytes:
+    """
+    Return the HMAC key used for blind indexes (lazily initialized).
+
+    Uses ``BLIND_INDEX_KEY`` when set; otherwise derives a dedicated key from
+    ``FERNET_KEY`` so the encryption key itself is never used as an HMAC key.
+
+    Returns:
+        Raw HMAC key bytes.
+
+    Raises:
+        RuntimeError: If neither ``BLIND_INDEX_KEY`` nor ``FERNET_KEY`` is set.
+    """
+    global _blind_index_key
+    if _blind_index_key is None:
+        key = os.getenv("BLIND_INDEX_KEY")
+        if key:
+            _blind_index_key = key.encode()
+        else:
+            fernet_key = os.getenv("FERNET_KEY")
+            if not fernet_key:
+                raise RuntimeError("BLIND_INDEX_KEY or FERNET_KEY must be set")
+            _blind_index_key = hmac.new(
+                fernet_key.encode(), b"jarvis-blind-index-v1", hashlib.sha256
+            ).digest()
+    return _blind_index_key
+
+
+def compute_blind_index(input_string: str) -> str:
+    """
+    Compute a keyed, deterministic blind index for an encrypted column.
+
+    Equal plain texts map to equal indexes, so encrypted values can be looked
+    up with an indexed equality query without decrypting every row.
+
+    Args:
+        input_string: Plain text (compared exactly, case-sensitive).
+
+    Returns:
+        HMAC-SHA256 hex digest.
+
+    Raises:
+        RuntimeError: If no key is configured.
+    """
+    return hmac.new(_get_blind_index_key(), input_string.encode(), hashlib.sha256).hexdigest()
+
+
 def hash_string_sha256_lowered(input_string: str) -> str:
     """
     Compute the SHA-256 hash of a lowercased string.
@@ -1,8 +1,22 @@
-"""Google integrations (Calendar OAuth, credentials on disk)."""
+"""Google integrations (Calendar OAuth, credentials on disk, API clients)."""
 
 from jarvis.infrastructure.google.calendar_auth import (
     GOOGLE_API_DIR,
     get_authentications_for_user,
 )
+from jarvis.infrastructure.google.calendar_mirror import CalendarMirror, get_calendar_mirror
+from jarvis.infrastructure.google.calendar_service import (
+    get_calendar_http,
+    get_calendar_service,
+    invalidate_calendar_services,
+)
 
-__all__ = ["GOOGLE_API_DIR", "get_authentications_for_user"]
+__all__ = [
+    "CalendarMirror",
+    "GOOGLE_API_DIR",
+    "get_authentications_for_user",
+    "get_calendar_http",
+    "get_calendar_mirror",
+    "get_calendar_service",
+    "invalidate_calendar_services",
+]
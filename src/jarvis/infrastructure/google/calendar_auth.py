@@ -1,7 +1,11 @@
 """Google Calendar OAuth authentication per user and account."""
 
+import datetime
 import logging
 import os
+import tempfile
+import threading
+from contextlib import suppress
 
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
@@ -11,6 +15,11 @@ logger = logging.getLogger(__name__)
 
 SCOPES = ["https://www.googleapis.com/auth/calendar.events"]
 
+from jarvis.core.config import (
+    GOOGLE_OAUTH_TOKEN_URI,
+    GOOGLE_TOKEN_REFRESH_AHEAD_SECONDS,
+    GOOGLE_TOKEN_REFRESH_INTERVAL_SECONDS,
+)
 from jarvis.core.paths import GOOGLE_CREDENTIALS_DIR
 
 GOOGLE_API_DIR = str(GOOGLE_CREDENTIALS_DIR)
@@ -39,7 +48,10 @@ def _load_paths(user_dir: str) -> tuple[str | None, str | None]:
 
 def _persist(creds: Credentials, token_path: str) -> None:
     """
-    Persist updated OAuth credentials to disk.
+    Persist updated OAuth credentials to disk atomically.
+
+    The JSON is written to a temporary file in the same directory and moved
+    over ``token_path`` with ``os.replace``, so readers never see a partial file.
 
     Args:
         creds: Google credentials.
@@ -48,8 +60,29 @@ def _persist(creds: Credentials, token_path: str) -> None:
     Returns:
         None.
     """
-    with open(token_path, "w", encoding="utf-8") as f:
-        f.write(creds.to_json())
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=".token-", suffix=".tmp", dir=os.path.dirname(token_path) or "."
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(creds.to_json())
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, token_path)
+    except BaseException:
+        with suppress(FileNotFoundError):
+            os.unlink(tmp_path)
+        raise
+
+
+def _mtime(path: str | None) -> int | None:
+    """Modification time of ``path`` in nanoseconds, or None if it is missing."""
+    if not path:
+        return None
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
 
 
 def _ensure_creds(
@@ -72,6 +105,10 @@ def _ensure_creds(
     creds = None
     if token_path and os.path.exists(token_path):
         creds = Credentials.from_authorized_user_file(token_path, SCOPES)
+        if GOOGLE_OAUTH_TOKEN_URI:
+            expiry = creds.expiry  # with_token_uri() does not copy the expiry
+            creds = creds.with_token_uri(GOOGLE_OAUTH_TOKEN_URI)
+            creds.expiry = expiry
 
     if creds and creds.valid:
         return creds
@@ -99,11 +136,228 @@ def _ensure_creds(
     return creds
 
 
+class _CachedCredentials:
+    """Credentials of one account plus the file state they were loaded from."""
+
+    def __init__(self, credentials: Credentials, account_dir: str) -> None:
+        self.credentials = credentials
+        self.account_dir = account_dir
+        self.lock = threading.Lock()
+        self.stamp()
+
+    def stamp(self) -> None:
+        """Record the current mtimes of the account directory and token file."""
+        self.credential_path, self.token_path = _load_paths(self.account_dir)
+        self.dir_mtime = _mtime(self.account_dir)
+        self.token_mtime = _mtime(self.token_path)
+
+    def is_fresh(self) -> bool:
+        """Whether nothing changed on disk since the credentials were loaded."""
+        return (
+            _mtime(self.account_dir) == self.dir_mtime
+            and _mtime(self.token_path) == self.token_mtime
+        )
+
+    def expires_within(self, seconds: float) -> bool:
+        """Whether the access token expires in less than ``seconds``."""
+        expiry = self.credentials.expiry
+        if expiry is None:
+            return False
+        now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+        return (expiry - now).total_seconds() < seconds
+
+
+class CredentialCache:
+    """
+    Process-wide cache of Google OAuth credentials keyed by (user, account).
+
+    A lookup costs a few ``stat`` calls: the account list is re-read only when
+    the user directory changes, and a token file is re-parsed only when its
+    mtime (or its directory's) changes. A background thread refreshes tokens
+    that expire within ``refresh_ahead_seconds`` and writes them back
+    atomically, so tool calls normally find a valid token without an OAuth
+    round-trip.
+
+    Attributes:
+        refresh_ahead_seconds: Renew tokens expiring within this window.
+        refresh_interval_seconds: Period of the background refresh pass.
+    """
+
+    def __init__(
+        self,
+        refresh_ahead_seconds: float = GOOGLE_TOKEN_REFRESH_AHEAD_SECONDS,
+        refresh_interval_seconds: float = GOOGLE_TOKEN_REFRESH_INTERVAL_SECONDS,
+    ) -> None:
+        """
+        Args:
+            refresh_ahead_seconds: Renew tokens expiring within this window.
+            refresh_interval_seconds: Period of the background refresh pass.
+        """
+        self.refresh_ahead_seconds = refresh_ahead_seconds
+        self.refresh_interval_seconds = refresh_interval_seconds
+        self._entries: dict[tuple[str, str], _CachedCredentials] = {}
+        self._accounts: dict[str, tuple[int | None, list[str]]] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._refresher: threading.Thread | None = None
+
+    def get_for_user(
+        self, username: str, allow_logging_popup: bool = False
+    ) -> dict[str, Credentials]:
+        """
+        Return valid credentials for every account of a user.
+
+        Args:
+            username: Folder name under ``GOOGLE_API_DIR``.
+            allow_logging_popup: Allow the browser OAuth flow if a token is missing.
+
+        Returns:
+            Dict ``{account_name: Credentials}`` for authenticated accounts only.
+
+        Raises:
+            FileNotFoundError: If the user directory does not exist.
+        """
+        base_user_dir = os.path.join(GOOGLE_API_DIR, username)
+        if not os.path.isdir(base_user_dir):
+            raise FileNotFoundError(
+                f"No existe el directorio para el usuario '{username}'. Ruta comprobada: {base_user_dir}"
+            )
+        self._ensure_refresher()
+
+        authentications: dict[str, Credentials] = {}
+        for account in self._list_accounts(base_user_dir):
+            try:
+                creds = self._get_account(username, account, os.path.join(base_user_dir, account), allow_logging_popup)
+            except Exception as e:
+                logger.warning("No se pudo autenticar %s: %s", account, e)
+                continue
+            if creds is not None:
+                authentications[account] = creds
+        return authentications
+
+    def refresh_due(self) -> int:
+        """
+        Refresh every cached token that expires within ``refresh_ahead_seconds``.
+
+        Returns:
+            Number of tokens refreshed.
+        """
+        with self._lock:
+            entries = list(self._entries.items())
+        refreshed = 0
+        for (username, account), entry in entries:
+            creds = entry.credentials
+            if not creds.refresh_token or not entry.expires_within(self.refresh_ahead_seconds):
+                continue
+            try:
+                self._refresh(entry)
+                refreshed += 1
+            except Exception as e:
+                logger.warning("Refresh anticipado fallido para %s/%s: %s", username, account, e)
+        return refreshed
+
+    def invalidate(self, username: str | None = None) -> None:
+        """
+        Forget cached credentials (all users, or one).
+
+        Args:
+            username: Restrict to this user.
+        """
+        with self._lock:
+            for key in list(self._entries):
+                if username is None or key[0] == username:
+                    del self._entries[key]
+            if username is None:
+                self._accounts.clear()
+            else:
+                self._accounts.pop(os.path.join(GOOGLE_API_DIR, username), None)
+
+    def stop(self) -> None:
+        """Stop the background refresh thread."""
+        self._stop.set()
+        refresher = self._refresher
+        if refresher is not None and refresher is not threading.current_thread():
+            refresher.join(timeout=5)
+        self._refresher = None
+
+    def _list_accounts(self, base_user_dir: str) -> list[str]:
+        """Account directories of a user, re-listed only when the directory changes."""
+        dir_mtime = _mtime(base_user_dir)
+        with self._lock:
+            cached = self._accounts.get(base_user_dir)
+            if cached is not None and cached[0] == dir_mtime:
+                return cached[1]
+        accounts = sorted(
+            name for name in os.listdir(base_user_dir)
+            if os.path.isdir(os.path.join(base_user_dir, name))
+        )
+        with self._lock:
+            self._accounts[base_user_dir] = (dir_mtime, accounts)
+        return accounts
+
+    def _get_account(
+        self, username: str, account: str, account_dir: str, allow_logging_popup: bool
+    ) -> Credentials | None:
+        """Cached credentials of one account, reloading or refreshing only when needed."""
+        key = (username, account)
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and entry.is_fresh():
+            if not entry.credentials.valid and entry.credentials.refresh_token:
+                with suppress(Exception):
+                    self._refresh(entry)
+            if entry.credentials.valid:
+                return entry.credentials
+
+        credential_path, token_path = _load_paths(account_dir)
+        if not credential_path:
+            logger.warning("Falta credential_*.json en %s", account_dir)
+            return None
+        creds = _ensure_creds(credential_path, token_path, allow_logging_popup)
+        with self._lock:
+            self._entries[key] = _CachedCredentials(creds, account_dir)
+        return creds
+
+    def _refresh(self, entry: _CachedCredentials) -> None:
+        """Refresh an entry's token and write it back atomically."""
+        with entry.lock:
+            if entry.credentials.valid and not entry.expires_within(self.refresh_ahead_seconds):
+                return  # another thread refreshed it meanwhile
+            entry.credentials.refresh(Request())
+            if entry.token_path:
+                _persist(entry.credentials, entry.token_path)
+            entry.stamp()
+
+    def _ensure_refresher(self) -> None:
+        """Start the refresh-ahead thread on first use."""
+        if self._refresher is not None and self._refresher.is_alive():
+            return
+        with self._lock:
+            if self._refresher is not None and self._refresher.is_alive():
+                return
+            self._stop.clear()
+            self._refresher = threading.Thread(
+                target=self._run_refresher, name="jarvis-google-token-refresh", daemon=True
+            )
+            self._refresher.start()
+
+    def _run_refresher(self) -> None:
+        """Periodically renew tokens before they expire."""
+        while not self._stop.wait(self.refresh_interval_seconds):
+            try:
+                self.refresh_due()
+            except Exception as e:
+                logger.error("Google token refresh pass failed: %s", e)
+
+
+_credential_cache = CredentialCache()
+
+
 def get_authentications_for_user(
     username: str, allow_logging_popup: bool = False
 ) -> dict[str, Credentials]:
     """
-    Load OAuth credentials for all Google accounts of a user.
+    Load OAuth credentials for all Google accounts of a user (cached).
 
     Args:
         username: Folder name under ``api/google_api/<username>/``.
@@ -115,28 +369,4 @@ def get_authentications_for_user(
     Raises:
         FileNotFoundError: If the user directory does not exist.
     """
-    authentications: dict[str, Credentials] = {}
-
-    base_user_dir = os.path.join(GOOGLE_API_DIR, username)
-    if not os.path.isdir(base_user_dir):
-        raise FileNotFoundError(
-            f"No existe el directorio para el usuario '{username}'. Ruta comprobada: {base_user_dir}"
-        )
-
-    for account in os.listdir(base_user_dir):
-        account_dir = os.path.join(base_user_dir, account)
-        if not os.path.isdir(account_dir):
-            continue
-
-        credential_path, token_path = _load_paths(account_dir)
-        if not credential_path:
-            logger.warning("Falta credential_*.json en %s", account_dir)
-            continue
-
-        try:
-            creds = _ensure_creds(credential_path, token_path, allow_logging_popup)
-            authentications[account] = creds
-        except Exception as e:
-            logger.warning("No se pudo autenticar %s: %s", account, e)
-
-    return authentications
+    return _credential_cache.get_for_user(username, allow_logging_popup)
@@ -0,0 +1,406 @@
+"""
+Local SQLite mirror of Google Calendar events, kept current with ``syncToken``.
+
+Event resources (titles, attendees, descriptions...) are stored
+Fernet-encrypted with the same key as the user database; only ids and the
+start/end timestamps used by range queries are kept in clear.
+"""
+
+import datetime
+import json
+import logging
+import threading
+import time
+from collections.abc import Callable
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from dateutil import parser
+from googleapiclient.discovery import Resource
+from googleapiclient.errors import HttpError
+
+from jarvis.core.config import (
+    CALENDAR_MIRROR_ENABLED,
+    CALENDAR_MIRROR_HISTORY_DAYS,
+    CALENDAR_MIRROR_STALENESS_SECONDS,
+)
+from jarvis.core.paths import CALENDAR_MIRROR_DB_PATH
+from jarvis.infrastructure.crypto.fernet import decode_symm_crypt_key, encode_symm_crypt_key
+from jarvis.infrastructure.persistence.sqlite import get_connection
+
+logger = logging.getLogger(__name__)
+
+CALENDAR_ID = "primary"
+"""Calendar mirrored for every account (the one the calendar tools use)."""
+
+_PAGE_SIZE = 250
+
+_SCHEMA_VERSION = 2
+"""``PRAGMA user_version`` of the current schema; older mirrors are dropped and resynced."""
+
+
+def _zone(name: str | None) -> datetime.tzinfo:
+    """
+    Time zone of an IANA name, falling back to UTC.
+
+    Args:
+        name: Zone such as ``Europe/Madrid``, or None.
+
+    Returns:
+        The zone, or UTC if the name is missing or unknown.
+    """
+    if not name:
+        return datetime.timezone.utc
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError):
+        logger.warning("Unknown calendar time zone %r; using UTC", name)
+        return datetime.timezone.utc
+
+
+def _timestamp(when: dict | None, time_zone: str | None = None) -> float | None:
+    """
+    Epoch seconds of an event ``start``/``end`` field.
+
+    Args:
+        when: ``{"dateTime": ...}`` or ``{"date": ...}`` (all-day, starting at local midnight).
+        time_zone: Calendar time zone, used when neither the value nor ``when``
+            carries one (UTC if None).
+
+    Returns:
+        Seconds since the epoch, or None if the field is missing.
+    """
+    if not when:
+        return None
+    value = when.get("dateTime") or when.get("date")
+    if not value:
+        return None
+    moment = parser.isoparse(value)
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=_zone(when.get("timeZone") or time_zone))
+    return moment.timestamp()
+
+
+class CalendarMirror:
+    """
+    Per-account copy of calendar events for indexed range queries.
+
+    The first sync of an account lists the events of the last
+    ``history_days`` days onwards and stores the returned ``nextSyncToken``;
+    later syncs send that token and only receive changes (cancelled events
+    are deleted). Ranges starting before that horizon are not covered (see
+    ``covers``). If Google answers 410 Gone the token has expired, so the
+    account is wiped and fully resynced. Each sync is applied in a single
+    transaction, so readers never see a half-applied change set. All-day
+    events are placed at midnight of the calendar's time zone.
+
+    Attributes:
+        db_path: SQLite file of the mirror.
+        staleness_seconds: Age after which an account must be synced before it is read.
+        history_days: Days of past events fetched by a full sync.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        staleness_seconds: float = CALENDAR_MIRROR_STALENESS_SECONDS,
+        clock: Callable[[], float] = time.time,
+        history_days: int = CALENDAR_MIRROR_HISTORY_DAYS,
+    ) -> None:
+        """
+        Args:
+            db_path: SQLite file of the mirror.
+            staleness_seconds: Freshness bound of local reads, in seconds.
+            clock: Wall-clock time source (overridable in tests).
+            history_days: Days of past events fetched by a full sync.
+        """
+        self.db_path = db_path
+        self.staleness_seconds = staleness_seconds
+        self.history_days = history_days
+        self._clock = clock
+        self._sync_locks: dict[tuple[str, str], threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        conn = get_connection(db_path)
+        with conn:
+            if conn.execute("PRAGMA user_version").fetchone()[0] < _SCHEMA_VERSION:
+                # Plaintext payloads and no time zones: a cache, so resync it.
+                conn.execute("DROP TABLE IF EXISTS calendar_events")
+                conn.execute("DROP TABLE IF EXISTS calendar_sync")
+                conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS calendar_events ("
+                " real_name TEXT NOT NULL, account TEXT NOT NULL, event_id TEXT NOT NULL,"
+                " start_ts REAL NOT NULL, end_ts REAL NOT NULL, payload TEXT NOT NULL,"
+                " PRIMARY KEY (real_name, account, event_id)) WITHOUT ROWID"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS calendar_events_range"
+                " ON calendar_events (real_name, account, end_ts)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS calendar_sync ("
+                " real_name TEXT NOT NULL, account TEXT NOT NULL,"
+                " sync_token TEXT, synced_at REAL NOT NULL,"
+                " time_zone TEXT, horizon_ts REAL NOT NULL,"
+                " PRIMARY KEY (real_name, account)) WITHOUT ROWID"
+            )
+
+    def is_fresh(self, real_name: str, account: str) -> bool:
+        """
+        Whether an account was synced within ``staleness_seconds``.
+
+        Args:
+            real_name: Owner of the Google accounts.
+            account: Account directory name.
+
+        Returns:
+            True if local reads can be served without syncing first.
+        """
+        row = get_connection(self.db_path).execute(
+            "SELECT synced_at FROM calendar_sync WHERE real_name = ? AND account = ?",
+            (real_name, account),
+        ).fetchone()
+        return row is not None and self._clock() - row[0] <= self.staleness_seconds
+
+    def covers(self, real_name: str, account: str, time_min: str) -> bool:
+        """
+        Whether the mirror holds every event of an account ending after ``time_min``.
+
+        Args:
+            real_name: Owner of the Google accounts.
+            account: Account directory name.
+            time_min: ISO 8601 lower bound of a query.
+
+        Returns:
+            False if the account was never synced or ``time_min`` is older
+            than the horizon of its last full sync.
+        """
+        row = get_connection(self.db_path).execute(
+            "SELECT horizon_ts FROM calendar_sync WHERE real_name = ? AND account = ?",
+            (real_name, account),
+        ).fetchone()
+        return row is not None and row[0] <= _timestamp({"dateTime": time_min})
+
+    def sync(self, real_name: str, account: str, service: Resource) -> int:
+        """
+        Bring an account up to date (incremental if possible, full otherwise).
+
+        Args:
+            real_name: Owner of the Google accounts.
+            account: Account directory name.
+            service: Calendar API client of the account.
+
+        Returns:
+            Number of changed (upserted or deleted) events.
+        """
+        with self._sync_lock(real_name, account):
+            if self.is_fresh(real_name, account):
+                return 0  # another thread synced it while we waited
+            row = get_connection(self.db_path).execute(
+                "SELECT sync_token, horizon_ts FROM calendar_sync WHERE real_name = ? AND account = ?",
+                (real_name, account),
+            ).fetchone()
+            sync_token, horizon_ts = row if row else (None, None)
+            if sync_token:
+                try:
+                    changes = self._list_changes(service, sync_token=sync_token)
+                    return self._apply(real_name, account, *changes, horizon_ts, full=False)
+                except HttpError as e:
+                    if e.resp.status != 410:
+                        raise
+                    logger.info("Sync token expired for %s/%s; full resync", real_name, account)
+            horizon_ts = self._clock() - self.history_days * 86400
+            time_min = datetime.datetime.fromtimestamp(horizon_ts, datetime.timezone.utc)
+            changes = self._list_changes(service, time_min=time_min.isoformat())
+            return self._apply(real_name, account, *changes, horizon_ts, full=True)
+
+    def query(
+        self,
+        real_name: str,
+        account: str,
+        time_min: str,
+        time_max: str | None = None,
+        limit: int = 50,
+    ) -> list[dict]:
+        """
+        Events overlapping a range, ordered by start (same semantics as ``events().list``).
+
+        Args:
+            real_name: Owner of the Google accounts.
+            account: Account directory name.
+            time_min: ISO 8601 lower bound on the event end (exclusive).
+            time_max: Optional ISO 8601 upper bound on the event start (exclusive).
+            limit: Maximum number of events.
+
+        Returns:
+            Event resources as returned by the API.
+        """
+        sql = (
+            "SELECT payload FROM calendar_events"
+            " WHERE real_name = ? AND account = ? AND end_ts > ?"
+        )
+        params: list = [real_name, account, _timestamp({"dateTime": time_min})]
+        if time_max:
+            sql += " AND start_ts < ?"
+            params.append(_timestamp({"dateTime": time_max}))
+        sql += " ORDER BY start_ts, event_id LIMIT ?"
+        params.append(limit)
+        rows = get_connection(self.db_path).execute(sql, params).fetchall()
+        return [json.loads(decode_symm_crypt_key(row[0])) for row in rows]
+
+    def upsert(self, real_name: str, account: str, event: dict) -> None:
+        """
+        Record an event written through the API (keeps a fresh mirror consistent).
+
+        Args:
+            real_name: Owner of the Google accounts.
+            account: Account directory name.
+            event: Event resource returned by ``insert``/``update``.
+        """
+        conn = get_connection(self.db_path)
+        row = conn.execute(
+            "SELECT time_zone FROM calendar_sync WHERE real_name = ? AND account = ?",
+            (real_name, account),
+        ).fetchone()
+        with conn:
+            self._store(conn, real_name, account, event, row[0] if row else None)
+
+    def remove(self, real_name: str, account: str, event_id: str) -> None:
+        """
+        Drop an event deleted through the API.
+
+        Args:
+            real_name: Owner of the Google accounts.
+            account: Account directory name.
+            event_id: Deleted event id.
+        """
+        conn = get_connection(self.db_path)
+        with conn:
+            conn.execute(
+                "DELETE FROM calendar_events WHERE real_name = ? AND account = ? AND event_id = ?",
+                (real_name, account, event_id),
+            )
+
+    def clear(self, real_name: str | None = None) -> None:
+        """
+        Forget mirrored events and sync tokens (all users, or one).
+
+        Args:
+            real_name: Restrict to this user.
+        """
+        conn = get_connection(self.db_path)
+        with conn:
+            for table in ("calendar_events", "calendar_sync"):
+                if real_name is None:
+                    conn.execute(f"DELETE FROM {table}")
+                else:
+                    conn.execute(f"DELETE FROM {table} WHERE real_name = ?", (real_name,))
+
+    def _sync_lock(self, real_name: str, account: str) -> threading.Lock:
+        """Lock serializing syncs of one account."""
+        with self._locks_guard:
+            return self._sync_locks.setdefault((real_name, account), threading.Lock())
+
+    @staticmethod
+    def _list_changes(
+        service: Resource, *, sync_token: str | None = None, time_min: str | None = None
+    ) -> tuple[list[dict], str | None, str | None]:
+        """
+        Follow every page of ``events().list``.
+
+        Args:
+            service: Calendar API client of the account.
+            sync_token: Token of the last sync (incremental listing).
+            time_min: Lower bound on event ends of a full listing (Google
+                rejects it together with ``syncToken``).
+
+        Returns:
+            Items, ``nextSyncToken`` and the calendar's ``timeZone``.
+        """
+        kwargs = {"calendarId": CALENDAR_ID, "singleEvents": True, "maxResults": _PAGE_SIZE}
+        if sync_token:
+            kwargs["syncToken"] = sync_token
+        elif time_min:
+            kwargs["timeMin"] = time_min
+        items: list[dict] = []
+        while True:
+            response = service.events().list(**kwargs).execute()
+            items.extend(response.get("items", []))
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                return items, response.get("nextSyncToken"), response.get("timeZone")
+            kwargs["pageToken"] = page_token
+
+    def _apply(
+        self,
+        real_name: str,
+        account: str,
+        items: list[dict],
+        sync_token: str | None,
+        time_zone: str | None,
+        horizon_ts: float,
+        full: bool,
+    ) -> int:
+        """Write a change set, the new sync token and the calendar zone in one transaction."""
+        conn = get_connection(self.db_path)
+        with conn:
+            if full:
+                conn.execute(
+                    "DELETE FROM calendar_events WHERE real_name = ? AND account = ?",
+                    (real_name, account),
+                )
+            for event in items:
+                if event.get("status") == "cancelled":
+                    conn.execute(
+                        "DELETE FROM calendar_events WHERE real_name = ? AND account = ? AND event_id = ?",
+                        (real_name, account, event["id"]),
+                    )
+                else:
+                    self._store(conn, real_name, account, event, time_zone)
+            conn.execute(
+                "INSERT OR REPLACE INTO calendar_sync"
+                " (real_name, account, sync_token, synced_at, time_zone, horizon_ts)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (real_name, account, sync_token, self._clock(), time_zone, horizon_ts),
+            )
+        logger.debug(
+            "%s sync of %s/%s applied %d changes", "Full" if full else "Incremental",
+            real_name, account, len(items),
+        )
+        return len(items)
+
+    @staticmethod
+    def _store(conn, real_name: str, account: str, event: dict, time_zone: str | None) -> None:
+        """Insert or replace one event row, its payload encrypted."""
+        start_ts = _timestamp(event.get("start"), time_zone)
+        if start_ts is None:
+            return
+        end_ts = _timestamp(event.get("end"), time_zone)
+        conn.execute(
+            "INSERT OR REPLACE INTO calendar_events"
+            " (real_name, account, event_id, start_ts, end_ts, payload) VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                real_name, account, event["id"], start_ts,
+                end_ts if end_ts is not None else start_ts,
+                encode_symm_crypt_key(json.dumps(event, ensure_ascii=False)),
+            ),
+        )
+
+
+_mirror: CalendarMirror | None = None
+_mirror_lock = threading.Lock()
+
+
+def get_calendar_mirror() -> CalendarMirror | None:
+    """
+    Return the process-wide event mirror when ``CALENDAR_MIRROR_ENABLED`` is set.
+
+    Returns:
+        Shared CalendarMirror, or None if the mirror is disabled.
+    """
+    global _mirror
+    if not CALENDAR_MIRROR_ENABLED:
+        return None
+    with _mirror_lock:
+        if _mirror is None:
+            _mirror = CalendarMirror(str(CALENDAR_MIRROR_DB_PATH))
+        return _mirror
@@ -0,0 +1,200 @@
+"""Reusable Google Calendar API clients per user and account."""
+
+import json
+import logging
+import threading
+
+import google_auth_httplib2
+import httplib2
+from google.oauth2.credentials import Credentials
+from googleapiclient.discovery import Resource, build_from_document
+from googleapiclient.discovery_cache import get_static_doc
+from googleapiclient.http import HttpRequest
+
+logger = logging.getLogger(__name__)
+
+HTTP_TIMEOUT_SECONDS: float = 30.0
+"""Socket timeout of the HTTP transports used by calendar clients."""
+
+
+class _ServiceEntry:
+    """A built client plus the credentials it was built for and per-thread transports."""
+
+    def __init__(self, service: Resource, credentials: Credentials) -> None:
+        self.service = service
+        self.credentials = credentials
+        self.token = credentials.token
+        self._local = threading.local()
+
+    def http(self) -> google_auth_httplib2.AuthorizedHttp:
+        """This thread's authorized transport (``httplib2.Http`` is not thread-safe)."""
+        http = getattr(self._local, "http", None)
+        if http is None:
+            http = self._local.http = google_auth_httplib2.AuthorizedHttp(
+                self.credentials, http=httplib2.Http(timeout=HTTP_TIMEOUT_SECONDS)
+            )
+        return http
+
+    def is_current(self, credentials: Credentials) -> bool:
+        """Whether the entry still matches ``credentials`` (same object, not refreshed)."""
+        return credentials is self.credentials and credentials.token == self.token
+
+
+class CalendarServiceCache:
+    """
+    Thread-safe cache of ``calendar v3`` clients keyed by (user, account).
+
+    Clients are built from the discovery document bundled with
+    ``google-api-python-client``, parsed once per cache (no discovery fetch),
+    and shared between
+    threads: each request runs on a per-thread ``AuthorizedHttp``, so
+    connections are reused without sharing an ``httplib2.Http``. An entry is
+    rebuilt when it is asked for with different credentials or after its
+    token was refreshed.
+    """
+
+    def __init__(self, api_endpoint: str | None = None) -> None:
+        """
+        Args:
+            api_endpoint: Override of the Calendar API root (e.g. a local stand-in).
+        """
+        self.api_endpoint = api_endpoint
+        self._entries: dict[tuple[str, str], _ServiceEntry] = {}
+        self._lock = threading.Lock()
+        self._discovery: dict | None = None
+
+    def get(self, username: str, account: str, credentials: Credentials) -> Resource:
+        """
+        Return the client for an account, building it on first use or after a refresh.
+
+        Args:
+            username: Owner of the Google accounts.
+            account: Account directory name.
+            credentials: Current OAuth credentials of the account.
+
+        Returns:
+            Calendar API resource.
+        """
+        return self._entry(username, account, credentials).service
+
+    def http_for(
+        self, username: str, account: str, credentials: Credentials
+    ) -> google_auth_httplib2.AuthorizedHttp:
+        """
+        Return this thread's authorized transport for an account.
+
+        Needed where a request is not built by the client itself, e.g.
+        ``BatchHttpRequest.execute(http=...)``.
+
+        Args:
+            username: Owner of the Google accounts.
+            account: Account directory name.
+            credentials: Current OAuth credentials of the account.
+
+        Returns:
+            Per-thread ``AuthorizedHttp`` of the account's client.
+        """
+        return self._entry(username, account, credentials).http()
+
+    def _entry(self, username: str, account: str, credentials: Credentials) -> _ServiceEntry:
+        """Cached entry for an account, rebuilt if the credentials changed."""
+        key = (username, account)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.is_current(credentials):
+                return entry
+        entry = self._build(credentials)
+        with self._lock:
+            self._entries[key] = entry
+        logger.debug("Built calendar client for %s/%s", username, account)
+        return entry
+
+    def invalidate(self, username: str | None = None, account: str | None = None) -> None:
+        """
+        Drop cached clients (all, one user's, or one account's).
+
+        Args:
+            username: Restrict to this user.
+            account: Restrict to this account of ``username``.
+        """
+        with self._lock:
+            for key in list(self._entries):
+                if (username is None or key[0] == username) and (account is None or key[1] == account):
+                    del self._entries[key]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _build(self, credentials: Credentials) -> _ServiceEntry:
+        """Build a client whose requests run on the entry's per-thread transport."""
+        entry: _ServiceEntry | None = None
+
+        def request_builder(_http, *args, **kwargs) -> HttpRequest:
+            return HttpRequest(entry.http(), *args, **kwargs)
+
+        service = build_from_document(
+            self._discovery_document(),
+            http=google_auth_httplib2.AuthorizedHttp(credentials, http=httplib2.Http()),
+            requestBuilder=request_builder,
+        )
+        entry = _ServiceEntry(service, credentials)
+        return entry
+
+    def _discovery_document(self) -> dict:
+        """Bundled ``calendar v3`` discovery document, rooted at ``api_endpoint`` if set."""
+        if self._discovery is None:
+            document = json.loads(get_static_doc("calendar", "v3"))
+            if self.api_endpoint:
+                # rootUrl (not client_options) so batch requests follow the override too.
+                document["rootUrl"] = self.api_endpoint
+                document["baseUrl"] = self.api_endpoint + document["servicePath"]
+            self._discovery = document
+        return self._discovery
+
+
+_service_cache = CalendarServiceCache()
+
+
+def get_calendar_service(username: str, account: str, credentials: Credentials) -> Resource:
+    """
+    Return the shared Calendar client for one of a user's accounts.
+
+    Args:
+        username: Owner of the Google accounts.
+        account: Account directory name.
+        credentials: Current OAuth credentials of the account.
+
+    Returns:
+        Calendar API resource, safe to use from any thread.
+    """
+    return _service_cache.get(username, account, credentials)
+
+
+def get_calendar_http(
+    username: str, account: str, credentials: Credentials
+) -> google_auth_httplib2.AuthorizedHttp:
+    """
+    Return this thread's authorized transport for one of a user's accounts.
+
+    Args:
+        username: Owner of the Google accounts.
+        account: Account directory name.
+        credentials: Current OAuth credentials of the account.
+
+    Returns:
+        ``AuthorizedHttp`` to pass to ``BatchHttpRequest.execute``.
+    """
+    return _service_cache.http_for(username, account, credentials)
+
+
+def invalidate_calendar_services(username: str | None = None, account: str | None = None) -> None:
+    """
+    Drop cached Calendar clients.
+
+    Args:
+        username: Restrict to this user (all users if None).
+        account: Restrict to this account of ``username``.
+    """
+    _service_cache.invalidate(username, account)
+
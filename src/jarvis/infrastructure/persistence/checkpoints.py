@@ -0,0 +1,683 @@
+"""Durable LangGraph checkpointer backed by a local SQLite file."""
+
+import asyncio
+import atexit
+import logging
+import random
+import sqlite3
+import threading
+import time
+from collections.abc import AsyncIterator, Iterator, Sequence
+from typing import Any
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    get_checkpoint_id,
+    get_checkpoint_metadata,
+)
+
+from jarvis.infrastructure.persistence.sqlite import get_connection
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA: tuple[str, ...] = (
+    """
+    CREATE TABLE IF NOT EXISTS checkpoints (
+        thread_id TEXT NOT NULL,
+        checkpoint_ns TEXT NOT NULL DEFAULT '',
+        checkpoint_id TEXT NOT NULL,
+        parent_checkpoint_id TEXT,
+        type TEXT,
+        checkpoint BLOB,
+        metadata_type TEXT,
+        metadata BLOB,
+        PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id)
+    ) WITHOUT ROWID
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS writes (
+        thread_id TEXT NOT NULL,
+        checkpoint_ns TEXT NOT NULL DEFAULT '',
+        checkpoint_id TEXT NOT NULL,
+        task_id TEXT NOT NULL,
+        idx INTEGER NOT NULL,
+        channel TEXT NOT NULL,
+        type TEXT,
+        value BLOB,
+        task_path TEXT NOT NULL DEFAULT '',
+        PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
+    ) WITHOUT ROWID
+    """,
+)
+"""Tables keyed by ``thread_id`` first, so per-thread reads and deletes are index range scans."""
+
+_UPSERT_CHECKPOINT = (
+    "INSERT OR REPLACE INTO checkpoints (thread_id, checkpoint_ns, checkpoint_id,"
+    " parent_checkpoint_id, type, checkpoint, metadata_type, metadata)"
+    " VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+)
+_INSERT_WRITE = (
+    "INSERT OR {conflict} INTO writes (thread_id, checkpoint_ns, checkpoint_id, task_id,"
+    " idx, channel, type, value, task_path) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+_MAX_FLUSH_ATTEMPTS = 5
+"""Consecutive locked/busy flushes after which the pending batch is dropped."""
+
+
+def _is_transient(error: Exception) -> bool:
+    """
+    Tell whether a write failed only because another connection held the database.
+
+    Args:
+        error: Exception raised while flushing.
+
+    Returns:
+        True for ``database is locked`` / ``busy`` errors worth retrying.
+    """
+    if not isinstance(error, sqlite3.OperationalError):
+        return False
+    message = str(error).lower()
+    return "locked" in message or "busy" in message
+
+
+def next_channel_version(current: str | int | None) -> str:
+    """
+    Return a monotonically increasing, string-sortable channel version.
+
+    Args:
+        current: Current version, if any.
+
+    Returns:
+        Next version string (same format as LangGraph's ``MemorySaver``).
+    """
+    if current is None:
+        current_v = 0
+    elif isinstance(current, int):
+        current_v = current
+    else:
+        current_v = int(current.split(".")[0])
+    next_v = current_v + 1
+    next_h = random.random()
+    return f"{next_v:032}.{next_h:016}"
+
+
+class SqliteCheckpointSaver(BaseCheckpointSaver[str]):
+    """
+    LangGraph checkpointer that persists threads to a SQLite file.
+
+    Writes are buffered in memory and flushed in a single transaction when
+    ``flush_batch_size`` operations are pending, when ``flush_interval_seconds``
+    elapse, or right before any read, so a turn's several checkpoints cost one
+    commit. Batch and interval flushes run on a background writer thread, so
+    ``put`` never waits on SQLite (and ``aput`` never blocks the event loop).
+    That thread also prunes each thread to its newest
+    ``keep_last`` checkpoints and reclaims free pages, keeping the file bounded
+    by the number of live threads rather than by total history. Nothing but the
+    pending batch is held in RAM.
+
+    Attributes:
+        db_path: SQLite database file.
+        keep_last: Checkpoints kept per thread and namespace when pruning.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        *,
+        keep_last: int = 20,
+        flush_batch_size: int = 64,
+        flush_interval_seconds: float = 1.0,
+        vacuum_interval_seconds: float = 600.0,
+    ) -> None:
+        """
+        Args:
+            db_path: SQLite database file (created on first use).
+            keep_last: Newest checkpoints kept per thread by the vacuum task.
+            flush_batch_size: Pending writes that wake the writer thread to flush.
+            flush_interval_seconds: Maximum age of a pending write.
+            vacuum_interval_seconds: Period of the prune + incremental vacuum pass.
+        """
+        super().__init__()
+        if keep_last < 1:
+            raise ValueError("keep_last must be at least 1")
+        self.db_path = db_path
+        self.keep_last = keep_last
+        self._flush_batch_size = flush_batch_size
+        self._flush_interval_seconds = flush_interval_seconds
+        self._vacuum_interval_seconds = vacuum_interval_seconds
+        self._pending: list[tuple[str, list[tuple]]] = []
+        self._pending_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._failed_flushes = 0
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._worker: threading.Thread | None = None
+        self._last_vacuum = time.monotonic()
+        self._atexit_registered = False
+        self._setup()
+
+    def _setup(self) -> None:
+        """Create the schema and switch new files to incremental auto-vacuum."""
+        conn = get_connection(self.db_path)
+        if conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+            # auto_vacuum only takes effect after a VACUUM; cheap on a new file.
+            conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            conn.execute("VACUUM")
+        with conn:
+            for statement in _SCHEMA:
+                conn.execute(statement)
+
+    def _enqueue(self, sql: str, rows: list[tuple]) -> None:
+        """Buffer a statement and wake the writer thread when the batch is full."""
+        with self._pending_lock:
+            self._pending.append((sql, rows))
+            batch_full = len(self._pending) >= self._flush_batch_size
+        self._ensure_worker()
+        if batch_full:
+            self._wake.set()
+
+    def flush(self) -> None:
+        """
+        Write every pending checkpoint and write in one transaction.
+
+        A locked or busy database re-queues the batch and re-raises, up to
+        ``_MAX_FLUSH_ATTEMPTS`` consecutive times; then the batch is dropped.
+        Any other error falls back to one transaction per statement, so only
+        the statements that fail are dropped (and logged) instead of blocking
+        every later read.
+
+        Returns:
+            None.
+        """
+        with self._flush_lock:
+            with self._pending_lock:
+                batch, self._pending = self._pending, []
+            if not batch:
+                return
+            conn = get_connection(self.db_path)
+            try:
+                with conn:
+                    for sql, rows in batch:
+                        conn.executemany(sql, rows)
+            except Exception as e:
+                if not _is_transient(e):
+                    self._failed_flushes = 0
+                    self._flush_each(conn, batch)
+                    return
+                self._failed_flushes += 1
+                if self._failed_flushes >= _MAX_FLUSH_ATTEMPTS:
+                    self._failed_flushes = 0
+                    logger.error(
+                        "Dropping %d pending checkpoint statements after %d failed flushes: %s",
+                        len(batch),
+                        _MAX_FLUSH_ATTEMPTS,
+                        e,
+                    )
+                    return
+                with self._pending_lock:
+                    self._pending[:0] = batch
+                raise
+            self._failed_flushes = 0
+
+    def _flush_each(self, conn, batch: list[tuple[str, list[tuple]]]) -> None:
+        """
+        Write a batch one statement per transaction, dropping the ones that fail.
+
+        Args:
+            conn: Connection to ``db_path``.
+            batch: Pending ``(sql, rows)`` statements, oldest first.
+
+        Raises:
+            sqlite3.OperationalError: If the database is locked or busy; the
+                statements not yet written are re-queued first.
+        """
+        for i, (sql, rows) in enumerate(batch):
+            try:
+                with conn:
+                    conn.executemany(sql, rows)
+            except Exception as e:
+                if _is_transient(e):
+                    with self._pending_lock:
+                        self._pending[:0] = batch[i:]
+                    raise
+                logger.error(
+                    "Dropping checkpoint statement with %d rows that cannot be written: %s",
+                    len(rows),
+                    e,
+                )
+
+    def _ensure_worker(self) -> None:
+        """Start the background flush/vacuum thread on first write."""
+        if self._worker is not None and self._worker.is_alive():
+            return
+        with self._pending_lock:
+            if self._worker is not None and self._worker.is_alive():
+                return
+            self._stop.clear()
+            self._worker = threading.Thread(
+                target=self._run_worker, name="jarvis-checkpoint-writer", daemon=True
+            )
+            self._worker.start()
+            if not self._atexit_registered:
+                atexit.register(self.close)
+                self._atexit_registered = True
+
+    def _run_worker(self) -> None:
+        """Flush when woken or periodically, and vacuum every ``vacuum_interval_seconds``."""
+        while True:
+            self._wake.wait(self._flush_interval_seconds)
+            self._wake.clear()
+            if self._stop.is_set():
+                return
+            try:
+                self.flush()
+                if time.monotonic() - self._last_vacuum >= self._vacuum_interval_seconds:
+                    self.vacuum()
+            except Exception as e:
+                logger.error("Checkpoint background flush failed: %s", e)
+
+    def close(self) -> None:
+        """
+        Stop the background thread and flush whatever is still pending.
+
+        Returns:
+            None. Safe to call more than once.
+        """
+        self._stop.set()
+        self._wake.set()
+        worker = self._worker
+        if worker is not None and worker is not threading.current_thread():
+            worker.join(timeout=10)
+        self._worker = None
+        try:
+            self.flush()
+        except Exception as e:
+            logger.error("Failed to flush checkpoints on close: %s", e)
+
+    def vacuum(self) -> int:
+        """
+        Prune every thread to its newest ``keep_last`` checkpoints and free pages.
+
+        Returns:
+            Number of checkpoints deleted.
+        """
+        self.flush()
+        conn = get_connection(self.db_path)
+        deleted = 0
+        with conn:
+            crowded = conn.execute(
+                "SELECT thread_id, checkpoint_ns FROM checkpoints"
+                " GROUP BY thread_id, checkpoint_ns HAVING COUNT(*) > ?",
+                (self.keep_last,),
+            ).fetchall()
+            for thread_id, checkpoint_ns in crowded:
+                deleted += self._prune_namespace(conn, thread_id, checkpoint_ns, self.keep_last)
+        conn.execute("PRAGMA incremental_vacuum")
+        self._last_vacuum = time.monotonic()
+        if deleted:
+            logger.info("Pruned %d old checkpoints from %d threads", deleted, len(crowded))
+        return deleted
+
+    @staticmethod
+    def _prune_namespace(conn, thread_id: str, checkpoint_ns: str, keep: int) -> int:
+        """Delete all but the newest ``keep`` checkpoints (and their writes)."""
+        cursor = conn.execute(
+            "DELETE FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ?"
+            " AND checkpoint_id NOT IN (SELECT checkpoint_id FROM checkpoints"
+            " WHERE thread_id = ? AND checkpoint_ns = ? ORDER BY checkpoint_id DESC LIMIT ?)",
+            (thread_id, checkpoint_ns, thread_id, checkpoint_ns, keep),
+        )
+        conn.execute(
+            "DELETE FROM writes WHERE thread_id = ? AND checkpoint_ns = ?"
+            " AND checkpoint_id NOT IN (SELECT checkpoint_id FROM checkpoints"
+            " WHERE thread_id = ? AND checkpoint_ns = ?)",
+            (thread_id, checkpoint_ns, thread_id, checkpoint_ns),
+        )
+        return cursor.rowcount
+
+    def prune(self, thread_ids: Sequence[str], *, strategy: str = "keep_latest") -> None:
+        """
+        Prune checkpoints of the given threads.
+
+        Args:
+            thread_ids: Threads to prune.
+            strategy: ``keep_latest`` keeps one checkpoint per namespace;
+                ``delete`` removes the threads entirely.
+
+        Raises:
+            ValueError: If the strategy is unknown.
+        """
+        if strategy == "delete":
+            for thread_id in thread_ids:
+                self.delete_thread(thread_id)
+            return
+        if strategy != "keep_latest":
+            raise ValueError(f"Unknown prune strategy: {strategy}")
+        self.flush()
+        conn = get_connection(self.db_path)
+        with conn:
+            for thread_id in thread_ids:
+                namespaces = conn.execute(
+                    "SELECT DISTINCT checkpoint_ns FROM checkpoints WHERE thread_id = ?",
+                    (thread_id,),
+                ).fetchall()
+                for (checkpoint_ns,) in namespaces:
+                    self._prune_namespace(conn, thread_id, checkpoint_ns, 1)
+
+    def get_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        """
+        Fetch a checkpoint by id, or the latest one of the thread.
+
+        Args:
+            config: Config with ``thread_id`` and optional ``checkpoint_ns`` / ``checkpoint_id``.
+
+        Returns:
+            Checkpoint tuple or None if the thread has none.
+        """
+        self.flush()
+        configurable = config["configurable"]
+        thread_id = configurable["thread_id"]
+        checkpoint_ns = configurable.get("checkpoint_ns", "")
+        conn = get_connection(self.db_path)
+        if checkpoint_id := get_checkpoint_id(config):
+            row = conn.execute(
+                "SELECT * FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ?"
+                " AND checkpoint_id = ?",
+                (thread_id, checkpoint_ns, checkpoint_id),
+            ).fetchone()
+        else:
+            row = conn.execute(
+                "SELECT * FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ?"
+                " ORDER BY checkpoint_id DESC LIMIT 1",
+                (thread_id, checkpoint_ns),
+            ).fetchone()
+        return self._row_to_tuple(conn, row) if row else None
+
+    def get_latest_checkpoint_id(self, config: RunnableConfig) -> str | None:
+        """
+        Return the id of the thread's latest checkpoint without loading it.
+
+        Args:
+            config: Config with ``thread_id`` and optional ``checkpoint_ns``.
+
+        Returns:
+            Checkpoint id, or None if the thread has no checkpoints.
+        """
+        self.flush()
+        configurable = config["configurable"]
+        row = get_connection(self.db_path).execute(
+            "SELECT MAX(checkpoint_id) FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ?",
+            (configurable["thread_id"], configurable.get("checkpoint_ns", "")),
+        ).fetchone()
+        return row[0] if row else None
+
+    def list(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> Iterator[CheckpointTuple]:
+        """
+        List checkpoints newest first.
+
+        Args:
+            config: Restrict to a thread (and namespace / checkpoint id) if given.
+            filter: Metadata key/value pairs that must all match.
+            before: Only checkpoints older than this one.
+            limit: Maximum number of tuples.
+
+        Yields:
+            Matching checkpoint tuples.
+        """
+        self.flush()
+        clauses: list[str] = []
+        params: list[Any] = []
+        if config is not None:
+            configurable = config["configurable"]
+            clauses.append("thread_id = ?")
+            params.append(configurable["thread_id"])
+            checkpoint_ns = configurable.get("checkpoint_ns")
+            if checkpoint_ns is not None:
+                clauses.append("checkpoint_ns = ?")
+                params.append(checkpoint_ns)
+            if checkpoint_id := get_checkpoint_id(config):
+                clauses.append("checkpoint_id = ?")
+                params.append(checkpoint_id)
+        if before is not None and (before_id := get_checkpoint_id(before)):
+            clauses.append("checkpoint_id < ?")
+            params.append(before_id)
+        sql = "SELECT * FROM checkpoints"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY thread_id, checkpoint_ns, checkpoint_id DESC"
+        if limit is not None and not filter:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        conn = get_connection(self.db_path)
+        remaining = limit
+        for row in conn.execute(sql, params).fetchall():
+            if filter:
+                metadata = self.serde.loads_typed((row["metadata_type"], row["metadata"]))
+                if not all(metadata.get(key) == value for key, value in filter.items()):
+                    continue
+            yield self._row_to_tuple(conn, row)
+            if remaining is not None:
+                remaining -= 1
+                if remaining <= 0:
+                    break
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """
+        Queue a checkpoint for the next batched flush.
+
+        Args:
+            config: Config of the parent checkpoint.
+            checkpoint: Checkpoint to store.
+            metadata: Checkpoint metadata.
+            new_versions: Channel versions written in this step (unused).
+
+        Returns:
+            Config pointing at the stored checkpoint.
+        """
+        configurable = config["configurable"]
+        thread_id = configurable["thread_id"]
+        checkpoint_ns = configurable.get("checkpoint_ns", "")
+        checkpoint_type, serialized_checkpoint = self.serde.dumps_typed(checkpoint)
+        metadata_type, serialized_metadata = self.serde.dumps_typed(
+            get_checkpoint_metadata(config, metadata)
+        )
+        self._enqueue(_UPSERT_CHECKPOINT, [(
+            thread_id,
+            checkpoint_ns,
+            checkpoint["id"],
+            configurable.get("checkpoint_id"),
+            checkpoint_type,
+            serialized_checkpoint,
+            metadata_type,
+            serialized_metadata,
+        )])
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint["id"],
+            }
+        }
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        """
+        Queue intermediate writes linked to a checkpoint.
+
+        Args:
+            config: Config of the related checkpoint.
+            writes: ``(channel, value)`` pairs.
+            task_id: Task that produced the writes.
+            task_path: Path of that task.
+        """
+        configurable = config["configurable"]
+        thread_id = configurable["thread_id"]
+        checkpoint_ns = configurable.get("checkpoint_ns", "")
+        checkpoint_id = configurable["checkpoint_id"]
+        rows = []
+        for idx, (channel, value) in enumerate(writes):
+            value_type, serialized_value = self.serde.dumps_typed(value)
+            rows.append((
+                thread_id,
+                checkpoint_ns,
+                checkpoint_id,
+                task_id,
+                WRITES_IDX_MAP.get(channel, idx),
+                channel,
+                value_type,
+                serialized_value,
+                task_path,
+            ))
+        # Special channels (errors, interrupts) replace earlier values; regular
+        # writes are idempotent on retry.
+        conflict = "REPLACE" if all(w[0] in WRITES_IDX_MAP for w in writes) else "IGNORE"
+        self._enqueue(_INSERT_WRITE.format(conflict=conflict), rows)
+
+    def delete_thread(self, thread_id: str) -> None:
+        """
+        Delete every checkpoint and write of a thread.
+
+        Args:
+            thread_id: Thread to delete.
+        """
+        self.flush()
+        conn = get_connection(self.db_path)
+        with conn:
+            conn.execute("DELETE FROM checkpoints WHERE thread_id = ?", (thread_id,))
+            conn.execute("DELETE FROM writes WHERE thread_id = ?", (thread_id,))
+
+    def delete_all_threads(self) -> None:
+        """
+        Delete every stored thread.
+
+        Returns:
+            None.
+        """
+        self.flush()
+        conn = get_connection(self.db_path)
+        with conn:
+            conn.execute("DELETE FROM checkpoints")
+            conn.execute("DELETE FROM writes")
+
+    def get_next_version(self, current: str | None, channel: None) -> str:
+        """
+        Return a monotonically increasing, string-sortable channel version.
+
+        Args:
+            current: Current version, if any.
+            channel: Deprecated, unused.
+
+        Returns:
+            Next version string.
+        """
+        return next_channel_version(current)
+
+    # Reads run in a worker thread so SQLite I/O never blocks the event loop;
+    # puts only append to the in-memory batch.
+
+    async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        """Async version of ``get_tuple``."""
+        return await asyncio.to_thread(self.get_tuple, config)
+
+    async def alist(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        """Async version of ``list``."""
+        items = await asyncio.to_thread(
+            lambda: list(self.list(config, filter=filter, before=before, limit=limit))
+        )
+        for item in items:
+            yield item
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """Async version of ``put``."""
+        return self.put(config, checkpoint, metadata, new_versions)
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        """Async version of ``put_writes``."""
+        self.put_writes(config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        """Async version of ``delete_thread``."""
+        await asyncio.to_thread(self.delete_thread, thread_id)
+
+    def _row_to_tuple(self, conn, row) -> CheckpointTuple:
+        """Deserialize a ``checkpoints`` row and attach its pending writes."""
+        thread_id, checkpoint_ns, checkpoint_id = (
+            row["thread_id"], row["checkpoint_ns"], row["checkpoint_id"]
+        )
+        writes = conn.execute(
+            "SELECT task_id, channel, type, value FROM writes WHERE thread_id = ?"
+            " AND checkpoint_ns = ? AND checkpoint_id = ? ORDER BY task_id, idx",
+            (thread_id, checkpoint_ns, checkpoint_id),
+        ).fetchall()
+        parent_id = row["parent_checkpoint_id"]
+        return CheckpointTuple(
+            config={
+                "configurable": {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": checkpoint_ns,
+                    "checkpoint_id": checkpoint_id,
+                }
+            },
+            checkpoint=self.serde.loads_typed((row["type"], row["checkpoint"])),
+            metadata=self.serde.loads_typed((row["metadata_type"], row["metadata"])),
+            parent_config=(
+                {
+                    "configurable": {
+                        "thread_id": thread_id,
+                        "checkpoint_ns": checkpoint_ns,
+                        "checkpoint_id": parent_id,
+                    }
+                }
+                if parent_id
+                else None
+            ),
+            pending_writes=[
+                (task_id, channel, self.serde.loads_typed((value_type, value)))
+                for task_id, channel, value_type, value in writes
+            ],
+        )
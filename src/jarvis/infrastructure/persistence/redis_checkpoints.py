@@ -0,0 +1,489 @@
+"""LangGraph checkpointer backed by Redis, shared by API workers on any host."""
+
+import asyncio
+import base64
+import json
+from collections.abc import AsyncIterator, Iterator, Sequence
+from typing import Any
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    get_checkpoint_id,
+    get_checkpoint_metadata,
+)
+
+from jarvis.infrastructure.persistence.checkpoints import next_channel_version
+
+
+def _encode(typed: tuple[str, bytes]) -> dict:
+    """JSON-safe form of a ``serde.dumps_typed`` result."""
+    return {"type": typed[0], "data": base64.b64encode(typed[1]).decode("ascii")}
+
+
+def _decode(value: dict) -> tuple[str, bytes]:
+    """Inverse of ``_encode``."""
+    return value["type"], base64.b64decode(value["data"])
+
+
+def _checkpoint_ids(fields) -> list[str]:
+    """Checkpoint ids among the fields of a namespace hash."""
+    return [field[2:] for field in fields if field.startswith("c:")]
+
+
+_LATEST_FIELD = "latest"
+"""Namespace hash field holding the id of the newest checkpoint."""
+
+_SET_LATEST_SCRIPT = """
+local current = redis.call('HGET', KEYS[1], ARGV[1])
+if not current or ARGV[2] > current then
+    redis.call('HSET', KEYS[1], ARGV[1], ARGV[2])
+end
+"""
+"""Lua: point ``latest`` at a checkpoint id only if it is newer than the current one."""
+
+
+class RedisCheckpointSaver(BaseCheckpointSaver[str]):
+    """
+    LangGraph checkpointer that keeps threads in Redis.
+
+    Each thread namespace is one hash: field ``c:<checkpoint_id>`` holds a
+    checkpoint and field ``latest`` the id of the newest one, so finding
+    the latest checkpoint is a single ``HGET``. Pending writes of a
+    checkpoint live in their own hash, read together with the checkpoint.
+    Checkpoint ids sort chronologically, and every ``put`` prunes the
+    namespace to its newest ``keep_last`` checkpoints. Writes are pipelined
+    and go straight to Redis, so every worker sees a turn as soon as it
+    ends; with ``ttl_seconds`` set, each key expires that long after its
+    last write, like an idle session.
+
+    Attributes:
+        keep_last: Checkpoints kept per thread and namespace.
+        key_prefix: Prefix of every key of the saver.
+        ttl_seconds: Lifetime of a key after its last write (None keeps it forever).
+    """
+
+    def __init__(
+        self,
+        client,
+        *,
+        keep_last: int = 20,
+        key_prefix: str = "jarvis",
+        ttl_seconds: float | None = None,
+    ) -> None:
+        """
+        Args:
+            client: ``redis.Redis`` created with ``decode_responses=True``.
+            keep_last: Newest checkpoints kept per thread namespace.
+            key_prefix: Namespace of the keys.
+            ttl_seconds: Expire keys this long after their last write (None: never).
+        """
+        super().__init__()
+        if keep_last < 1:
+            raise ValueError("keep_last must be at least 1")
+        self.keep_last = keep_last
+        self.key_prefix = key_prefix
+        self.ttl_seconds = ttl_seconds
+        self._client = client
+
+    def _namespaces_key(self, thread_id: str) -> str:
+        """Key of the set of checkpoint namespaces of a thread."""
+        # Length prefix: thread ids may contain ':'.
+        return f"{self.key_prefix}:checkpoint-ns:{len(thread_id)}:{thread_id}"
+
+    def _thread_key(self, thread_id: str, checkpoint_ns: str) -> str:
+        """Key of the hash holding the checkpoints of a thread namespace."""
+        return f"{self.key_prefix}:checkpoints:{len(thread_id)}:{thread_id}:{checkpoint_ns}"
+
+    def _writes_key(self, thread_id: str, checkpoint_ns: str, checkpoint_id: str) -> str:
+        """Key of the hash holding the pending writes of a checkpoint."""
+        return (
+            f"{self.key_prefix}:checkpoint-writes:{len(thread_id)}:{thread_id}"
+            f":{checkpoint_ns}:{checkpoint_id}"
+        )
+
+    def _thread_ids(self) -> list[str]:
+        """Every thread with a namespace set, found by scanning their keys."""
+        prefix = f"{self.key_prefix}:checkpoint-ns:"
+        keys = self._client.scan_iter(match=f"{prefix}*", count=500)
+        return sorted(key[len(prefix):].split(":", 1)[1] for key in keys)
+
+    def _expire(self, pipe, *keys: str) -> None:
+        """Queue the renewal of the keys' TTL on ``pipe`` (no-op without TTL)."""
+        if self.ttl_seconds is None:
+            return
+        for key in keys:
+            pipe.expire(key, max(1, int(self.ttl_seconds)))
+
+    def get_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        """
+        Fetch a checkpoint by id, or the latest one of the thread.
+
+        Args:
+            config: Config with ``thread_id`` and optional ``checkpoint_ns`` / ``checkpoint_id``.
+
+        Returns:
+            Checkpoint tuple or None if the thread has none.
+        """
+        configurable = config["configurable"]
+        thread_id = configurable["thread_id"]
+        checkpoint_ns = configurable.get("checkpoint_ns", "")
+        key = self._thread_key(thread_id, checkpoint_ns)
+        checkpoint_id = get_checkpoint_id(config) or self._client.hget(key, _LATEST_FIELD)
+        if checkpoint_id is None:
+            return None
+        pipe = self._client.pipeline()
+        pipe.hget(key, f"c:{checkpoint_id}")
+        pipe.hgetall(self._writes_key(thread_id, checkpoint_ns, checkpoint_id))
+        raw, writes = pipe.execute()
+        if raw is None:
+            return None
+        return self._to_tuple(thread_id, checkpoint_ns, checkpoint_id, raw, writes)
+
+    def get_latest_checkpoint_id(self, config: RunnableConfig) -> str | None:
+        """
+        Return the id of the thread's latest checkpoint without loading it.
+
+        Args:
+            config: Config with ``thread_id`` and optional ``checkpoint_ns``.
+
+        Returns:
+            Checkpoint id, or None if the thread has no checkpoints.
+        """
+        configurable = config["configurable"]
+        key = self._thread_key(configurable["thread_id"], configurable.get("checkpoint_ns", ""))
+        return self._client.hget(key, _LATEST_FIELD)
+
+    def list(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> Iterator[CheckpointTuple]:
+        """
+        List checkpoints newest first.
+
+        Args:
+            config: Restrict to a thread (and namespace / checkpoint id) if given.
+            filter: Metadata key/value pairs that must all match.
+            before: Only checkpoints older than this one.
+            limit: Maximum number of tuples.
+
+        Yields:
+            Matching checkpoint tuples.
+        """
+        if config is not None:
+            thread_ids = [config["configurable"]["thread_id"]]
+            only_ns = config["configurable"].get("checkpoint_ns")
+            only_id = get_checkpoint_id(config)
+        else:
+            thread_ids = self._thread_ids()
+            only_ns = only_id = None
+        before_id = get_checkpoint_id(before) if before is not None else None
+        remaining = limit
+        for thread_id in thread_ids:
+            if only_ns is not None:
+                namespaces = [only_ns]
+            else:
+                namespaces = sorted(self._client.smembers(self._namespaces_key(thread_id)))
+            for checkpoint_ns in namespaces:
+                # At most ``keep_last`` checkpoints: pruning bounds this read.
+                fields = self._client.hgetall(self._thread_key(thread_id, checkpoint_ns))
+                for checkpoint_id in sorted(_checkpoint_ids(fields), reverse=True):
+                    if only_id and checkpoint_id != only_id:
+                        continue
+                    if before_id and checkpoint_id >= before_id:
+                        continue
+                    writes = self._client.hgetall(
+                        self._writes_key(thread_id, checkpoint_ns, checkpoint_id)
+                    )
+                    raw = fields[f"c:{checkpoint_id}"]
+                    checkpoint_tuple = self._to_tuple(
+                        thread_id, checkpoint_ns, checkpoint_id, raw, writes
+                    )
+                    if filter and not all(
+                        checkpoint_tuple.metadata.get(key) == value for key, value in filter.items()
+                    ):
+                        continue
+                    yield checkpoint_tuple
+                    if remaining is not None:
+                        remaining -= 1
+                        if remaining <= 0:
+                            return
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """
+        Store a checkpoint and prune the namespace to ``keep_last`` checkpoints.
+
+        The write is one ``MULTI`` round trip; pruning adds a second one when
+        the namespace holds more than ``keep_last`` checkpoints. ``latest``
+        only moves forward, so a worker finishing an older checkpoint late
+        cannot hide a newer one.
+
+        Args:
+            config: Config of the parent checkpoint.
+            checkpoint: Checkpoint to store.
+            metadata: Checkpoint metadata.
+            new_versions: Channel versions written in this step (unused).
+
+        Returns:
+            Config pointing at the stored checkpoint.
+        """
+        configurable = config["configurable"]
+        thread_id = configurable["thread_id"]
+        checkpoint_ns = configurable.get("checkpoint_ns", "")
+        value = {
+            "parent_checkpoint_id": configurable.get("checkpoint_id"),
+            "checkpoint": _encode(self.serde.dumps_typed(checkpoint)),
+            "metadata": _encode(self.serde.dumps_typed(get_checkpoint_metadata(config, metadata))),
+        }
+        key = self._thread_key(thread_id, checkpoint_ns)
+        namespaces_key = self._namespaces_key(thread_id)
+        pipe = self._client.pipeline()
+        pipe.hset(key, f"c:{checkpoint['id']}", json.dumps(value))
+        pipe.eval(_SET_LATEST_SCRIPT, 1, key, _LATEST_FIELD, checkpoint["id"])
+        pipe.sadd(namespaces_key, checkpoint_ns)
+        self._expire(pipe, key, namespaces_key)
+        pipe.hkeys(key)
+        fields = pipe.execute()[-1]
+        self._prune(thread_id, checkpoint_ns, fields, self.keep_last)
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint["id"],
+            }
+        }
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        """
+        Store intermediate writes linked to a checkpoint (one round trip).
+
+        Args:
+            config: Config of the related checkpoint.
+            writes: ``(channel, value)`` pairs.
+            task_id: Task that produced the writes.
+            task_path: Path of that task.
+        """
+        configurable = config["configurable"]
+        key = self._writes_key(
+            configurable["thread_id"],
+            configurable.get("checkpoint_ns", ""),
+            configurable["checkpoint_id"],
+        )
+        # Special channels (errors, interrupts) replace earlier values; regular
+        # writes are idempotent on retry.
+        replace = all(channel in WRITES_IDX_MAP for channel, _ in writes)
+        pipe = self._client.pipeline()
+        for idx, (channel, value) in enumerate(writes):
+            idx = WRITES_IDX_MAP.get(channel, idx)
+            field = f"{task_id}:{idx}"
+            encoded = json.dumps({
+                "task_id": task_id,
+                "idx": idx,
+                "channel": channel,
+                "value": _encode(self.serde.dumps_typed(value)),
+                "task_path": task_path,
+            })
+            if replace:
+                pipe.hset(key, field, encoded)
+            else:
+                pipe.hsetnx(key, field, encoded)
+        self._expire(pipe, key)
+        pipe.execute()
+
+    def delete_thread(self, thread_id: str) -> None:
+        """
+        Delete every checkpoint and write of a thread.
+
+        Args:
+            thread_id: Thread to delete.
+        """
+        namespaces_key = self._namespaces_key(thread_id)
+        namespaces = list(self._client.smembers(namespaces_key))
+        pipe = self._client.pipeline()
+        for checkpoint_ns in namespaces:
+            pipe.hkeys(self._thread_key(thread_id, checkpoint_ns))
+        keys = [namespaces_key]
+        for checkpoint_ns, fields in zip(namespaces, pipe.execute()):
+            keys.append(self._thread_key(thread_id, checkpoint_ns))
+            keys += [
+                self._writes_key(thread_id, checkpoint_ns, checkpoint_id)
+                for checkpoint_id in _checkpoint_ids(fields)
+            ]
+        self._client.delete(*keys)
+
+    def delete_all_threads(self) -> None:
+        """
+        Delete every stored thread.
+
+        Returns:
+            None.
+        """
+        for thread_id in self._thread_ids():
+            self.delete_thread(thread_id)
+
+    def prune(self, thread_ids: Sequence[str], *, strategy: str = "keep_latest") -> None:
+        """
+        Prune checkpoints of the given threads.
+
+        Args:
+            thread_ids: Threads to prune.
+            strategy: ``keep_latest`` keeps one checkpoint per namespace;
+                ``delete`` removes the threads entirely.
+
+        Raises:
+            ValueError: If the strategy is unknown.
+        """
+        if strategy not in ("keep_latest", "delete"):
+            raise ValueError(f"Unknown prune strategy: {strategy}")
+        for thread_id in thread_ids:
+            if strategy == "delete":
+                self.delete_thread(thread_id)
+                continue
+            for checkpoint_ns in self._client.smembers(self._namespaces_key(thread_id)):
+                fields = self._client.hkeys(self._thread_key(thread_id, checkpoint_ns))
+                self._prune(thread_id, checkpoint_ns, fields, 1)
+
+    def get_next_version(self, current: str | None, channel: None) -> str:
+        """
+        Return a monotonically increasing, string-sortable channel version.
+
+        Args:
+            current: Current version, if any.
+            channel: Deprecated, unused.
+
+        Returns:
+            Next version string.
+        """
+        return next_channel_version(current)
+
+    # Redis calls are network round trips: run them in a worker thread so they
+    # never block the event loop.
+
+    async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        """Async version of ``get_tuple``."""
+        return await asyncio.to_thread(self.get_tuple, config)
+
+    async def alist(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        """Async version of ``list``."""
+        items = await asyncio.to_thread(
+            lambda: list(self.list(config, filter=filter, before=before, limit=limit))
+        )
+        for item in items:
+            yield item
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """Async version of ``put``."""
+        return await asyncio.to_thread(self.put, config, checkpoint, metadata, new_versions)
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        """Async version of ``put_writes``."""
+        await asyncio.to_thread(self.put_writes, config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        """Async version of ``delete_thread``."""
+        await asyncio.to_thread(self.delete_thread, thread_id)
+
+    def _prune(self, thread_id: str, checkpoint_ns: str, fields: Sequence[str], keep: int) -> None:
+        """
+        Delete all but the newest ``keep`` checkpoints (and their writes) of a namespace.
+
+        Args:
+            thread_id: Thread of the namespace.
+            checkpoint_ns: Namespace to prune.
+            fields: Current fields of the namespace hash.
+            keep: Number of newest checkpoints to keep.
+        """
+        stale = sorted(_checkpoint_ids(fields), reverse=True)[keep:]
+        if not stale:
+            return
+        pipe = self._client.pipeline()
+        pipe.hdel(
+            self._thread_key(thread_id, checkpoint_ns),
+            *(f"c:{checkpoint_id}" for checkpoint_id in stale),
+        )
+        pipe.delete(
+            *(self._writes_key(thread_id, checkpoint_ns, checkpoint_id) for checkpoint_id in stale)
+        )
+        pipe.execute()
+
+    def _to_tuple(
+        self,
+        thread_id: str,
+        checkpoint_ns: str,
+        checkpoint_id: str,
+        raw: str,
+        raw_writes: dict[str, str],
+    ) -> CheckpointTuple:
+        """Deserialize a stored checkpoint and attach its pending writes."""
+        value = json.loads(raw)
+        writes = sorted(
+            (json.loads(write) for write in raw_writes.values()),
+            key=lambda write: (write["task_id"], write["idx"]),
+        )
+        parent_id = value["parent_checkpoint_id"]
+        return CheckpointTuple(
+            config={
+                "configurable": {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": checkpoint_ns,
+                    "checkpoint_id": checkpoint_id,
+                }
+            },
+            checkpoint=self.serde.loads_typed(_decode(value["checkpoint"])),
+            metadata=self.serde.loads_typed(_decode(value["metadata"])),
+            parent_config=(
+                {
+                    "configurable": {
+                        "thread_id": thread_id,
+                        "checkpoint_ns": checkpoint_ns,
+                        "checkpoint_id": parent_id,
+                    }
+                }
+                if parent_id
+                else None
+            ),
+            pending_writes=[
+                (write["task_id"], write["channel"], self.serde.loads_typed(_decode(write["value"])))
+                for write in writes
+            ],
+        )
@@ -0,0 +1,37 @@
+"""Shared Redis client for the session store and checkpointer (optional ``redis`` extra)."""
+
+import os
+import threading
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_redis_client():
+    """
+    Return the process-wide Redis client, connecting lazily to ``REDIS_URL``.
+
+    The client decodes responses to ``str`` and pools connections, so it can
+    be shared by every thread of the worker.
+
+    Returns:
+        ``redis.Redis`` instance.
+
+    Raises:
+        RuntimeError: If the ``redis`` package is missing or ``REDIS_URL`` is not set.
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                try:
+                    import redis
+                except ImportError as e:
+                    raise RuntimeError(
+                        "The Redis backend needs the redis package: pip install 'jarvis[redis]'"
+                    ) from e
+                url = os.getenv("REDIS_URL")
+                if not url:
+                    raise RuntimeError("REDIS_URL is not set")
+                _client = redis.Redis.from_url(url, decode_responses=True)
+    return _client
@@ -0,0 +1,204 @@
+"""Session state shared between API worker processes (SQLite file or Redis)."""
+
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+
+from jarvis.infrastructure.persistence.sqlite import get_connection
+
+_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS sessions (
+        model TEXT NOT NULL,
+        thread_id TEXT NOT NULL,
+        state TEXT NOT NULL,
+        expires_at REAL NOT NULL,
+        PRIMARY KEY (model, thread_id)
+    ) WITHOUT ROWID
+"""
+
+_PURGE_INTERVAL_SECONDS = 600.0
+
+
+class SessionStore(ABC):
+    """
+    Key-value store of per-session state, keyed by ``(model, thread_id)``.
+
+    States are JSON-serializable dicts; each entry expires ``ttl_seconds``
+    after its last write, like an idle session in the worker's cache.
+    Subclasses implement the four abstract operations below.
+
+    Attributes:
+        ttl_seconds: Lifetime of an entry after its last ``put``.
+    """
+
+    def __init__(self, ttl_seconds: float) -> None:
+        """
+        Args:
+            ttl_seconds: Lifetime of an entry after its last ``put``.
+        """
+        self.ttl_seconds = ttl_seconds
+
+    @abstractmethod
+    def get(self, model: str, thread_id: str) -> dict | None:
+        """
+        Return the stored state of a session.
+
+        Args:
+            model: Model name of the session.
+            thread_id: Conversation thread.
+
+        Returns:
+            State dict, or None if absent or expired.
+        """
+
+    @abstractmethod
+    def put(self, model: str, thread_id: str, state: dict) -> None:
+        """
+        Store (or replace) the state of a session and renew its expiry.
+
+        Args:
+            model: Model name of the session.
+            thread_id: Conversation thread.
+            state: JSON-serializable state.
+        """
+
+    @abstractmethod
+    def delete(self, model: str, thread_id: str) -> None:
+        """
+        Forget the state of a session.
+
+        Args:
+            model: Model name of the session.
+            thread_id: Conversation thread.
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Forget every stored session."""
+
+
+class SqliteSessionStore(SessionStore):
+    """
+    Session store in a local SQLite file, shared by the workers of one host.
+
+    Every call commits immediately (WAL mode lets workers read while another
+    writes). Expired rows are ignored on read and purged at most every
+    ten minutes on write.
+
+    Attributes:
+        db_path: SQLite database file.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Args:
+            db_path: SQLite database file (created on first use).
+            ttl_seconds: Lifetime of an entry after its last ``put``.
+            clock: Wall-clock time source, shared by all workers (overridable in tests).
+        """
+        super().__init__(ttl_seconds)
+        self.db_path = db_path
+        self._clock = clock
+        self._last_purge = clock()
+        self._purge_lock = threading.Lock()
+        with get_connection(db_path) as conn:
+            conn.execute(_SCHEMA)
+
+    def get(self, model: str, thread_id: str) -> dict | None:
+        """Read a session's state from the file, ignoring expired rows."""
+        row = get_connection(self.db_path).execute(
+            "SELECT state FROM sessions WHERE model = ? AND thread_id = ? AND expires_at > ?",
+            (model, thread_id, self._clock()),
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, model: str, thread_id: str, state: dict) -> None:
+        """Upsert a session's state, renew its expiry and purge stale rows now and then."""
+        now = self._clock()
+        conn = get_connection(self.db_path)
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO sessions (model, thread_id, state, expires_at)"
+                " VALUES (?, ?, ?, ?)",
+                (model, thread_id, json.dumps(state), now + self.ttl_seconds),
+            )
+        self._purge_expired(now)
+
+    def delete(self, model: str, thread_id: str) -> None:
+        """Delete a session's row."""
+        conn = get_connection(self.db_path)
+        with conn:
+            conn.execute(
+                "DELETE FROM sessions WHERE model = ? AND thread_id = ?", (model, thread_id)
+            )
+
+    def clear(self) -> None:
+        """Delete every session row."""
+        conn = get_connection(self.db_path)
+        with conn:
+            conn.execute("DELETE FROM sessions")
+
+    def _purge_expired(self, now: float) -> None:
+        """Delete expired rows if the last purge is older than the purge interval."""
+        with self._purge_lock:
+            if now - self._last_purge < _PURGE_INTERVAL_SECONDS:
+                return
+            self._last_purge = now
+        conn = get_connection(self.db_path)
+        with conn:
+            conn.execute("DELETE FROM sessions WHERE expires_at <= ?", (now,))
+
+
+class RedisSessionStore(SessionStore):
+    """
+    Session store in Redis, shared by workers on any host.
+
+    Each session is one string key holding its JSON state, with the TTL set
+    by Redis itself (``SET ... EX``), so nothing needs purging.
+
+    Attributes:
+        key_prefix: Prefix of every key of the store.
+    """
+
+    def __init__(self, client, ttl_seconds: float, key_prefix: str = "jarvis") -> None:
+        """
+        Args:
+            client: ``redis.Redis`` created with ``decode_responses=True``.
+            ttl_seconds: Lifetime of an entry after its last ``put``.
+            key_prefix: Namespace of the keys (``<prefix>:session:<model>:<thread_id>``).
+        """
+        super().__init__(ttl_seconds)
+        self.key_prefix = key_prefix
+        self._client = client
+
+    def _key(self, model: str, thread_id: str) -> str:
+        """Key of a session's state."""
+        return f"{self.key_prefix}:session:{model}:{thread_id}"
+
+    def get(self, model: str, thread_id: str) -> dict | None:
+        """Read a session's state; Redis has already dropped expired keys."""
+        value = self._client.get(self._key(model, thread_id))
+        return json.loads(value) if value else None
+
+    def put(self, model: str, thread_id: str, state: dict) -> None:
+        """Store a session's state with a fresh TTL (one ``SET ... EX``)."""
+        self._client.set(
+            self._key(model, thread_id), json.dumps(state), ex=max(1, int(self.ttl_seconds))
+        )
+
+    def delete(self, model: str, thread_id: str) -> None:
+        """Delete a session's key."""
+        self._client.delete(self._key(model, thread_id))
+
+    def clear(self) -> None:
+        """Delete every session key of the store's prefix."""
+        keys = list(self._client.scan_iter(match=f"{self.key_prefix}:session:*", count=500))
+        if keys:
+            self._client.delete(*keys)
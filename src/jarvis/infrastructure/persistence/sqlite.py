@@ -0,0 +1,116 @@
+"""Thread-local SQLite connections with WAL journaling and tuned pragmas."""
+
+import logging
+import sqlite3
+import threading
+
+logger = logging.getLogger(__name__)
+
+SQLITE_PRAGMAS: tuple[str, ...] = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-8000",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA temp_store=MEMORY",
+)
+"""Pragmas applied to every new connection (WAL, 8 MiB page cache, 5 s busy wait)."""
+
+STATEMENT_CACHE_SIZE: int = 128
+"""Prepared statements kept per connection (``sqlite3`` reuses them by SQL text)."""
+
+
+class SQLiteConnectionManager:
+    """
+    Hand out one long-lived connection per (thread, database file).
+
+    Connections are never shared between threads, so callers in uvicorn's
+    threadpool do not need extra locking; WAL mode lets readers proceed while
+    another thread writes. Prepared statements are cached per connection.
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._all_connections: list[sqlite3.Connection] = []
+        self._registry_lock = threading.Lock()
+
+    def connection(self, db_path: str) -> sqlite3.Connection:
+        """
+        Return this thread's connection to ``db_path``, opening it on first use.
+
+        Args:
+            db_path: SQLite database file.
+
+        Returns:
+            Open connection with ``sqlite3.Row`` rows and tuned pragmas.
+        """
+        connections: dict[str, sqlite3.Connection] | None = getattr(
+            self._local, "connections", None
+        )
+        if connections is None:
+            connections = self._local.connections = {}
+        conn = connections.get(db_path)
+        if conn is None:
+            conn = self._open(db_path)
+            connections[db_path] = conn
+            with self._registry_lock:
+                self._all_connections.append(conn)
+        return conn
+
+    def close_all(self) -> None:
+        """
+        Close every connection opened by any thread.
+
+        Returns:
+            None. Threads reopen connections lazily afterwards.
+        """
+        with self._registry_lock:
+            connections, self._all_connections = self._all_connections, []
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error as e:
+                logger.warning("Error closing SQLite connection: %s", e)
+        self._local = threading.local()
+
+    @staticmethod
+    def _open(db_path: str) -> sqlite3.Connection:
+        """Open a connection and apply ``SQLITE_PRAGMAS``."""
+        # check_same_thread=False only so close_all() can run from another
+        # thread; each connection is otherwise used by its owner thread alone.
+        conn = sqlite3.connect(
+            db_path,
+            check_same_thread=False,
+            cached_statements=STATEMENT_CACHE_SIZE,
+        )
+        conn.row_factory = sqlite3.Row
+        for pragma in SQLITE_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+
+_manager = SQLiteConnectionManager()
+
+
+def get_connection(db_path: str) -> sqlite3.Connection:
+    """
+    Return the calling thread's shared connection to ``db_path``.
+
+    Use ``with conn:`` around writes to commit (or roll back) a transaction.
+
+    Args:
+        db_path: SQLite database file.
+
+    Returns:
+        Open SQLite connection.
+    """
+    return _manager.connection(db_path)
+
+
+def close_all_connections() -> None:
+    """
+    Close every pooled SQLite connection (e.g. on shutdown or in tests).
+
+    Returns:
+        None.
+    """
+    _manager.close_all()
@@ -7,12 +7,26 @@ logger = logging.getLogger(__name__)
 
 from jarvis.core.config import DB_DEBUG_MODE
 from jarvis.core.paths import USERS_DB_PATH
-from jarvis.infrastructure.crypto.fernet import decode_symm_crypt_key, encode_symm_crypt_key
+from jarvis.infrastructure.crypto.fernet import (
+    compute_blind_index,
+    decode_symm_crypt_key,
+    encode_symm_crypt_key,
+)
+from jarvis.infrastructure.persistence.sqlite import get_connection
 
 DB_PATH = str(USERS_DB_PATH)
 
 _ALLOWED_QUERY_FIELDS = frozenset({"real_name", "access_name"})
 
+_BLIND_INDEX_COLUMNS: dict[str, str] = {"access_name": "access_name_bidx"}
+"""Encrypted fields that have a keyed blind-index column for equality lookups."""
+
+_migrated_db_paths: set[str] = set()
+
+_UNIQUE_BIDX_INDEX = "idx_users_access_name_bidx"
+_LOOKUP_BIDX_INDEX = "idx_users_access_name_bidx_lookup"
+"""Non-unique fallback used while the table holds duplicate access_names."""
+
 
 def init_db() -> None:
     """
@@ -21,7 +35,8 @@ def init_db() -> None:
     Returns:
         None.
     """
-    with sqlite3.connect(DB_PATH) as conn:
+    conn = get_connection(DB_PATH)
+    with conn:
         cursor = conn.cursor()
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS users (
@@ -31,10 +46,82 @@ def init_db() -> None:
                 password TEXT NOT NULL,
                 jarvis_name TEXT NOT NULL,
                 is_female BOOLEAN NOT NULL,
-                admin BOOLEAN NOT NULL DEFAULT 0
+                admin BOOLEAN NOT NULL DEFAULT 0,
+                access_name_bidx TEXT
             )
         """)
-        conn.commit()
+    migrate_blind_index()
+
+
+def migrate_blind_index() -> int:
+    """
+    Add and backfill the ``access_name_bidx`` blind-index column (idempotent).
+
+    Older ``users.db`` files lack the column: it is added, every row missing an
+    index is decrypted once to compute it, and a unique index is created so
+    lookups by access_name become a single indexed query.
+
+    The old ``UNIQUE`` constraint on the ciphertext never rejected repeated
+    access_names (each encryption differs), so legacy files may hold
+    duplicates. They are logged and indexed without uniqueness until an
+    admin removes them; the unique index is created on the next run after that.
+
+    Returns:
+        Number of rows backfilled.
+    """
+    conn = get_connection(DB_PATH)
+    with conn:
+        cursor = conn.cursor()
+        columns = {row[1] for row in cursor.execute("PRAGMA table_info(users)")}
+        if not columns:
+            return 0
+        if "access_name_bidx" not in columns:
+            cursor.execute("ALTER TABLE users ADD COLUMN access_name_bidx TEXT")
+
+        backfilled = 0
+        rows = cursor.execute(
+            "SELECT id, access_name FROM users WHERE access_name_bidx IS NULL"
+        ).fetchall()
+        for user_id, encrypted_access_name in rows:
+            try:
+                access_name = decode_symm_crypt_key(encrypted_access_name)
+            except Exception as e:
+                logger.error("Decryption failed for user id %s during migration: %s", user_id, e)
+                continue
+            cursor.execute(
+                "UPDATE users SET access_name_bidx = ? WHERE id = ?",
+                (compute_blind_index(access_name), user_id),
+            )
+            backfilled += 1
+
+        duplicates = cursor.execute(
+            "SELECT GROUP_CONCAT(id) FROM users WHERE access_name_bidx IS NOT NULL"
+            " GROUP BY access_name_bidx HAVING COUNT(*) > 1"
+        ).fetchall()
+        if duplicates:
+            logger.warning(
+                "Users share an access_name (ids %s); access_name index left non-unique"
+                " until the duplicates are removed",
+                "; ".join(ids for (ids,) in duplicates),
+            )
+            cursor.execute(
+                f"CREATE INDEX IF NOT EXISTS {_LOOKUP_BIDX_INDEX} ON users(access_name_bidx)"
+            )
+        else:
+            cursor.execute(
+                f"CREATE UNIQUE INDEX IF NOT EXISTS {_UNIQUE_BIDX_INDEX} ON users(access_name_bidx)"
+            )
+            cursor.execute(f"DROP INDEX IF EXISTS {_LOOKUP_BIDX_INDEX}")
+    _migrated_db_paths.add(DB_PATH)
+    if backfilled:
+        logger.info("Backfilled access_name blind index for %d users", backfilled)
+    return backfilled
+
+
+def _ensure_blind_index() -> None:
+    """Run ``migrate_blind_index`` once per process for the current database."""
+    if DB_PATH not in _migrated_db_paths:
+        migrate_blind_index()
 
 
 def insert_user(
@@ -46,7 +133,7 @@ def insert_user(
     admin: bool = False,
 ) -> None:
     """
-    Insert a user; encrypt access_name and password.
+    Insert a user; encrypt access_name and password and index access_name.
 
     Args:
         real_name: Unique real name.
@@ -57,15 +144,28 @@ def insert_user(
         admin: Administrator privileges.
 
     Returns:
-        None. Prints a warning on IntegrityError (duplicate).
+        None. Logs a warning if the real_name or access_name already exists.
     """
+    _ensure_blind_index()
+    conn = get_connection(DB_PATH)
+    access_name_bidx = compute_blind_index(access_name)
+    # The unique index may be missing on legacy files with duplicates.
+    if conn.execute(
+        "SELECT 1 FROM users WHERE access_name_bidx = ?", (access_name_bidx,)
+    ).fetchone():
+        logger.warning(
+            "IntegrityError: user with real_name '%s' or access_name '%s' already exists",
+            real_name,
+            access_name,
+        )
+        return
     try:
-        with sqlite3.connect(DB_PATH) as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
+        with conn:
+            conn.execute("""
                 INSERT INTO users (
-                    real_name, access_name, password, jarvis_name, is_female, admin
-                ) VALUES (?, ?, ?, ?, ?, ?)
+                    real_name, access_name, password, jarvis_name, is_female, admin,
+                    access_name_bidx
+                ) VALUES (?, ?, ?, ?, ?, ?, ?)
             """, (
                 real_name,
                 encode_symm_crypt_key(access_name),
@@ -73,8 +173,8 @@ def insert_user(
                 jarvis_name,
                 int(is_female),
                 int(admin),
+                access_name_bidx,
             ))
-            conn.commit()
     except sqlite3.IntegrityError:
         logger.warning(
             "IntegrityError: user with real_name '%s' or access_name '%s' already exists",
@@ -115,7 +215,8 @@ def get_user_by_field(field: str, value: str, is_sensitive: bool = False) -> dic
     Args:
         field: ``real_name`` or ``access_name``.
         value: Value to compare (plain text; decrypted in DB when is_sensitive).
-        is_sensitive: If True, scan rows decrypting (e.g. access_name).
+        is_sensitive: If True, the column is encrypted: use its blind index when
+            available (access_name), otherwise scan rows decrypting.
 
     Returns:
         User row dict or None if no match.
@@ -126,25 +227,38 @@ def get_user_by_field(field: str, value: str, is_sensitive: bool = False) -> dic
     if field not in _ALLOWED_QUERY_FIELDS:
         raise ValueError(f"Field '{field}' is not allowed for querying.")
 
-    with sqlite3.connect(DB_PATH) as conn:
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-
-        if is_sensitive:
-            cursor.execute("SELECT * FROM users")
-            rows = cursor.fetchall()
-            for row in rows:
-                try:
-                    decrypted_value = decode_symm_crypt_key(row[field])
-                    if decrypted_value == value:
-                        return dict(row)
-                except Exception as e:
-                    logger.error("Decryption failed for %s: %s", field, e)
-            return None
-
-        cursor.execute(f"SELECT * FROM users WHERE {field} = ?", (value,))
-        row = cursor.fetchone()
-        return dict(row) if row else None
+    if is_sensitive and field in _BLIND_INDEX_COLUMNS:
+        _ensure_blind_index()
+
+    conn = get_connection(DB_PATH)
+
+    if is_sensitive and field in _BLIND_INDEX_COLUMNS:
+        # Legacy files may hold duplicates: take the oldest row that decrypts
+        # to the value (defense in depth against blind-index collisions).
+        rows = conn.execute(
+            f"SELECT * FROM users WHERE {_BLIND_INDEX_COLUMNS[field]} = ? ORDER BY id",
+            (compute_blind_index(value),),
+        ).fetchall()
+        for row in rows:
+            try:
+                if decode_symm_crypt_key(row[field]) == value:
+                    return dict(row)
+            except Exception as e:
+                logger.error("Decryption failed for %s: %s", field, e)
+        return None
+
+    if is_sensitive:
+        for row in conn.execute("SELECT * FROM users").fetchall():
+            try:
+                decrypted_value = decode_symm_crypt_key(row[field])
+                if decrypted_value == value:
+                    return dict(row)
+            except Exception as e:
+                logger.error("Decryption failed for %s: %s", field, e)
+        return None
+
+    row = conn.execute(f"SELECT * FROM users WHERE {field} = ?", (value,)).fetchone()
+    return dict(row) if row else None
 
 
 def delete_user_by_field(field: str, value: str, is_sensitive: bool = False) -> bool:
@@ -165,16 +279,40 @@ def delete_user_by_field(field: str, value: str, is_sensitive: bool = False) ->
     if field not in _ALLOWED_QUERY_FIELDS:
         raise ValueError(f"Field '{field}' not allowed for deletion.")
 
-    user = get_user_by_field(field, value, is_sensitive)
-    if not user:
-        return False
-
-    user_id = user["id"]
-    with sqlite3.connect(DB_PATH) as conn:
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM users WHERE id = ?", (user_id,))
-        conn.commit()
-        return cursor.rowcount > 0
+    conn = get_connection(DB_PATH)
+
+    if is_sensitive and field in _BLIND_INDEX_COLUMNS:
+        _ensure_blind_index()
+        # The blind index only narrows the candidates: delete the rows whose
+        # value decrypts to the one given, never a colliding neighbour.
+        rows = conn.execute(
+            f"SELECT id, {field} FROM users WHERE {_BLIND_INDEX_COLUMNS[field]} = ?",
+            (compute_blind_index(value),),
+        ).fetchall()
+        ids = []
+        for row in rows:
+            try:
+                if decode_symm_crypt_key(row[field]) == value:
+                    ids.append(row["id"])
+            except Exception as e:
+                logger.error("Decryption failed for %s: %s", field, e)
+        if not ids:
+            return False
+        with conn:
+            conn.executemany("DELETE FROM users WHERE id = ?", [(user_id,) for user_id in ids])
+        return True
+
+    if is_sensitive:
+        user = get_user_by_field(field, value, is_sensitive)
+        if not user:
+            return False
+        column, lookup_value = "id", user["id"]
+    else:
+        column, lookup_value = field, value
+
+    with conn:
+        cursor = conn.execute(f"DELETE FROM users WHERE {column} = ?", (lookup_value,))
+    return cursor.rowcount > 0
 
 
 def get_all_users() -> list[tuple]:
@@ -190,10 +328,8 @@ def get_all_users() -> list[tuple]:
     if not DB_DEBUG_MODE:
         raise PermissionError("Access to user list is disabled in production.")
 
-    with sqlite3.connect(DB_PATH) as conn:
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT id, real_name, access_name, jarvis_name, is_female, admin
-            FROM users
-        """)
-        return cursor.fetchall()
+    rows = get_connection(DB_PATH).execute("""
+        SELECT id, real_name, access_name, jarvis_name, is_female, admin
+        FROM users
+    """).fetchall()
+    return [tuple(row) for row in rows]
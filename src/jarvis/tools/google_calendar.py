@@ -1,14 +1,41 @@
 """Herramientas LangChain para leer y modificar Google Calendar por usuario."""
 
 import datetime
+import heapq
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from langchain_core.tools import tool
-from googleapiclient.discovery import build
 from typing_extensions import Annotated
 from langgraph.prebuilt import InjectedState
 from typing import Optional
 from dateutil import parser
+from googleapiclient.http import HttpRequest
+from pydantic import BaseModel, Field
 
 from jarvis.infrastructure.google.calendar_auth import get_authentications_for_user
+from jarvis.core.config import CALENDAR_FETCH_MAX_WORKERS
+from jarvis.infrastructure.google.calendar_mirror import get_calendar_mirror
+from jarvis.infrastructure.google.calendar_service import get_calendar_http, get_calendar_service
+
+logger = logging.getLogger(__name__)
+
+_calendar_executor = ThreadPoolExecutor(
+    max_workers=CALENDAR_FETCH_MAX_WORKERS, thread_name_prefix="jarvis-calendar"
+)
+
+BATCH_MAX_REQUESTS: int = 50
+"""Peticiones por lote HTTP (límite recomendado por la API de Calendar)."""
+
+
+class CalendarEventInput(BaseModel):
+    """An event to create with create_calendar_events_tool."""
+
+    start_datetime: str = Field(description="Start date and time in ISO 8601 (e.g. '2025-07-08T09:00:00').")
+    end_datetime: str = Field(description="End date and time in ISO 8601 (e.g. '2025-07-08T10:00:00').")
+    title: Optional[str] = Field(default=None, description="Event title.")
+    description: Optional[str] = Field(default=None, description="Event description.")
+    location: Optional[str] = Field(default=None, description="Event location.")
 
 
 def ensure_timezone(dt_string: str, fallback_tz: str = "+00:00") -> str:
@@ -34,6 +61,92 @@ def ensure_timezone(dt_string: str, fallback_tz: str = "+00:00") -> str:
         raise ValueError(f"Formato de fecha inválido: '{dt_string}'. Usa ISO 8601 (e.g. 2025-07-22T00:00:00+02:00)")
 
 
+def _event_start(event: dict) -> datetime.datetime:
+    """
+    Instante de inicio de un evento, comparable entre cuentas y zonas horarias.
+
+    Args:
+        event: Evento devuelto por la API (``start.dateTime`` o ``start.date``).
+
+    Returns:
+        Fecha y hora con zona (los eventos de día completo empiezan a las 00:00 UTC).
+    """
+    start = parser.isoparse(event["start"].get("dateTime", event["start"].get("date")))
+    if start.tzinfo is None:
+        start = start.replace(tzinfo=datetime.timezone.utc)
+    return start
+
+
+def _fetch_account_events(real_name: str, account: str, authentication, list_kwargs: dict) -> list[dict]:
+    """
+    Eventos de una cuenta ordenados por inicio, desde el espejo local si es posible.
+
+    Con el espejo activado, la cuenta se sincroniza (``syncToken``) solo si su
+    última sincronización supera la antigüedad permitida, y el rango se resuelve
+    con una consulta indexada. Si la sincronización falla, o el rango empieza
+    antes del histórico que guarda el espejo, se consulta la API.
+
+    Args:
+        real_name: Usuario propietario de las cuentas.
+        account: Nombre de la cuenta.
+        authentication: Credenciales OAuth de la cuenta.
+        list_kwargs: Parámetros de ``events().list``.
+
+    Returns:
+        Eventos de la cuenta.
+    """
+    service = get_calendar_service(real_name, account, authentication)
+    mirror = get_calendar_mirror()
+    if mirror is not None:
+        try:
+            if not mirror.is_fresh(real_name, account):
+                mirror.sync(real_name, account, service)
+            if mirror.covers(real_name, account, list_kwargs["timeMin"]):
+                return mirror.query(
+                    real_name,
+                    account,
+                    list_kwargs["timeMin"],
+                    list_kwargs.get("timeMax"),
+                    list_kwargs["maxResults"],
+                )
+        except Exception as e:
+            logger.warning("Calendar mirror unavailable for %s/%s: %s", real_name, account, e)
+    return service.events().list(**list_kwargs).execute().get("items", [])
+
+
+def _fetch_merged_events(
+    real_name: str, authentications: dict, list_kwargs: dict, num_events: int
+) -> tuple[list[dict], dict[str, Exception]]:
+    """
+    Consulta todas las cuentas en paralelo y mezcla sus listas ordenadas.
+
+    Args:
+        real_name: Usuario propietario de las cuentas.
+        authentications: ``{cuenta: credenciales}``.
+        list_kwargs: Parámetros de ``events().list``.
+        num_events: Máximo de eventos a devolver.
+
+    Returns:
+        Tupla (los ``num_events`` primeros eventos por inicio, errores por cuenta).
+    """
+    futures = {
+        account: _calendar_executor.submit(
+            _fetch_account_events, real_name, account, authentication, list_kwargs
+        )
+        for account, authentication in authentications.items()
+    }
+    per_account: list[list[dict]] = []
+    failures: dict[str, Exception] = {}
+    for account, future in futures.items():
+        try:
+            per_account.append(future.result())
+        except Exception as e:
+            logger.warning("Calendar query failed for %s/%s: %s", real_name, account, e)
+            failures[account] = e
+    merged = heapq.merge(*per_account, key=_event_start)
+    return list(islice(merged, num_events)), failures
+
+
 @tool
 def get_upcoming_events_tool(
     real_name: Annotated[str, InjectedState("real_name")],
@@ -62,38 +175,24 @@ def get_upcoming_events_tool(
         time_min = ensure_timezone(date_from) if date_from else datetime.datetime.now(tz=datetime.timezone.utc).isoformat()
         time_max = ensure_timezone(date_to) if date_to else None
 
-        events = []
-
-        for authentication in authentications.values():
-            try:
-                service = build("calendar", "v3", credentials=authentication)
-
-                list_kwargs = {
-                    "calendarId": "primary",
-                    "timeMin": time_min,
-                    "maxResults": num_events,
-                    "singleEvents": True,
-                    "orderBy": "startTime",
-                }
-                if time_max:
-                    list_kwargs["timeMax"] = time_max
+        list_kwargs = {
+            "calendarId": "primary",
+            "timeMin": time_min,
+            "maxResults": num_events,
+            "singleEvents": True,
+            "orderBy": "startTime",
+        }
+        if time_max:
+            list_kwargs["timeMax"] = time_max
 
-                events_result = service.events().list(**list_kwargs).execute()
-                events.extend(events_result.get("items", []))
+        events, failures = _fetch_merged_events(real_name, authentications, list_kwargs, num_events)
 
-            except Exception as e:
-                return f"Error al consultar uno de los calendarios: {str(e)}"
+        if failures and len(failures) == len(authentications):
+            return f"Error al consultar los calendarios: {str(next(iter(failures.values())))}"
 
-        if not events:
+        if not events and not failures:
             return "No se encontraron eventos para las fechas indicadas."
 
-        events = sorted(
-            events,
-            key=lambda event: event["start"].get("dateTime", event["start"].get("date")),
-            reverse=False,
-        )
-        events = events[:num_events] if len(events) > num_events else events
-
         result = (
             "Este es el resultado de la consulta de eventos.\n\n"
             "📌 Nota para ti, agente: el campo 'ID del evento' es útil para el manejo interno, "
@@ -109,6 +208,17 @@ def get_upcoming_events_tool(
             event_id = event.get("id", "Sin ID")
             result += f"{start} - {summary} - {event_id}\n"
 
+        if not events:
+            result += "No se encontraron eventos para las fechas indicadas en las cuentas disponibles.\n"
+
+        if failures:
+            result += (
+                "\n⚠️ Resultado parcial: no se pudieron consultar estas cuentas, "
+                "por lo que pueden faltar eventos:\n"
+            )
+            for account, error in failures.items():
+                result += f"- {account}: {error}\n"
+
         return result.strip()
 
     except FileNotFoundError as fnf:
@@ -119,6 +229,83 @@ def get_upcoming_events_tool(
         return f"Error desconocido. No fue posible obtener los eventos: {str(e)}"
 
 
+def _event_body(
+    start_datetime: str,
+    end_datetime: str,
+    title: Optional[str],
+    description: Optional[str],
+    location: Optional[str],
+    timezone: str,
+) -> dict:
+    """
+    Construye el cuerpo de ``events().insert``.
+
+    Args:
+        start_datetime: Inicio en ISO 8601.
+        end_datetime: Fin en ISO 8601.
+        title: Título opcional.
+        description: Descripción opcional.
+        location: Ubicación opcional.
+        timezone: Zona horaria del evento.
+
+    Returns:
+        Recurso de evento para la API.
+    """
+    event = {
+        "start": {
+            "dateTime": start_datetime,
+            "timeZone": timezone,
+        },
+        "end": {
+            "dateTime": end_datetime,
+            "timeZone": timezone,
+        },
+        "reminders": {
+            "useDefault": True
+        },
+    }
+
+    if title and title.strip():
+        event["summary"] = title.strip()
+    if description and description.strip():
+        event["description"] = description.strip()
+    if location and location.strip():
+        event["location"] = location.strip()
+    return event
+
+
+def _execute_batched(
+    real_name: str, account: str, authentication, requests: list[HttpRequest]
+) -> list[tuple[Optional[dict], Optional[Exception]]]:
+    """
+    Envía peticiones en lotes HTTP (``BatchHttpRequest``) de ``BATCH_MAX_REQUESTS``.
+
+    Args:
+        real_name: Usuario propietario de las cuentas.
+        account: Nombre de la cuenta.
+        authentication: Credenciales OAuth de la cuenta.
+        requests: Peticiones construidas con el cliente de la cuenta.
+
+    Returns:
+        Por cada petición, en el mismo orden, (respuesta, error); uno de los dos es None.
+    """
+    service = get_calendar_service(real_name, account, authentication)
+    http = get_calendar_http(real_name, account, authentication)
+    results: list[tuple[Optional[dict], Optional[Exception]]] = [
+        (None, RuntimeError("sin respuesta"))
+    ] * len(requests)
+
+    def on_response(request_id: str, response, exception) -> None:
+        results[int(request_id)] = (response, exception)
+
+    for offset in range(0, len(requests), BATCH_MAX_REQUESTS):
+        batch = service.new_batch_http_request(callback=on_response)
+        for index, request in enumerate(requests[offset:offset + BATCH_MAX_REQUESTS], offset):
+            batch.add(request, request_id=str(index))
+        batch.execute(http=http)
+    return results
+
+
 @tool
 def create_calendar_event_tool(
     real_name: Annotated[str, InjectedState("real_name")],
@@ -151,37 +338,82 @@ def create_calendar_event_tool(
         if not authentications:
             return "No authentication found for the user."
 
-        authentication = list(authentications.values())[0]
-        service = build("calendar", "v3", credentials=authentication)
-
-        event = {
-            "start": {
-                "dateTime": start_datetime,
-                "timeZone": timezone,
-            },
-            "end": {
-                "dateTime": end_datetime,
-                "timeZone": timezone,
-            },
-            "reminders": {
-                "useDefault": True
-            },
-        }
-
-        if title and title.strip():
-            event["summary"] = title.strip()
-        if description and description.strip():
-            event["description"] = description.strip()
-        if location and location.strip():
-            event["location"] = location.strip()
+        account, authentication = next(iter(authentications.items()))
+        service = get_calendar_service(real_name, account, authentication)
 
+        event = _event_body(start_datetime, end_datetime, title, description, location, timezone)
         created_event = service.events().insert(calendarId="primary", body=event).execute()
+        mirror = get_calendar_mirror()
+        if mirror is not None:
+            mirror.upsert(real_name, account, created_event)
         return f"Evento creado correctamente. Link: {created_event.get('htmlLink')}. ID: {created_event.get('id')}"
 
     except Exception as e:
         return f"Error al crear el evento: {str(e)}"
 
 
+@tool
+def create_calendar_events_tool(
+    real_name: Annotated[str, InjectedState("real_name")],
+    events: list[CalendarEventInput],
+    timezone: str = "Europe/Madrid"
+) -> str:
+    """
+    Create several events in the user's Google Calendar in a single call.
+
+    Prefer this over calling create_calendar_event_tool repeatedly when the user
+    asks for more than one event (e.g. "block out every morning this week").
+
+    Required:
+    - events: List of events, each with start_datetime and end_datetime in ISO 8601
+      and optional title, description and location.
+
+    Optional:
+    - timezone: Timezone of all the events (default is 'Europe/Madrid')
+
+    Returns one result line per event, in order, with its ID or the error.
+    """
+    try:
+        real_name = real_name.strip().lower()
+        if not events:
+            return "No se indicó ningún evento para crear."
+        authentications = get_authentications_for_user(real_name, allow_logging_popup=True)
+        if not authentications:
+            return "No authentication found for the user."
+
+        account, authentication = next(iter(authentications.items()))
+        service = get_calendar_service(real_name, account, authentication)
+        specs = [CalendarEventInput.model_validate(event) for event in events]
+        requests = [
+            service.events().insert(
+                calendarId="primary",
+                body=_event_body(
+                    spec.start_datetime, spec.end_datetime, spec.title,
+                    spec.description, spec.location, timezone,
+                ),
+            )
+            for spec in specs
+        ]
+        results = _execute_batched(real_name, account, authentication, requests)
+
+        mirror = get_calendar_mirror()
+        lines = []
+        for number, (spec, (created_event, error)) in enumerate(zip(specs, results), 1):
+            label = f"{number}. {spec.title or 'Sin título'} ({spec.start_datetime})"
+            if error is not None:
+                lines.append(f"❌ {label}: error: {error}")
+                continue
+            if mirror is not None:
+                mirror.upsert(real_name, account, created_event)
+            lines.append(f"✅ {label}: creado. ID: {created_event.get('id')}")
+
+        created = sum(1 for _, error in results if error is None)
+        return f"Eventos creados: {created}/{len(specs)}.\n" + "\n".join(lines)
+
+    except Exception as e:
+        return f"Error al crear los eventos: {str(e)}"
+
+
 @tool
 def delete_calendar_event_tool(
     real_name: Annotated[str, InjectedState("real_name")],
@@ -199,11 +431,62 @@ def delete_calendar_event_tool(
         if not authentications:
             return "No authentication found for the user."
 
-        authentication = list(authentications.values())[0]
-        service = build("calendar", "v3", credentials=authentication)
+        account, authentication = next(iter(authentications.items()))
+        service = get_calendar_service(real_name, account, authentication)
 
         service.events().delete(calendarId="primary", eventId=event_id).execute()
+        mirror = get_calendar_mirror()
+        if mirror is not None:
+            mirror.remove(real_name, account, event_id)
         return f"Evento con ID '{event_id}' eliminado correctamente."
 
     except Exception as e:
         return f"No se pudo eliminar el evento con ID '{event_id}': {str(e)}"
+
+
+@tool
+def delete_calendar_events_tool(
+    real_name: Annotated[str, InjectedState("real_name")],
+    event_ids: list[str]
+) -> str:
+    """
+    Delete several events from the user's Google Calendar in a single call.
+
+    Prefer this over calling delete_calendar_event_tool repeatedly (e.g. "clear my Friday").
+
+    Required:
+    - event_ids: IDs of the events to delete (must be exact)
+
+    Returns one result line per event ID, in order.
+    """
+    try:
+        real_name = real_name.strip().lower()
+        if not event_ids:
+            return "No se indicó ningún evento para eliminar."
+        authentications = get_authentications_for_user(real_name, allow_logging_popup=True)
+        if not authentications:
+            return "No authentication found for the user."
+
+        account, authentication = next(iter(authentications.items()))
+        service = get_calendar_service(real_name, account, authentication)
+        requests = [
+            service.events().delete(calendarId="primary", eventId=event_id)
+            for event_id in event_ids
+        ]
+        results = _execute_batched(real_name, account, authentication, requests)
+
+        mirror = get_calendar_mirror()
+        lines = []
+        for event_id, (_, error) in zip(event_ids, results):
+            if error is not None:
+                lines.append(f"❌ {event_id}: no se pudo eliminar: {error}")
+                continue
+            if mirror is not None:
+                mirror.remove(real_name, account, event_id)
+            lines.append(f"✅ {event_id}: eliminado.")
+
+        deleted = sum(1 for _, error in results if error is None)
+        return f"Eventos eliminados: {deleted}/{len(event_ids)}.\n" + "\n".join(lines)
+
+    except Exception as e:
+        return f"No se pudieron eliminar los eventos: {str(e)}"
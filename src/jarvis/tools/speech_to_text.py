@@ -1,4 +1,11 @@
-"""Audio transcription with OpenAI Whisper for the agent and Gradio UI."""
+"""
+Audio transcription with OpenAI Whisper for the agent and Gradio UI.
+
+Audio already transcribed (same SHA-256) is answered from the transcription
+cache without calling the API. Otherwise, it is reduced to mono 16 kHz,
+trimmed of leading and trailing silence and re-encoded in a compact codec
+before upload (see ``AUDIO_PREPROCESSING_ENABLED``).
+"""
 
 import os
 from typing import Optional
@@ -8,6 +15,12 @@ from langchain_core.callbacks.manager import CallbackManagerForToolRun
 from openai import OpenAI
 from pydantic import BaseModel, Field
 
+from jarvis.core.config import AUDIO_PREPROCESSING_ENABLED
+from jarvis.infrastructure.audio.preprocessing import PreparedAudio, preprocess_audio
+from jarvis.infrastructure.audio.transcription_cache import file_sha256, get_transcription_cache
+
+TRANSCRIPTION_MODEL = "whisper-1"
+
 
 class TranscribeAudioInput(BaseModel):
     """Argument schema for the transcription tool."""
@@ -37,11 +50,22 @@ def speech_to_text_tool(
         raise ToolException(f"The file does not exist at the provided path: {file_path}")
 
     try:
-        with open(file_path, "rb") as audio_file:
-            transcription = OpenAI().audio.transcriptions.create(
-                model="whisper-1",
-                file=audio_file,
-            )
+        cache = get_transcription_cache()
+        digest = file_sha256(file_path) if cache is not None else None
+        if cache is not None and (text := cache.get(digest, TRANSCRIPTION_MODEL)) is not None:
+            return text
+
+        if AUDIO_PREPROCESSING_ENABLED:
+            audio = preprocess_audio(file_path)
+        else:
+            with open(file_path, "rb") as f:
+                audio = PreparedAudio(os.path.basename(file_path), f.read())
+        transcription = OpenAI().audio.transcriptions.create(
+            model=TRANSCRIPTION_MODEL,
+            file=(audio.filename, audio.data),
+        )
+        if cache is not None:
+            cache.put(digest, TRANSCRIPTION_MODEL, transcription.text)
         return transcription.text
     except Exception as e:
         raise ToolException(f"Failed to transcribe the audio file: {str(e)}") from e
@@ -1,22 +1,255 @@
-"""Automatic discovery of LangChain tools in the tools package."""
+"""Lazy registry of LangChain tools built from a cached manifest.
+
+Tool modules are imported only to (re)generate the manifest, when a source file
+changed, and otherwise on the first call of one of their tools. Third-party
+packages contribute tools through the ``jarvis.tools`` entry-point group; each
+entry point must reference a tool or a list of tools.
+"""
 
 import importlib
 import inspect
+import json
+import logging
 import os
 import pkgutil
+import tempfile
+import threading
+from importlib.metadata import entry_points
+from typing import Annotated, Any, get_args, get_origin
+
+from langchain_core.callbacks import AsyncCallbackManagerForToolRun, CallbackManagerForToolRun
+from langchain_core.tools import BaseTool
+from langchain_core.tools.base import get_all_basemodel_annotations
+from langchain_core.utils.function_calling import convert_to_openai_tool
+from langgraph.prebuilt import InjectedState
+from pydantic import BaseModel, PrivateAttr, create_model
+
+from jarvis.core.paths import TOOLS_MANIFEST_PATH
+
+logger = logging.getLogger(__name__)
 
 current_dir = os.path.dirname(__file__)
 package_name = __package__ or "jarvis.tools"
 
-local_tools: list = []
-"""List of @tool objects registered when this module is imported."""
+ENTRY_POINT_GROUP = "jarvis.tools"
+"""Entry-point group for tools shipped by other distributions."""
+
+MANIFEST_VERSION = 1
+"""Bumped whenever the manifest layout changes (older manifests are regenerated)."""
+
+
+def _injected_state_args(tool: BaseTool) -> dict[str, str | None]:
+    """
+    Arguments of a tool filled from graph state by ``ToolNode``.
+
+    Args:
+        tool: Imported tool.
+
+    Returns:
+        ``{argument: state_field}``; the field is None for the whole state.
+    """
+    annotations = dict(get_all_basemodel_annotations(tool.get_input_schema()))
+    func = getattr(tool, "func", None) or getattr(tool, "coroutine", None)
+    if func is not None:
+        annotations.update(inspect.get_annotations(func, eval_str=True))
+    injected: dict[str, str | None] = {}
+    for name, type_ in annotations.items():
+        if get_origin(type_) is not Annotated:
+            continue
+        for marker in get_args(type_)[1:]:
+            if isinstance(marker, InjectedState):
+                injected[name] = marker.field
+            elif marker is InjectedState:
+                injected[name] = None
+    return injected
+
+
+def _describe(tool: BaseTool, module: str, attribute: str, index: int | None) -> dict:
+    """Manifest entry of one tool: identity, schema for the LLM, and injected args."""
+    return {
+        "name": tool.name,
+        "description": tool.description,
+        "parameters": convert_to_openai_tool(tool)["function"].get("parameters", {}),
+        "injected": _injected_state_args(tool),
+        "return_direct": tool.return_direct,
+        "module": module,
+        "attribute": attribute,
+        "index": index,
+    }
+
+
+class LazyTool(BaseTool):
+    """
+    Stand-in for a registered tool that imports its module on first call.
+
+    The LLM-facing schema comes from the manifest, so binding a model to the
+    tool does not import it. ``InjectedState`` arguments are re-declared in
+    the input schema, so ``ToolNode`` still fills them from graph state.
+    """
+
+    module: str
+    attribute: str
+    index: int | None = None
+    injected: dict[str, str | None] = {}
+    _target: BaseTool | None = PrivateAttr(default=None)
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
+    @classmethod
+    def from_manifest(cls, entry: dict) -> "LazyTool":
+        """
+        Build a proxy from a manifest entry.
+
+        Args:
+            entry: Output of ``_describe``.
+
+        Returns:
+            LazyTool with the entry's name, description and schema.
+        """
+        return cls(
+            name=entry["name"],
+            description=entry["description"],
+            args_schema=entry["parameters"],
+            return_direct=entry["return_direct"],
+            module=entry["module"],
+            attribute=entry["attribute"],
+            index=entry["index"],
+            injected=entry["injected"],
+        )
+
+    def get_input_schema(self, config=None) -> type[BaseModel]:
+        """Model declaring only the injected arguments, for ``ToolNode``'s detection."""
+        fields = {
+            name: (Annotated[Any, InjectedState(field) if field else InjectedState], ...)
+            for name, field in self.injected.items()
+        }
+        return create_model(f"{self.name}_injected", **fields)
+
+    def resolve(self) -> BaseTool:
+        """
+        Import the tool's module (once) and return the real tool.
+
+        Returns:
+            The registered BaseTool.
+        """
+        if self._target is None:
+            with self._lock:
+                if self._target is None:
+                    target = getattr(importlib.import_module(self.module), self.attribute)
+                    self._target = target if self.index is None else target[self.index]
+        return self._target
+
+    def _run(self, run_manager: CallbackManagerForToolRun | None = None, **kwargs) -> Any:
+        callbacks = run_manager.get_child() if run_manager else None
+        return self.resolve().invoke(kwargs, {"callbacks": callbacks})
+
+    async def _arun(self, run_manager: AsyncCallbackManagerForToolRun | None = None, **kwargs) -> Any:
+        callbacks = run_manager.get_child() if run_manager else None
+        return await self.resolve().ainvoke(kwargs, {"callbacks": callbacks})
+
+
+def _local_modules() -> dict[str, int]:
+    """Tool modules of this package with their source mtimes (nanoseconds)."""
+    modules: dict[str, int] = {}
+    for module_info in pkgutil.iter_modules([current_dir]):
+        name = module_info.name
+        if module_info.ispkg or name.startswith("_") or name == "tools_registry":
+            continue
+        modules[f"{package_name}.{name}"] = os.stat(os.path.join(current_dir, f"{name}.py")).st_mtime_ns
+    return modules
+
+
+def _plugin_versions() -> dict[str, str]:
+    """Entry points of ``ENTRY_POINT_GROUP`` with the version of their distribution."""
+    return {
+        f"{ep.name}={ep.value}": ep.dist.version if ep.dist else ""
+        for ep in entry_points(group=ENTRY_POINT_GROUP)
+    }
+
+
+def build_manifest() -> dict:
+    """
+    Import every tool module and entry point and describe their tools.
+
+    Local modules contribute each module attribute whose name ends in
+    ``_tool``; entry points contribute the tool (or list of tools) they name.
+
+    Returns:
+        Manifest dict (sources, plugins, and tool entries).
+    """
+    tools: list[dict] = []
+    sources = _local_modules()
+    for module_name in sources:
+        module = importlib.import_module(module_name)
+        for name, obj in inspect.getmembers(module):
+            if name.endswith("_tool") and isinstance(obj, BaseTool):
+                tools.append(_describe(obj, module_name, name, None))
+
+    for ep in entry_points(group=ENTRY_POINT_GROUP):
+        try:
+            target = ep.load()
+        except Exception as e:
+            logger.warning("Could not load tool entry point %s: %s", ep.name, e)
+            continue
+        if isinstance(target, BaseTool):
+            tools.append(_describe(target, ep.module, ep.attr, None))
+        else:
+            for index, tool in enumerate(target):
+                tools.append(_describe(tool, ep.module, ep.attr, index))
+
+    return {
+        "version": MANIFEST_VERSION,
+        "sources": sources,
+        "plugins": _plugin_versions(),
+        "tools": tools,
+    }
+
+
+def _read_manifest(path: str) -> dict | None:
+    """Cached manifest if it matches the current sources and plugins."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if (
+        manifest.get("version") != MANIFEST_VERSION
+        or manifest.get("sources") != _local_modules()
+        or manifest.get("plugins") != _plugin_versions()
+    ):
+        return None
+    return manifest
+
+
+def _write_manifest(path: str, manifest: dict) -> None:
+    """Write the manifest atomically; failures only cost a rebuild next time."""
+    try:
+        directory = os.path.dirname(path) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=".tools-", suffix=".tmp", dir=directory)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning("Could not write tools manifest %s: %s", path, e)
+
+
+def load_tools(manifest_path: str = str(TOOLS_MANIFEST_PATH), refresh: bool = False) -> list[BaseTool]:
+    """
+    Registered tools as lazy proxies, regenerating the manifest if it is stale.
+
+    Args:
+        manifest_path: JSON manifest cache.
+        refresh: Rebuild the manifest even if it looks current.
 
-for _, module_name, is_pkg in pkgutil.iter_modules([current_dir]):
-    if is_pkg or module_name.startswith("_"):
-        continue
+    Returns:
+        One LazyTool per registered tool.
+    """
+    manifest = None if refresh else _read_manifest(manifest_path)
+    if manifest is None:
+        manifest = build_manifest()
+        _write_manifest(manifest_path, manifest)
+    return [LazyTool.from_manifest(entry) for entry in manifest["tools"]]
 
-    module = importlib.import_module(f"{package_name}.{module_name}")
 
-    for name, obj in inspect.getmembers(module):
-        if name.endswith("_tool"):
-            local_tools.append(obj)
+local_tools: list = load_tools()
+"""Registered tools (lazy proxies), loaded when this module is imported."""
@@ -16,3 +16,17 @@ def _test_env():
     os.environ.setdefault("JWT_SECRET_KEY", "pytest-jwt-secret-do-not-use-in-production")
     os.environ.setdefault("FERNET_KEY", Fernet.generate_key().decode())
     yield
+
+
+@pytest.fixture(autouse=True)
+def _isolated_session_storage(tmp_path, monkeypatch):
+    """Keep sessions and checkpoints in memory or under tmp_path, never in ``data/``."""
+    from jarvis.agents import checkpointer, session_store
+    from jarvis.core.enums import SessionStoreBackendEnum
+
+    monkeypatch.setattr(session_store, "SESSION_STORE_BACKEND", SessionStoreBackendEnum.MEMORY)
+    monkeypatch.setattr(session_store, "SESSIONS_DB_PATH", tmp_path / "sessions.db")
+    monkeypatch.setattr(session_store, "_session_store", None)
+    monkeypatch.setattr(checkpointer, "CHECKPOINTS_DB_PATH", tmp_path / "checkpoints.db")
+    monkeypatch.setattr(checkpointer, "_sqlite_savers", {})
+    yield
@@ -0,0 +1,112 @@
+"""Admission scheduler: per-model caps, weighted fair queuing, admin priority."""
+
+import asyncio
+
+from langchain_core.messages import AIMessage
+
+from jarvis.agents import session as session_module
+from jarvis.agents.admission import AdmissionScheduler
+from jarvis.api.schemas.chat import AskInput
+from jarvis.api.services.chat_service import chat_service
+from jarvis.core.enums import ModelEnum
+
+
+def _served_order(scheduler: AdmissionScheduler, requests: list[tuple[str, bool]]) -> list[str]:
+    """Queue ``requests`` behind a held slot and return the order they are admitted in."""
+    order: list[str] = []
+
+    async def call(name: str, admin: bool) -> None:
+        async with scheduler.admit(ModelEnum.GPT_3_5, name.split("-")[0], admin):
+            order.append(name)
+            await asyncio.sleep(0)
+
+    async def scenario():
+        release = asyncio.Event()
+
+        async def holder():
+            async with scheduler.admit(ModelEnum.GPT_3_5, "holder"):
+                await release.wait()
+
+        held = asyncio.create_task(holder())
+        await asyncio.sleep(0)
+        tasks = []
+        for name, admin in requests:
+            tasks.append(asyncio.create_task(call(name, admin)))
+            await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(held, *tasks)
+
+    asyncio.run(scenario())
+    return order
+
+
+def test_concurrency_is_capped_per_model():
+    scheduler = AdmissionScheduler({ModelEnum.GPT_3_5: 2}, default_limit=1)
+    running = {"now": 0, "max": 0}
+
+    async def call(model: ModelEnum) -> None:
+        async with scheduler.admit(model, "ana"):
+            running["now"] += 1
+            running["max"] = max(running["max"], running["now"])
+            await asyncio.sleep(0.01)
+            running["now"] -= 1
+
+    async def scenario():
+        await asyncio.gather(*(call(ModelEnum.GPT_3_5) for _ in range(6)))
+
+    asyncio.run(scenario())
+
+    assert running["max"] == 2
+    stats = scheduler.stats()["GPT_3_5"]
+    assert stats["limit"] == 2 and stats["admitted"] == 6 and stats["queued"] == 4
+    assert stats["running"] == 0 and stats["waiting"] == 0
+
+
+def test_burst_from_one_user_does_not_starve_others():
+    scheduler = AdmissionScheduler({ModelEnum.GPT_3_5: 1})
+
+    order = _served_order(scheduler, [(f"ana-{i}", False) for i in range(4)] + [("luis-0", False)])
+
+    assert order == ["ana-0", "luis-0", "ana-1", "ana-2", "ana-3"]
+
+
+def test_weights_and_admin_priority():
+    scheduler = AdmissionScheduler({ModelEnum.GPT_3_5: 1}, weights={"ana": 2.0})
+
+    order = _served_order(
+        scheduler,
+        [("luis-0", False), ("luis-1", False), ("ana-0", False), ("ana-1", False), ("admin-0", True)],
+    )
+
+    assert order == ["admin-0", "ana-0", "luis-0", "ana-1", "luis-1"]
+
+
+class _SlowAgent:
+    memory = None
+
+    async def ainvoke(self, **kwargs) -> dict:
+        await asyncio.sleep(0.1)
+        return {"messages": [*kwargs["input"]["messages"], AIMessage(content="Listo.")]}
+
+    def cleanup(self) -> None:
+        pass
+
+
+def test_ask_reports_queue_wait(monkeypatch):
+    session_module.reset_cache_global()
+    session_module._agents_cache[ModelEnum.GPT_3_5] = _SlowAgent()
+    scheduler = AdmissionScheduler({ModelEnum.GPT_3_5: 1})
+    monkeypatch.setattr(session_module, "get_admission_scheduler", lambda: scheduler)
+    users = [{"real_name": name, "jarvis_name": "Sir", "is_female": False, "admin": False} for name in ("ana", "luis")]
+
+    async def scenario():
+        await asyncio.gather(*(chat_service.aask(AskInput(message="hola"), user) for user in users))
+        return await asyncio.gather(*(chat_service.aask(AskInput(message="¿y bien?"), user) for user in users))
+
+    replies = asyncio.run(scenario())
+
+    waits = sorted(reply["queue_wait_ms"] for reply in replies)
+    assert [reply["response"] for reply in replies] == [["Listo."], ["Listo."]]
+    assert waits[0] < 50 and waits[1] >= 80
+    session_module._agents_cache.clear()
+    session_module.reset_cache_global()
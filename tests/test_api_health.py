@@ -0,0 +1,74 @@
+"""Startup warm-up and the /healthz and /readyz probes."""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+from fastapi.testclient import TestClient
+
+import jarvis.api.main as api_main
+from jarvis.agents import warmup
+from jarvis.core.enums import ModelEnum
+
+
+def test_healthz_is_always_ok():
+    assert TestClient(api_main.app).get("/healthz").json() == {"status": "ok"}
+
+
+def test_readiness_follows_warmup_progress(monkeypatch):
+    release = threading.Event()
+
+    def slow_agent(model):
+        release.wait(timeout=5)
+        return SimpleNamespace(summary_llm=None)
+
+    monkeypatch.setattr(warmup, "get_agent", slow_agent)
+    client = TestClient(api_main.app)
+
+    async def scenario():
+        task = warmup.start_warmup([ModelEnum.GPT_3_5])
+        await asyncio.sleep(0.05)
+        pending = await asyncio.to_thread(client.get, "/readyz")
+        release.set()
+        await task
+        return pending
+
+    pending = asyncio.run(scenario())
+
+    assert pending.status_code == 503
+    assert pending.json()["models"][ModelEnum.GPT_3_5.value]["status"] == "warming"
+    ready = client.get("/readyz")
+    assert ready.status_code == 200
+    assert ready.json()["status"] == "ready"
+
+
+def test_failed_warmup_reports_degraded_but_ready(monkeypatch):
+    def broken(model):
+        raise RuntimeError("sin clave de API")
+
+    monkeypatch.setattr(warmup, "get_agent", broken)
+
+    async def scenario():
+        return await warmup.start_warmup([ModelEnum.GPT_3_5])
+
+    status = asyncio.run(scenario())
+
+    assert status["ready"] is True
+    assert status["status"] == "degraded"
+    assert status["models"][ModelEnum.GPT_3_5.value]["error"] == "sin clave de API"
+
+
+def test_lifespan_warms_up_configured_models(monkeypatch):
+    built = []
+    monkeypatch.setattr(warmup, "get_agent", lambda model: built.append(model) or SimpleNamespace())
+    monkeypatch.setattr(api_main, "WARMUP_MODELS", [ModelEnum.GPT_3_5])
+    monkeypatch.setattr(api_main, "shutdown_agents", lambda: None)
+
+    with TestClient(api_main.app) as client:
+        deadline = time.monotonic() + 5
+        while client.get("/readyz").status_code != 200 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert client.get("/readyz").json()["models"][ModelEnum.GPT_3_5.value]["status"] == "ready"
+
+    assert built == [ModelEnum.GPT_3_5]
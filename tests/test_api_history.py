@@ -0,0 +1,98 @@
+"""GET /message-history: single-snapshot reads, cursor pagination, and ETags."""
+
+import os
+from types import SimpleNamespace
+from typing import Annotated
+
+import jwt
+import pytest
+from fastapi.testclient import TestClient
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage, HumanMessage
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.graph import StateGraph
+from langgraph.graph.message import add_messages
+from typing_extensions import TypedDict
+
+from jarvis.agents import session as session_module
+from jarvis.agents.chatbot_node import build_chatbot_node
+from jarvis.api.main import app
+from jarvis.core.config import JWT_ALGORITHM
+from jarvis.core.enums import ModelEnum
+
+
+class _State(TypedDict):
+    messages: Annotated[list, add_messages]
+    real_name: str
+
+
+def _token(real_name: str) -> str:
+    payload = {"sub": "pytest", "real_name": real_name, "admin": False, "exp": 9999999999}
+    return jwt.encode(payload, os.environ["JWT_SECRET_KEY"], algorithm=JWT_ALGORITHM)
+
+
+@pytest.fixture
+def history_agent():
+    replies = iter([AIMessage(content=f"respuesta {i}") for i in range(3)])
+    builder = StateGraph(_State)
+    builder.add_node("chatbot", build_chatbot_node(GenericFakeChatModel(messages=replies)))
+    builder.set_entry_point("chatbot")
+    memory = MemorySaver()
+    agent = SimpleNamespace(graph=builder.compile(checkpointer=memory), memory=memory, cleanup=lambda: None)
+    session_module.reset_cache_global()
+    session_module._agents_cache[ModelEnum.GPT_3_5] = agent
+    yield agent
+    session_module._agents_cache.clear()
+    session_module.reset_cache_global()
+
+
+def _turn(agent, text: str) -> None:
+    agent.graph.invoke(
+        {"messages": [HumanMessage(text)], "real_name": "Hist"},
+        {"configurable": {"thread_id": "Hist"}},
+    )
+
+
+def test_history_pages_backwards_with_cursor(history_agent):
+    for i in range(3):
+        _turn(history_agent, f"pregunta {i}")
+    client = TestClient(app)
+    headers = {"Authorization": f"Bearer {_token('Hist')}"}
+
+    newest = client.get("/message-history", params={"limit": 4}, headers=headers).json()
+    assert [m["content"] for m in newest["messages"]] == [
+        "pregunta 1", "respuesta 1", "pregunta 2", "respuesta 2",
+    ]
+    older = client.get(
+        "/message-history", params={"limit": 4, "before": newest["next_before"]}, headers=headers
+    ).json()
+    assert [m["content"] for m in older["messages"]] == ["pregunta 0", "respuesta 0"]
+    assert older["next_before"] is None
+
+
+def test_history_etag_returns_304_until_next_turn(history_agent):
+    _turn(history_agent, "hola")
+    client = TestClient(app)
+    headers = {"Authorization": f"Bearer {_token('Hist')}"}
+
+    first = client.get("/message-history", headers=headers)
+    etag = first.headers["ETag"]
+    assert len(first.json()["messages"]) == 2
+
+    cached = client.get("/message-history", headers={**headers, "If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["ETag"] == etag
+
+    _turn(history_agent, "otra")
+    fresh = client.get("/message-history", headers={**headers, "If-None-Match": etag})
+    assert fresh.status_code == 200
+    assert fresh.headers["ETag"] != etag
+
+
+def test_history_without_agent_is_empty():
+    session_module.reset_cache_global()
+    client = TestClient(app)
+    response = client.get("/message-history", headers={"Authorization": f"Bearer {_token('Nadie')}"})
+    assert response.status_code == 200
+    assert response.json() == {"thread_id": "Nadie", "messages": [], "next_before": None}
+    assert "ETag" not in response.headers
@@ -1,13 +1,14 @@
 """Tests for router registration on the FastAPI application."""
 
 from jarvis.api.main import app
-from jarvis.api.routers import admin, auth, chat
+from jarvis.api.routers import admin, auth, chat, health
 
 
 def test_routers_have_expected_route_count():
     assert len(auth.router.routes) == 2
-    assert len(chat.router.routes) == 4
+    assert len(chat.router.routes) == 5
     assert len(admin.router.routes) == 2
+    assert len(health.router.routes) == 2
 
 
 def test_app_includes_all_router_paths():
@@ -16,10 +17,13 @@ def test_app_includes_all_router_paths():
         "/token",
         "/validate-token",
         "/ask",
+        "/ask/stream",
         "/reset-session",
         "/individual-cache-status",
         "/message-history",
         "/admin/reset-global-memory",
         "/admin/cache-status",
+        "/healthz",
+        "/readyz",
     ):
         assert path in paths
@@ -25,12 +25,15 @@ def test_app_has_documented_routes():
     expected = {
         "/token",
         "/ask",
+        "/ask/stream",
         "/reset-session",
         "/admin/reset-global-memory",
         "/admin/cache-status",
         "/individual-cache-status",
         "/message-history",
         "/validate-token",
+        "/healthz",
+        "/readyz",
     }
     assert expected.issubset(paths)
 
@@ -0,0 +1,97 @@
+"""POST /ask/stream Server-Sent Events (fake LLM, no network)."""
+
+import json
+import os
+from typing import Annotated
+
+import jwt
+from fastapi.testclient import TestClient
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.graph import StateGraph
+from langgraph.graph.message import add_messages
+from typing_extensions import TypedDict
+
+from jarvis.agents import session as session_module
+from jarvis.agents.chatbot_node import build_chatbot_node
+from jarvis.api.main import app
+from jarvis.core.config import JWT_ALGORITHM
+from jarvis.core.enums import ModelEnum
+
+
+class _State(TypedDict):
+    messages: Annotated[list, add_messages]
+    real_name: str
+
+
+class _FakeStreamingAgent:
+    def __init__(self) -> None:
+        llm = GenericFakeChatModel(messages=iter([AIMessage(content="Muy bien, señor.")]))
+        builder = StateGraph(_State)
+        builder.add_node("chatbot", build_chatbot_node(llm))
+        builder.set_entry_point("chatbot")
+        self.memory = MemorySaver()
+        self.graph = builder.compile(checkpointer=self.memory)
+
+    async def astream_events(self, **kwargs):
+        async for event in self.graph.astream_events(**kwargs, version="v2"):
+            yield event
+
+    def cleanup(self) -> None:
+        pass
+
+
+def _token(real_name: str) -> str:
+    payload = {
+        "sub": "pytest",
+        "real_name": real_name,
+        "jarvis_name": "Sir",
+        "is_female": False,
+        "admin": False,
+        "exp": 9999999999,
+    }
+    return jwt.encode(payload, os.environ["JWT_SECRET_KEY"], algorithm=JWT_ALGORITHM)
+
+
+def _parse_sse(body: str) -> list[tuple[str, dict]]:
+    events = []
+    for frame in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in frame.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+def test_ask_stream_keeps_welcome_flow_then_streams_tokens():
+    session_module.reset_cache_global()
+    session_module._agents_cache[ModelEnum.GPT_3_5] = _FakeStreamingAgent()
+    client = TestClient(app)
+    headers = {"Authorization": f"Bearer {_token('Stream User')}"}
+
+    first = client.post("/ask/stream", json={"message": "hola"}, headers=headers)
+    assert first.headers["content-type"].startswith("text/event-stream")
+    welcome = _parse_sse(first.text)
+    assert welcome[0][0] == "message"
+    assert "Bienvenido" in welcome[0][1]["content"]
+    assert welcome[-1][0] == "done"
+
+    second = _parse_sse(client.post("/ask/stream", json={"message": "hola"}, headers=headers).text)
+    tokens = "".join(data["content"] for name, data in second if name == "token")
+    assert tokens == "Muy bien, señor."
+    assert second[-1][0] == "done"
+    assert second[-1][1]["response"] == ["Muy bien, señor."]
+    assert second[-1][1]["queue_wait_ms"] == 0
+
+    session_module._agents_cache.clear()
+    session_module.reset_cache_global()
+
+
+def test_tool_end_hides_output_of_not_verbosed_tools():
+    quiet = session_module._to_stream_event(
+        {"event": "on_tool_end", "name": "get_upcoming_events_tool", "data": {"output": "lista"}}
+    )
+    loud = session_module._to_stream_event(
+        {"event": "on_tool_end", "name": "calculate_tool", "data": {"output": "4"}}
+    )
+    assert quiet == {"event": "tool_end", "data": {"name": "get_upcoming_events_tool"}}
+    assert loud["data"]["output"] == "4"
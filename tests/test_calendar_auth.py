@@ -0,0 +1,121 @@
+"""Process-wide Google credential cache: mtime invalidation and refresh-ahead."""
+
+import datetime
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+from jarvis.infrastructure.google import calendar_auth
+from jarvis.infrastructure.google.calendar_auth import CredentialCache
+
+
+class _TokenEndpoint(BaseHTTPRequestHandler):
+    calls = 0
+
+    def do_POST(self):
+        type(self).calls += 1
+        self.rfile.read(int(self.headers["Content-Length"]))
+        body = json.dumps({"access_token": f"fresh-{self.calls}", "expires_in": 3600}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def token_uri():
+    _TokenEndpoint.calls = 0
+    server = HTTPServer(("127.0.0.1", 0), _TokenEndpoint)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/token"
+    server.shutdown()
+
+
+def _write_token(path, token_uri: str, token: str, expires_in: datetime.timedelta) -> None:
+    expiry = datetime.datetime.now(datetime.timezone.utc) + expires_in
+    path.write_text(json.dumps({
+        "token": token,
+        "refresh_token": "refresh",
+        "token_uri": token_uri,
+        "client_id": "client",
+        "client_secret": "secret",
+        "scopes": calendar_auth.SCOPES,
+        "expiry": expiry.strftime("%Y-%m-%dT%H:%M:%SZ"),
+    }))
+
+
+@pytest.fixture
+def account_dir(tmp_path, monkeypatch, token_uri):
+    monkeypatch.setattr(calendar_auth, "GOOGLE_API_DIR", str(tmp_path))
+    monkeypatch.setattr(calendar_auth, "GOOGLE_OAUTH_TOKEN_URI", token_uri)
+    account = tmp_path / "ana" / "personal"
+    account.mkdir(parents=True)
+    (account / "credential_personal.json").write_text("{}")
+    _write_token(account / "token_personal.json", token_uri, "old", datetime.timedelta(minutes=30))
+    return account
+
+
+def _cache(**kwargs) -> CredentialCache:
+    cache = CredentialCache(refresh_interval_seconds=3600, **kwargs)
+    cache._ensure_refresher = lambda: None  # refresh passes are driven by the tests
+    return cache
+
+
+def test_token_file_is_parsed_once_until_it_changes(account_dir, token_uri, monkeypatch):
+    cache = _cache()
+    loads = []
+    original = calendar_auth._ensure_creds
+    monkeypatch.setattr(
+        calendar_auth, "_ensure_creds", lambda *args: loads.append(args) or original(*args)
+    )
+
+    first = cache.get_for_user("ana")["personal"]
+    assert cache.get_for_user("ana")["personal"] is first
+    assert len(loads) == 1
+
+    token_path = account_dir / "token_personal.json"
+    _write_token(token_path, token_uri, "edited", datetime.timedelta(minutes=30))
+    os.utime(token_path, ns=(0, os.stat(token_path).st_mtime_ns + 1_000_000))
+
+    assert cache.get_for_user("ana")["personal"].token == "edited"
+    assert len(loads) == 2
+
+
+def test_refresh_ahead_renews_and_persists_atomically(account_dir):
+    cache = _cache(refresh_ahead_seconds=45 * 60)
+    creds = cache.get_for_user("ana")["personal"]
+
+    assert cache.refresh_due() == 1
+    assert creds.token == "fresh-1"
+    saved = json.loads((account_dir / "token_personal.json").read_text())
+    assert saved["token"] == "fresh-1"
+    assert sorted(os.listdir(account_dir)) == ["credential_personal.json", "token_personal.json"]
+
+    # The rewrite is recorded, so the next lookup reuses the refreshed object.
+    assert cache.get_for_user("ana")["personal"] is creds
+    assert cache.refresh_due() == 0
+
+
+def test_tokens_far_from_expiry_are_left_alone(account_dir):
+    cache = _cache(refresh_ahead_seconds=60)
+    cache.get_for_user("ana")
+
+    assert cache.refresh_due() == 0
+    assert _TokenEndpoint.calls == 0
+
+
+def test_expired_token_is_refreshed_on_lookup(account_dir, token_uri):
+    _write_token(account_dir / "token_personal.json", token_uri, "old", -datetime.timedelta(minutes=5))
+
+    creds = _cache().get_for_user("ana")["personal"]
+
+    assert creds.token == "fresh-1"
+    assert creds.valid
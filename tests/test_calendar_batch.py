@@ -0,0 +1,109 @@
+"""Bulk calendar tools: one HTTP batch request, per-item results."""
+
+import email.parser
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+from google.oauth2.credentials import Credentials
+
+from jarvis.infrastructure.google.calendar_service import CalendarServiceCache
+from jarvis.tools import google_calendar
+
+
+class _FakeBatchEndpoint(BaseHTTPRequestHandler):
+    """Answers ``multipart/mixed`` batches: inserts succeed, deleting ``missing`` is a 404."""
+
+    batches: list[int] = []
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        message = email.parser.BytesParser().parsebytes(
+            b"Content-Type: " + self.headers["Content-Type"].encode() + b"\r\n\r\n" + body
+        )
+        parts = message.get_payload()
+        type(self).batches.append(len(parts))
+        out = ""
+        for part in parts:
+            request_line, _, rest = part.get_payload().partition("\n")
+            method, path, _ = request_line.split(" ")
+            status, payload = self._handle(method, path, rest.partition("\r\n\r\n")[2] or rest.partition("\n\n")[2])
+            out += (
+                "--batch_boundary\r\nContent-Type: application/http\r\n"
+                f"Content-ID: <response-{part['Content-ID'][1:-1]}>\r\n\r\n"
+                f"HTTP/1.1 {status} X\r\nContent-Type: application/json\r\n\r\n{json.dumps(payload)}\r\n"
+            )
+        data = (out + "--batch_boundary--").encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "multipart/mixed; boundary=batch_boundary")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    @staticmethod
+    def _handle(method: str, path: str, body: str) -> tuple[int, dict]:
+        if method == "POST":
+            event = json.loads(body)
+            return 200, {**event, "id": "id-" + event["summary"]}
+        if path.endswith("/missing"):
+            return 404, {"error": {"code": 404, "message": "Not Found"}}
+        return 204, {}
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def calendar(monkeypatch):
+    _FakeBatchEndpoint.batches = []
+    server = HTTPServer(("127.0.0.1", 0), _FakeBatchEndpoint)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    cache = CalendarServiceCache(api_endpoint=f"http://127.0.0.1:{server.server_port}/")
+    monkeypatch.setattr(google_calendar, "get_calendar_service", cache.get)
+    monkeypatch.setattr(google_calendar, "get_calendar_http", cache.http_for)
+    monkeypatch.setattr(google_calendar, "get_calendar_mirror", lambda: None)
+    credentials = Credentials(token="t")
+    monkeypatch.setattr(
+        google_calendar,
+        "get_authentications_for_user",
+        lambda name, allow_logging_popup=False: {"personal": credentials},
+    )
+    yield
+    server.shutdown()
+
+
+def test_bulk_create_sends_one_batch_and_reports_each_event(calendar):
+    events = [
+        {"start_datetime": f"2030-01-0{day}T09:00:00", "end_datetime": f"2030-01-0{day}T12:00:00", "title": f"foco{day}"}
+        for day in (1, 2, 3)
+    ]
+
+    result = google_calendar.create_calendar_events_tool.func("Ana", events)
+
+    assert _FakeBatchEndpoint.batches == [3]
+    assert result.splitlines() == [
+        "Eventos creados: 3/3.",
+        "✅ 1. foco1 (2030-01-01T09:00:00): creado. ID: id-foco1",
+        "✅ 2. foco2 (2030-01-02T09:00:00): creado. ID: id-foco2",
+        "✅ 3. foco3 (2030-01-03T09:00:00): creado. ID: id-foco3",
+    ]
+
+
+def test_bulk_delete_reports_per_item_failures(calendar):
+    result = google_calendar.delete_calendar_events_tool.func("Ana", ["a", "missing", "b"])
+
+    lines = result.splitlines()
+    assert lines[0] == "Eventos eliminados: 2/3."
+    assert lines[1] == "✅ a: eliminado."
+    assert lines[2].startswith("❌ missing: no se pudo eliminar")
+    assert lines[3] == "✅ b: eliminado."
+
+
+def test_large_lists_are_split_into_batches(calendar, monkeypatch):
+    monkeypatch.setattr(google_calendar, "BATCH_MAX_REQUESTS", 2)
+
+    result = google_calendar.delete_calendar_events_tool.func("Ana", ["a", "b", "c"])
+
+    assert _FakeBatchEndpoint.batches == [2, 1]
+    assert result.startswith("Eventos eliminados: 3/3.")
@@ -0,0 +1,177 @@
+"""Local calendar mirror: syncToken increments, 410 resync, and range queries."""
+
+import datetime
+import json
+import sqlite3
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from google.oauth2.credentials import Credentials
+
+from jarvis.infrastructure.google.calendar_mirror import CalendarMirror
+from jarvis.infrastructure.google.calendar_service import CalendarServiceCache
+
+
+def _event(event_id: str, start: str, end: str, **extra) -> dict:
+    return {"id": event_id, "summary": event_id, "start": {"dateTime": start}, "end": {"dateTime": end}, **extra}
+
+
+class _FakeCalendar(BaseHTTPRequestHandler):
+    """Minimal ``events.list`` with pages, sync tokens, and 410 for expired tokens."""
+
+    full: list[dict] = []
+    time_zone = "UTC"
+    changes: dict[str, tuple[list[dict], str]] = {}
+    requests: list[dict] = []
+
+    def do_GET(self):
+        query = {k: v[0] for k, v in parse_qs(urlparse(self.path).query).items()}
+        type(self).requests.append(query)
+        if "syncToken" in query:
+            if query["syncToken"] not in self.changes:
+                return self._send(410, {"error": {"code": 410, "message": "Sync token is no longer valid"}})
+            items, next_token = self.changes[query["syncToken"]]
+            return self._send(200, {"items": items, "nextSyncToken": next_token})
+        # Full listing in pages of one event.
+        page = int(query.get("pageToken", 0))
+        body = {"items": self.full[page:page + 1], "timeZone": self.time_zone}
+        if page + 1 < len(self.full):
+            body["nextPageToken"] = str(page + 1)
+        else:
+            body["nextSyncToken"] = "sync-1"
+        self._send(200, body)
+
+    def _send(self, status: int, body: dict):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def service():
+    _FakeCalendar.full = [
+        _event("a", "2030-01-01T09:00:00+00:00", "2030-01-01T10:00:00+00:00"),
+        _event("b", "2030-01-02T09:00:00+00:00", "2030-01-02T10:00:00+00:00"),
+        _event("c", "2030-01-03T09:00:00+00:00", "2030-01-03T10:00:00+00:00"),
+    ]
+    _FakeCalendar.time_zone = "UTC"
+    _FakeCalendar.changes = {}
+    _FakeCalendar.requests = []
+    server = HTTPServer(("127.0.0.1", 0), _FakeCalendar)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    cache = CalendarServiceCache(api_endpoint=f"http://127.0.0.1:{server.server_port}/")
+    yield cache.get("ana", "personal", Credentials(token="t"))
+    server.shutdown()
+
+
+def _ids(events: list[dict]) -> list[str]:
+    return [e["id"] for e in events]
+
+
+def test_full_sync_follows_pages_and_answers_ranges(tmp_path, service):
+    mirror = CalendarMirror(str(tmp_path / "mirror.db"), staleness_seconds=60)
+
+    assert mirror.sync("ana", "personal", service) == 3
+    assert len(_FakeCalendar.requests) == 3
+
+    assert _ids(mirror.query("ana", "personal", "2030-01-01T09:30:00+00:00")) == ["a", "b", "c"]
+    assert _ids(mirror.query("ana", "personal", "2030-01-01T10:00:00+00:00", limit=1)) == ["b"]
+    assert _ids(mirror.query(
+        "ana", "personal", "2030-01-01T00:00:00+01:00", "2030-01-02T09:00:00+00:00"
+    )) == ["a"]
+    assert mirror.query("ana", "trabajo", "2030-01-01T00:00:00+00:00") == []
+
+
+def test_incremental_sync_applies_changes_and_deletions(tmp_path, service):
+    clock = _Clock()
+    mirror = CalendarMirror(str(tmp_path / "mirror.db"), staleness_seconds=60, clock=clock)
+    mirror.sync("ana", "personal", service)
+    _FakeCalendar.changes["sync-1"] = (
+        [
+            {"id": "a", "status": "cancelled"},
+            _event("b", "2030-01-02T15:00:00+00:00", "2030-01-02T16:00:00+00:00", summary="movido"),
+            _event("d", "2030-01-04T09:00:00+00:00", "2030-01-04T10:00:00+00:00"),
+        ],
+        "sync-2",
+    )
+
+    assert mirror.sync("ana", "personal", service) == 0  # still fresh: no request
+    clock.now += 61
+    assert not mirror.is_fresh("ana", "personal")
+    assert mirror.sync("ana", "personal", service) == 3
+
+    assert _FakeCalendar.requests[-1]["syncToken"] == "sync-1"
+    events = mirror.query("ana", "personal", "2029-12-31T00:00:00+00:00")
+    assert _ids(events) == ["b", "c", "d"]
+    assert events[0]["summary"] == "movido"
+
+
+def test_expired_sync_token_triggers_full_resync(tmp_path, service):
+    clock = _Clock()
+    mirror = CalendarMirror(str(tmp_path / "mirror.db"), staleness_seconds=60, clock=clock)
+    mirror.sync("ana", "personal", service)
+    mirror.upsert("ana", "personal", _event("stale", "2030-01-05T09:00:00+00:00", "2030-01-05T10:00:00+00:00"))
+    _FakeCalendar.full = _FakeCalendar.full[1:]
+
+    clock.now += 61
+    assert mirror.sync("ana", "personal", service) == 2
+
+    assert "syncToken" not in _FakeCalendar.requests[-1]
+    assert _ids(mirror.query("ana", "personal", "2029-12-31T00:00:00+00:00")) == ["b", "c"]
+    assert mirror.is_fresh("ana", "personal")
+
+
+def test_full_sync_is_bounded_and_older_ranges_are_not_covered(tmp_path, service):
+    clock = _Clock()
+    clock.now = datetime.datetime(2030, 1, 10, tzinfo=datetime.timezone.utc).timestamp()
+    mirror = CalendarMirror(str(tmp_path / "mirror.db"), clock=clock, history_days=7)
+
+    mirror.sync("ana", "personal", service)
+
+    assert _FakeCalendar.requests[0]["timeMin"] == "2030-01-03T00:00:00+00:00"
+    assert mirror.covers("ana", "personal", "2030-01-03T00:00:00+00:00")
+    assert not mirror.covers("ana", "personal", "2030-01-02T23:59:00+00:00")
+    assert not mirror.covers("ana", "trabajo", "2030-01-09T00:00:00+00:00")
+
+
+def test_all_day_events_use_the_calendar_time_zone(tmp_path, service):
+    _FakeCalendar.time_zone = "Europe/Madrid"
+    _FakeCalendar.full = [
+        {"id": "fiesta", "start": {"date": "2030-01-01"}, "end": {"date": "2030-01-02"}},
+    ]
+    mirror = CalendarMirror(str(tmp_path / "mirror.db"))
+    mirror.sync("ana", "personal", service)
+
+    # Madrid midnight is 23:00 UTC the day before.
+    assert _ids(mirror.query("ana", "personal", "2030-01-01T22:30:00+00:00")) == ["fiesta"]
+    assert mirror.query("ana", "personal", "2030-01-01T23:00:00+00:00") == []
+    assert _ids(mirror.query(
+        "ana", "personal", "2029-12-31T00:00:00+00:00", "2029-12-31T23:30:00+00:00"
+    )) == ["fiesta"]
+
+
+def test_event_payloads_are_encrypted_at_rest(tmp_path, service):
+    db_path = str(tmp_path / "mirror.db")
+    mirror = CalendarMirror(db_path)
+    mirror.sync("ana", "personal", service)
+
+    with sqlite3.connect(db_path) as conn:
+        payloads = [row[0] for row in conn.execute("SELECT payload FROM calendar_events")]
+    assert len(payloads) == 3 and not any('"summary"' in payload for payload in payloads)
+    assert mirror.query("ana", "personal", "2030-01-01T00:00:00+00:00")[0]["summary"] == "a"
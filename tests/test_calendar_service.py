@@ -0,0 +1,44 @@
+"""Cached Google Calendar clients (static discovery, per-thread transports)."""
+
+import threading
+
+from google.oauth2.credentials import Credentials
+
+from jarvis.infrastructure.google.calendar_service import CalendarServiceCache
+
+
+def test_client_is_reused_until_credentials_refresh():
+    cache = CalendarServiceCache()
+    credentials = Credentials(token="token-1")
+
+    service = cache.get("ana", "personal", credentials)
+    assert cache.get("ana", "personal", credentials) is service
+    assert cache.get("ana", "trabajo", credentials) is not service
+
+    credentials.token = "token-2"
+    refreshed = cache.get("ana", "personal", credentials)
+    assert refreshed is not service
+    assert cache.get("ana", "personal", Credentials(token="token-2")) is not refreshed
+
+
+def test_requests_use_one_transport_per_thread():
+    cache = CalendarServiceCache()
+    service = cache.get("ana", "personal", Credentials(token="t"))
+
+    main = service.events().list(calendarId="primary").http
+    assert service.events().list(calendarId="primary").http is main
+
+    other: list = []
+    thread = threading.Thread(target=lambda: other.append(service.events().list(calendarId="primary").http))
+    thread.start()
+    thread.join()
+    assert other[0] is not main
+
+
+def test_api_endpoint_override_and_invalidate():
+    cache = CalendarServiceCache(api_endpoint="http://127.0.0.1:9/")
+    service = cache.get("ana", "personal", Credentials(token="t"))
+
+    assert service.events().list(calendarId="primary").uri.startswith("http://127.0.0.1:9/")
+    cache.invalidate("ana")
+    assert len(cache) == 0
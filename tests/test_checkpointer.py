@@ -0,0 +1,206 @@
+"""SQLite checkpointer: graph round-trips, batching, vacuum, and backend selection."""
+
+import asyncio
+import sqlite3
+import time
+from typing import Annotated
+
+import pytest
+
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage, HumanMessage
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.graph import StateGraph
+from langgraph.graph.message import add_messages
+from typing_extensions import TypedDict
+
+from jarvis.agents.chatbot_node import build_chatbot_node
+from jarvis.agents.checkpointer import build_checkpointer, is_durable_checkpointer
+from jarvis.core.enums import CheckpointerBackendEnum
+from jarvis.infrastructure.persistence import checkpoints
+from jarvis.infrastructure.persistence.checkpoints import SqliteCheckpointSaver
+
+
+class _State(TypedDict):
+    messages: Annotated[list, add_messages]
+    real_name: str
+
+
+def _graph(saver, replies: list[str]):
+    llm = GenericFakeChatModel(messages=iter([AIMessage(content=r) for r in replies]))
+    builder = StateGraph(_State)
+    builder.add_node("chatbot", build_chatbot_node(llm))
+    builder.set_entry_point("chatbot")
+    return builder.compile(checkpointer=saver)
+
+
+def _config(thread_id: str) -> dict:
+    return {"configurable": {"thread_id": thread_id}}
+
+
+def _count(db_path: str, table: str) -> int:
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def test_history_survives_a_new_saver_instance(tmp_path):
+    db_path = str(tmp_path / "checkpoints.db")
+    saver = SqliteCheckpointSaver(db_path, flush_interval_seconds=60)
+    graph = _graph(saver, ["Hola, señor.", "Sigo aquí."])
+    graph.invoke({"messages": [HumanMessage("hola")], "real_name": "Ana"}, _config("ana"))
+    saver.close()
+
+    reopened = SqliteCheckpointSaver(db_path)
+    state = _graph(reopened, ["Sigo aquí."]).invoke(
+        {"messages": [HumanMessage("¿sigues?")], "real_name": "Ana"}, _config("ana")
+    )
+
+    assert [m.content for m in state["messages"]] == ["hola", "Hola, señor.", "¿sigues?", "Sigo aquí."]
+    latest = reopened.get_tuple(_config("ana"))
+    assert latest.parent_config["configurable"]["checkpoint_id"] < latest.config["configurable"]["checkpoint_id"]
+    reopened.close()
+
+
+def test_writes_are_batched_until_flush_or_read(tmp_path):
+    db_path = str(tmp_path / "checkpoints.db")
+    saver = SqliteCheckpointSaver(db_path, flush_interval_seconds=60)
+    graph = _graph(saver, ["uno"])
+    graph.invoke({"messages": [HumanMessage("hola")], "real_name": ""}, _config("t"))
+
+    assert _count(db_path, "checkpoints") == 0
+    assert graph.get_state(_config("t")).values["messages"][-1].content == "uno"
+    assert _count(db_path, "checkpoints") > 0
+    saver.close()
+
+
+def test_full_batch_is_flushed_by_the_writer_thread(tmp_path):
+    db_path = str(tmp_path / "checkpoints.db")
+    saver = SqliteCheckpointSaver(db_path, flush_batch_size=1, flush_interval_seconds=60)
+    graph = _graph(saver, ["uno"])
+
+    asyncio.run(graph.ainvoke({"messages": [HumanMessage("hola")], "real_name": ""}, _config("t")))
+
+    deadline = time.monotonic() + 5
+    while _count(db_path, "checkpoints") == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert _count(db_path, "checkpoints") > 0
+    saver.close()
+
+
+def test_unwritable_statement_is_dropped_without_blocking_reads(tmp_path):
+    db_path = str(tmp_path / "checkpoints.db")
+    saver = SqliteCheckpointSaver(db_path, flush_interval_seconds=60)
+    saver._enqueue("INSERT INTO checkpoints (thread_id, checkpoint_id) VALUES (?, ?)", [(None, "x")])
+    graph = _graph(saver, ["uno"])
+    graph.invoke({"messages": [HumanMessage("hola")], "real_name": ""}, _config("t"))
+
+    assert graph.get_state(_config("t")).values["messages"][-1].content == "uno"
+    assert saver._pending == []
+    saver.close()
+
+
+class _LockedConnection:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def executemany(self, sql, rows):
+        raise sqlite3.OperationalError("database is locked")
+
+
+def test_locked_database_is_retried_then_the_batch_dropped(tmp_path, monkeypatch):
+    saver = SqliteCheckpointSaver(str(tmp_path / "checkpoints.db"), flush_interval_seconds=60)
+    monkeypatch.setattr(checkpoints, "get_connection", lambda db_path: _LockedConnection())
+    saver._enqueue(checkpoints._UPSERT_CHECKPOINT, [("t", "", "1", None, None, None, None, None)])
+
+    for _ in range(checkpoints._MAX_FLUSH_ATTEMPTS - 1):
+        with pytest.raises(sqlite3.OperationalError):
+            saver.flush()
+        assert len(saver._pending) == 1
+    saver.flush()
+
+    assert saver._pending == []
+    saver.close()
+
+
+def test_list_filters_and_limits(tmp_path):
+    saver = SqliteCheckpointSaver(str(tmp_path / "checkpoints.db"))
+    graph = _graph(saver, ["a", "b"])
+    for text in ("1", "2"):
+        graph.invoke({"messages": [HumanMessage(text)], "real_name": ""}, _config("t"))
+
+    everything = list(saver.list(_config("t")))
+    ids = [item.config["configurable"]["checkpoint_id"] for item in everything]
+    assert ids == sorted(ids, reverse=True)
+    assert len(list(saver.list(_config("t"), limit=2))) == 2
+    inputs = list(saver.list(_config("t"), filter={"source": "input"}))
+    assert len(inputs) == 2
+    older = list(saver.list(_config("t"), before=everything[0].config))
+    assert len(older) == len(everything) - 1
+    saver.close()
+
+
+def test_delete_thread_drops_pending_and_stored_rows(tmp_path):
+    db_path = str(tmp_path / "checkpoints.db")
+    saver = SqliteCheckpointSaver(db_path, flush_interval_seconds=60)
+    graph = _graph(saver, ["a", "b"])
+    graph.invoke({"messages": [HumanMessage("x")], "real_name": ""}, _config("keep"))
+    graph.invoke({"messages": [HumanMessage("y")], "real_name": ""}, _config("drop"))
+
+    saver.delete_thread("drop")
+
+    assert saver.get_tuple(_config("drop")) is None
+    assert saver.get_tuple(_config("keep")) is not None
+    saver.close()
+
+
+def test_vacuum_keeps_newest_checkpoints_per_thread(tmp_path):
+    db_path = str(tmp_path / "checkpoints.db")
+    saver = SqliteCheckpointSaver(db_path, keep_last=2)
+    graph = _graph(saver, ["a", "b", "c"])
+    for text in ("1", "2", "3"):
+        graph.invoke({"messages": [HumanMessage(text)], "real_name": ""}, _config("t"))
+    latest = saver.get_tuple(_config("t")).config["configurable"]["checkpoint_id"]
+
+    assert saver.vacuum() > 0
+    assert _count(db_path, "checkpoints") == 2
+    assert saver.get_tuple(_config("t")).config["configurable"]["checkpoint_id"] == latest
+    assert len(graph.get_state(_config("t")).values["messages"]) == 6
+    saver.close()
+
+
+def test_async_graph_round_trip(tmp_path):
+    saver = SqliteCheckpointSaver(str(tmp_path / "checkpoints.db"))
+    graph = _graph(saver, ["async"])
+
+    state = asyncio.run(
+        graph.ainvoke({"messages": [HumanMessage("hola")], "real_name": ""}, _config("t"))
+    )
+
+    assert state["messages"][-1].content == "async"
+    assert asyncio.run(saver.aget_tuple(_config("t"))) is not None
+    saver.close()
+
+
+def test_build_checkpointer_selects_backend(tmp_path):
+    db_path = str(tmp_path / "checkpoints.db")
+    memory = build_checkpointer(CheckpointerBackendEnum.MEMORY)
+    sqlite_saver = build_checkpointer(CheckpointerBackendEnum.SQLITE, db_path)
+
+    assert isinstance(memory, MemorySaver) and not is_durable_checkpointer(memory)
+    assert is_durable_checkpointer(sqlite_saver)
+    assert build_checkpointer(CheckpointerBackendEnum.SQLITE, db_path) is sqlite_saver
+    sqlite_saver.close()
+
+
+def test_latest_checkpoint_id_matches_get_state(tmp_path):
+    saver = SqliteCheckpointSaver(str(tmp_path / "checkpoints.db"), flush_interval_seconds=60)
+    graph = _graph(saver, ["uno"])
+    assert saver.get_latest_checkpoint_id(_config("t")) is None
+    graph.invoke({"messages": [HumanMessage("hola")], "real_name": ""}, _config("t"))
+
+    snapshot = graph.get_state(_config("t"))
+    assert saver.get_latest_checkpoint_id(_config("t")) == snapshot.config["configurable"]["checkpoint_id"]
+    saver.close()
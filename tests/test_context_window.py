@@ -0,0 +1,141 @@
+"""Token-budgeted context selection and background rolling summaries."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Annotated
+
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.graph import StateGraph
+from langgraph.graph.message import add_messages
+from typing_extensions import NotRequired, TypedDict
+
+from jarvis.agents.chatbot_node import build_chatbot_node
+from jarvis.agents.context_window import (
+    SUMMARY_PREFIX,
+    afold_overflow,
+    fold_overflow,
+    select_context,
+)
+
+
+class _State(TypedDict):
+    messages: Annotated[list, add_messages]
+    real_name: str
+    summary: NotRequired[str]
+    summarized_through: NotRequired[str]
+
+
+def _long(text: str) -> str:
+    return f"{text} " + "palabra " * 60
+
+
+def test_select_context_keeps_system_prompt_and_whole_recent_turns():
+    tool_call = {"name": "calculate_tool", "args": {"expression": "2+2"}, "id": "call-1"}
+    messages = [
+        SystemMessage(content="Eres Jarvis."),
+        HumanMessage(content=_long("antigua")),
+        AIMessage(content=_long("respuesta antigua")),
+        HumanMessage(content="¿cuánto es 2+2?"),
+        AIMessage(content="", tool_calls=[tool_call]),
+        ToolMessage(content="4", tool_call_id="call-1"),
+        AIMessage(content="Son 4, señor."),
+    ]
+
+    context = select_context(messages, token_budget=120)
+
+    assert context[0].content == "Eres Jarvis."
+    assert [type(m).__name__ for m in context[1:]] == [
+        "HumanMessage", "AIMessage", "ToolMessage", "AIMessage",
+    ]
+
+
+def test_select_context_always_keeps_current_turn():
+    messages = [SystemMessage(content="Eres Jarvis."), HumanMessage(content=_long("enorme"))]
+    assert select_context(messages, token_budget=10) == messages
+
+
+def test_select_context_places_summary_after_system_prompt():
+    old, new = HumanMessage(content="vieja", id="h1"), HumanMessage(content="nueva", id="h2")
+    messages = [SystemMessage(content="Eres Jarvis."), old, AIMessage(content="ok", id="a1"), new]
+
+    context = select_context(messages, 1000, summary="Hablamos de X.", summarized_through="a1")
+
+    assert context[1].content == SUMMARY_PREFIX + "Hablamos de X."
+    assert context[2:] == [new]
+
+
+def _graph(replies: int):
+    chat = GenericFakeChatModel(messages=iter([AIMessage(content=_long(f"r{i}")) for i in range(replies)]))
+    builder = StateGraph(_State)
+    builder.add_node("chatbot", build_chatbot_node(chat, token_budget=200))
+    builder.set_entry_point("chatbot")
+    return builder.compile(checkpointer=MemorySaver())
+
+
+def test_fold_overflow_summarizes_old_turns_without_touching_history():
+    graph = _graph(4)
+    config = {"configurable": {"thread_id": "t"}}
+    graph.invoke({"messages": [SystemMessage(content="Eres Jarvis.")], "real_name": ""}, config)
+    for i in range(3):
+        graph.invoke({"messages": [HumanMessage(content=_long(f"p{i}"))], "real_name": ""}, config)
+    before = graph.get_state(config).values["messages"]
+    summarizer = GenericFakeChatModel(messages=iter([AIMessage(content="Resumen de p0 y p1.")]))
+
+    assert fold_overflow(graph, summarizer, "t", token_budget=200) is True
+
+    values = graph.get_state(config).values
+    assert values["messages"] == before
+    assert values["summary"] == "Resumen de p0 y p1."
+    context = select_context(values["messages"], 200, values["summary"], values["summarized_through"])
+    assert context[0].content == "Eres Jarvis."
+    assert context[1].content.endswith("Resumen de p0 y p1.")
+    assert fold_overflow(graph, summarizer, "t", token_budget=200) is False
+
+
+class _RacingSummarizer:
+    """Summary model during whose call another turn of the thread completes."""
+
+    def __init__(self, graph, config: dict) -> None:
+        self.graph = graph
+        self.config = config
+
+    def invoke(self, request):
+        self.graph.invoke({"messages": [HumanMessage(content="entretanto")], "real_name": ""}, self.config)
+        return AIMessage(content="resumen obsoleto")
+
+
+def test_fold_is_discarded_when_a_turn_lands_during_the_summary():
+    graph = _graph(4)
+    config = {"configurable": {"thread_id": "race"}}
+    for i in range(3):
+        graph.invoke({"messages": [HumanMessage(content=_long(f"p{i}"))], "real_name": ""}, config)
+
+    assert fold_overflow(graph, _RacingSummarizer(graph, config), "race", token_budget=200) is False
+
+    values = graph.get_state(config).values
+    assert "summary" not in values
+    assert values["messages"][-2].content == "entretanto"
+
+
+def test_afold_overflow_holds_admission_only_for_the_summary_call():
+    graph = _graph(3)
+    config = {"configurable": {"thread_id": "async"}}
+    admitted = []
+
+    @asynccontextmanager
+    async def admit():
+        admitted.append(True)
+        yield 0.0
+
+    summarizer = GenericFakeChatModel(messages=iter([AIMessage(content="resumen")]))
+    graph.invoke({"messages": [HumanMessage(content="corta")], "real_name": ""}, config)
+    assert asyncio.run(afold_overflow(graph, summarizer, "async", 200, admit=admit)) is False
+    assert admitted == []
+
+    for i in range(2):
+        graph.invoke({"messages": [HumanMessage(content=_long(f"p{i}"))], "real_name": ""}, config)
+    assert asyncio.run(afold_overflow(graph, summarizer, "async", 200, admit=admit)) is True
+    assert admitted == [True]
+    assert graph.get_state(config).values["summary"] == "resumen"
@@ -0,0 +1,117 @@
+"""get_upcoming_events_tool: parallel per-account queries merged by start time."""
+
+import threading
+import time
+
+from jarvis.tools import google_calendar
+
+
+def _event(event_id: str, start: str) -> dict:
+    return {"id": event_id, "summary": event_id, "start": {"dateTime": start}}
+
+
+_ACCOUNT_EVENTS = {
+    "personal": [
+        _event("p1", "2030-01-01T09:00:00+01:00"),
+        _event("p2", "2030-01-01T12:00:00+01:00"),
+    ],
+    "trabajo": [
+        _event("t1", "2030-01-01T09:30:00+00:00"),  # 10:30 in +01:00
+        _event("t2", "2030-01-02T08:00:00+00:00"),
+    ],
+}
+
+
+def _patch_accounts(monkeypatch, accounts: list[str], fetch) -> None:
+    monkeypatch.setattr(
+        google_calendar,
+        "get_authentications_for_user",
+        lambda name, allow_logging_popup=False: {account: object() for account in accounts},
+    )
+    monkeypatch.setattr(google_calendar, "_fetch_account_events", fetch)
+
+
+def _ids(result: str) -> list[str]:
+    return [line.rsplit(" - ", 1)[1] for line in result.splitlines() if line.startswith("2030")]
+
+
+def test_events_are_merged_across_accounts_and_time_zones(monkeypatch):
+    _patch_accounts(
+        monkeypatch,
+        ["personal", "trabajo"],
+        lambda real_name, account, auth, kwargs: _ACCOUNT_EVENTS[account],
+    )
+
+    result = google_calendar.get_upcoming_events_tool.func("Ana", num_events=3)
+
+    assert _ids(result) == ["p1", "t1", "p2"]
+
+
+def test_accounts_are_queried_concurrently(monkeypatch):
+    barrier = threading.Barrier(2, timeout=5)
+
+    def fetch(real_name, account, auth, kwargs):
+        barrier.wait()  # deadlocks (times out) if accounts were queried one by one
+        return _ACCOUNT_EVENTS[account]
+
+    _patch_accounts(monkeypatch, ["personal", "trabajo"], fetch)
+    started = time.monotonic()
+
+    result = google_calendar.get_upcoming_events_tool.func("Ana")
+
+    assert len(_ids(result)) == 4
+    assert time.monotonic() - started < 5
+
+
+def test_failing_account_returns_partial_result(monkeypatch):
+    def fetch(real_name, account, auth, kwargs):
+        if account == "trabajo":
+            raise RuntimeError("token revocado")
+        return _ACCOUNT_EVENTS[account]
+
+    _patch_accounts(monkeypatch, ["personal", "trabajo"], fetch)
+
+    result = google_calendar.get_upcoming_events_tool.func("Ana")
+
+    assert _ids(result) == ["p1", "p2"]
+    assert "Resultado parcial" in result
+    assert "trabajo: token revocado" in result
+
+
+def test_all_accounts_failing_is_an_error(monkeypatch):
+    def fetch(real_name, account, auth, kwargs):
+        raise RuntimeError("sin red")
+
+    _patch_accounts(monkeypatch, ["personal"], fetch)
+
+    assert google_calendar.get_upcoming_events_tool.func("Ana") == (
+        "Error al consultar los calendarios: sin red"
+    )
+
+
+def test_fresh_mirror_answers_without_calling_the_api(monkeypatch, tmp_path):
+    from jarvis.infrastructure.google.calendar_mirror import CalendarMirror
+
+    mirror = CalendarMirror(str(tmp_path / "mirror.db"), staleness_seconds=60)
+    for account, events in _ACCOUNT_EVENTS.items():
+        for event in events:
+            mirror.upsert("ana", account, {**event, "end": event["start"]})
+        mirror._apply("ana", account, [], "token", None, 0.0, full=False)  # mark as just synced
+
+    class _Offline:
+        def events(self):
+            raise AssertionError("the API must not be called")
+
+    monkeypatch.setattr(google_calendar, "get_calendar_mirror", lambda: mirror)
+    monkeypatch.setattr(google_calendar, "get_calendar_service", lambda *args: _Offline())
+    monkeypatch.setattr(
+        google_calendar,
+        "get_authentications_for_user",
+        lambda name, allow_logging_popup=False: {"personal": object(), "trabajo": object()},
+    )
+
+    result = google_calendar.get_upcoming_events_tool.func(
+        "Ana", num_events=3, date_from="2029-12-31T00:00:00+00:00"
+    )
+
+    assert _ids(result) == ["p1", "t1", "p2"]
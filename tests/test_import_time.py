@@ -0,0 +1,45 @@
+"""Import cost of ``jarvis.api.main``: unused agent backends must stay unloaded."""
+
+import logging
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+_PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+logger = logging.getLogger(__name__)
+
+_LAZY_BACKENDS = (
+    "langchain_ollama",
+    "langchain_huggingface",
+    "langchain.agents",
+    "mcp",
+    "langchain_mcp_adapters",
+    "jarvis.agents.jarvis_basic_agent",
+    "jarvis.agents.jarvis_mcp_memory_agent",
+)
+
+
+def _import_times(module: str) -> dict[str, int]:
+    """Cumulative import time in microseconds per module, from ``python -X importtime``."""
+    env = {**os.environ, "PYTHONPATH": str(_PROJECT_ROOT / "src")}
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, cwd=_PROJECT_ROOT, env=env, check=True, timeout=120,
+    )
+    times: dict[str, int] = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_api_import_skips_backends():
+    times = _import_times("jarvis.api.main")
+
+    assert [m for m in _LAZY_BACKENDS if m in times] == []
+    # Wall-clock cost depends on the machine, so it is reported rather than asserted.
+    logger.info("jarvis.api.main imports in %.2f s", times["jarvis.api.main"] / 1e6)
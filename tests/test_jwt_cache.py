@@ -0,0 +1,75 @@
+"""Verified-token cache and signing-key rotation in api.security.jwt."""
+
+import asyncio
+
+import jwt
+import pytest
+
+from jarvis.api.security import jwt as jwt_module
+from jarvis.api.security.jwt import VerifiedTokenCache, reload_signing_keys, verify_jwt
+from jarvis.core.config import JWT_ALGORITHM
+
+
+@pytest.fixture
+def rotated_keys(monkeypatch):
+    """Rotate to a new current key, keeping the pytest key as the previous one."""
+    old = jwt_module.get_jwt_secret_key()
+    monkeypatch.setenv("JWT_SECRET_KEY", "pytest-rotated-secret-0123456789abcdef")
+    monkeypatch.setenv("JWT_PREVIOUS_SECRET_KEYS", f" {old} ,")
+    yield reload_signing_keys()
+    monkeypatch.undo()
+    reload_signing_keys()
+
+
+def test_cached_claims_expire_at_exp():
+    now = [1000.0]
+    cache = VerifiedTokenCache(max_entries=8, clock=lambda: now[0])
+    cache.put("token", {"sub": "a", "exp": 1010})
+
+    claims = cache.get("token")
+    claims["sub"] = "modified"
+    assert cache.get("token") == {"sub": "a", "exp": 1010}
+    now[0] = 1010.0
+    assert cache.get("token") is None
+    assert cache.stats() == {"size": 0, "max_entries": 8, "hits": 2, "misses": 1, "hit_ratio": 0.6667}
+
+
+def test_cache_is_bounded_and_skips_tokens_without_exp():
+    cache = VerifiedTokenCache(max_entries=2, clock=lambda: 0.0)
+    for name in ("a", "b", "c"):
+        cache.put(name, {"exp": 10})
+    cache.put("no-exp", {"sub": "x"})
+
+    assert cache.get("a") is None
+    assert cache.get("c") == {"exp": 10}
+    assert cache.get("no-exp") is None
+    assert cache.stats()["size"] == 2
+
+
+def test_verify_jwt_serves_repeated_tokens_from_cache():
+    token = jwt_module.encode_jwt(jwt_module.build_token_payload(sub="cache-user"))
+    before = jwt_module.get_verified_token_cache_stats()
+
+    assert verify_jwt(token)["sub"] == "cache-user"
+    assert verify_jwt(token)["sub"] == "cache-user"
+
+    after = jwt_module.get_verified_token_cache_stats()
+    assert after["hits"] - before["hits"] == 1
+    assert after["misses"] - before["misses"] == 1
+
+
+def test_rotation_accepts_previous_key_and_signs_with_new_one(rotated_keys):
+    payload = {"sub": "rotated", "exp": 9999999999}
+    old_token = jwt.encode(payload, rotated_keys.previous[0], algorithm=JWT_ALGORITHM)
+    new_token = jwt_module.encode_jwt(payload)
+
+    assert verify_jwt(old_token)["sub"] == "rotated"
+    assert jwt.decode(new_token, "pytest-rotated-secret-0123456789abcdef", algorithms=[JWT_ALGORITHM])["sub"] == "rotated"
+    with pytest.raises(jwt.InvalidSignatureError):
+        verify_jwt(jwt.encode(payload, "unknown-secret-0123456789abcdef0123456", algorithm=JWT_ALGORITHM))
+
+
+def test_admin_cache_status_reports_jwt_hit_ratio():
+    from jarvis.api.services.admin_service import admin_service
+
+    assert "hit_ratio" in asyncio.run(admin_service.get_cache_status())["jwt_cache_stats"]
@@ -0,0 +1,137 @@
+"""Exact-match LLM response cache: keys, layers, TTL, bypass, and the chatbot node."""
+
+from typing import Annotated
+
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.graph import StateGraph
+from langgraph.graph.message import add_messages
+from typing_extensions import TypedDict
+
+from jarvis.agents.chatbot_node import build_chatbot_node
+from jarvis.agents.llm_cache import LlmResponseCache
+
+
+class _DeterministicChat(GenericFakeChatModel):
+    temperature: float = 0.0
+    model_name: str = "fake-0"
+
+
+class _State(TypedDict):
+    messages: Annotated[list, add_messages]
+    real_name: str
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _prompt(text: str = "¿Quién eres?") -> list:
+    return [SystemMessage(content="Eres Jarvis."), HumanMessage(content=text, id="random-id")]
+
+
+def test_key_ignores_message_ids_but_not_content_or_tools():
+    cache = LlmResponseCache(max_entries=10, ttl_seconds=60)
+    llm = _DeterministicChat(messages=iter([]))
+
+    key = cache.make_key(llm, _prompt())
+    other_ids = [m.model_copy(update={"id": "other"}) for m in _prompt()]
+
+    assert cache.make_key(llm, other_ids) == key
+    assert cache.make_key(llm, _prompt("¿Qué hora es?")) != key
+    assert cache.make_key(llm.bind(tools=[{"name": "calculate_tool"}]), _prompt()) != key
+
+
+def test_non_deterministic_models_are_not_cached():
+    cache = LlmResponseCache(max_entries=10, ttl_seconds=60)
+    llm = _DeterministicChat(messages=iter([]), temperature=0.7)
+    assert cache.make_key(llm, _prompt()) is None
+
+
+def test_entries_expire_and_lru_evicts():
+    clock = _Clock()
+    cache = LlmResponseCache(max_entries=2, ttl_seconds=60, clock=clock)
+    for key in ("a", "b", "c"):
+        cache.put(key, AIMessage(content=key))
+
+    assert cache.get("a") is None
+    assert cache.get("c").content == "c"
+    clock.now += 61
+    assert cache.get("c") is None
+    assert cache.stats()["misses"] == 2
+
+
+def test_tool_calls_are_never_stored():
+    cache = LlmResponseCache(max_entries=10, ttl_seconds=60)
+    call = AIMessage(content="", tool_calls=[{"name": "t", "args": {}, "id": "call-1"}])
+    assert cache.put("k", call) is False
+    assert cache.get("k") is None
+
+
+def test_sqlite_layer_survives_a_new_cache(tmp_path):
+    db_path = str(tmp_path / "llm_cache.db")
+    LlmResponseCache(max_entries=10, ttl_seconds=60, db_path=db_path).put("k", AIMessage(content="hola"))
+
+    reopened = LlmResponseCache(max_entries=10, ttl_seconds=60, db_path=db_path)
+
+    assert reopened.get("k").content == "hola"
+    assert reopened.get("k").content == "hola"
+    stats = reopened.stats()
+    assert (stats["sqlite_hits"], stats["memory_hits"], stats["hit_ratio"]) == (1, 1, 1.0)
+
+
+def _graph(cache: LlmResponseCache, replies: list[str]):
+    llm = _DeterministicChat(messages=iter([AIMessage(content=r) for r in replies]))
+    builder = StateGraph(_State)
+    builder.add_node("chatbot", build_chatbot_node(llm, response_cache=cache))
+    builder.set_entry_point("chatbot")
+    return builder.compile(checkpointer=MemorySaver())
+
+
+def _ask(graph, thread_id: str, **configurable) -> str:
+    state = graph.invoke(
+        {"messages": _prompt(), "real_name": ""},
+        {"configurable": {"thread_id": thread_id, **configurable}},
+    )
+    return state["messages"][-1].content
+
+
+def test_chatbot_node_serves_identical_calls_from_cache():
+    cache = LlmResponseCache(max_entries=10, ttl_seconds=60)
+    graph = _graph(cache, ["primera", "segunda"])
+
+    assert _ask(graph, "a") == "primera"
+    assert _ask(graph, "b") == "primera"
+    assert cache.stats()["memory_hits"] == 1
+
+    assert _ask(graph, "c", llm_cache_bypass=True) == "segunda"
+
+
+def test_thread_bypass_always_calls_the_model():
+    cache = LlmResponseCache(max_entries=10, ttl_seconds=60)
+    graph = _graph(cache, ["primera", "segunda"])
+    _ask(graph, "a")
+
+    cache.set_thread_bypass("b")
+
+    assert _ask(graph, "b") == "segunda"
+    assert cache.stats()["bypassed"] == 1
+
+
+def test_cached_reply_gets_a_new_message_id():
+    cache = LlmResponseCache(max_entries=10, ttl_seconds=60)
+    graph = _graph(cache, ["hola"])
+    _ask(graph, "a")
+    _ask(graph, "b")
+
+    ids = [
+        graph.get_state({"configurable": {"thread_id": t}}).values["messages"][-1].id
+        for t in ("a", "b")
+    ]
+
+    assert all(ids) and ids[0] != ids[1]
@@ -0,0 +1,94 @@
+"""MCP agent turns: shared reconnects and safe resumes after transport failures."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from langchain_core.messages import AIMessage
+
+from jarvis.agents.jarvis_mcp_memory_agent import JarvisMcpMemoryAgent
+from jarvis.core.enums import ModelEnum
+from jarvis.tools.tools_registry import local_tools
+
+
+class _FakeManager:
+    def __init__(self) -> None:
+        self.generation = 0
+        self.reconnects = 0
+        self.is_connected = False
+
+    async def aget_tools(self) -> list:
+        self.is_connected = True
+        self.generation += 1
+        return []
+
+    async def areconnect(self) -> list:
+        self.reconnects += 1
+        await asyncio.sleep(0.01)
+        self.generation += 1
+        return []
+
+
+class _FlakyGraph:
+    """Fails every new turn with ``tool_calls`` pending; resumes succeed."""
+
+    def __init__(self, tool_calls: list[dict]) -> None:
+        self.tool_calls = tool_calls
+        self.resumed: list = []
+
+    async def ainvoke(self, input, config):
+        if input is None:
+            self.resumed.append(config)
+            return {"messages": [AIMessage(content="listo")]}
+        await asyncio.sleep(0.01)
+        raise ConnectionError("stdio closed")
+
+    async def aget_state(self, config):
+        message = AIMessage(content="", tool_calls=self.tool_calls)
+        return SimpleNamespace(next=("tools",), values={"messages": [message]})
+
+
+@pytest.fixture
+def agent(monkeypatch):
+    agent = JarvisMcpMemoryAgent(ModelEnum.GPT_3_5)
+    agent.mcp_manager = _FakeManager()
+    agent.graphs = []
+
+    def compile_graph(model_enum, tools, memory=None):
+        agent.graph = _FlakyGraph(agent.pending_calls)
+        agent.graphs.append(agent.graph)
+
+    monkeypatch.setattr(agent, "_create_langgraph_agent", compile_graph)
+    return agent
+
+
+def _call(name: str, call_id: str) -> dict:
+    return {"name": name, "args": {}, "id": call_id}
+
+
+def test_concurrent_failures_share_one_reconnect_and_resume(agent):
+    agent.pending_calls = [_call("add", "c1")]
+    config = {"configurable": {"thread_id": "ana"}}
+
+    async def scenario():
+        return await asyncio.gather(
+            *(agent._ainvoke_on_mcp_loop(input={"messages": []}, config=config) for _ in range(3))
+        )
+
+    results = asyncio.run(scenario())
+
+    assert [r["messages"][-1].content for r in results] == ["listo"] * 3
+    assert agent.mcp_manager.reconnects == 1
+    assert len(agent.graphs) == 2 and len(agent.graphs[-1].resumed) == 3
+
+
+def test_failed_step_with_a_local_tool_is_not_replayed(agent):
+    agent.pending_calls = [_call("add", "c1"), _call(local_tools[0].name, "c2")]
+    config = {"configurable": {"thread_id": "ana"}}
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(agent._ainvoke_on_mcp_loop(input={"messages": []}, config=config))
+
+    # Reconnected for the next turn, but nothing was resumed.
+    assert agent.mcp_manager.reconnects == 1
+    assert all(not graph.resumed for graph in agent.graphs)
@@ -0,0 +1,40 @@
+"""Persistent MCP sessions against the bundled stdio math server."""
+
+import shutil
+
+import pytest
+
+from jarvis.agents.mcp_session_manager import McpSessionManager, resolve_mcp_server_config
+from jarvis.core.paths import MCP_DIR
+
+pytestmark = pytest.mark.skipif(shutil.which("python") is None, reason="python not on PATH")
+
+
+def _tools_by_name(tools: list) -> dict:
+    return {tool.name: tool for tool in tools}
+
+
+def test_resolve_mcp_server_config_makes_script_paths_absolute():
+    resolved = resolve_mcp_server_config({"command": "python", "args": ["servers/math_server.py"]})
+    assert resolved["args"] == [str((MCP_DIR / "servers/math_server.py").resolve())]
+
+
+def test_sessions_survive_across_calls_and_reconnect():
+    manager = McpSessionManager()
+    try:
+        tools = manager.run(manager.aget_tools())
+        add = _tools_by_name(tools)["add"]
+        assert "5" in str(manager.run(add.ainvoke({"a": 2, "b": 3})))
+        first_owner = manager._owner_task
+
+        again = manager.run(manager.aget_tools())
+        assert manager._owner_task is first_owner
+        assert {t.name for t in again} == {t.name for t in tools}
+
+        reconnected = manager.run(manager.areconnect())
+        assert manager._owner_task is not first_owner
+        multiply = _tools_by_name(reconnected)["multiply"]
+        assert "12" in str(manager.run(multiply.ainvoke({"a": 3, "b": 4})))
+    finally:
+        manager.shutdown()
+    assert not manager.is_connected
@@ -0,0 +1,147 @@
+"""OpenAI rate limiting and retries against a local fake OpenAI-compatible server."""
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from jarvis.agents import openai_client
+from jarvis.agents.openai_client import build_chat_openai
+from jarvis.agents.rate_limit import ModelRateLimiter, TokenBucket, backoff_delay, parse_retry_after
+from jarvis.core.enums import ModelEnum
+
+
+class _FakeOpenAI(BaseHTTPRequestHandler):
+    """``/v1/chat/completions`` that answers 429 ``failures`` times, then succeeds."""
+
+    protocol_version = "HTTP/1.1"
+    failures = 0
+    requests: list[dict] = []
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        type(self).requests.append(payload)
+        if type(self).failures > 0:
+            type(self).failures -= 1
+            self._send(429, b'{"error": {"message": "rate limited"}}', "application/json", {"retry-after-ms": "20"})
+            return
+        usage = {"prompt_tokens": 30, "completion_tokens": 12, "total_tokens": 42}
+        message = {"role": "assistant", "content": "A su servicio."}
+        if payload.get("stream"):
+            chunks = [
+                {"id": "c1", "object": "chat.completion.chunk", "created": 0, "model": payload["model"],
+                 "choices": [{"index": 0, "delta": message, "finish_reason": None}]},
+                {"id": "c1", "object": "chat.completion.chunk", "created": 0, "model": payload["model"],
+                 "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]},
+                {"id": "c1", "object": "chat.completion.chunk", "created": 0, "model": payload["model"],
+                 "choices": [], "usage": usage},
+            ]
+            body = "".join(f"data: {json.dumps(chunk)}\n\n" for chunk in chunks) + "data: [DONE]\n\n"
+            self._send(200, body.encode(), "text/event-stream")
+            return
+        completion = {
+            "id": "c1", "object": "chat.completion", "created": 0, "model": payload["model"],
+            "choices": [{"index": 0, "message": message, "finish_reason": "stop"}],
+            "usage": usage,
+        }
+        self._send(200, json.dumps(completion).encode(), "application/json")
+
+    def _send(self, status: int, body: bytes, content_type: str, headers: dict | None = None) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class _RecordingLimiter(ModelRateLimiter):
+    def __init__(self) -> None:
+        super().__init__(requests_per_minute=60_000, tokens_per_minute=10_000_000)
+        self.reconciled: list[tuple[int, int]] = []
+
+    def reconcile(self, estimated_tokens: int, actual_tokens: int) -> None:
+        self.reconciled.append((estimated_tokens, actual_tokens))
+        super().reconcile(estimated_tokens, actual_tokens)
+
+
+@pytest.fixture
+def fake_openai(monkeypatch):
+    _FakeOpenAI.failures = 0
+    _FakeOpenAI.requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FakeOpenAI)
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    limiter = _RecordingLimiter()
+    monkeypatch.setattr(openai_client, "get_rate_limiter", lambda model: limiter)
+    monkeypatch.setattr(
+        openai_client, "backoff_delay", lambda attempt, retry_after=None: backoff_delay(attempt, retry_after, base=0.01)
+    )
+    monkeypatch.setenv("OPENAI_BASE_URL", f"http://127.0.0.1:{server.server_port}/v1")
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    yield limiter
+    server.shutdown()
+
+
+def test_token_bucket_reservations_wait_for_refill():
+    now = [0.0]
+    bucket = TokenBucket(60, clock=lambda: now[0])
+
+    assert bucket.reserve(60) == 0.0
+    assert bucket.reserve(30) == pytest.approx(30.0)
+    now[0] = 30.0
+    assert bucket.level == pytest.approx(0.0)
+    bucket.adjust(-20)
+    assert bucket.reserve(20) == 0.0
+    bucket.pause(5)
+    assert bucket.reserve(1) == pytest.approx(6.0)
+
+
+def test_backoff_honours_retry_after_and_jitters_otherwise():
+    assert parse_retry_after({"retry-after-ms": "1500"}) == 1.5
+    assert parse_retry_after({"retry-after": "3"}) == 3.0
+    assert parse_retry_after({}) is None
+    assert backoff_delay(0, retry_after=2.0, base=0.5, rng=lambda: 1.0) == 2.5
+    assert backoff_delay(3, base=0.5, cap=30, rng=lambda: 1.0) == 4.0
+    assert backoff_delay(10, base=0.5, cap=30, rng=lambda: 0.5) == 15.0
+
+
+def test_429_is_retried_and_usage_reconciled(fake_openai):
+    _FakeOpenAI.failures = 2
+
+    reply = build_chat_openai(ModelEnum.GPT_3_5).invoke("hola")
+
+    assert reply.content == "A su servicio."
+    assert len(_FakeOpenAI.requests) == 3
+    assert fake_openai.throttled == 2 and fake_openai.retries == 2
+    assert [actual for _, actual in fake_openai.reconciled] == [0, 0, 42]
+
+
+def test_sdk_retries_are_disabled_in_favour_of_the_transport(fake_openai):
+    _FakeOpenAI.failures = 5
+    llm = build_chat_openai(ModelEnum.GPT_3_5)
+    llm.http_client._transport._policy.max_retries = 1
+
+    with pytest.raises(Exception, match="429"):
+        llm.invoke("hola")
+
+    assert llm.max_retries == 0
+    assert len(_FakeOpenAI.requests) == 2
+
+
+def test_async_stream_reports_usage_from_final_chunk(fake_openai):
+    _FakeOpenAI.failures = 1
+    llm = build_chat_openai(ModelEnum.GPT_3_5)
+
+    async def collect() -> str:
+        return "".join([chunk.content async for chunk in llm.astream("hola")])
+
+    assert asyncio.run(collect()) == "A su servicio."
+    assert _FakeOpenAI.requests[-1]["stream"] is True
+    assert fake_openai.reconciled[-1][1] == 42
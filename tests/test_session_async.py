@@ -0,0 +1,85 @@
+"""Async chat path: ask_jarvis_async awaits agents and overlaps concurrent turns."""
+
+import asyncio
+import time
+
+from langchain_core.messages import AIMessage
+
+from jarvis.agents import session as session_module
+from jarvis.core.enums import ModelEnum
+
+
+class _SlowAsyncAgent:
+    memory = None
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def invoke(self, **kwargs) -> dict:
+        raise AssertionError("sync invoke must not be used on the async path")
+
+    async def ainvoke(self, **kwargs) -> dict:
+        self.calls += 1
+        await asyncio.sleep(0.2)
+        messages = kwargs["input"]["messages"]
+        return {"messages": [*messages, AIMessage(content="A su servicio.")]}
+
+    def cleanup(self) -> None:
+        pass
+
+
+def _user(name: str) -> dict:
+    return {"real_name": name, "jarvis_name": "Sir", "is_female": False, "admin": False}
+
+
+def test_ask_jarvis_async_overlaps_llm_waits():
+    session_module.reset_cache_global()
+    agent = _SlowAsyncAgent()
+    session_module._agents_cache[ModelEnum.GPT_3_5] = agent
+
+    async def _conversation(name: str) -> list[str]:
+        welcome = await session_module.ask_jarvis_async("hola", ModelEnum.GPT_3_5, name, _user(name))
+        assert "Bienvenido" in welcome[0]
+        return await session_module.ask_jarvis_async("¿qué hora es?", ModelEnum.GPT_3_5, name, _user(name))
+
+    async def _run() -> list[list[str]]:
+        return await asyncio.gather(*(_conversation(f"user-{i}") for i in range(3)))
+
+    started = time.perf_counter()
+    replies = asyncio.run(_run())
+    elapsed = time.perf_counter() - started
+
+    assert replies == [["A su servicio."]] * 3
+    assert agent.calls == 3
+    assert elapsed < 0.5
+    session_module._agents_cache.clear()
+    session_module.reset_cache_global()
+
+
+def test_agent_build_and_turn_setup_stay_off_the_event_loop(monkeypatch):
+    session_module.reset_cache_global()
+    agent = _SlowAsyncAgent()
+
+    def slow_build(model):
+        time.sleep(0.2)
+        return agent
+
+    monkeypatch.setattr(session_module, "build_agent", slow_build)
+
+    async def _ticker(stop: asyncio.Event) -> int:
+        ticks = 0
+        while not stop.is_set():
+            await asyncio.sleep(0.01)
+            ticks += 1
+        return ticks
+
+    async def _run() -> int:
+        stop = asyncio.Event()
+        ticker = asyncio.create_task(_ticker(stop))
+        await session_module.ask_jarvis_async("hola", ModelEnum.GPT_3_5, "slow", _user("slow"))
+        stop.set()
+        return await ticker
+
+    assert asyncio.run(_run()) >= 5
+    session_module._agents_cache.clear()
+    session_module.reset_cache_global()
@@ -0,0 +1,73 @@
+"""Tests for the bounded LRU/TTL session cache."""
+
+from types import SimpleNamespace
+
+from jarvis.agents.session_cache import SessionCache
+from jarvis.agents import session as session_module
+from jarvis.core.enums import ModelEnum
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_lru_eviction_calls_hook_for_oldest_entry():
+    evicted = []
+    cache = SessionCache(max_entries=2, ttl_seconds=0, on_evict=lambda k, v: evicted.append(k))
+    cache.get_or_create("a", lambda: 1)
+    cache.get_or_create("b", lambda: 2)
+    cache.get_or_create("a", lambda: 99)
+    cache.get_or_create("c", lambda: 3)
+
+    assert evicted == ["b"]
+    assert cache.keys() == ["a", "c"]
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"]) == (1, 3, 1)
+
+
+def test_idle_ttl_expires_entries():
+    clock = _FakeClock()
+    evicted = []
+    cache = SessionCache(
+        max_entries=10, ttl_seconds=60, on_evict=lambda k, v: evicted.append(k), clock=clock
+    )
+    cache.get_or_create("a", lambda: 1)
+    clock.now = 30
+    cache.get_or_create("b", lambda: 2)
+    clock.now = 70
+
+    assert "a" not in cache
+    assert "b" in cache
+    assert cache.expire() == 1
+    assert evicted == ["a"]
+
+
+def test_pop_and_clear_do_not_call_hook():
+    evicted = []
+    cache = SessionCache(max_entries=10, ttl_seconds=0, on_evict=lambda k, v: evicted.append(k))
+    cache.get_or_create("a", lambda: 1)
+    cache.get_or_create("b", lambda: 2)
+    assert cache.pop("a") == 1
+    cache.clear()
+    assert evicted == []
+    assert len(cache) == 0
+
+
+def test_session_eviction_deletes_checkpointer_thread():
+    deleted = []
+    memory = SimpleNamespace(delete_thread=deleted.append)
+    session = SimpleNamespace(agent=SimpleNamespace(memory=memory))
+
+    session_module._on_session_evicted((ModelEnum.GPT_3_5, "thread-x"), session)
+
+    assert deleted == ["thread-x"]
+
+
+def test_cache_status_exposes_counters():
+    session_module.reset_cache_global()
+    stats = session_module.get_cache_status()["sessions_cache_stats"]
+    assert {"hits", "misses", "evictions", "max_entries", "ttl_seconds"} <= stats.keys()
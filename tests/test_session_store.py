@@ -0,0 +1,342 @@
+"""Shared session store: SQLite/Redis backends and sessions continued by another worker."""
+
+import asyncio
+import fnmatch
+import importlib.util
+import time
+from typing import Annotated
+
+import pytest
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.graph import StateGraph
+from langgraph.graph.message import add_messages
+from typing_extensions import TypedDict
+
+from jarvis.agents import session as session_module
+from jarvis.agents import session_store as session_store_module
+from jarvis.agents.chatbot_node import build_chatbot_node
+from jarvis.api.services.chat_service import chat_service
+from jarvis.core.enums import ModelEnum, SessionStoreBackendEnum
+from jarvis.infrastructure.persistence import redis_checkpoints, redis_client
+from jarvis.infrastructure.persistence.redis_checkpoints import RedisCheckpointSaver
+from jarvis.infrastructure.persistence.session_store import RedisSessionStore, SqliteSessionStore
+
+
+class _FakePipeline:
+    """Queues commands and runs them against the fake client on ``execute``."""
+
+    def __init__(self, client: "_FakeRedis") -> None:
+        self._client = client
+        self._commands: list = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self._commands.append((name, args, kwargs))
+            return self
+
+        return queue
+
+    def execute(self) -> list:
+        commands, self._commands = self._commands, []
+        return [getattr(self._client, name)(*args, **kwargs) for name, args, kwargs in commands]
+
+
+class _FakeRedis:
+    """In-memory stand-in for the few ``redis.Redis`` commands the backends use."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, object] = {}
+        self.ttls: dict[str, int] = {}
+        self.hgetall_keys: list[str] = []
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None):
+        self.data[key] = value
+        self.ttls[key] = ex
+
+    def expire(self, key, seconds):
+        if key in self.data:
+            self.ttls[key] = seconds
+
+    def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+            self.ttls.pop(key, None)
+
+    def scan_iter(self, match="*", count=None):
+        return [key for key in list(self.data) if fnmatch.fnmatchcase(key, match)]
+
+    def hget(self, key, field):
+        return self.data.get(key, {}).get(field)
+
+    def hgetall(self, key):
+        self.hgetall_keys.append(key)
+        return dict(self.data.get(key, {}))
+
+    def hkeys(self, key):
+        return list(self.data.get(key, {}))
+
+    def hset(self, key, field=None, value=None, mapping=None):
+        fields = self.data.setdefault(key, {})
+        fields.update(mapping or {field: value})
+
+    def hsetnx(self, key, field, value):
+        self.data.setdefault(key, {}).setdefault(field, value)
+
+    def hdel(self, key, *fields):
+        for field in fields:
+            self.data.get(key, {}).pop(field, None)
+
+    def eval(self, script, numkeys, *args):
+        # The only script is the checkpointer's "move latest forward".
+        assert script == redis_checkpoints._SET_LATEST_SCRIPT
+        (key,), (field, value) = args[:numkeys], args[numkeys:]
+        current = self.hget(key, field)
+        if current is None or value > current:
+            self.hset(key, field, value)
+
+    def sadd(self, key, *members):
+        self.data.setdefault(key, set()).update(members)
+
+    def smembers(self, key):
+        return set(self.data.get(key, set()))
+
+
+class _State(TypedDict):
+    messages: Annotated[list, add_messages]
+    real_name: str
+
+
+def _graph(saver, replies: list[str]):
+    llm = GenericFakeChatModel(messages=iter([AIMessage(content=r) for r in replies]))
+    builder = StateGraph(_State)
+    builder.add_node("chatbot", build_chatbot_node(llm))
+    builder.set_entry_point("chatbot")
+    return builder.compile(checkpointer=saver)
+
+
+def test_store_is_shared_only_with_several_workers_unless_configured(monkeypatch):
+    monkeypatch.setattr(session_store_module, "SESSION_STORE_BACKEND", None)
+    monkeypatch.setenv("API_WORKERS", "1")
+    assert session_store_module.session_store_backend() == SessionStoreBackendEnum.MEMORY
+    monkeypatch.setenv("API_WORKERS", "4")
+    assert session_store_module.session_store_backend() == SessionStoreBackendEnum.SQLITE
+    monkeypatch.setattr(session_store_module, "SESSION_STORE_BACKEND", SessionStoreBackendEnum.REDIS)
+    assert session_store_module.session_store_backend() == SessionStoreBackendEnum.REDIS
+
+
+def test_sqlite_store_round_trip_expiry_and_clear(tmp_path):
+    now = [1000.0]
+    store = SqliteSessionStore(str(tmp_path / "sessions.db"), ttl_seconds=60, clock=lambda: now[0])
+    store.put("GPT_3_5", "ana", {"chat_state": "INITIALIZED", "user": {"real_name": "Ana"}})
+    store.put("GPT_3_5", "luis", {"chat_state": "STARTING_CHAT", "user": None})
+
+    reopened = SqliteSessionStore(str(tmp_path / "sessions.db"), ttl_seconds=60, clock=lambda: now[0])
+    assert reopened.get("GPT_3_5", "ana") == {"chat_state": "INITIALIZED", "user": {"real_name": "Ana"}}
+    assert reopened.get("ZEPHYR", "ana") is None
+
+    reopened.delete("GPT_3_5", "luis")
+    assert store.get("GPT_3_5", "luis") is None
+    now[0] += 61
+    assert store.get("GPT_3_5", "ana") is None
+    store.clear()
+
+
+def test_redis_store_sets_ttl_and_clears_only_its_keys():
+    client = _FakeRedis()
+    client.set("other:key", "x")
+    store = RedisSessionStore(client, ttl_seconds=3600, key_prefix="jarvis")
+    store.put("GPT_3_5", "a:b", {"chat_state": "INITIALIZED", "user": None})
+
+    assert store.get("GPT_3_5", "a:b") == {"chat_state": "INITIALIZED", "user": None}
+    assert client.ttls["jarvis:session:GPT_3_5:a:b"] == 3600
+    store.clear()
+    assert store.get("GPT_3_5", "a:b") is None
+    assert client.get("other:key") == "x"
+
+
+def test_redis_checkpointer_round_trip_prunes_and_deletes():
+    client = _FakeRedis()
+    saver = RedisCheckpointSaver(client, keep_last=2, ttl_seconds=3600)
+    config = {"configurable": {"thread_id": "ana"}}
+    graph = _graph(saver, ["uno", "dos", "tres"])
+    for text in ("1", "2", "3"):
+        graph.invoke({"messages": [HumanMessage(text)], "real_name": ""}, config)
+
+    # Another worker's saver on the same server sees the whole thread.
+    other = _graph(saver, [])
+    assert [m.content for m in other.get_state(config).values["messages"]][-2:] == ["3", "tres"]
+    ids = [item.config["configurable"]["checkpoint_id"] for item in saver.list(config)]
+    assert len(ids) == 2 and ids == sorted(ids, reverse=True)
+    assert saver.get_latest_checkpoint_id({"configurable": {"thread_id": "ana"}}) == ids[0]
+    assert [key for key in client.data if key not in client.ttls] == []
+    assert set(client.ttls.values()) == {3600}
+    # Only the kept checkpoints' writes remain.
+    assert len([key for key in client.data if ":checkpoint-writes:" in key]) <= 2
+
+    saver.delete_all_threads()
+    assert saver.get_tuple(config) is None
+    assert list(saver.list(None)) == []
+    assert client.data == {}
+
+
+def test_redis_checkpointer_reads_only_the_latest_checkpoint():
+    client = _FakeRedis()
+    saver = RedisCheckpointSaver(client, keep_last=5)
+    config = {"configurable": {"thread_id": "a:b"}}
+    graph = _graph(saver, ["uno", "dos"])
+    for text in ("1", "2"):
+        graph.invoke({"messages": [HumanMessage(text)], "real_name": ""}, config)
+    client.hgetall_keys.clear()
+
+    latest = saver.get_tuple(config)
+
+    assert latest.config["configurable"]["checkpoint_id"] == saver.get_latest_checkpoint_id(config)
+    assert all(":checkpoint-writes:" in key for key in client.hgetall_keys)
+    assert saver._thread_ids() == ["a:b"]
+
+
+def test_redis_checkpointer_latest_never_moves_back():
+    saver = RedisCheckpointSaver(_FakeRedis(), keep_last=5)
+    graph = _graph(saver, ["uno", "dos"])
+    config = {"configurable": {"thread_id": "ana"}}
+    for text in ("1", "2"):
+        graph.invoke({"messages": [HumanMessage(text)], "real_name": ""}, config)
+    newest, older = list(saver.list(config))[:2]
+
+    # A slower worker stores an older checkpoint after the newest one.
+    saver.put(older.parent_config or config, older.checkpoint, older.metadata, {})
+
+    assert saver.get_latest_checkpoint_id(config) == newest.config["configurable"]["checkpoint_id"]
+
+
+class _EchoAgent:
+    memory = None
+
+    def __init__(self) -> None:
+        self.calls: list[dict] = []
+
+    async def ainvoke(self, **kwargs) -> dict:
+        self.calls.append(kwargs["input"])
+        messages = kwargs["input"]["messages"]
+        return {"messages": [*messages, AIMessage(content="A su servicio.")]}
+
+    def cleanup(self) -> None:
+        pass
+
+
+@pytest.fixture
+def shared_store(tmp_path, monkeypatch):
+    store = SqliteSessionStore(str(tmp_path / "sessions.db"), ttl_seconds=60)
+    monkeypatch.setattr(session_module, "get_session_store", lambda: store)
+    session_module.reset_cache_global()
+    agent = _EchoAgent()
+    session_module._agents_cache[ModelEnum.GPT_3_5] = agent
+    yield agent
+    session_module._agents_cache.clear()
+    session_module.reset_cache_global()
+
+
+def test_another_worker_continues_the_thread(shared_store):
+    user = {"real_name": "Ana", "jarvis_name": "Señorita", "is_female": True, "admin": False}
+    worker_a = session_module.JarvisSession(ModelEnum.GPT_3_5, "ana", user)
+    welcome = asyncio.run(worker_a.aask("hola"))
+    assert "Bienvenida" in welcome[0]
+
+    # A second worker picks up the chat state from the store (no second welcome).
+    worker_b = session_module.JarvisSession(ModelEnum.GPT_3_5, "ana", dict(user))
+    assert asyncio.run(worker_b.aask("¿qué hora es?")) == ["A su servicio."]
+    assert shared_store.calls[-1]["real_name"] == "Ana"
+    assert session_module.check_individual_session_cache_exists("ana", ModelEnum.GPT_3_5)
+
+    session_module.reset_session("ana", ModelEnum.GPT_3_5)
+    assert "Bienvenida" in asyncio.run(worker_a.aask("hola de nuevo"))[0]
+
+
+class _GraphAgent:
+    """Agent backed by a real graph on an in-memory checkpointer."""
+
+    def __init__(self, replies: list[str]) -> None:
+        self.memory = MemorySaver()
+        self.graph = _graph(self.memory, replies)
+
+    async def ainvoke(self, **kwargs) -> dict:
+        return await self.graph.ainvoke(kwargs["input"], kwargs["config"])
+
+    def cleanup(self) -> None:
+        pass
+
+
+def test_lost_in_memory_thread_restarts_chat_with_system_prompt(shared_store):
+    agent = session_module._agents_cache[ModelEnum.GPT_3_5] = _GraphAgent(["uno", "dos"])
+    user = {"real_name": "Ana", "jarvis_name": "Señorita", "is_female": True, "admin": False}
+    config = {"configurable": {"thread_id": "ana"}}
+    worker = session_module.JarvisSession(ModelEnum.GPT_3_5, "ana", user)
+    asyncio.run(worker.aask("hola"))
+    assert asyncio.run(worker.aask("¿qué tal?")) == ["uno"]
+
+    # Eviction (or a restart) drops the in-memory thread; the store still says INITIALIZED.
+    agent.memory.delete_thread("ana")
+    restarted = session_module.JarvisSession(ModelEnum.GPT_3_5, "ana", user)
+    assert asyncio.run(restarted.aask("sigo aquí")) == ["dos"]
+
+    messages = agent.graph.get_state(config).values["messages"]
+    assert isinstance(messages[0], SystemMessage)
+    assert messages[-2].content == "sigo aquí"
+
+
+class _SlowStore:
+    def get(self, model, thread_id):
+        time.sleep(0.2)
+        return {"chat_state": "INITIALIZED", "user": None}
+
+
+def test_cache_status_reads_the_store_off_the_event_loop(monkeypatch):
+    monkeypatch.setattr(session_module, "get_session_store", lambda: _SlowStore())
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        for _ in range(10):
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    async def lookup():
+        exists = await chat_service.individual_cache_exists("nadie")
+        return exists, ticks
+
+    async def scenario():
+        result, _ = await asyncio.gather(lookup(), ticker())
+        return result
+
+    exists, ticks_during_lookup = asyncio.run(scenario())
+    assert exists and ticks_during_lookup >= 5
+
+
+def test_local_sessions_never_share_state(shared_store):
+    identified = session_module.JarvisSession(ModelEnum.GPT_3_5, "1", None)
+    identified.valid_user = True
+    identified.user = {"real_name": "Ana", "jarvis_name": "Señorita", "is_female": True, "admin": False}
+    asyncio.run(identified.aask("hola"))
+
+    # The next person to open the CLI gets thread "1" again and must identify.
+    next_person = session_module.JarvisSession(ModelEnum.GPT_3_5, "1", None)
+    next_person._restore_state()
+    assert next_person.user is None and not next_person.valid_user
+    assert not session_module.check_individual_session_cache_exists("1", ModelEnum.GPT_3_5)
+
+
+@pytest.mark.skipif(importlib.util.find_spec("redis") is not None, reason="redis is installed")
+def test_redis_backend_without_package_explains_extra(monkeypatch):
+    monkeypatch.setattr(redis_client, "_client", None)
+    monkeypatch.setenv("REDIS_URL", "redis://localhost:6379/0")
+
+    with pytest.raises(RuntimeError, match=r"jarvis\[redis\]"):
+        redis_client.get_redis_client()
@@ -0,0 +1,98 @@
+"""Audio preprocessing, the transcription LRU cache, and the transcription tool."""
+
+import wave
+from types import SimpleNamespace
+
+import numpy as np
+
+from jarvis.infrastructure.audio import preprocessing
+from jarvis.infrastructure.audio.transcription_cache import TranscriptionCache
+from jarvis.tools import speech_to_text
+
+
+def _write_stereo_wav(path, rate: int = 48_000) -> None:
+    silence = np.zeros(rate // 2)
+    tone = 0.5 * np.sin(2 * np.pi * 440 * np.arange(rate) / rate)
+    mono = np.concatenate([silence, tone, silence])
+    stereo = (np.repeat(mono[:, None], 2, axis=1) * 32767).astype("<i2")
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(2)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(stereo.tobytes())
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        self.now += 1
+        return self.now
+
+
+def test_wav_fallback_downmixes_resamples_and_trims(tmp_path, monkeypatch):
+    monkeypatch.setattr(preprocessing.shutil, "which", lambda name: None)
+    source = tmp_path / "voz.wav"
+    _write_stereo_wav(source)
+
+    prepared = preprocessing.preprocess_audio(str(source))
+
+    out = tmp_path / prepared.filename
+    out.write_bytes(prepared.data)
+    with wave.open(str(out), "rb") as wav:
+        assert (wav.getnchannels(), wav.getframerate(), wav.getsampwidth()) == (1, 16_000, 2)
+        assert abs(wav.getnframes() / 16_000 - 1.0) < 0.05  # only the tone is left
+    assert len(prepared.data) < source.stat().st_size / 10
+
+
+def test_unsupported_input_without_ffmpeg_is_uploaded_unchanged(tmp_path, monkeypatch):
+    monkeypatch.setattr(preprocessing.shutil, "which", lambda name: None)
+    source = tmp_path / "nota.mp3"
+    source.write_bytes(b"ID3 not really audio")
+
+    prepared = preprocessing.preprocess_audio(str(source))
+
+    assert (prepared.filename, prepared.data) == ("nota.mp3", b"ID3 not really audio")
+
+
+def test_cache_evicts_least_recently_used_by_count_and_size(tmp_path):
+    cache = TranscriptionCache(str(tmp_path / "t.db"), max_entries=2, max_bytes=10, clock=_Clock())
+    cache.put("a", "whisper-1", "uno")
+    cache.put("b", "whisper-1", "dos")
+    assert cache.get("a", "whisper-1") == "uno"  # "b" is now the least recently used
+
+    cache.put("c", "whisper-1", "tres")
+    assert cache.get("b", "whisper-1") is None
+    assert cache.get("a", "whisper-1") == "uno"
+    assert cache.get("a", "otro-modelo") is None
+
+    cache.put("d", "whisper-1", "muy largo")
+    assert cache.stats()["entries"] == 1
+    assert cache.get("d", "whisper-1") == "muy largo"
+
+
+def test_tool_transcribes_each_recording_once(tmp_path, monkeypatch):
+    uploads = []
+
+    class _FakeOpenAI:
+        def __init__(self):
+            self.audio = SimpleNamespace(transcriptions=SimpleNamespace(create=self.create))
+
+        def create(self, model, file):
+            uploads.append(file)
+            return SimpleNamespace(text="hola jarvis")
+
+    cache = TranscriptionCache(str(tmp_path / "t.db"))
+    monkeypatch.setattr(speech_to_text, "OpenAI", _FakeOpenAI)
+    monkeypatch.setattr(speech_to_text, "get_transcription_cache", lambda: cache)
+    monkeypatch.setattr(preprocessing.shutil, "which", lambda name: None)
+    first, resent = tmp_path / "a.wav", tmp_path / "b.wav"
+    _write_stereo_wav(first)
+    resent.write_bytes(first.read_bytes())
+
+    assert speech_to_text.speech_to_text_tool.invoke({"file_path": str(first)}) == "hola jarvis"
+    assert speech_to_text.speech_to_text_tool.invoke({"file_path": str(resent)}) == "hola jarvis"
+
+    assert len(uploads) == 1
+    assert uploads[0][0] == "audio.wav" and len(uploads[0][1]) < first.stat().st_size / 10
@@ -0,0 +1,38 @@
+"""Thread-local SQLite connection manager (WAL, pragmas, reuse)."""
+
+import threading
+
+from jarvis.infrastructure.persistence.sqlite import SQLiteConnectionManager
+
+
+def test_connection_is_reused_per_thread_and_uses_wal(tmp_path):
+    manager = SQLiteConnectionManager()
+    db_path = str(tmp_path / "pool.db")
+
+    first = manager.connection(db_path)
+    assert manager.connection(db_path) is first
+    assert first.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert first.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+
+    other: list = []
+    thread = threading.Thread(target=lambda: other.append(manager.connection(db_path)))
+    thread.start()
+    thread.join()
+    assert other[0] is not first
+    manager.close_all()
+
+
+def test_close_all_reopens_lazily(tmp_path):
+    manager = SQLiteConnectionManager()
+    db_path = str(tmp_path / "pool.db")
+    first = manager.connection(db_path)
+    with first:
+        first.execute("CREATE TABLE t (x INTEGER)")
+        first.execute("INSERT INTO t VALUES (1)")
+
+    manager.close_all()
+    second = manager.connection(db_path)
+
+    assert second is not first
+    assert second.execute("SELECT x FROM t").fetchone()[0] == 1
+    manager.close_all()
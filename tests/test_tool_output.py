@@ -0,0 +1,90 @@
+"""Token-budgeted tool node: compact encodings and deterministic truncation."""
+
+import asyncio
+import json
+import logging
+from typing import Annotated
+
+from langchain_core.messages import AIMessage
+from langchain_core.tools import tool
+from langgraph.graph import StateGraph
+from langgraph.graph.message import add_messages
+from langgraph.prebuilt import InjectedState
+from typing_extensions import TypedDict
+
+from jarvis.agents.tool_output import build_tool_node, compact_text, truncate_text
+
+
+class _State(TypedDict):
+    messages: Annotated[list, add_messages]
+    real_name: str
+
+
+@tool
+def list_things_tool(real_name: Annotated[str, InjectedState("real_name")], count: int) -> str:
+    """List things."""
+    return "\n".join(f"{real_name} {i:03d} " + "x" * 20 for i in range(count))
+
+
+def test_json_and_blank_lines_are_compacted():
+    assert compact_text('{\n  "a": [1, 2],\n  "b": "ñ"\n}') == '{"a":[1,2],"b":"ñ"}'
+    assert compact_text("uno   \n\n\n\ndos\n") == "uno\n\ndos"
+
+
+def test_truncation_keeps_whole_lines_and_marks_the_rest():
+    text = "\n".join(f"línea {i}" for i in range(100))
+
+    truncated = truncate_text(text, 60)
+
+    assert truncated == truncate_text(text, 60)
+    body, marker = truncated.rsplit("\n", 1)
+    kept = body.split("\n")
+    assert kept == [f"línea {i}" for i in range(len(kept))]
+    assert marker.startswith(f"… [{100 - len(kept)} líneas más disponibles")
+    assert len(truncated) / 4 <= 60
+    assert truncate_text("corto", 60) == "corto"
+
+
+def test_single_oversized_line_is_cut():
+    truncated = truncate_text("x" * 1000, 50)
+    assert truncated.startswith("x") and len(truncated) / 4 <= 50
+
+
+def test_oversized_json_keeps_whole_elements_and_stays_valid():
+    events = [{"summary": f"Reunión {i}", "start": "2030-01-01"} for i in range(200)]
+    array = truncate_text(compact_text(json.dumps(events)), 100)
+    kept_json, marker = array.split("\n")
+    kept = json.loads(kept_json)
+    assert kept == events[: len(kept)] and kept
+    assert marker.startswith(f"… [{200 - len(kept)} elementos más")
+    assert len(array) / 4 <= 100
+
+    wrapped = truncate_text(compact_text(json.dumps({"total": 200, "items": events})), 100)
+    kept_object = json.loads(wrapped.split("\n")[0])
+    assert kept_object["total"] == 200 and kept_object["items"] == events[: len(kept_object["items"])]
+
+
+def _run(node, count: int, **kwargs) -> str:
+    builder = StateGraph(_State)
+    builder.add_node("tools", build_tool_node([list_things_tool], **kwargs))
+    builder.set_entry_point("tools")
+    graph = builder.compile()
+    call = AIMessage(content="", tool_calls=[{"name": "list_things_tool", "args": {"count": count}, "id": "c1"}])
+    state = {"messages": [call], "real_name": "ana"}
+    return asyncio.run(graph.ainvoke(state)) if node == "async" else graph.invoke(state)
+
+
+def test_node_applies_per_tool_budget_and_logs_savings(caplog):
+    with caplog.at_level(logging.INFO, logger="jarvis.agents.tool_output"):
+        for mode in ("sync", "async"):
+            result = _run(mode, 200, budgets={"list_things_tool": 100})["messages"][-1]
+            assert result.content.startswith("ana 000 ")  # injected state still reaches the tool
+            assert "líneas más disponibles" in result.content
+            assert len(result.content) / 4 <= 100
+            assert result.tool_call_id == "c1"
+    assert "saved" in caplog.text
+
+
+def test_small_results_pass_through_unchanged():
+    result = _run("sync", 2, default_budget=100)["messages"][-1]
+    assert result.content == list_things_tool.func("ana", 2)
@@ -0,0 +1,84 @@
+"""Manifest-based tool registry: caching, lazy imports, state injection, entry points."""
+
+import sys
+import textwrap
+from importlib.metadata import EntryPoint
+
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.utils.function_calling import convert_to_openai_tool
+from langgraph.graph import MessagesState, StateGraph
+from langgraph.prebuilt import ToolNode
+
+from jarvis.tools import tools_registry
+
+_PLUGIN = "jarvis_test_plugin_tools"
+
+
+class _State(MessagesState):
+    real_name: str
+
+
+@pytest.fixture
+def plugin(tmp_path, monkeypatch):
+    (tmp_path / f"{_PLUGIN}.py").write_text(textwrap.dedent('''
+        from typing import Annotated
+        from langchain_core.tools import tool
+        from langgraph.prebuilt import InjectedState
+
+        @tool
+        def greet_tool(real_name: Annotated[str, InjectedState("real_name")], greeting: str) -> str:
+            """Greet the user."""
+            return f"{greeting}, {real_name}"
+
+        extra_tools = [greet_tool]
+    '''))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(
+        tools_registry,
+        "entry_points",
+        lambda group: [EntryPoint(name="greet", value=f"{_PLUGIN}:extra_tools", group=group)],
+    )
+    yield
+    sys.modules.pop(_PLUGIN, None)
+
+
+def test_manifest_is_reused_until_a_source_changes(tmp_path, monkeypatch):
+    path = str(tmp_path / "manifest.json")
+    first = tools_registry.load_tools(path)
+
+    def fail():
+        raise AssertionError("manifest should have been reused")
+
+    monkeypatch.setattr(tools_registry, "build_manifest", fail)
+    assert [t.name for t in tools_registry.load_tools(path)] == [t.name for t in first]
+
+    sources = tools_registry._local_modules()
+    touched = {name: mtime + 1 for name, mtime in sources.items()}
+    monkeypatch.setattr(tools_registry, "_local_modules", lambda: touched)
+    with pytest.raises(AssertionError):
+        tools_registry.load_tools(path)
+
+
+def test_proxies_match_the_real_tool_schemas(tmp_path):
+    for proxy in tools_registry.load_tools(str(tmp_path / "manifest.json")):
+        assert convert_to_openai_tool(proxy) == convert_to_openai_tool(proxy.resolve())
+
+
+def test_entry_point_tools_are_lazy_and_receive_injected_state(plugin, tmp_path):
+    path = str(tmp_path / "manifest.json")
+    tools_registry.load_tools(path)
+    sys.modules.pop(_PLUGIN)
+
+    greet = next(t for t in tools_registry.load_tools(path) if t.name == "greet_tool")
+    assert _PLUGIN not in sys.modules
+    assert list(convert_to_openai_tool(greet)["function"]["parameters"]["properties"]) == ["greeting"]
+
+    builder = StateGraph(_State)
+    builder.add_node("tools", ToolNode([greet]))
+    builder.set_entry_point("tools")
+    call = AIMessage(content="", tool_calls=[{"name": "greet_tool", "args": {"greeting": "Hola"}, "id": "c1"}])
+    result = builder.compile().invoke({"messages": [call], "real_name": "ana"})
+
+    assert result["messages"][-1].content == "Hola, ana"
+    assert _PLUGIN in sys.modules
@@ -0,0 +1,201 @@
+"""Per-thread turn serialization: ordering, backpressure (429), and coalescing."""
+
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+from langchain_core.messages import AIMessage
+
+from jarvis.agents import session as session_module
+from jarvis.agents.turn_queue import ThreadBusyError, TurnQueue
+from jarvis.api.schemas.chat import AskInput
+from jarvis.api.services.chat_service import chat_service
+from jarvis.core.enums import ModelEnum
+
+
+class _TrackingAgent:
+    memory = None
+
+    def __init__(self, delay: float = 0.05) -> None:
+        self.delay = delay
+        self.prompts: list[str] = []
+        self.running = 0
+        self.max_running = 0
+
+    async def ainvoke(self, **kwargs) -> dict:
+        messages = kwargs["input"]["messages"]
+        self.prompts.append(messages[-1].content)
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(self.delay)
+        self.running -= 1
+        return {"messages": [*messages, AIMessage(content=f"eco: {messages[-1].content}")]}
+
+    def cleanup(self) -> None:
+        pass
+
+
+def _user(name: str) -> dict:
+    return {"real_name": name, "jarvis_name": "Sir", "is_female": False, "admin": False}
+
+
+@pytest.fixture
+def agent():
+    session_module.reset_cache_global()
+    tracking = _TrackingAgent()
+    session_module._agents_cache[ModelEnum.GPT_3_5] = tracking
+    yield tracking
+    session_module._agents_cache.clear()
+    session_module.reset_cache_global()
+
+
+async def _ask(prompt: str, thread: str) -> list[str]:
+    return await session_module.ask_jarvis_async(prompt, ModelEnum.GPT_3_5, thread, _user(thread))
+
+
+def test_turns_of_one_thread_run_in_order_while_threads_overlap(agent):
+    async def scenario():
+        await asyncio.gather(_ask("hola", "ana"), _ask("hola", "luis"))
+        agent.max_running = 0
+        return await asyncio.gather(
+            _ask("uno", "ana"), _ask("dos", "ana"), _ask("tres", "ana"), _ask("uno", "luis")
+        )
+
+    replies = asyncio.run(scenario())
+
+    assert replies == [["eco: uno"], ["eco: dos"], ["eco: tres"], ["eco: uno"]]
+    assert [p for p in agent.prompts if p != "uno"] == ["dos", "tres"]
+    assert agent.max_running == 2
+
+
+def test_duplicate_queued_messages_share_one_turn(agent, monkeypatch):
+    monkeypatch.setattr(session_module, "TURN_COALESCE_DUPLICATES", True)
+    agent.delay = 0.2
+
+    async def scenario():
+        await _ask("hola", "ana")
+        running = asyncio.create_task(_ask("uno", "ana"))
+        await asyncio.sleep(0.05)
+        duplicates = await asyncio.gather(*(_ask("¿qué hora es?", "ana") for _ in range(3)))
+        return await running, duplicates
+
+    first, replies = asyncio.run(scenario())
+
+    assert first == ["eco: uno"]
+    assert replies == [["eco: ¿qué hora es?"]] * 3
+    assert agent.prompts == ["uno", "¿qué hora es?"]
+    session = session_module._sessions_cache.get((ModelEnum.GPT_3_5, "ana"))
+    assert session.turns.stats()["coalesced"] == 2
+
+
+def test_running_or_stale_duplicates_get_their_own_turn():
+    now = [0.0]
+    queue = TurnQueue("ana", max_depth=4, coalesce=True, coalesce_window=2.0, clock=lambda: now[0])
+    release = asyncio.Event()
+    calls: list[str] = []
+
+    async def hold(message: str):
+        calls.append(message)
+        await release.wait()
+        return message
+
+    async def scenario():
+        running = asyncio.create_task(queue.run("hola", lambda: hold("hola")))
+        await asyncio.sleep(0)
+        repeat_of_running = asyncio.create_task(queue.run("hola", lambda: hold("hola")))
+        await asyncio.sleep(0)
+        now[0] = 5.0
+        stale_repeat = asyncio.create_task(queue.run("hola", lambda: hold("hola")))
+        await asyncio.sleep(0)
+        release.set()
+        return await asyncio.gather(running, repeat_of_running, stale_repeat)
+
+    assert asyncio.run(scenario()) == ["hola"] * 3
+    assert calls == ["hola"] * 3
+    assert queue.stats()["coalesced"] == 0
+
+
+def test_full_queue_is_rejected_with_retry_after():
+    queue = TurnQueue("ana", max_depth=1, coalesce=False)
+    release = asyncio.Event()
+
+    async def hold():
+        await release.wait()
+        return "ok"
+
+    async def scenario():
+        running = asyncio.create_task(queue.run("a", hold))
+        waiting = asyncio.create_task(queue.run("b", hold))
+        await asyncio.sleep(0)
+        with pytest.raises(ThreadBusyError) as busy:
+            await queue.run("c", hold)
+        release.set()
+        return busy.value, await asyncio.gather(running, waiting)
+
+    error, results = asyncio.run(scenario())
+
+    assert error.retry_after >= 1
+    assert results == ["ok", "ok"]
+    assert queue.stats() == {"busy": False, "pending": 0, "max_depth": 1, "coalesced": 0, "rejected": 1}
+
+
+def test_chat_service_maps_full_queue_to_429(agent, monkeypatch):
+    monkeypatch.setattr(session_module, "TURN_QUEUE_MAX_DEPTH", 0)
+    agent.delay = 0.2
+
+    async def scenario():
+        await chat_service.aask(AskInput(message="hola"), _user("ana"))
+        first = asyncio.create_task(chat_service.aask(AskInput(message="uno"), _user("ana")))
+        await asyncio.sleep(0.05)
+        with pytest.raises(HTTPException) as rejected:
+            await chat_service.aask(AskInput(message="dos"), _user("ana"))
+        await first
+        return rejected.value
+
+    rejected = asyncio.run(scenario())
+
+    assert rejected.status_code == 429
+    assert int(rejected.headers["Retry-After"]) >= 1
+
+
+class _FoldingAgent(_TrackingAgent):
+    async def afold_context(self, thread_id: str, admit=None) -> bool:
+        session = session_module._sessions_cache.get((ModelEnum.GPT_3_5, thread_id))
+        self.prompts.append(f"fold busy={session.turns.stats()['busy']} running={self.running}")
+        return True
+
+
+def test_context_fold_runs_as_a_turn_of_its_own(agent):
+    folding = _FoldingAgent(delay=0.05)
+    session_module._agents_cache[ModelEnum.GPT_3_5] = folding
+
+    async def scenario():
+        await _ask("hola", "ana")
+        await asyncio.gather(_ask("uno", "ana"), _ask("dos", "ana"))
+        await asyncio.sleep(0.2)
+
+    asyncio.run(scenario())
+
+    assert folding.prompts == ["uno", "dos", "fold busy=True running=0"]
+
+
+class _SyncFoldingAgent(_TrackingAgent):
+    def invoke(self, **kwargs) -> dict:
+        messages = kwargs["input"]["messages"]
+        self.prompts.append(messages[-1].content)
+        return {"messages": [*messages, AIMessage(content=f"eco: {messages[-1].content}")]}
+
+    def fold_context(self, thread_id: str) -> bool:
+        self.prompts.append("fold")
+        return True
+
+
+def test_sync_turn_folds_before_returning(agent):
+    folding = _SyncFoldingAgent()
+    session_module._agents_cache[ModelEnum.GPT_3_5] = folding
+
+    for prompt in ("hola", "uno"):
+        session_module.ask_jarvis(prompt, ModelEnum.GPT_3_5, "ana", _user("ana"))
+        folding.prompts.append(f"returned {prompt}")
+
+    assert folding.prompts[-3:] == ["uno", "fold", "returned uno"]
@@ -0,0 +1,106 @@
+"""SQLite user repository against a temporary database (blind-index lookups)."""
+
+import sqlite3
+
+import pytest
+
+from jarvis.infrastructure.crypto.fernet import encode_symm_crypt_key
+from jarvis.infrastructure.persistence.users import repository
+
+
+@pytest.fixture
+def users_db(tmp_path, monkeypatch):
+    db_path = str(tmp_path / "users.db")
+    monkeypatch.setattr(repository, "DB_PATH", db_path)
+    return db_path
+
+
+def _create_legacy_db(db_path: str) -> None:
+    """Schema and rows as written before the blind-index column existed."""
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("""
+            CREATE TABLE users (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                real_name TEXT NOT NULL UNIQUE,
+                access_name TEXT NOT NULL UNIQUE,
+                password TEXT NOT NULL,
+                jarvis_name TEXT NOT NULL,
+                is_female BOOLEAN NOT NULL,
+                admin BOOLEAN NOT NULL DEFAULT 0
+            )
+        """)
+        for real_name, access_name in (("Ana", "anita"), ("Luis", "luisito")):
+            conn.execute(
+                "INSERT INTO users (real_name, access_name, password, jarvis_name, is_female)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (real_name, encode_symm_crypt_key(access_name), encode_symm_crypt_key("pw"), real_name, 0),
+            )
+
+
+def test_insert_and_lookup_by_blind_index(users_db):
+    repository.init_db()
+    repository.insert_user("Ana", "anita", "Señora", True, "secret")
+
+    user = repository.get_user_by_field("access_name", "anita", is_sensitive=True)
+
+    assert user["real_name"] == "Ana"
+    assert repository.get_user_by_field("access_name", "Anita", is_sensitive=True) is None
+
+
+def test_legacy_database_is_migrated_on_first_lookup(users_db):
+    _create_legacy_db(users_db)
+
+    user = repository.get_user_by_field("access_name", "luisito", is_sensitive=True)
+
+    assert user["real_name"] == "Luis"
+    with sqlite3.connect(users_db) as conn:
+        missing = conn.execute("SELECT COUNT(*) FROM users WHERE access_name_bidx IS NULL").fetchone()
+        indexes = {row[1] for row in conn.execute("PRAGMA index_list(users)")}
+    assert missing == (0,)
+    assert "idx_users_access_name_bidx" in indexes
+    assert repository.migrate_blind_index() == 0
+
+
+def test_delete_user_by_blind_index(users_db):
+    repository.init_db()
+    repository.insert_user("Ana", "anita", "Señora", True, "secret")
+
+    assert repository.delete_user_by_field("access_name", "anita", is_sensitive=True) is True
+    assert repository.delete_user_by_field("access_name", "anita", is_sensitive=True) is False
+    assert repository.get_user_by_field("real_name", "Ana") is None
+
+
+def test_legacy_duplicates_keep_lookups_working(users_db):
+    _create_legacy_db(users_db)
+    with sqlite3.connect(users_db) as conn:
+        conn.execute(
+            "INSERT INTO users (real_name, access_name, password, jarvis_name, is_female)"
+            " VALUES (?, ?, ?, ?, ?)",
+            ("Ana bis", encode_symm_crypt_key("anita"), encode_symm_crypt_key("pw"), "Ana", 1),
+        )
+
+    assert repository.get_user_by_field("access_name", "luisito", is_sensitive=True)["real_name"] == "Luis"
+    assert repository.get_user_by_field("access_name", "anita", is_sensitive=True)["real_name"] == "Ana"
+    with sqlite3.connect(users_db) as conn:
+        indexes = {row[1]: row[2] for row in conn.execute("PRAGMA index_list(users)")}
+    assert indexes.get("idx_users_access_name_bidx_lookup") == 0
+    assert "idx_users_access_name_bidx" not in indexes
+
+    repository.delete_user_by_field("real_name", "Ana bis")
+    assert repository.migrate_blind_index() == 0
+    with sqlite3.connect(users_db) as conn:
+        indexes = {row[1]: row[2] for row in conn.execute("PRAGMA index_list(users)")}
+    assert indexes.get("idx_users_access_name_bidx") == 1
+    assert "idx_users_access_name_bidx_lookup" not in indexes
+
+
+def test_delete_by_blind_index_spares_colliding_rows(users_db):
+    _create_legacy_db(users_db)
+    with sqlite3.connect(users_db) as conn:
+        conn.execute("ALTER TABLE users ADD COLUMN access_name_bidx TEXT")
+        conn.execute("UPDATE users SET access_name_bidx = ?", (repository.compute_blind_index("anita"),))
+
+    assert repository.delete_user_by_field("access_name", "anita", is_sensitive=True) is True
+
+    assert repository.get_user_by_field("real_name", "Ana") is None
+    assert repository.get_user_by_field("real_name", "Luis") is not None